@@ -0,0 +1,178 @@
+"""Benchmark concurrent ticker fetches against a local mock exchange.
+
+The mock answers every request after a fixed latency, standing in for the
+round trip to a real exchange. Sequential fetches should take N round trips
+and concurrent ones about one, over a handful of kept-alive connections.
+A bulk fetch takes one round trip and one request. Rate limiting and the
+ticker cache are switched off so every fetch reaches the mock.
+
+Usage:
+    uv run python scripts/benchmark_exchange_client.py [requests] [latency ms]
+"""
+
+import asyncio
+import json
+import sys
+import time
+from typing import Any
+
+from aiohttp import web
+
+from system_trading.data.models import Exchange
+from system_trading.exchanges.unified_client import UnifiedExchangeClient
+
+SYMBOLS = [f"C{i}/USDT" for i in range(1000)]
+
+
+class MockExchange:
+    """Local HTTP server answering Binance 24h ticker requests."""
+
+    def __init__(self, latency: float) -> None:
+        """Initialize mock exchange.
+
+        Args:
+            latency: Seconds before each response is sent.
+        """
+        self.latency = latency
+        self.requests = 0
+        self.connections: set[tuple[str, int]] = set()
+        self.url = ""
+        self._runner: web.AppRunner | None = None
+
+    async def start(self) -> None:
+        """Start serving on a free local port."""
+        app = web.Application()
+        app.router.add_get("/{path:.*}", self._ticker)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f"http://127.0.0.1:{port}"
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def _ticker(self, request: web.Request) -> web.Response:
+        """Answer a single or bulk ticker request after the latency."""
+        self.requests += 1
+        self.connections.add(request.transport.get_extra_info("peername"))
+        await asyncio.sleep(self.latency)
+        if "symbols" in request.query:
+            market_ids = json.loads(request.query["symbols"])
+            return web.json_response(list(map(self._ticker_data, market_ids)))
+        return web.json_response(self._ticker_data(request.query.get("symbol", "")))
+
+    def _ticker_data(self, market_id: str) -> dict[str, Any]:
+        """Create the 24h ticker of a market."""
+        now = int(time.time() * 1000)
+        return {
+            "symbol": market_id,
+            "openPrice": "100.0",
+            "highPrice": "102.0",
+            "lowPrice": "99.0",
+            "lastPrice": "101.0",
+            "bidPrice": "100.9",
+            "askPrice": "101.1",
+            "priceChange": "1.0",
+            "priceChangePercent": "1.0",
+            "volume": "10.0",
+            "quoteVolume": "1010.0",
+            "openTime": now - 86_400_000,
+            "closeTime": now,
+        }
+
+
+def point_client_at(client: UnifiedExchangeClient, url: str) -> None:
+    """Route the client's async Binance instance to the mock exchange."""
+    ex = client.get_async_exchange(Exchange.BINANCE)
+    ex.urls["api"] = {key: url for key in ex.urls["api"]}
+    ex.enableRateLimit = False
+    ex.set_markets(
+        [
+            {
+                "id": symbol.replace("/", ""),
+                "symbol": symbol,
+                "base": symbol.split("/")[0],
+                "quote": "USDT",
+                "baseId": symbol.split("/")[0],
+                "quoteId": "USDT",
+                "type": "spot",
+                "spot": True,
+                "margin": False,
+                "swap": False,
+                "future": False,
+                "option": False,
+                "contract": False,
+                "linear": None,
+                "inverse": None,
+                "active": True,
+            }
+            for symbol in SYMBOLS
+        ]
+    )
+
+
+async def run(requests: int, latency: float) -> None:
+    """Time sequential, concurrent and bulk fetches of the same tickers."""
+    mock = MockExchange(latency)
+    await mock.start()
+    symbols = SYMBOLS[:requests]
+    try:
+        async with UnifiedExchangeClient(cache_ttls={}) as client:
+            point_client_at(client, mock.url)
+            # Warm up so every run starts with an open connection
+            await client.get_ticker(symbols[0], Exchange.BINANCE)
+
+            async def sequential() -> None:
+                for symbol in symbols:
+                    await client.get_ticker(symbol, Exchange.BINANCE)
+
+            async def concurrent() -> None:
+                await asyncio.gather(
+                    *(client.get_ticker(symbol, Exchange.BINANCE) for symbol in symbols)
+                )
+
+            async def bulk() -> None:
+                await client.get_tickers(symbols, Exchange.BINANCE)
+
+            results = []
+            for mode in (sequential, concurrent, bulk):
+                requests_before = mock.requests
+                start = time.perf_counter()
+                await mode()
+                elapsed = time.perf_counter() - start
+                results.append(
+                    (
+                        mode.__name__,
+                        elapsed,
+                        mock.requests - requests_before,
+                        len(mock.connections),
+                    )
+                )
+    finally:
+        await mock.stop()
+
+    print(f"{requests} tickers, {latency * 1000:.0f} ms round trip")
+    print(
+        f"{'mode':>10} {'total s':>8} {'round trips':>12} {'requests':>9} "
+        f"{'connections':>12}"
+    )
+    for name, elapsed, made, connections in results:
+        print(
+            f"{name:>10} {elapsed:8.3f} {elapsed / latency:12.1f} {made:9d} "
+            f"{connections:12d}"
+        )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    latency = float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else 0.1
+    asyncio.run(run(requests, latency))
+
+
+if __name__ == "__main__":
+    main()
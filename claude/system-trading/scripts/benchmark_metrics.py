@@ -0,0 +1,64 @@
+"""Benchmark the NumPy metrics kernel against vectorbt's portfolio.stats().
+
+Usage:
+    uv run python scripts/benchmark_metrics.py [bars] [repeats]
+"""
+
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from system_trading.backtesting.engine import BacktestEngine
+from system_trading.strategies.enhanced_ma_strategy import EnhancedMAStrategy
+
+
+def create_data(length: int) -> pd.DataFrame:
+    """Create random-walk hourly OHLCV data."""
+    rng = np.random.default_rng(42)
+    close = 50000 * np.cumprod(1 + rng.normal(0, 0.01, length))
+    open_price = np.concatenate([[close[0]], close[:-1]])
+    spread = np.abs(rng.normal(0, 0.003, length))
+    return pd.DataFrame(
+        {
+            "open": open_price,
+            "high": np.maximum(open_price, close) * (1 + spread),
+            "low": np.minimum(open_price, close) * (1 - spread),
+            "close": close,
+            "volume": rng.uniform(100, 1000, length),
+        },
+        index=pd.date_range("2023-01-01", periods=length, freq="h"),
+    )
+
+
+def main() -> None:
+    """Time statistics calculation with both metrics engines."""
+    bars = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    data = create_data(bars)
+    strategy = EnhancedMAStrategy(min_confidence=0.3)
+    reference = BacktestEngine()
+    signals = reference._generate_signals(strategy, data)
+    portfolio = reference._run_vectorbt_backtest(data, signals)
+
+    print(f"{bars} bars, {portfolio.trades.count()} trades, {repeats} repeats")
+    for metrics_engine in ("vectorbt", "numpy"):
+        engine = BacktestEngine(metrics_engine=metrics_engine)
+        # Fresh portfolio copies so vectorbt's cached properties don't carry over
+        seconds = timeit.timeit(
+            lambda engine=engine: engine._calculate_statistics(portfolio.copy(), data),
+            number=repeats,
+        )
+        stats = engine._calculate_statistics(portfolio.copy(), data)
+        print(
+            f"{metrics_engine:>8}: {seconds / repeats * 1000:8.2f} ms/run  "
+            f"return={stats['total_return']:.4f} "
+            f"sharpe={stats['sharpe_ratio']:.3f} "
+            f"drawdown={stats['max_drawdown']:.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Benchmark candle storage profiles: file size, write time and read time.
+
+Cold reads evict the files from the OS page cache first where the platform
+supports it (``posix_fadvise``); otherwise both reads are warm.
+
+Usage:
+    uv run python scripts/benchmark_storage.py [minutes] [repeats]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from system_trading.backtesting.candle_store import CandleStore
+from system_trading.backtesting.storage import STORAGE_PROFILES
+
+
+def create_data(length: int) -> pd.DataFrame:
+    """Create random-walk minute OHLCV data with exchange-like precision."""
+    rng = np.random.default_rng(42)
+    close = np.round(50000 * np.cumprod(1 + rng.normal(0, 0.0005, length)), 2)
+    open_price = np.concatenate([[close[0]], close[:-1]])
+    spread = np.abs(rng.normal(0, 0.0003, length))
+    return pd.DataFrame(
+        {
+            "open": open_price,
+            "high": np.round(np.maximum(open_price, close) * (1 + spread), 2),
+            "low": np.round(np.minimum(open_price, close) * (1 - spread), 2),
+            "close": close,
+            "volume": np.round(rng.lognormal(1, 1, length), 5),
+        },
+        index=pd.date_range("2022-01-01", periods=length, freq="min"),
+    )
+
+
+def evict(files: list[Path]) -> None:
+    """Drop files from the page cache so the next read hits the disk."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for file in files:
+        fd = os.open(file, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+
+def main() -> None:
+    """Write and read the same candles with every storage profile."""
+    minutes = int(sys.argv[1]) if len(sys.argv) > 1 else 2 * 365 * 24 * 60
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    data = create_data(minutes)
+    print(f"{minutes} candles, {repeats} repeats")
+    print(
+        f"{'profile':>8} {'size MB':>8} {'write s':>8} {'cold s':>8} "
+        f"{'warm s':>8} {'max price err':>14}"
+    )
+
+    for name in STORAGE_PROFILES:
+        write = cold = warm = float("inf")
+        for _ in range(repeats):
+            # A fresh store each time so writes never merge with older files
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                store = CandleStore(tmp_dir, profile=name)
+                start = time.perf_counter()
+                store.write(data, "binance", "BTC/USDT", "1m")
+                write = min(write, time.perf_counter() - start)
+
+                files = store.partitions("binance", "BTC/USDT", "1m")
+                size = sum(file.stat().st_size for file in files)
+                evict(files)
+                start = time.perf_counter()
+                result = store.read("binance", "BTC/USDT", "1m")
+                cold = min(cold, time.perf_counter() - start)
+
+                start = time.perf_counter()
+                store.read("binance", "BTC/USDT", "1m")
+                warm = min(warm, time.perf_counter() - start)
+
+        prices = ["open", "high", "low", "close"]
+        error = np.max(
+            np.abs(result[prices].to_numpy() - data[prices].to_numpy())
+            / data[prices].to_numpy()
+        )
+        print(
+            f"{name:>8} {size / 2**20:8.1f} {write:8.3f} {cold:8.3f} "
+            f"{warm:8.3f} {error:14.2e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
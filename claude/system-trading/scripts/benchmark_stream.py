@@ -0,0 +1,62 @@
+"""Load-test the streaming pipeline against the local mock stream server.
+
+Replays synthetic Binance trade and ticker frames as fast as possible and
+measures frames per second through parsing, state updates and delivery to
+several subscribers, plus the events subscribers lost by falling behind.
+
+Usage:
+    uv run python scripts/benchmark_stream.py [symbols] [trades] [subscribers]
+"""
+
+import asyncio
+import sys
+import time
+
+from system_trading.data.models import Exchange
+from system_trading.exchanges.mock_stream import MockStreamServer, binance_frames
+from system_trading.exchanges.streaming import MarketDataStream, Subscription
+
+
+async def consume(subscription: Subscription) -> int:
+    """Count the events a subscriber receives."""
+    count = 0
+    async for _ in subscription:
+        count += 1
+    return count
+
+
+async def run(symbols: int, trades: int, subscribers: int) -> None:
+    """Stream every frame through the pipeline and time it."""
+    names = [f"C{i}/USDT" for i in range(symbols)]
+    frames = binance_frames(names, trades)
+
+    async with MockStreamServer(frames) as server:
+        stream = MarketDataStream(Exchange.BINANCE, names, url=server.url)
+        subscriptions = [stream.subscribe() for _ in range(subscribers)]
+        consumers = [asyncio.create_task(consume(s)) for s in subscriptions]
+
+        start = time.perf_counter()
+        await stream.start()
+        while stream.messages < len(frames):
+            await asyncio.sleep(0.01)
+        elapsed = time.perf_counter() - start
+        await stream.stop()
+        received = await asyncio.gather(*consumers)
+
+    dropped = sum(s.dropped for s in subscriptions)
+    print(f"{len(frames)} frames, {symbols} symbols, {subscribers} subscribers")
+    print(f"{elapsed:.3f} s, {len(frames) / elapsed:,.0f} frames/s")
+    print(f"events delivered {sum(received):,}, dropped {dropped:,}")
+    print(f"gaps {stream.gaps}, errors {stream.errors}")
+
+
+def main() -> None:
+    """Run the load test."""
+    symbols = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    trades = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    subscribers = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+    asyncio.run(run(symbols, trades, subscribers))
+
+
+if __name__ == "__main__":
+    main()
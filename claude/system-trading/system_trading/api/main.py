@@ -1,6 +1,8 @@
 """FastAPI main application."""
 
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -36,6 +38,16 @@ else:
 
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Close the market data streams and exchange connections on shutdown."""
+    yield
+    await market_data.close_streams()
+    await market_data.client.close()
+    await trading.client.close()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="System Trading API",
@@ -44,6 +56,7 @@ app = FastAPI(
     debug=settings.api_debug,
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -82,19 +95,18 @@ async def root() -> dict[str, str]:
 async def health_check() -> dict[str, str]:
     """Health check endpoint."""
     try:
-        # Basic health checks
-        from system_trading.exchanges.unified_client import UnifiedExchangeClient
-
-        client = UnifiedExchangeClient()
+        # Basic health checks, reusing the market data connection pools
+        client = market_data.client
         exchanges_status = {}
 
-        for exchange_name, exchange_client in client.exchanges.items():
+        for exchange_name in client.EXCHANGE_IDS:
             try:
-                # Simple connectivity check
-                markets = exchange_client.load_markets()
+                # Served from the market snapshot unless it needs a refresh
+                markets = await client.load_markets(exchange_name)
                 exchanges_status[exchange_name.value] = {
                     "status": "healthy",
                     "markets": len(markets),
+                    "markets_age": client.get_markets_age(exchange_name),
                 }
             except Exception as e:
                 exchanges_status[exchange_name.value] = {
@@ -1,16 +1,28 @@
 """Backtesting API endpoints."""
 
+import asyncio
 import logging
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
 
+from system_trading.backtesting.bulk_download import BulkDownloader, BulkDownloadJob
 from system_trading.backtesting.data_manager import BacktestDataManager
 from system_trading.backtesting.engine import BacktestEngine
+from system_trading.backtesting.result_cache import BacktestResultCache
+from system_trading.backtesting.search import (
+    GridSearch,
+    ParameterSearch,
+    RandomSearch,
+    SuccessiveHalvingSearch,
+    TPESearch,
+)
+from system_trading.backtesting.walk_forward import WalkForwardOptimizer
 from system_trading.data.models import Exchange
 from system_trading.strategies.enhanced_ma_strategy import EnhancedMAStrategy
+from system_trading.strategies.indicator_cache import indicator_cache
 from system_trading.strategies.rsi_strategy import RSIStrategy
 
 logger = logging.getLogger(__name__)
@@ -20,6 +32,10 @@ router = APIRouter(prefix="/api/backtest", tags=["backtesting"])
 # Global instances
 backtest_engine = BacktestEngine()
 data_manager = BacktestDataManager()
+bulk_downloader = BulkDownloader(data_manager)
+download_jobs: dict[str, BulkDownloadJob] = {}
+MAX_DOWNLOAD_JOBS = 100
+result_cache = BacktestResultCache()
 
 # Available strategies
 AVAILABLE_STRATEGIES = {
@@ -42,6 +58,9 @@ class BacktestRequest(BaseModel):
     )
     initial_cash: float = Field(default=10000.0, description="Initial cash")
     commission: float = Field(default=0.001, description="Commission rate")
+    metrics_engine: Literal["vectorbt", "numpy"] = Field(
+        default="vectorbt", description="Metrics backend"
+    )
 
 
 class OptimizationRequest(BaseModel):
@@ -54,6 +73,121 @@ class OptimizationRequest(BaseModel):
     param_ranges: dict[str, list[Any]] = Field(..., description="Parameter ranges")
     metric: str = Field(default="sharpe_ratio", description="Optimization metric")
     initial_cash: float = Field(default=10000.0, description="Initial cash")
+    metrics_engine: Literal["vectorbt", "numpy"] = Field(
+        default="vectorbt", description="Metrics backend"
+    )
+    n_jobs: int = Field(
+        default=1, description="Worker processes (-1 for all cores)", ge=-1
+    )
+    broadcast: bool = Field(
+        default=False, description="Simulate all combinations in one portfolio"
+    )
+    search: str = Field(
+        default="grid", description="Search strategy (grid, random, halving, tpe)"
+    )
+    max_evaluations: int = Field(
+        default=100, description="Evaluation budget for adaptive searches", gt=0
+    )
+    seed: int | None = Field(None, description="Random seed for sampling searches")
+    top_k: int = Field(default=10, description="Top results returned per metric", gt=0)
+
+
+class WalkForwardRequest(BaseModel):
+    """Walk-forward optimization request model."""
+
+    strategy: str = Field(..., description="Strategy name")
+    symbol: str = Field(..., description="Trading symbol")
+    exchange: Exchange = Field(..., description="Exchange")
+    timeframe: str = Field(default="1h", description="Data timeframe")
+    start_date: datetime | None = Field(None, description="Start date")
+    end_date: datetime | None = Field(None, description="End date")
+    param_ranges: dict[str, list[Any]] = Field(..., description="Parameter ranges")
+    metric: str = Field(default="sharpe_ratio", description="Optimization metric")
+    train_bars: int = Field(..., description="Bars per training window", gt=0)
+    test_bars: int = Field(..., description="Bars per test window", gt=0)
+    step_bars: int | None = Field(None, description="Bars between folds", gt=0)
+    anchored: bool = Field(default=False, description="Anchor training windows")
+    n_jobs: int = Field(
+        default=1, description="Folds run concurrently (-1 for all cores)", ge=-1
+    )
+    initial_cash: float = Field(default=10000.0, description="Initial cash")
+    commission: float = Field(default=0.001, description="Commission rate")
+
+
+class PortfolioBacktestRequest(BaseModel):
+    """Multi-asset portfolio backtest request model."""
+
+    strategy: str = Field(..., description="Strategy name")
+    symbols: list[str] = Field(..., description="Trading symbols", min_length=1)
+    exchange: Exchange = Field(..., description="Exchange")
+    timeframe: str = Field(default="1h", description="Data timeframe")
+    start_date: datetime | None = Field(None, description="Start date")
+    end_date: datetime | None = Field(None, description="End date")
+    parameters: dict[str, Any] = Field(
+        default_factory=dict, description="Strategy parameters"
+    )
+    allocations: dict[str, float] | None = Field(
+        None, description="Fraction of initial cash per entry for each symbol"
+    )
+    initial_cash: float = Field(default=10000.0, description="Initial cash")
+    commission: float = Field(default=0.001, description="Commission rate")
+
+
+def _result_cache_key(request: BacktestRequest, engine: BacktestEngine) -> str | None:
+    """Get the result cache key of a backtest request.
+
+    Returns None when the request would not run on cached data, e.g. because
+    the data cache is missing or stale and must be refetched first.
+    """
+    data_fingerprint = data_manager.get_data_fingerprint(
+        symbol=request.symbol,
+        exchange=request.exchange,
+        timeframe=request.timeframe,
+        start_date=request.start_date,
+        end_date=request.end_date,
+    )
+    if data_fingerprint is None:
+        return None
+
+    return result_cache.make_key(
+        data_fingerprint=data_fingerprint,
+        strategy_class=AVAILABLE_STRATEGIES[request.strategy],
+        parameters=request.parameters,
+        settings={
+            "initial_cash": engine.initial_cash,
+            "commission": engine.commission,
+            "slippage": engine.slippage,
+            "metrics_engine": engine.metrics_engine,
+        },
+        symbol=request.symbol,
+        start_date=request.start_date,
+        end_date=request.end_date,
+    )
+
+
+def _build_search(request: OptimizationRequest) -> ParameterSearch:
+    """Create the parameter search strategy for an optimization request."""
+    if request.search == "grid":
+        return GridSearch()
+    if request.search == "random":
+        return RandomSearch(n_iter=request.max_evaluations, seed=request.seed)
+    if request.search == "halving":
+        return SuccessiveHalvingSearch(
+            n_candidates=request.max_evaluations, seed=request.seed
+        )
+    if request.search == "tpe":
+        return TPESearch(
+            n_iter=request.max_evaluations,
+            n_startup=max(1, request.max_evaluations // 5),
+            # One batch keeps every worker busy; n_jobs=-1 means all CPUs
+            batch_size=backtest_engine._resolve_n_jobs(
+                request.n_jobs, request.max_evaluations
+            ),
+            seed=request.seed,
+        )
+    raise HTTPException(
+        status_code=400, detail=f"Unknown search strategy: {request.search}"
+    )
 
 
 @router.get("/strategies")
@@ -83,6 +217,21 @@ async def run_backtest(request: BacktestRequest) -> dict[str, Any]:
                 status_code=400, detail=f"Unknown strategy: {request.strategy}"
             )
 
+        # Configure backtest engine
+        engine = BacktestEngine(
+            initial_cash=request.initial_cash,
+            commission=request.commission,
+            metrics_engine=request.metrics_engine,
+        )
+
+        # Serve repeated requests from the result cache
+        cache_key = _result_cache_key(request, engine)
+        if cache_key is not None:
+            cached = result_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Using cached backtest result for %s", request.symbol)
+                return {**cached, "cached": True}
+
         # Get historical data
         logger.info(
             "Fetching data for backtest: %s %s", request.symbol, request.exchange
@@ -104,12 +253,6 @@ async def run_backtest(request: BacktestRequest) -> dict[str, Any]:
         strategy_class = AVAILABLE_STRATEGIES[request.strategy]
         strategy = strategy_class(**request.parameters)
 
-        # Configure backtest engine
-        engine = BacktestEngine(
-            initial_cash=request.initial_cash,
-            commission=request.commission,
-        )
-
         # Run backtest
         logger.info("Running backtest for %s", strategy.name)
         result = engine.run_backtest(
@@ -120,15 +263,25 @@ async def run_backtest(request: BacktestRequest) -> dict[str, Any]:
             end_date=request.end_date,
         )
 
-        # Return results
-        return {
+        response = {
             "success": True,
             "summary": result.get_summary(),
             "statistics": result.stats,
+            "data_points": len(data),
+        }
+
+        # Data may have been refetched, so key on the data actually used
+        cache_key = _result_cache_key(request, engine)
+        if cache_key is not None:
+            result_cache.put(cache_key, response, result.trades)
+
+        # Return results
+        return {
+            **response,
             "trades": result.trades.to_dict("records")
             if not result.trades.empty
             else [],
-            "data_points": len(data),
+            "cached": False,
         }
 
     except HTTPException:
@@ -138,6 +291,77 @@ async def run_backtest(request: BacktestRequest) -> dict[str, Any]:
         raise HTTPException(status_code=500, detail=f"Backtest failed: {e}")
 
 
+@router.post("/portfolio")
+async def run_portfolio_backtest(request: PortfolioBacktestRequest) -> dict[str, Any]:
+    """Run a multi-asset backtest with cash shared across symbols.
+
+    Args:
+        request: Portfolio backtest configuration.
+
+    Returns:
+        Combined and per-symbol backtest results.
+    """
+    try:
+        # Validate strategy
+        if request.strategy not in AVAILABLE_STRATEGIES:
+            raise HTTPException(
+                status_code=400, detail=f"Unknown strategy: {request.strategy}"
+            )
+
+        panel = {}
+        for symbol in request.symbols:
+            data = data_manager.prepare_backtest_data(
+                symbol=symbol,
+                exchange=request.exchange,
+                timeframe=request.timeframe,
+                start_date=request.start_date,
+                end_date=request.end_date,
+            )
+            if data.empty:
+                logger.warning("No data for %s", symbol)
+                continue
+            panel[symbol] = data
+
+        if not panel:
+            raise HTTPException(
+                status_code=400, detail="No data available for the specified symbols"
+            )
+
+        strategy = AVAILABLE_STRATEGIES[request.strategy](**request.parameters)
+        engine = BacktestEngine(
+            initial_cash=request.initial_cash,
+            commission=request.commission,
+        )
+
+        logger.info(
+            "Running portfolio backtest for %s on %s", strategy.name, list(panel)
+        )
+        try:
+            result = engine.run_portfolio_backtest(
+                strategy=strategy,
+                data=panel,
+                allocations=request.allocations,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        return {
+            "success": True,
+            "summary": result.get_summary(),
+            "statistics": result.stats,
+            "trades": result.trades.to_dict("records")
+            if not result.trades.empty
+            else [],
+            "symbols": list(panel),
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Portfolio backtest failed: %s", e)
+        raise HTTPException(status_code=500, detail=f"Portfolio backtest failed: {e}")
+
+
 @router.post("/optimize")
 async def run_optimization(request: OptimizationRequest) -> dict[str, Any]:
     """Run parameter optimization.
@@ -159,7 +383,13 @@ async def run_optimization(request: OptimizationRequest) -> dict[str, Any]:
         logger.info(
             "Fetching data for optimization: %s %s", request.symbol, request.exchange
         )
-        data = data_manager.prepare_backtest_data(
+        # Worker processes attach to memory-mapped data instead of copies
+        load_data = (
+            data_manager.open_shared
+            if request.n_jobs != 1
+            else data_manager.prepare_backtest_data
+        )
+        data = load_data(
             symbol=request.symbol,
             exchange=request.exchange,
             timeframe=request.timeframe,
@@ -171,7 +401,10 @@ async def run_optimization(request: OptimizationRequest) -> dict[str, Any]:
             )
 
         # Configure backtest engine
-        engine = BacktestEngine(initial_cash=request.initial_cash)
+        engine = BacktestEngine(
+            initial_cash=request.initial_cash,
+            metrics_engine=request.metrics_engine,
+        )
 
         # Run optimization
         strategy_class = AVAILABLE_STRATEGIES[request.strategy]
@@ -183,6 +416,10 @@ async def run_optimization(request: OptimizationRequest) -> dict[str, Any]:
             param_ranges=request.param_ranges,
             symbol=request.symbol,
             metric=request.metric,
+            n_jobs=request.n_jobs,
+            broadcast=request.broadcast,
+            search=_build_search(request),
+            top_k=request.top_k,
         )
 
         return {
@@ -191,11 +428,10 @@ async def run_optimization(request: OptimizationRequest) -> dict[str, Any]:
             "best_score": result["best_score"],
             "optimization_metric": result["metric"],
             "total_combinations": result["total_combinations"],
-            "top_results": sorted(
-                result["all_results"],
-                key=lambda x: x["score"],
-                reverse=request.metric != "max_drawdown",
-            )[:10],  # Top 10 results
+            "evaluated_combinations": result["evaluated_combinations"],
+            "search": result["search"],
+            "top_results": result["all_results"],
+            "top_results_by_metric": result["top_results"],
         }
 
     except HTTPException:
@@ -205,6 +441,105 @@ async def run_optimization(request: OptimizationRequest) -> dict[str, Any]:
         raise HTTPException(status_code=500, detail=f"Optimization failed: {e}")
 
 
+@router.post("/walk-forward")
+async def run_walk_forward(request: WalkForwardRequest) -> dict[str, Any]:
+    """Run walk-forward optimization.
+
+    Args:
+        request: Walk-forward configuration.
+
+    Returns:
+        Per-fold parameters and scores with out-of-sample performance.
+    """
+    try:
+        # Validate strategy
+        if request.strategy not in AVAILABLE_STRATEGIES:
+            raise HTTPException(
+                status_code=400, detail=f"Unknown strategy: {request.strategy}"
+            )
+
+        # Get historical data
+        logger.info(
+            "Fetching data for walk-forward: %s %s", request.symbol, request.exchange
+        )
+        # Worker processes attach to memory-mapped data instead of copies
+        load_data = (
+            data_manager.open_shared
+            if request.n_jobs != 1
+            else data_manager.prepare_backtest_data
+        )
+        # Loading and folds take minutes; keep the event loop serving requests
+        data = await asyncio.to_thread(
+            load_data,
+            symbol=request.symbol,
+            exchange=request.exchange,
+            timeframe=request.timeframe,
+            start_date=request.start_date,
+            end_date=request.end_date,
+        )
+
+        if data.empty:
+            raise HTTPException(
+                status_code=400, detail="No data available for walk-forward"
+            )
+
+        engine = BacktestEngine(
+            initial_cash=request.initial_cash,
+            commission=request.commission,
+        )
+        try:
+            optimizer = WalkForwardOptimizer(
+                engine=engine,
+                train_size=request.train_bars,
+                test_size=request.test_bars,
+                step=request.step_bars,
+                anchored=request.anchored,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        result = await asyncio.to_thread(
+            optimizer.run,
+            strategy_class=AVAILABLE_STRATEGIES[request.strategy],
+            data=data,
+            param_ranges=request.param_ranges,
+            symbol=request.symbol,
+            metric=request.metric,
+            n_jobs=request.n_jobs,
+        )
+
+        return {
+            "success": True,
+            "optimization_metric": result["metric"],
+            "anchored": result["anchored"],
+            "folds": [
+                {
+                    "fold": fold["fold"],
+                    "train_start": fold["train_period"][0].isoformat(),
+                    "train_end": fold["train_period"][1].isoformat(),
+                    "test_start": fold["test_period"][0].isoformat(),
+                    "test_end": fold["test_period"][1].isoformat(),
+                    "best_parameters": fold["best_params"],
+                    "train_score": fold["train_score"],
+                    "test_score": fold["test_score"],
+                    "test_statistics": fold["test_stats"],
+                }
+                for fold in result["folds"]
+            ],
+            "oos_statistics": result["oos_stats"],
+            "oos_equity": {
+                timestamp.isoformat(): float(value)
+                for timestamp, value in result["oos_equity"].items()
+            },
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Walk-forward optimization failed: %s", e)
+        raise HTTPException(status_code=500, detail=f"Walk-forward failed: {e}")
+
+
 @router.post("/compare")
 async def compare_strategies(
     symbols: list[str] = Query(..., description="Trading symbols"),
@@ -297,74 +632,181 @@ async def get_data_info(
         raise HTTPException(status_code=500, detail=f"Failed to get data info: {e}")
 
 
+@router.get("/data/validate/{exchange}/{symbol}")
+async def validate_data(
+    exchange: Exchange,
+    symbol: str,
+    timeframe: str = Query("1h", description="Data timeframe"),
+    start_date: datetime | None = Query(None, description="Start date"),
+    end_date: datetime | None = Query(None, description="End date"),
+) -> dict[str, Any]:
+    """Report data-quality issues of historical data.
+
+    Args:
+        exchange: Exchange name.
+        symbol: Trading symbol.
+        timeframe: Data timeframe.
+        start_date: Start date for data.
+        end_date: End date for data.
+
+    Returns:
+        Duplicates, gaps, OHLC violations and outliers found in the data.
+    """
+    try:
+        report = data_manager.validate_data(
+            symbol, exchange, timeframe, start_date, end_date
+        )
+        return {"symbol": symbol, "timeframe": timeframe, **report.to_dict()}
+    except Exception as e:
+        logger.error("Failed to validate data: %s", e)
+        raise HTTPException(status_code=500, detail=f"Failed to validate data: {e}")
+
+
+@router.get("/data/catalog")
+async def get_data_catalog() -> dict[str, Any]:
+    """List every cached dataset.
+
+    Returns:
+        Coverage, candle count, gaps and checksum of each dataset, served
+        from the catalog without reading candle files.
+    """
+    try:
+        datasets = data_manager.get_catalog()
+        return {"datasets": datasets, "total": len(datasets)}
+    except Exception as e:
+        logger.error("Failed to get data catalog: %s", e)
+        raise HTTPException(status_code=500, detail=f"Failed to get data catalog: {e}")
+
+
 @router.post("/data/download")
 async def download_data(
     symbols: list[str] = Query(..., description="Trading symbols"),
     exchange: Exchange = Query(..., description="Exchange"),
     timeframes: list[str] = Query(["1h"], description="Data timeframes"),
     days_back: int = Query(365, description="Days to download", ge=1, le=1095),
+    background: bool = Query(True, description="Return before it completes"),
 ) -> dict[str, Any]:
     """Download historical data.
 
+    Downloads run concurrently on the event loop, so the API stays
+    responsive. In the background the job id is returned immediately and
+    progress is available from ``/data/download/{job_id}``.
+
     Args:
         symbols: List of trading symbols.
         exchange: Exchange name.
         timeframes: List of timeframes.
         days_back: Number of days to download.
+        background: Return the job id instead of waiting for the download.
 
     Returns:
-        Download results.
+        Download job state with progress per symbol and timeframe.
     """
     try:
         logger.info("Starting bulk data download for %d symbols", len(symbols))
 
-        results = data_manager.download_bulk_data(
-            symbols=symbols,
-            exchange=exchange,
-            timeframes=timeframes,
-            days_back=days_back,
-        )
-
-        # Summary statistics
-        summary = {
-            "total_symbols": len(symbols),
-            "total_timeframes": len(timeframes),
-            "successful_downloads": 0,
-            "failed_downloads": 0,
-            "details": {},
-        }
-
-        for symbol, timeframe_data in results.items():
-            symbol_summary = {}
-            for timeframe, data in timeframe_data.items():
-                if not data.empty:
-                    summary["successful_downloads"] += 1
-                    symbol_summary[timeframe] = {
-                        "success": True,
-                        "candles": len(data),
-                        "start_date": data.index[0].isoformat()
-                        if len(data) > 0
-                        else None,
-                        "end_date": data.index[-1].isoformat()
-                        if len(data) > 0
-                        else None,
-                    }
-                else:
-                    summary["failed_downloads"] += 1
-                    symbol_summary[timeframe] = {"success": False}
-
-            summary["details"][symbol] = symbol_summary
+        job = BulkDownloadJob(bulk_downloader, symbols, exchange, timeframes, days_back)
+        download_jobs[job.job_id] = job
+        # Forget the oldest finished jobs
+        finished = [j for j in download_jobs.values() if j.finished_at is not None]
+        for old_job in finished[: max(0, len(download_jobs) - MAX_DOWNLOAD_JOBS)]:
+            del download_jobs[old_job.job_id]
+        if background:
+            job.start()
+        else:
+            await job.run()
 
-        return {
-            "success": True,
-            "summary": summary,
-        }
+        return {"success": True, "summary": job.to_dict()}
 
     except Exception as e:
         logger.error("Data download failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Data download failed: {e}")
 
 
+@router.get("/data/download/{job_id}")
+async def get_download_job(job_id: str) -> dict[str, Any]:
+    """Get progress of a bulk download job.
+
+    Args:
+        job_id: Job id returned by ``/data/download``.
+
+    Returns:
+        Download job state with progress per symbol and timeframe.
+    """
+    job = download_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown download job: {job_id}")
+    return job.to_dict()
+
+
+@router.post("/data/refresh")
+async def refresh_data(
+    symbols: list[str] = Query(..., description="Trading symbols"),
+    exchange: Exchange = Query(..., description="Exchange"),
+    timeframes: list[str] = Query(["1h"], description="Data timeframes"),
+) -> dict[str, Any]:
+    """Append the candles after the last cached one for each series.
+
+    Args:
+        symbols: List of trading symbols.
+        exchange: Exchange name.
+        timeframes: List of timeframes.
+
+    Returns:
+        New candle counts per symbol and timeframe.
+    """
+    details: dict[str, dict[str, Any]] = {}
+
+    for symbol in symbols:
+        details[symbol] = {}
+        for timeframe in timeframes:
+            try:
+                data = await asyncio.to_thread(
+                    data_manager.refresh_tail, symbol, exchange, timeframe
+                )
+                details[symbol][timeframe] = {
+                    "success": True,
+                    "candles": len(data),
+                    "end_date": data.index[-1].isoformat() if len(data) else None,
+                }
+            except Exception as e:
+                logger.error("Failed to refresh %s %s: %s", symbol, timeframe, e)
+                details[symbol][timeframe] = {"success": False, "error": str(e)}
+
+    return {"success": True, "details": details}
+
+
+@router.get("/cache/indicators")
+async def get_indicator_cache_stats() -> dict[str, Any]:
+    """Get indicator cache statistics.
+
+    Returns:
+        Hit/miss counters and memory usage of the indicator cache.
+    """
+    return indicator_cache.get_stats()
+
+
+@router.get("/cache/results")
+async def get_result_cache_stats() -> dict[str, Any]:
+    """Get backtest result cache statistics.
+
+    Returns:
+        Hit/miss counters and disk usage of the result cache.
+    """
+    return result_cache.get_stats()
+
+
+@router.delete("/cache/results")
+async def clear_result_cache() -> dict[str, Any]:
+    """Clear the backtest result cache.
+
+    Returns:
+        Success message.
+    """
+    result_cache.clear()
+    return {"success": True, "message": "Result cache cleared"}
+
+
 @router.get("/metrics")
 async def get_backtest_metrics() -> list[str]:
     """Get available backtest metrics for optimization.
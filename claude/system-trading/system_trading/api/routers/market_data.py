@@ -1,11 +1,17 @@
 """Market data API endpoints."""
 
+import asyncio
 import logging
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, WebSocket, WebSocketDisconnect
 
 from system_trading.data.models import Exchange, MarketData, Ticker
+from system_trading.exchanges.streaming import (
+    CHANNELS,
+    MarketDataStream,
+    Subscription,
+)
 from system_trading.exchanges.unified_client import UnifiedExchangeClient
 
 logger = logging.getLogger(__name__)
@@ -15,6 +21,50 @@ router = APIRouter(prefix="/api/market", tags=["market_data"])
 # Global client instance
 client = UnifiedExchangeClient()
 
+# Streams opened by WebSocket subscribers, by exchange
+streams: dict[Exchange, MarketDataStream] = {}
+# Keeps subscribers from joining a stream that is being stopped
+streams_lock = asyncio.Lock()
+
+# Seconds a streamed ticker is served before falling back to REST
+STREAM_MAX_AGE = 10.0
+
+
+async def get_stream(exchange: Exchange, symbols: list[str]) -> MarketDataStream:
+    """Get the running stream of an exchange, subscribed to the symbols."""
+    if exchange not in streams:
+        streams[exchange] = MarketDataStream(exchange)
+        await streams[exchange].start()
+    await streams[exchange].add_symbols(symbols)
+    return streams[exchange]
+
+
+async def open_subscription(
+    exchange: Exchange, symbols: list[str], channels: list[str]
+) -> Subscription:
+    """Subscribe to the stream of an exchange, starting it if needed."""
+    async with streams_lock:
+        stream = await get_stream(exchange, symbols)
+        return stream.subscribe(channels, symbols)
+
+
+async def close_subscription(exchange: Exchange, subscription: Subscription) -> None:
+    """Close a subscription and stop its stream once nobody listens."""
+    subscription.close()
+    async with streams_lock:
+        stream = subscription.stream
+        if stream.subscribers == 0 and streams.get(exchange) is stream:
+            del streams[exchange]
+            await stream.stop()
+            logger.info("Stopped idle %s stream", exchange.value)
+
+
+async def close_streams() -> None:
+    """Stop every stream."""
+    for stream in streams.values():
+        await stream.stop()
+    streams.clear()
+
 
 @router.get("/ticker/{exchange}/{symbol}")
 async def get_ticker(
@@ -31,6 +81,12 @@ async def get_ticker(
         Ticker data.
     """
     try:
+        stream = streams.get(exchange)
+        if stream is not None:
+            ticker = stream.get_ticker(symbol, max_age=STREAM_MAX_AGE)
+            if ticker is not None:
+                return ticker
+
         ticker = await client.get_ticker(symbol, exchange)
         return ticker
     except Exception as e:
@@ -101,8 +157,7 @@ async def get_available_symbols(exchange: Exchange) -> list[str]:
         List of available symbols.
     """
     try:
-        ex = client.get_exchange(exchange)
-        markets = ex.load_markets()
+        markets = await client.load_markets(exchange)
         symbols = list(markets.keys())
         return symbols
     except Exception as e:
@@ -131,8 +186,8 @@ async def get_exchange_status(exchange: Exchange) -> dict[str, Any]:
         Exchange status information.
     """
     try:
-        ex = client.get_exchange(exchange)
-        status = ex.fetch_status()
+        ex = client.get_async_exchange(exchange)
+        status = await ex.fetch_status()
 
         return {
             "exchange": exchange.value,
@@ -164,15 +219,14 @@ async def get_multiple_prices(
     """
     try:
         symbol_list = [s.strip() for s in symbols.split(",")]
-        prices = {}
+        tickers = await client.get_tickers(symbol_list, exchange)
 
+        prices = {}
         for symbol in symbol_list:
-            try:
-                ticker = await client.get_ticker(symbol, exchange)
-                prices[symbol] = float(ticker.last)
-            except Exception as e:
-                logger.warning("Failed to get price for %s: %s", symbol, e)
-                prices[symbol] = None
+            ticker = tickers.get(symbol)
+            if ticker is None:
+                logger.warning("Failed to get price for %s", symbol)
+            prices[symbol] = float(ticker.last) if ticker else None
 
         return prices
     except Exception as e:
@@ -197,3 +251,68 @@ async def get_supported_timeframes(exchange: Exchange) -> list[str]:
     except Exception as e:
         logger.error("Failed to get timeframes for %s: %s", exchange, e)
         raise HTTPException(status_code=500, detail=f"Failed to get timeframes: {e}")
+
+
+@router.get("/cache/stats")
+async def get_cache_stats() -> dict[str, Any]:
+    """Get hit, miss and coalesce counts of the market data cache.
+
+    Returns:
+        Cache statistics per endpoint.
+    """
+    return client.get_cache_stats()
+
+
+@router.get("/stream/status")
+async def get_stream_status() -> list[dict[str, Any]]:
+    """Get connection and traffic counters of the running streams.
+
+    Returns:
+        Stream statistics.
+    """
+    return [stream.get_stats() for stream in streams.values()]
+
+
+@router.websocket("/stream/{exchange}")
+async def stream_market_data(
+    websocket: WebSocket,
+    exchange: Exchange,
+    symbols: str = Query(..., description="Comma-separated symbols"),
+    channels: str = Query(",".join(CHANNELS), description="Comma-separated channels"),
+) -> None:
+    """Push ticker, trade and kline updates as they arrive.
+
+    Args:
+        websocket: Client connection.
+        exchange: Exchange name.
+        symbols: Comma-separated trading symbols.
+        channels: Comma-separated channels (ticker, trade, kline).
+    """
+    symbol_list = [s.strip() for s in symbols.split(",")]
+    channel_list = [c.strip() for c in channels.split(",")]
+    await websocket.accept()
+
+    subscription = await open_subscription(exchange, symbol_list, channel_list)
+
+    async def forward() -> None:
+        async for event in subscription:
+            await websocket.send_json(event.to_dict())
+
+    async def wait_disconnect() -> None:
+        # Quiet symbols send nothing, so watch the socket itself
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+
+    tasks = [asyncio.create_task(forward()), asyncio.create_task(wait_disconnect())]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            task.result()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await close_subscription(exchange, subscription)
+        logger.debug("Stream subscriber for %s disconnected", exchange)
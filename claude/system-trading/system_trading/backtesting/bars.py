@@ -0,0 +1,357 @@
+"""Streaming aggregation of public trades into time and information bars."""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+import ccxt
+import pandas as pd
+
+from system_trading.backtesting.resample import bucket_starts, timeframe_to_timedelta
+
+# (timestamp in ms, price, amount)
+TradeTick = tuple[int, float, float]
+# (opening time in ms, open, high, low, close, volume)
+Bar = tuple[int, float, float, float, float, float]
+
+
+class BarAggregator:
+    """Incremental OHLCV bar builder fed one trade at a time.
+
+    Each trade costs O(1) work and the state is a handful of scalars, so
+    memory stays constant however many trades flow through. Subclasses
+    decide when a bar closes.
+    """
+
+    def __init__(self) -> None:
+        """Initialize bar aggregator."""
+        self._open_time: int | None = None
+        self._open = self._high = self._low = self._close = 0.0
+        self._volume = 0.0
+        self._dollars = 0.0
+        self._trades = 0
+
+    @property
+    def name(self) -> str:
+        """Get the series name the bars are stored under."""
+        raise NotImplementedError
+
+    def update(self, timestamp: int, price: float, amount: float) -> Bar | None:
+        """Add a trade.
+
+        Args:
+            timestamp: Trade time in milliseconds.
+            price: Trade price.
+            amount: Traded base amount.
+
+        Returns:
+            The bar completed by this trade, if any.
+        """
+        completed = None
+        if self._open_time is not None and self._starts_new_bar(timestamp):
+            completed = self._emit()
+
+        if self._open_time is None:
+            self._open_time = self._bar_time(timestamp)
+            self._open = self._high = self._low = price
+        elif price > self._high:
+            self._high = price
+        elif price < self._low:
+            self._low = price
+        self._close = price
+        self._volume += amount
+        self._dollars += price * amount
+        self._trades += 1
+
+        if self._is_complete():
+            return self._emit()
+        return completed
+
+    def flush(self) -> Bar | None:
+        """Close the bar being built, if any, and return it."""
+        return self._emit() if self._open_time is not None else None
+
+    def _emit(self) -> Bar:
+        """Return the current bar and start a new one."""
+        open_time = self._open_time
+        assert open_time is not None
+        bar = (
+            open_time,
+            self._open,
+            self._high,
+            self._low,
+            self._close,
+            self._volume,
+        )
+        self._reset()
+        return bar
+
+    def _reset(self) -> None:
+        """Clear the bar being built."""
+        self._open_time = None
+        self._open = self._high = self._low = self._close = 0.0
+        self._volume = 0.0
+        self._dollars = 0.0
+        self._trades = 0
+
+    def _bar_time(self, timestamp: int) -> int:
+        """Get the opening time of a bar whose first trade is at a time."""
+        return timestamp
+
+    def _starts_new_bar(self, timestamp: int) -> bool:
+        """Check whether a trade belongs to a new bar."""
+        return False
+
+    def _is_complete(self) -> bool:
+        """Check whether the bar being built is complete."""
+        return False
+
+
+class TimeBarAggregator(BarAggregator):
+    """Bars covering fixed time intervals, aligned like exchange candles.
+
+    A bar closes when the first trade of a later interval arrives; intervals
+    without trades produce no bar. Late trades from an earlier interval are
+    merged into the current bar.
+    """
+
+    def __init__(self, timeframe: str) -> None:
+        """Initialize time bar aggregator.
+
+        Args:
+            timeframe: Bar interval (e.g. ``"1m"``, ``"4h"``, ``"1w"``).
+        """
+        self.timeframe = timeframe
+        self._step = timeframe_to_timedelta(timeframe).value // 1_000_000
+        epoch = pd.DatetimeIndex([pd.Timestamp(0)])
+        self._origin = int(bucket_starts(epoch, timeframe)[0]) // 1_000_000 % self._step
+        super().__init__()
+
+    @property
+    def name(self) -> str:
+        """Get the series name the bars are stored under."""
+        return f"time-{self.timeframe}"
+
+    def _bar_time(self, timestamp: int) -> int:
+        """Get the opening time of the interval holding a time."""
+        return (timestamp - self._origin) // self._step * self._step + self._origin
+
+    def _starts_new_bar(self, timestamp: int) -> bool:
+        """Check whether a trade falls after the current interval."""
+        open_time = self._open_time
+        assert open_time is not None
+        return timestamp >= open_time + self._step
+
+
+class ThresholdBarAggregator(BarAggregator):
+    """Bars closing once a running total reaches a threshold.
+
+    Trades are never split, so the total of a bar may exceed the threshold
+    by the last trade. Bars are stamped with the time of their first trade.
+    """
+
+    KIND = ""
+
+    def __init__(self, threshold: float) -> None:
+        """Initialize threshold bar aggregator.
+
+        Args:
+            threshold: Total that completes a bar.
+        """
+        if threshold <= 0:
+            raise ValueError(f"Bar threshold must be positive: {threshold}")
+        self.threshold = threshold
+        super().__init__()
+
+    @property
+    def name(self) -> str:
+        """Get the series name the bars are stored under."""
+        threshold = format(self.threshold, "f").rstrip("0").rstrip(".")
+        return f"{self.KIND}-{threshold}"
+
+    def _is_complete(self) -> bool:
+        """Check whether the running total reached the threshold."""
+        return self._total() >= self.threshold
+
+    def _total(self) -> float:
+        """Get the running total of the bar being built."""
+        raise NotImplementedError
+
+
+class TickBarAggregator(ThresholdBarAggregator):
+    """Bars of a fixed number of trades."""
+
+    KIND = "tick"
+
+    def _total(self) -> float:
+        """Get the number of trades in the bar."""
+        return self._trades
+
+
+class VolumeBarAggregator(ThresholdBarAggregator):
+    """Bars of a fixed traded base amount."""
+
+    KIND = "volume"
+
+    def _total(self) -> float:
+        """Get the traded base amount of the bar."""
+        return self._volume
+
+
+class DollarBarAggregator(ThresholdBarAggregator):
+    """Bars of a fixed traded quote value."""
+
+    KIND = "dollar"
+
+    def _total(self) -> float:
+        """Get the traded quote value of the bar."""
+        return self._dollars
+
+
+BAR_TYPES: dict[str, Callable[[Any], BarAggregator]] = {
+    "time": TimeBarAggregator,
+    "tick": TickBarAggregator,
+    "volume": VolumeBarAggregator,
+    "dollar": DollarBarAggregator,
+}
+
+
+def create_aggregator(bar_type: str, size: str) -> BarAggregator:
+    """Create a bar aggregator from its type and size.
+
+    Args:
+        bar_type: ``"time"``, ``"tick"``, ``"volume"`` or ``"dollar"``.
+        size: Timeframe of time bars, threshold of the others.
+
+    Returns:
+        Bar aggregator.
+    """
+    if bar_type not in BAR_TYPES:
+        raise ValueError(
+            f"Unknown bar type: {bar_type} (expected one of {list(BAR_TYPES)})"
+        )
+    return BAR_TYPES[bar_type](size if bar_type == "time" else float(size))
+
+
+def iter_bars(trades: Iterable[TradeTick], aggregator: BarAggregator) -> Iterator[Bar]:
+    """Yield bars as the trades completing them arrive."""
+    update = aggregator.update
+    for timestamp, price, amount in trades:
+        bar = update(timestamp, price, amount)
+        if bar is not None:
+            yield bar
+
+
+def read_trade_file(path: str | Path, chunksize: int = 100_000) -> Iterator[TradeTick]:
+    """Read recorded trades from a CSV file in constant memory.
+
+    The file needs ``timestamp`` (milliseconds or a date string), ``price``
+    and ``amount`` columns, in time order; compressed files are supported.
+
+    Args:
+        path: Trade file.
+        chunksize: Rows parsed at a time.
+
+    Yields:
+        Trades as ``(timestamp in ms, price, amount)``.
+    """
+    columns = ["timestamp", "price", "amount"]
+    for chunk in pd.read_csv(path, usecols=columns, chunksize=chunksize):
+        timestamps = chunk["timestamp"]
+        if not pd.api.types.is_numeric_dtype(timestamps):
+            timestamps = pd.to_datetime(timestamps).astype("int64") // 1_000_000
+        yield from zip(
+            timestamps.astype("int64").tolist(),
+            chunk["price"].astype(float).tolist(),
+            chunk["amount"].astype(float).tolist(),
+            strict=True,
+        )
+
+
+async def poll_exchange_trades(
+    exchange: ccxt.Exchange,
+    symbol: str,
+    since: int | None = None,
+    poll_interval: float = 1.0,
+) -> AsyncIterator[TradeTick]:
+    """Stream public trades of a symbol by polling the exchange.
+
+    Args:
+        exchange: CCXT exchange instance.
+        symbol: Trading symbol.
+        since: First trade time in milliseconds (latest trades if None).
+        poll_interval: Seconds to wait when no new trade arrived.
+
+    Yields:
+        Trades as ``(timestamp in ms, price, amount)``, each once.
+    """
+    seen: set[str] = set()
+    while True:
+        trades = await asyncio.to_thread(exchange.fetch_trades, symbol, since)
+        new = [trade for trade in trades if trade["id"] not in seen]
+        if not new:
+            await asyncio.sleep(poll_interval)
+            continue
+
+        for trade in new:
+            yield trade["timestamp"], float(trade["price"]), float(trade["amount"])
+
+        # Trades sharing the last timestamp come back with the next page
+        since = new[-1]["timestamp"]
+        seen = {trade["id"] for trade in new if trade["timestamp"] == since}
+
+
+class BarWriter:
+    """Buffer bars and hand them to the cache in batches.
+
+    The cache keys candles by time, and threshold bars of busy markets can
+    open within the same millisecond. Such bars are spaced one nanosecond
+    apart so each keeps its own row; replaying the same trades produces the
+    same keys.
+    """
+
+    def __init__(
+        self, save: Callable[[pd.DataFrame], None], batch_size: int = 10_000
+    ) -> None:
+        """Initialize bar writer.
+
+        Args:
+            save: Stores a DataFrame of bars.
+            batch_size: Bars buffered between saves.
+        """
+        self.save = save
+        self.batch_size = batch_size
+        self.written = 0
+        self._buffer: list[Bar] = []
+        self._last_time = -1
+
+    def add(self, bar: Bar) -> bool:
+        """Buffer a bar without saving.
+
+        Returns:
+            Whether the buffer is full and should be flushed.
+        """
+        # Keys in nanoseconds, strictly increasing
+        timestamp = max(bar[0] * 1_000_000, self._last_time + 1)
+        self._last_time = timestamp
+        self._buffer.append((timestamp, *bar[1:]))
+        return len(self._buffer) >= self.batch_size
+
+    def write(self, bar: Bar) -> None:
+        """Add a bar, saving the buffer once it is full."""
+        if self.add(bar):
+            self.flush()
+
+    def flush(self) -> None:
+        """Save the buffered bars."""
+        if not self._buffer:
+            return
+        frame = pd.DataFrame(
+            self._buffer,
+            columns=["timestamp", "open", "high", "low", "close", "volume"],
+        )
+        frame["timestamp"] = pd.to_datetime(frame["timestamp"], unit="ns")
+        self.save(frame.set_index("timestamp"))
+        self.written += len(self._buffer)
+        self._buffer.clear()
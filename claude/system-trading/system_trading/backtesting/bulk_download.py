@@ -0,0 +1,268 @@
+"""Asynchronous bulk download of OHLCV history."""
+
+import asyncio
+import logging
+import uuid
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any
+
+from system_trading.backtesting.data_manager import BacktestDataManager
+from system_trading.data.models import Exchange
+
+logger = logging.getLogger(__name__)
+
+
+class SeriesProgress:
+    """Download progress of one symbol/timeframe series."""
+
+    def __init__(self, symbol: str, timeframe: str) -> None:
+        """Initialize series progress.
+
+        Args:
+            symbol: Trading symbol.
+            timeframe: Data timeframe.
+        """
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.status = "pending"  # pending, running, done or failed
+        self.pages_done = 0
+        self.pages_total = 0
+        self.candles = 0
+        self.error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert progress to a dictionary."""
+        return {
+            "symbol": self.symbol,
+            "timeframe": self.timeframe,
+            "status": self.status,
+            "pages_done": self.pages_done,
+            "pages_total": self.pages_total,
+            "candles": self.candles,
+            "error": self.error,
+        }
+
+
+class BulkDownloader:
+    """Download many series concurrently on the event loop.
+
+    Every series runs as its own task; requests to the same exchange share
+    one semaphore bounding how many are in flight, on top of the exchange's
+    rate limiter. Candles are written to the cache as pages arrive, and one
+    failing series does not stop the others.
+    """
+
+    def __init__(
+        self,
+        data_manager: BacktestDataManager,
+        max_concurrency: int = 8,
+        checkpoint_pages: int = 20,
+    ) -> None:
+        """Initialize bulk downloader.
+
+        Args:
+            data_manager: Data manager owning the cache.
+            max_concurrency: Requests in flight per exchange.
+            checkpoint_pages: Contiguous pages between cache checkpoints.
+        """
+        self.data_manager = data_manager
+        self.max_concurrency = max_concurrency
+        self.checkpoint_pages = checkpoint_pages
+        self._semaphores: dict[Exchange, asyncio.Semaphore] = {}
+
+    def _get_semaphore(self, exchange: Exchange) -> asyncio.Semaphore:
+        """Get the request semaphore shared by downloads from an exchange."""
+        if exchange not in self._semaphores:
+            self._semaphores[exchange] = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphores[exchange]
+
+    async def download(
+        self,
+        symbols: list[str],
+        exchange: Exchange,
+        timeframes: list[str],
+        start_date: datetime,
+        end_date: datetime | None = None,
+        progress: dict[str, dict[str, SeriesProgress]] | None = None,
+        progress_callback: Callable[[SeriesProgress], None] | None = None,
+    ) -> dict[str, dict[str, SeriesProgress]]:
+        """Download every symbol/timeframe series into the cache.
+
+        Args:
+            symbols: Trading symbols.
+            exchange: Exchange name.
+            timeframes: Data timeframes.
+            start_date: First candle to download.
+            end_date: Last candle to download (defaults to now).
+            progress: Progress to update in place (created if None);
+                its series are the ones downloaded.
+            progress_callback: Called whenever a series makes progress.
+
+        Returns:
+            Nested dictionary: {symbol: {downloaded timeframe: SeriesProgress}}.
+        """
+        if progress is None:
+            progress = self.create_progress(symbols, timeframes)
+
+        await asyncio.gather(
+            *(
+                self._download_series(
+                    series, exchange, start_date, end_date, progress_callback
+                )
+                for by_timeframe in progress.values()
+                for series in by_timeframe.values()
+            )
+        )
+        return progress
+
+    def create_progress(
+        self, symbols: list[str], timeframes: list[str]
+    ) -> dict[str, dict[str, SeriesProgress]]:
+        """Create pending progress entries for every series to download.
+
+        Timeframes derived locally are replaced by the base timeframe they
+        are built from.
+        """
+        sources = dict.fromkeys(
+            self.data_manager.source_timeframe(timeframe) for timeframe in timeframes
+        )
+        return {
+            symbol: {
+                timeframe: SeriesProgress(symbol, timeframe) for timeframe in sources
+            }
+            for symbol in symbols
+        }
+
+    async def _download_series(
+        self,
+        progress: SeriesProgress,
+        exchange: Exchange,
+        start_date: datetime,
+        end_date: datetime | None,
+        progress_callback: Callable[[SeriesProgress], None] | None,
+    ) -> None:
+        """Download one series, recording its outcome in ``progress``."""
+
+        def on_page(pages_done: int, pages_total: int) -> None:
+            progress.pages_done = pages_done
+            progress.pages_total = pages_total
+            if progress_callback:
+                progress_callback(progress)
+
+        progress.status = "running"
+        try:
+            progress.candles = await self.data_manager.download_history_async(
+                progress.symbol,
+                exchange,
+                progress.timeframe,
+                start_date,
+                end_date,
+                semaphore=self._get_semaphore(exchange),
+                checkpoint_pages=self.checkpoint_pages,
+                progress_callback=on_page,
+            )
+            progress.status = "done"
+            logger.info(
+                "Downloaded %d candles for %s %s",
+                progress.candles,
+                progress.symbol,
+                progress.timeframe,
+            )
+        except Exception as e:
+            progress.status = "failed"
+            progress.error = str(e)
+            logger.error(
+                "Failed to download %s %s %s: %s",
+                progress.symbol,
+                exchange,
+                progress.timeframe,
+                e,
+            )
+
+        if progress_callback:
+            progress_callback(progress)
+
+
+class BulkDownloadJob:
+    """Bulk download running as a background task of the event loop."""
+
+    def __init__(
+        self,
+        downloader: BulkDownloader,
+        symbols: list[str],
+        exchange: Exchange,
+        timeframes: list[str],
+        days_back: int = 365,
+    ) -> None:
+        """Initialize bulk download job.
+
+        Args:
+            downloader: Downloader running the job.
+            symbols: Trading symbols.
+            exchange: Exchange name.
+            timeframes: Data timeframes.
+            days_back: Number of days to go back.
+        """
+        self.job_id = uuid.uuid4().hex
+        self.downloader = downloader
+        self.symbols = symbols
+        self.exchange = exchange
+        self.timeframes = timeframes
+        self.end_date = datetime.now()
+        self.start_date = self.end_date - timedelta(days=days_back)
+        self.progress = downloader.create_progress(symbols, timeframes)
+        self.created_at = datetime.now()
+        self.finished_at: datetime | None = None
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> "BulkDownloadJob":
+        """Schedule the job on the running event loop."""
+        self._task = asyncio.create_task(self.run())
+        return self
+
+    async def run(self) -> None:
+        """Run the download until every series is done or failed."""
+        try:
+            await self.downloader.download(
+                self.symbols,
+                self.exchange,
+                self.timeframes,
+                self.start_date,
+                self.end_date,
+                progress=self.progress,
+            )
+        finally:
+            self.finished_at = datetime.now()
+
+    @property
+    def status(self) -> str:
+        """Get the job status."""
+        if self.finished_at is not None:
+            return "finished"
+        return "running" if self._task is not None else "pending"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert job state to a dictionary."""
+        series = [
+            progress
+            for timeframes in self.progress.values()
+            for progress in timeframes.values()
+        ]
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "exchange": self.exchange.value,
+            "created_at": self.created_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "total_series": len(series),
+            "successful_downloads": sum(p.status == "done" for p in series),
+            "failed_downloads": sum(p.status == "failed" for p in series),
+            "details": {
+                symbol: {
+                    timeframe: progress.to_dict()
+                    for timeframe, progress in timeframes.items()
+                }
+                for symbol, timeframes in self.progress.items()
+            },
+        }
@@ -0,0 +1,506 @@
+"""Month-partitioned Parquet store for OHLCV candles."""
+
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from system_trading.backtesting.catalog import DATA_FILE, DataCatalog, file_checksum
+from system_trading.backtesting.resample import timeframe_to_timedelta
+from system_trading.backtesting.storage import StorageProfile, get_storage_profile
+
+logger = logging.getLogger(__name__)
+
+
+class CandleStore:
+    """Hive-style partitioned candle storage.
+
+    Candles live under
+    ``<root>/exchange=<exchange>/symbol=<symbol>/timeframe=<tf>/month=<YYYY-MM>/``
+    with one compacted Parquet file per month. Reads only open the months
+    overlapping the requested range, push the date filter down to the boundary
+    files and project the requested columns; writes rewrite only the months
+    that received new candles.
+
+    Tail refreshes ``append`` small ``segment-*.parquet`` files next to the
+    compacted file instead of rewriting it; reads merge them (the latest copy
+    of a timestamp wins) until ``compact`` folds them back in.
+
+    Every write also updates a ``DataCatalog`` (``<root>/catalog.sqlite``)
+    with the candle count, coverage, gaps and file checksums of the months it
+    touched, so bounds and statistics never open the candle files.
+
+    Files are encoded with a ``StorageProfile`` (dtypes and compression);
+    reads decode every file according to the profile it was written with.
+    """
+
+    FILE_NAME = DATA_FILE
+    CATALOG_NAME = "catalog.sqlite"
+    SEGMENT_PREFIX = "segment-"
+    INDEX_NAME = "timestamp"
+
+    def __init__(
+        self, root: str | Path, profile: str | StorageProfile = "default"
+    ) -> None:
+        """Initialize candle store.
+
+        Args:
+            root: Root directory of the store.
+            profile: Storage profile (or its name) of written files.
+        """
+        self.root = Path(root)
+        self.profile = get_storage_profile(profile)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.catalog = DataCatalog(self.root / self.CATALOG_NAME)
+        self._lock = threading.Lock()
+        # Month files and their catalog entries change together per series
+        self._series_locks: dict[Path, threading.Lock] = {}
+        self._last_segment_id = 0
+
+    def series_dir(self, exchange: str, symbol: str, timeframe: str) -> Path:
+        """Get the directory holding one exchange/symbol/timeframe series."""
+        safe_symbol = symbol.replace("/", "_").replace("-", "_")
+        return (
+            self.root
+            / f"exchange={exchange}"
+            / f"symbol={safe_symbol}"
+            / f"timeframe={timeframe}"
+        )
+
+    def partitions(
+        self,
+        exchange: str,
+        symbol: str,
+        timeframe: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> list[Path]:
+        """List partition files overlapping a date range, oldest first.
+
+        Within a month the compacted file comes first, followed by its
+        segments in the order they were appended.
+        """
+        series_dir = self.series_dir(exchange, symbol, timeframe)
+        if not series_dir.exists():
+            return []
+
+        first = self._month_key(start_date) if start_date else None
+        last = self._month_key(end_date) if end_date else None
+
+        files = []
+        for month_dir in sorted(series_dir.glob("month=*")):
+            month = month_dir.name.removeprefix("month=")
+            if (first and month < first) or (last and month > last):
+                continue
+            files.extend(self._month_files(month_dir))
+        return files
+
+    def exists(self, exchange: str, symbol: str, timeframe: str) -> bool:
+        """Check whether any candles are stored for a series."""
+        return bool(self.partitions(exchange, symbol, timeframe))
+
+    def read(
+        self,
+        exchange: str,
+        symbol: str,
+        timeframe: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame:
+        """Read candles of a date range.
+
+        Args:
+            exchange: Exchange name.
+            symbol: Trading symbol.
+            timeframe: Data timeframe.
+            start_date: First candle to read (inclusive).
+            end_date: Last candle to read (inclusive).
+            columns: Columns to load (all if None).
+
+        Returns:
+            OHLCV DataFrame with datetime index.
+        """
+        # Compaction deletes segments, so list and read them under the lock
+        with self._series_lock(self.series_dir(exchange, symbol, timeframe)):
+            files = self.partitions(exchange, symbol, timeframe, start_date, end_date)
+            return self._read_files(files, start_date, end_date, columns)
+
+    def _read_files(
+        self,
+        files: list[Path],
+        start_date: datetime | None,
+        end_date: datetime | None,
+        columns: list[str] | None,
+    ) -> pd.DataFrame:
+        """Read and merge partition files."""
+        if not files:
+            return pd.DataFrame()
+
+        frames = []
+        for file in files:
+            # Inner months are fully inside the range; only the boundary
+            # months need row filtering
+            filters = []
+            if start_date and file.parent == files[0].parent:
+                filters.append((self.INDEX_NAME, ">=", pd.Timestamp(start_date)))
+            if end_date and file.parent == files[-1].parent:
+                filters.append((self.INDEX_NAME, "<=", pd.Timestamp(end_date)))
+
+            frames.append(
+                self._read_file(file, columns=columns, filters=filters or None)
+            )
+
+        data = pd.concat(frames) if len(frames) > 1 else frames[0]
+        data.index = pd.to_datetime(data.index)
+        if any(file.name != self.FILE_NAME for file in files):
+            # Segments may repeat or precede candles of earlier files
+            data = data[~data.index.duplicated(keep="last")].sort_index()
+        return data
+
+    def write(
+        self, data: pd.DataFrame, exchange: str, symbol: str, timeframe: str
+    ) -> int:
+        """Upsert candles, rewriting only the months they fall into.
+
+        Args:
+            data: OHLCV DataFrame with datetime index.
+            exchange: Exchange name.
+            symbol: Trading symbol.
+            timeframe: Data timeframe.
+
+        Returns:
+            Number of partitions written.
+        """
+        if data.empty:
+            return 0
+
+        data = data.rename_axis(self.INDEX_NAME)
+        series_dir = self.series_dir(exchange, symbol, timeframe)
+        months = data.index.strftime("%Y-%m")
+
+        written = 0
+        for month, new_rows in data.groupby(months, sort=True):
+            month_dir = series_dir / f"month={month}"
+            month_dir.mkdir(parents=True, exist_ok=True)
+            self._compact_month(month_dir, (exchange, symbol, timeframe), new_rows)
+            written += 1
+
+        logger.debug(
+            "Wrote %d rows to %d partitions of %s %s %s",
+            len(data),
+            written,
+            exchange,
+            symbol,
+            timeframe,
+        )
+        return written
+
+    def append(
+        self, data: pd.DataFrame, exchange: str, symbol: str, timeframe: str
+    ) -> int:
+        """Append candles as new segments without rewriting existing files.
+
+        Intended for tail refreshes: the cost is proportional to the new
+        candles only. Candles repeating stored timestamps replace them on
+        read, and the catalog counts only candles after the month's last
+        stored one as new.
+
+        Args:
+            data: OHLCV DataFrame with datetime index.
+            exchange: Exchange name.
+            symbol: Trading symbol.
+            timeframe: Data timeframe.
+
+        Returns:
+            Number of segments written.
+        """
+        if data.empty:
+            return 0
+
+        data = data.rename_axis(self.INDEX_NAME)
+        series_dir = self.series_dir(exchange, symbol, timeframe)
+        months = data.index.strftime("%Y-%m")
+
+        series = (exchange, symbol, timeframe)
+        written = 0
+        for month, new_rows in data.groupby(months, sort=True):
+            month_dir = series_dir / f"month={month}"
+            month_dir.mkdir(parents=True, exist_ok=True)
+            segment = f"{self.SEGMENT_PREFIX}{self._next_segment_id():020d}.parquet"
+            with self._series_lock(series_dir):
+                self._ensure_cataloged(series)
+                entry = self.catalog.get_month(*series, month)
+                self._write_file(new_rows.sort_index(), month_dir / segment)
+                self._record_append(series, month_dir, entry, new_rows, segment)
+            written += 1
+
+        logger.debug(
+            "Appended %d rows as %d segments of %s %s %s",
+            len(data),
+            written,
+            exchange,
+            symbol,
+            timeframe,
+        )
+        return written
+
+    def compact(self, exchange: str, symbol: str, timeframe: str) -> int:
+        """Fold appended segments into the compacted file of their month.
+
+        Segments appended while compaction runs are kept for the next one.
+
+        Returns:
+            Number of months compacted.
+        """
+        series_dir = self.series_dir(exchange, symbol, timeframe)
+        if not series_dir.exists():
+            return 0
+
+        compacted = 0
+        for month_dir in sorted(series_dir.glob("month=*")):
+            if self._compact_month(month_dir, (exchange, symbol, timeframe)):
+                compacted += 1
+        return compacted
+
+    def _compact_month(
+        self,
+        month_dir: Path,
+        series: tuple[str, str, str],
+        new_rows: pd.DataFrame | None = None,
+    ) -> bool:
+        """Rewrite a month as one file, merging segments and new rows."""
+        with self._series_lock(month_dir.parent):
+            self._ensure_cataloged(series)
+            files = self._month_files(month_dir)
+            segments = [file for file in files if file.name != self.FILE_NAME]
+            if new_rows is None and not segments:
+                return False
+
+            frames = [self._read_file(file) for file in files]
+            if new_rows is not None:
+                frames.append(new_rows)
+            data = pd.concat(frames) if len(frames) > 1 else frames[0]
+            data.index = pd.to_datetime(data.index)
+            data = data[~data.index.duplicated(keep="last")].sort_index()
+            self._write_file(
+                data.rename_axis(self.INDEX_NAME), month_dir / self.FILE_NAME
+            )
+
+            for segment in segments:
+                segment.unlink(missing_ok=True)
+            self._record_month(series, month_dir, data.index.asi8)
+        return True
+
+    def _series_lock(self, series_dir: Path) -> threading.Lock:
+        """Get the lock serializing reads and writes of a series."""
+        with self._lock:
+            return self._series_locks.setdefault(series_dir, threading.Lock())
+
+    def _ensure_cataloged(self, series: tuple[str, str, str]) -> None:
+        """Catalog a series stored before the catalog existed."""
+        if self.catalog.get(*series) is None and self.exists(*series):
+            self._rebuild_series(series)
+
+    def _rebuild_series(self, series: tuple[str, str, str]) -> int:
+        """Catalog every month of a series from its files."""
+        self.catalog.remove(*series)
+        months = [
+            month_dir
+            for month_dir in sorted(self.series_dir(*series).glob("month=*"))
+            if self._month_files(month_dir)
+        ]
+        for month_dir in months:
+            self._rebuild_month(series, month_dir)
+        return len(months)
+
+    def _rebuild_month(self, series: tuple[str, str, str], month_dir: Path) -> None:
+        """Catalog a month from its files."""
+        frames = [
+            self._read_file(file, columns=["close"])
+            for file in self._month_files(month_dir)
+        ]
+        index = pd.to_datetime(pd.concat(frames).index).asi8
+        self._record_month(series, month_dir, np.unique(index))
+
+    def _record_month(
+        self, series: tuple[str, str, str], month_dir: Path, index_ns: np.ndarray
+    ) -> None:
+        """Catalog a month from its sorted, unique candle timestamps."""
+        step_ns = self._step_ns(series[2])
+        rows, start_ns, end_ns, gaps = self._index_stats(index_ns, step_ns)
+        files = {
+            file.name: self._file_entry(file) for file in self._month_files(month_dir)
+        }
+        self.catalog.put_month(
+            *series,
+            month_dir.name.removeprefix("month="),
+            rows,
+            start_ns,
+            end_ns,
+            gaps,
+            files,
+            step_ns,
+        )
+
+    def _record_append(
+        self,
+        series: tuple[str, str, str],
+        month_dir: Path,
+        entry: dict | None,
+        new_rows: pd.DataFrame,
+        segment: str,
+    ) -> None:
+        """Update the catalog entry of a month with an appended segment."""
+        step_ns = self._step_ns(series[2])
+        index_ns = np.unique(pd.to_datetime(new_rows.index).asi8)
+        if entry is None:
+            rows, start_ns, end_ns, gaps = self._index_stats(index_ns, step_ns)
+            files = {}
+        else:
+            # Candles up to the last stored one replace existing candles
+            tail = index_ns[index_ns > entry["end_ns"]]
+            gaps = (
+                entry["gaps"]
+                + self._index_stats(np.r_[entry["end_ns"], tail], step_ns)[3]
+            )
+            rows = entry["rows"] + len(tail)
+            start_ns = min(entry["start_ns"], int(index_ns[0]))
+            end_ns = max(entry["end_ns"], int(index_ns[-1]))
+            files = entry["files"]
+
+        files[segment] = self._file_entry(month_dir / segment)
+        self.catalog.put_month(
+            *series,
+            month_dir.name.removeprefix("month="),
+            rows,
+            start_ns,
+            end_ns,
+            gaps,
+            files,
+            step_ns,
+        )
+
+    @staticmethod
+    def _index_stats(
+        index_ns: np.ndarray, step_ns: int | None
+    ) -> tuple[int, int, int, list[list[int]]]:
+        """Get count, first, last and missing ranges of sorted timestamps."""
+        gaps = []
+        if step_ns:
+            missing = np.flatnonzero(np.diff(index_ns) > step_ns)
+            gaps = [
+                [int(index_ns[i]) + step_ns, int(index_ns[i + 1]) - step_ns]
+                for i in missing
+            ]
+        return len(index_ns), int(index_ns[0]), int(index_ns[-1]), gaps
+
+    @staticmethod
+    def _step_ns(timeframe: str) -> int | None:
+        """Get the candle spacing of a timeframe (None if irregular)."""
+        try:
+            return timeframe_to_timedelta(timeframe).value
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _file_entry(file: Path) -> list:
+        """Get the catalog entry of a file: ``[checksum, size]``."""
+        return [file_checksum(file), file.stat().st_size]
+
+    def _month_files(self, month_dir: Path) -> list[Path]:
+        """List the compacted file and segments of a month, oldest first."""
+        files = []
+        if (month_dir / self.FILE_NAME).exists():
+            files.append(month_dir / self.FILE_NAME)
+        files.extend(sorted(month_dir.glob(f"{self.SEGMENT_PREFIX}*.parquet")))
+        return files
+
+    def _read_file(self, file: Path, **kwargs: Any) -> pd.DataFrame:
+        """Read a Parquet file, undoing its storage encoding."""
+        return StorageProfile.decode(pd.read_parquet(file, **kwargs))
+
+    def _write_file(self, data: pd.DataFrame, file: Path) -> None:
+        """Write a Parquet file atomically."""
+        # Replace atomically so concurrent readers never see partial files
+        tmp_file = file.with_suffix(f".{threading.get_ident()}.tmp")
+        self.profile.to_parquet(data, tmp_file)
+        os.replace(tmp_file, file)
+
+    def _next_segment_id(self) -> int:
+        """Get an increasing segment id so names sort in append order."""
+        with self._lock:
+            self._last_segment_id = max(self._last_segment_id + 1, time.time_ns())
+            return self._last_segment_id
+
+    def catalog_entry(self, exchange: str, symbol: str, timeframe: str) -> dict | None:
+        """Get the catalog summary of a series.
+
+        Series stored before the catalog existed are cataloged on first use.
+
+        Returns:
+            Dataset summary (see ``DataCatalog``), or None if nothing is stored.
+        """
+        entry = self.catalog.get(exchange, symbol, timeframe)
+        if entry is None and self.exists(exchange, symbol, timeframe):
+            self.rebuild_catalog(exchange, symbol, timeframe)
+            entry = self.catalog.get(exchange, symbol, timeframe)
+        return entry
+
+    def rebuild_catalog(self, exchange: str, symbol: str, timeframe: str) -> int:
+        """Recatalog a series from its files.
+
+        Returns:
+            Number of months cataloged.
+        """
+        series = (exchange, symbol, timeframe)
+        with self._series_lock(self.series_dir(*series)):
+            return self._rebuild_series(series)
+
+    def bounds(
+        self, exchange: str, symbol: str, timeframe: str
+    ) -> tuple[pd.Timestamp, pd.Timestamp] | None:
+        """Get the first and last stored timestamps of a series."""
+        entry = self.catalog_entry(exchange, symbol, timeframe)
+        if entry is None:
+            return None
+        return pd.Timestamp(entry["start_ns"]), pd.Timestamp(entry["end_ns"])
+
+    def version(
+        self,
+        exchange: str,
+        symbol: str,
+        timeframe: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> str:
+        """Get a string that changes whenever partitions of a range change."""
+        parts = []
+        with self._series_lock(self.series_dir(exchange, symbol, timeframe)):
+            files = self.partitions(exchange, symbol, timeframe, start_date, end_date)
+            for file in files:
+                stat = file.stat()
+                parts.append(
+                    f"{file.parent.name}/{file.name}:{stat.st_mtime_ns}:{stat.st_size}"
+                )
+        return ",".join(parts)
+
+    def stats(self, exchange: str, symbol: str, timeframe: str) -> dict[str, int]:
+        """Get partition and segment counts and disk usage of a series."""
+        entry = self.catalog_entry(exchange, symbol, timeframe) or {}
+        return {
+            "partitions": entry.get("partitions", 0),
+            "segments": entry.get("segments", 0),
+            "file_size": entry.get("bytes", 0),
+            "last_modified_ns": int(entry.get("last_refresh", 0) * 1e9),
+        }
+
+    def _month_key(self, value: datetime) -> str:
+        """Get the partition key of a timestamp."""
+        return pd.Timestamp(value).strftime("%Y-%m")
@@ -0,0 +1,255 @@
+"""SQLite catalog of cached candle datasets."""
+
+import hashlib
+import json
+import sqlite3
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+# Compacted month file; every other file of a month is an appended segment
+DATA_FILE = "data.parquet"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS partitions (
+    exchange TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    timeframe TEXT NOT NULL,
+    month TEXT NOT NULL,
+    rows INTEGER NOT NULL,
+    start_ns INTEGER NOT NULL,
+    end_ns INTEGER NOT NULL,
+    gaps TEXT NOT NULL,
+    files TEXT NOT NULL,
+    PRIMARY KEY (exchange, symbol, timeframe, month)
+);
+CREATE TABLE IF NOT EXISTS datasets (
+    exchange TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    timeframe TEXT NOT NULL,
+    start_ns INTEGER NOT NULL,
+    end_ns INTEGER NOT NULL,
+    rows INTEGER NOT NULL,
+    gaps TEXT NOT NULL,
+    partitions INTEGER NOT NULL,
+    segments INTEGER NOT NULL,
+    bytes INTEGER NOT NULL,
+    checksum TEXT NOT NULL,
+    last_refresh REAL NOT NULL,
+    PRIMARY KEY (exchange, symbol, timeframe)
+);
+"""
+
+
+def file_checksum(path: Path) -> str:
+    """Get the BLAKE2b checksum of a file."""
+    digest = hashlib.blake2b(digest_size=16)
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DataCatalog:
+    """Catalog of stored candle datasets, updated on every write.
+
+    Each month partition has a row with its candle count, coverage, gaps
+    and the checksum and size of its files. Each dataset also has a
+    summary row that is recomputed whenever one of its months changes. So
+    looking up a dataset is a single primary-key read, and listing
+    everything never touches the candle files.
+
+    Gaps are ``[first missing, last missing]`` candle timestamps in UTC
+    nanoseconds.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize data catalog.
+
+        Args:
+            path: SQLite database file (created if missing).
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            # Readers do not block the writer and vice versa
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection committing on success."""
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get_month(
+        self, exchange: str, symbol: str, timeframe: str, month: str
+    ) -> dict[str, Any] | None:
+        """Get the entry of a month partition."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM partitions WHERE exchange = ? AND symbol = ? "
+                "AND timeframe = ? AND month = ?",
+                (exchange, symbol, timeframe, month),
+            ).fetchone()
+        return self._month_entry(row) if row else None
+
+    def put_month(
+        self,
+        exchange: str,
+        symbol: str,
+        timeframe: str,
+        month: str,
+        rows: int,
+        start_ns: int,
+        end_ns: int,
+        gaps: list[list[int]],
+        files: dict[str, list[Any]],
+        step_ns: int | None,
+    ) -> None:
+        """Record a month partition and refresh its dataset summary.
+
+        Args:
+            exchange: Exchange name.
+            symbol: Trading symbol.
+            timeframe: Data timeframe.
+            month: Partition key (``YYYY-MM``).
+            rows: Distinct candles in the month.
+            start_ns: First candle of the month.
+            end_ns: Last candle of the month.
+            gaps: Missing candle ranges inside the month.
+            files: ``{file name: [checksum, size]}`` of the month's files.
+            step_ns: Candle spacing used to find gaps between months.
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO partitions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    exchange,
+                    symbol,
+                    timeframe,
+                    month,
+                    rows,
+                    start_ns,
+                    end_ns,
+                    json.dumps(gaps),
+                    json.dumps(files),
+                ),
+            )
+            self._refresh_dataset(conn, exchange, symbol, timeframe, step_ns)
+
+    def _refresh_dataset(
+        self,
+        conn: sqlite3.Connection,
+        exchange: str,
+        symbol: str,
+        timeframe: str,
+        step_ns: int | None,
+    ) -> None:
+        """Recompute the summary row of a dataset from its months."""
+        months = [
+            self._month_entry(row)
+            for row in conn.execute(
+                "SELECT * FROM partitions WHERE exchange = ? AND symbol = ? "
+                "AND timeframe = ? ORDER BY month",
+                (exchange, symbol, timeframe),
+            )
+        ]
+        if not months:
+            conn.execute(
+                "DELETE FROM datasets WHERE exchange = ? AND symbol = ? "
+                "AND timeframe = ?",
+                (exchange, symbol, timeframe),
+            )
+            return
+
+        gaps: list[list[int]] = []
+        checksum = hashlib.blake2b(digest_size=16)
+        for previous, month in zip([None, *months[:-1]], months, strict=True):
+            # Candles missing between the end of a month and the next one
+            if (
+                previous
+                and step_ns
+                and month["start_ns"] - previous["end_ns"] > step_ns
+            ):
+                gaps.append([previous["end_ns"] + step_ns, month["start_ns"] - step_ns])
+            gaps.extend(month["gaps"])
+            for name, (digest, _) in sorted(month["files"].items()):
+                checksum.update(f"{month['month']}/{name}:{digest};".encode())
+
+        files = [entry for month in months for entry in month["files"].items()]
+        conn.execute(
+            "INSERT OR REPLACE INTO datasets "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                exchange,
+                symbol,
+                timeframe,
+                months[0]["start_ns"],
+                months[-1]["end_ns"],
+                sum(month["rows"] for month in months),
+                json.dumps(gaps),
+                len(months),
+                sum(name != DATA_FILE for name, _ in files),
+                sum(size for _, (_, size) in files),
+                checksum.hexdigest(),
+                time.time(),
+            ),
+        )
+
+    def remove(self, exchange: str, symbol: str, timeframe: str) -> None:
+        """Remove a dataset and its months from the catalog."""
+        key = (exchange, symbol, timeframe)
+        with self._connect() as conn:
+            conn.execute(
+                "DELETE FROM partitions WHERE exchange = ? AND symbol = ? "
+                "AND timeframe = ?",
+                key,
+            )
+            conn.execute(
+                "DELETE FROM datasets WHERE exchange = ? AND symbol = ? "
+                "AND timeframe = ?",
+                key,
+            )
+
+    def get(self, exchange: str, symbol: str, timeframe: str) -> dict[str, Any] | None:
+        """Get the summary of a dataset.
+
+        Returns:
+            Dataset summary, or None if nothing is stored.
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM datasets WHERE exchange = ? AND symbol = ? "
+                "AND timeframe = ?",
+                (exchange, symbol, timeframe),
+            ).fetchone()
+        return self._dataset_entry(row) if row else None
+
+    def list_datasets(self) -> list[dict[str, Any]]:
+        """List the summaries of every dataset."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM datasets ORDER BY exchange, symbol, timeframe"
+            ).fetchall()
+        return [self._dataset_entry(row) for row in rows]
+
+    def _month_entry(self, row: sqlite3.Row) -> dict[str, Any]:
+        """Convert a partition row to a dictionary."""
+        entry = dict(row)
+        entry["gaps"] = json.loads(entry["gaps"])
+        entry["files"] = json.loads(entry["files"])
+        return entry
+
+    def _dataset_entry(self, row: sqlite3.Row) -> dict[str, Any]:
+        """Convert a dataset row to a dictionary."""
+        entry = dict(row)
+        entry["gaps"] = json.loads(entry["gaps"])
+        return entry
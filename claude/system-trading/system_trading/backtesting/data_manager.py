@@ -1,30 +1,141 @@
 """Data management for backtesting."""
 
+import asyncio
+import contextlib
+import functools
+import hashlib
 import logging
+import os
+import shutil
+import threading
+from collections.abc import AsyncIterable, Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+import ccxt
 import pandas as pd
 
+from system_trading.backtesting.bars import (
+    BarAggregator,
+    BarWriter,
+    TradeTick,
+    iter_bars,
+)
+from system_trading.backtesting.candle_store import CandleStore
+from system_trading.backtesting.parallel import SharedOHLCV
+from system_trading.backtesting.resample import (
+    bucket_starts,
+    can_resample,
+    parse_timeframe,
+    resample_ohlcv,
+    timeframe_to_timedelta,
+)
+from system_trading.backtesting.storage import StorageProfile
+from system_trading.backtesting.validation import DataValidator, ValidationReport
 from system_trading.data.models import Exchange
 from system_trading.exchanges.unified_client import UnifiedExchangeClient
+from system_trading.utils.retry import RateLimiter, retry_sync
 
 logger = logging.getLogger(__name__)
 
+# Maximum candles returned by one OHLCV request
+PAGE_LIMITS = {Exchange.BINANCE: 1000, Exchange.UPBIT: 200}
+DEFAULT_PAGE_LIMIT = 500
+
+
+def _to_milliseconds(value: datetime) -> int:
+    """Convert a datetime (naive values are UTC) to epoch milliseconds."""
+    return int(pd.Timestamp(value).value // 1_000_000)
+
+
+class _PageCheckpoints:
+    """Collect downloaded pages and checkpoint their contiguous prefix."""
+
+    def __init__(
+        self, checkpoint: Callable[[pd.DataFrame], None] | None, every: int
+    ) -> None:
+        """Initialize page checkpoints.
+
+        Args:
+            checkpoint: Stores a run of contiguous pages (None to only collect).
+            every: Contiguous pages between checkpoints.
+        """
+        self.pages: dict[int, pd.DataFrame] = {}
+        self.contiguous = 0
+        self._checkpoint = checkpoint
+        self._every = every
+        self._unsaved: list[pd.DataFrame] = []
+
+    def add(self, index: int, page: pd.DataFrame) -> bool:
+        """Add a page without checkpointing.
+
+        Returns:
+            Whether enough contiguous pages are unsaved to checkpoint them.
+        """
+        self.pages[index] = page
+
+        # Checkpoint the run of pages that has no holes before it
+        while self.contiguous in self.pages:
+            self._unsaved.append(self.pages[self.contiguous])
+            self.contiguous += 1
+        return len(self._unsaved) >= self._every
+
+    def flush(self) -> None:
+        """Checkpoint the unsaved contiguous pages."""
+        if self._checkpoint and self._unsaved:
+            self._checkpoint(pd.concat(self._unsaved))
+        self._unsaved.clear()
+
+    def result(self, n_pages: int) -> pd.DataFrame:
+        """Concatenate all pages in order."""
+        frames = [self.pages[i] for i in range(n_pages)]
+        return pd.concat(frames) if frames else pd.DataFrame()
+
 
 class BacktestDataManager:
     """Manages historical data for backtesting."""
 
-    def __init__(self, data_dir: str = "data") -> None:
+    def __init__(
+        self,
+        data_dir: str = "data",
+        compact_segments: int = 8,
+        base_timeframe: str | None = "1h",
+        validator: DataValidator | None = None,
+        storage_profile: str | StorageProfile = "default",
+    ) -> None:
         """Initialize data manager.
 
         Args:
             data_dir: Directory to store historical data.
+            compact_segments: Appended segments of a series that trigger a
+                background compaction.
+            base_timeframe: Timeframe that is downloaded; coarser timeframes
+                made of whole base candles are derived from it locally
+                (None downloads every timeframe).
+            validator: Data-quality validator and repair policy of backtest
+                data (drops invalid candles by default).
+            storage_profile: Encoding and compression of cached candle files
+                (a ``StorageProfile`` or one of ``STORAGE_PROFILES``).
         """
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
         self.client = UnifiedExchangeClient()
+        self.store = CandleStore(self.data_dir / "candles", storage_profile)
+        self.shared_dir = self.data_dir / "mmap"
+        self.derived_dir = self.data_dir / "derived"
+        self.validated_dir = self.data_dir / "validated"
+        self.validator = validator or DataValidator()
+        self.base_timeframe = base_timeframe
+        self.compact_segments = compact_segments
+        # Request budget shared by all downloads from the same exchange
+        self._rate_limiters: dict[Exchange, RateLimiter] = {}
+        self._rate_limiters_lock = threading.Lock()
+        # Single background thread folding appended segments into partitions
+        self._compactor: ThreadPoolExecutor | None = None
+        self._compactions: dict[tuple[Exchange, str, str], Future] = {}
+        self._compactions_lock = threading.Lock()
 
     def get_historical_data(
         self,
@@ -50,26 +161,59 @@ class BacktestDataManager:
         Returns:
             OHLCV DataFrame with datetime index.
         """
-        try:
-            # Generate cache filename
-            cache_file = self._get_cache_filename(symbol, exchange, timeframe)
+        if use_cache and self._is_derived(timeframe):
+            return self.get_resampled_data(
+                symbol, exchange, timeframe, start_date, end_date, limit
+            )
 
+        try:
             # Try to load from cache first
-            if use_cache and cache_file.exists():
-                cached_data = self._load_cached_data(cache_file)
-                if self._is_cache_valid(cached_data, start_date, end_date):
-                    logger.info(
-                        "Using cached data for %s %s %s", symbol, exchange, timeframe
-                    )
-                    return self._filter_data_by_date(cached_data, start_date, end_date)
+            bounds = (
+                self._get_cache_bounds(symbol, exchange, timeframe)
+                if use_cache
+                else None
+            )
+            if bounds and self._is_range_valid(*bounds, start_date, end_date):
+                logger.info(
+                    "Using cached data for %s %s %s", symbol, exchange, timeframe
+                )
+                return self.store.read(
+                    exchange.value, symbol, timeframe, start_date, end_date
+                )
 
             # Fetch fresh data
             logger.info("Fetching fresh data for %s %s %s", symbol, exchange, timeframe)
-            data = self.client.get_ohlcv_dataframe(symbol, exchange, timeframe, limit)
+            if bounds and not start_date:
+                # Stale cache: append the missing tail instead of refetching
+                self.refresh_tail(symbol, exchange, timeframe)
+                window = pd.Timedelta(
+                    milliseconds=limit * self._timeframe_ms(exchange, timeframe)
+                )
+                data = self.store.read(
+                    exchange.value,
+                    symbol,
+                    timeframe,
+                    start_date=pd.Timestamp(end_date or datetime.now()) - window,
+                    end_date=end_date,
+                ).iloc[-limit:]
+            elif start_date:
+                # Page through the whole range; this also updates the cache
+                data = self.download_history(
+                    symbol,
+                    exchange,
+                    timeframe,
+                    start_date,
+                    end_date,
+                    use_cache=use_cache,
+                )
+            else:
+                data = self.client.get_ohlcv_dataframe(
+                    symbol, exchange, timeframe, limit
+                )
 
-            # Cache the data
-            if use_cache:
-                self._save_cached_data(data, cache_file)
+                # Cache the data
+                if use_cache:
+                    self._save_cached_data(data, symbol, exchange, timeframe)
 
             # Filter by date range
             if start_date or end_date:
@@ -81,6 +225,668 @@ class BacktestDataManager:
             logger.error("Failed to get historical data for %s: %s", symbol, e)
             raise
 
+    def get_resampled_data(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        timeframe: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        limit: int = 1000,
+    ) -> pd.DataFrame:
+        """Get candles of a timeframe derived from the base timeframe.
+
+        Base candles are loaded from the start of the first requested bar, so
+        bars are complete; a bar still forming at the end is left out.
+        Derived frames are cached under the fingerprint of the base candles
+        they were built from, so refreshing those candles invalidates them.
+
+        Args:
+            symbol: Trading symbol.
+            exchange: Exchange name.
+            timeframe: Target timeframe (e.g. ``"2h"``, ``"6h"``, ``"1d"``).
+            start_date: Start date for data.
+            end_date: End date for data.
+            limit: Number of bars when no start date is given.
+
+        Returns:
+            OHLCV DataFrame with datetime index.
+        """
+        base_timeframe = self.base_timeframe
+        if base_timeframe is None or not can_resample(timeframe, base_timeframe):
+            raise ValueError(f"Cannot derive {timeframe} from {base_timeframe}")
+
+        if start_date is None:
+            # Enough base history for ``limit`` bars before the end
+            count, unit = parse_timeframe(timeframe)
+            bar = (
+                pd.Timedelta(days=31 * count)
+                if unit == "M"
+                else timeframe_to_timedelta(timeframe)
+            )
+            base_start = pd.Timestamp(end_date or datetime.now()) - bar * (limit + 1)
+        else:
+            base_start = pd.Timestamp(start_date)
+
+        # Align to the opening of the first bar so it is built from all candles
+        base_start = self._bar_start(base_start, timeframe)
+
+        fingerprint = self.get_data_fingerprint(
+            symbol, exchange, base_timeframe, base_start, end_date
+        )
+        series_dir = self.derived_dir / self.store.series_dir(
+            exchange.value, symbol, timeframe
+        ).relative_to(self.store.root)
+
+        if fingerprint is not None:
+            cache_file = series_dir / f"{self._export_key(fingerprint, False)}.parquet"
+            if cache_file.exists():
+                data = pd.read_parquet(cache_file)
+                data.index = pd.to_datetime(data.index)
+                return self._limit_bars(data, start_date, limit)
+
+        base = self.get_historical_data(
+            symbol, exchange, base_timeframe, base_start, end_date
+        )
+        data = resample_ohlcv(base, timeframe, base_timeframe)
+        logger.info(
+            "Derived %d %s candles of %s from %d %s candles",
+            len(data),
+            timeframe,
+            symbol,
+            len(base),
+            base_timeframe,
+        )
+
+        fingerprint = self.get_data_fingerprint(
+            symbol, exchange, base_timeframe, base_start, end_date
+        )
+        if fingerprint is not None:
+            self._save_derived(data, series_dir, self._export_key(fingerprint, False))
+
+        return self._limit_bars(data, start_date, limit)
+
+    def source_timeframe(self, timeframe: str) -> str:
+        """Get the timeframe that is downloaded to serve a timeframe."""
+        if self.base_timeframe and can_resample(timeframe, self.base_timeframe):
+            return self.base_timeframe
+        return timeframe
+
+    def _is_derived(self, timeframe: str) -> bool:
+        """Check whether a timeframe is derived from the base timeframe."""
+        return self.base_timeframe is not None and can_resample(
+            timeframe, self.base_timeframe
+        )
+
+    def _bar_start(self, timestamp: datetime, timeframe: str) -> pd.Timestamp:
+        """Get the opening time of the bar of a timeframe holding a timestamp."""
+        timestamp = pd.Timestamp(timestamp)
+        aligned = bucket_starts(pd.DatetimeIndex([timestamp]), timeframe)[0]
+        if timestamp.tz is not None:
+            return pd.Timestamp(aligned, tz="UTC").tz_convert(timestamp.tz)
+        return pd.Timestamp(aligned)
+
+    def _limit_bars(
+        self, data: pd.DataFrame, start_date: datetime | None, limit: int
+    ) -> pd.DataFrame:
+        """Trim derived bars to the requested start or the last ``limit``."""
+        if start_date is not None:
+            return data[data.index >= start_date]
+        return data.iloc[-limit:]
+
+    def _save_derived(self, data: pd.DataFrame, series_dir: Path, key: str) -> None:
+        """Cache derived candles, replacing those built from older data."""
+        try:
+            series_dir.mkdir(parents=True, exist_ok=True)
+            cache_file = series_dir / f"{key}.parquet"
+            tmp_file = cache_file.with_suffix(".tmp")
+            data.to_parquet(tmp_file)
+            os.replace(tmp_file, cache_file)
+
+            for stale in series_dir.glob("*.parquet"):
+                if stale != cache_file:
+                    stale.unlink(missing_ok=True)
+        except Exception as e:
+            logger.warning("Failed to cache derived data in %s: %s", series_dir, e)
+
+    def download_history(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        timeframe: str,
+        start_date: datetime,
+        end_date: datetime | None = None,
+        max_workers: int = 4,
+        checkpoint_pages: int = 20,
+        use_cache: bool = True,
+    ) -> pd.DataFrame:
+        """Download OHLCV history page by page and store it in the cache.
+
+        The range is split into fixed windows of one request each, which are
+        fetched concurrently while a per-exchange rate limiter keeps requests
+        within the exchange's budget. Completed pages are merged into the
+        cache as they form a contiguous run, so an interrupted download
+        resumes from the last stored candle. Candles after already cached
+        history are appended as segments rather than rewriting partitions.
+
+        Args:
+            symbol: Trading symbol.
+            exchange: Exchange name.
+            timeframe: Data timeframe.
+            start_date: First candle to download.
+            end_date: Last candle to download (defaults to now).
+            max_workers: Concurrent requests in flight.
+            checkpoint_pages: Contiguous pages between cache checkpoints.
+            use_cache: Resume from and store into the cache file.
+
+        Returns:
+            OHLCV DataFrame covering ``start_date`` to ``end_date``.
+        """
+        timeframe_ms = self._timeframe_ms(exchange, timeframe)
+        start_ms = _to_milliseconds(start_date)
+        end_ms = _to_milliseconds(end_date or pd.Timestamp.now(tz="UTC"))
+        ranges, appending = self._plan_download(
+            symbol, exchange, timeframe, timeframe_ms, start_ms, end_ms, use_cache
+        )
+
+        downloaded: list[pd.DataFrame] = []
+
+        def save(frame: pd.DataFrame) -> None:
+            # Only the months touched by the new candles are rewritten
+            if use_cache:
+                self._save_cached_data(frame, symbol, exchange, timeframe)
+            else:
+                downloaded.append(frame)
+
+        def append(frame: pd.DataFrame) -> None:
+            # Tail candles are appended without rewriting existing files
+            if use_cache:
+                self._append_cached_data(frame, symbol, exchange, timeframe)
+            else:
+                downloaded.append(frame)
+
+        for low, high, resumable in ranges:
+            checkpoint = append if resumable and appending else save
+            logger.info(
+                "Downloading %s %s %s from %s to %s",
+                symbol,
+                exchange,
+                timeframe,
+                pd.Timestamp(low, unit="ms"),
+                pd.Timestamp(high, unit="ms"),
+            )
+            frame = self._fetch_pages(
+                symbol,
+                exchange,
+                timeframe,
+                timeframe_ms,
+                low,
+                high,
+                max_workers,
+                checkpoint_pages,
+                checkpoint if resumable else None,
+            )
+            if not resumable:
+                checkpoint(frame)
+
+        if use_cache:
+            self._schedule_compaction(symbol, exchange, timeframe)
+            return self.store.read(
+                exchange.value,
+                symbol,
+                timeframe,
+                pd.Timestamp(start_ms, unit="ms"),
+                pd.Timestamp(end_ms, unit="ms"),
+            )
+
+        data = self._merge_candles(pd.DataFrame(), pd.concat(downloaded))
+        index_ms = data.index.asi8 // 1_000_000
+        return data[(index_ms >= start_ms) & (index_ms <= end_ms)]
+
+    async def download_history_async(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        timeframe: str,
+        start_date: datetime,
+        end_date: datetime | None = None,
+        semaphore: asyncio.Semaphore | None = None,
+        checkpoint_pages: int = 20,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> int:
+        """Download OHLCV history into the cache without blocking the loop.
+
+        Same plan and checkpoints as ``download_history``, but pages are
+        fetched as tasks on the event loop. A semaphore shared by every
+        download from the same exchange bounds the requests in flight, and
+        each request also waits for the exchange's rate limiter. Candles go
+        straight to the cache and are not returned, so bulk downloads keep
+        memory flat.
+
+        Args:
+            symbol: Trading symbol.
+            exchange: Exchange name.
+            timeframe: Data timeframe.
+            start_date: First candle to download.
+            end_date: Last candle to download (defaults to now).
+            semaphore: Bounds concurrent requests (unbounded if None).
+            checkpoint_pages: Contiguous pages between cache checkpoints.
+            progress_callback: Called with ``(pages done, total pages)``
+                after every page.
+
+        Returns:
+            Number of candles downloaded.
+        """
+        timeframe_ms = self._timeframe_ms(exchange, timeframe)
+        start_ms = _to_milliseconds(start_date)
+        end_ms = _to_milliseconds(end_date or pd.Timestamp.now(tz="UTC"))
+        ranges, appending = await asyncio.to_thread(
+            self._plan_download,
+            symbol,
+            exchange,
+            timeframe,
+            timeframe_ms,
+            start_ms,
+            end_ms,
+            True,
+        )
+
+        limit = PAGE_LIMITS.get(exchange, DEFAULT_PAGE_LIMIT)
+        page_ms = limit * timeframe_ms
+        total_pages = sum(len(range(low, high + 1, page_ms)) for low, high, _ in ranges)
+        pages_done = 0
+        candles = 0
+
+        async def fetch(index: int, since: int, until: int) -> tuple[int, pd.DataFrame]:
+            async with semaphore or contextlib.nullcontext():
+                page = await asyncio.to_thread(
+                    self._fetch_page, symbol, exchange, timeframe, since, limit, until
+                )
+            return index, page
+
+        for low, high, resumable in ranges:
+            store = (
+                self._append_cached_data
+                if resumable and appending
+                else self._save_cached_data
+            )
+            checkpoint = functools.partial(
+                store, symbol=symbol, exchange=exchange, timeframe=timeframe
+            )
+            checkpoints = _PageCheckpoints(
+                checkpoint if resumable else None, checkpoint_pages
+            )
+            page_starts = range(low, high + 1, page_ms)
+            tasks = [
+                asyncio.create_task(fetch(i, since, min(since + page_ms - 1, high)))
+                for i, since in enumerate(page_starts)
+            ]
+
+            try:
+                for next_page in asyncio.as_completed(tasks):
+                    index, page = await next_page
+                    # Keep cache writes off the event loop
+                    if checkpoints.add(index, page):
+                        await asyncio.to_thread(checkpoints.flush)
+                    pages_done += 1
+                    candles += len(page)
+                    if progress_callback:
+                        progress_callback(pages_done, total_pages)
+            except BaseException:
+                # Keep the contiguous pages downloaded so far
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                await asyncio.to_thread(checkpoints.flush)
+                raise
+
+            if resumable:
+                await asyncio.to_thread(checkpoints.flush)
+            else:
+                await asyncio.to_thread(
+                    checkpoint, checkpoints.result(len(page_starts))
+                )
+
+        self._schedule_compaction(symbol, exchange, timeframe)
+        return candles
+
+    def _plan_download(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        timeframe: str,
+        timeframe_ms: int,
+        start_ms: int,
+        end_ms: int,
+        use_cache: bool,
+    ) -> tuple[list[tuple[int, int, bool]], bool]:
+        """Plan the ranges a download has to fetch.
+
+        Returns:
+            ``(low, high, resumable)`` ranges in milliseconds, and whether
+            they extend already cached history.
+        """
+        bounds = (
+            self._get_cache_bounds(symbol, exchange, timeframe) if use_cache else None
+        )
+
+        # Only download what the cache does not already hold, extending each
+        # range up to the cached data so the cache never contains holes
+        if bounds is None:
+            return [(start_ms, end_ms, True)], False
+
+        cache_start = _to_milliseconds(bounds[0])
+        cache_end = _to_milliseconds(bounds[1])
+        ranges = []
+        if start_ms < cache_start:
+            # Partial head downloads would leave a gap, so save them whole
+            ranges.append((start_ms, cache_start - timeframe_ms, False))
+        if end_ms > cache_end:
+            # Refetch the last cached candle, which may have been incomplete
+            ranges.append((cache_end, end_ms, True))
+        return ranges, True
+
+    def refresh_tail(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        timeframe: str = "1h",
+        max_workers: int = 4,
+    ) -> pd.DataFrame:
+        """Fetch only the candles after the last cached one.
+
+        New candles are appended as segments, so keeping a series current
+        costs in proportion to the new data rather than the stored history.
+        Segments are compacted in the background once enough accumulate.
+
+        Args:
+            symbol: Trading symbol.
+            exchange: Exchange name.
+            timeframe: Data timeframe.
+            max_workers: Concurrent requests in flight.
+
+        Returns:
+            Candles from the last previously cached one (which may have been
+            incomplete) up to now.
+        """
+        bounds = self._get_cache_bounds(symbol, exchange, timeframe)
+        if bounds is None:
+            raise ValueError(
+                f"No cached data to refresh for {symbol} {exchange} {timeframe}"
+            )
+
+        return self.download_history(
+            symbol, exchange, timeframe, bounds[1], max_workers=max_workers
+        )
+
+    def build_trade_bars(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        trades: Iterable[TradeTick],
+        aggregator: BarAggregator,
+        batch_size: int = 10_000,
+    ) -> int:
+        """Aggregate recorded trades into bars and append them to the cache.
+
+        Trades are consumed as a stream, so memory stays bounded by
+        ``batch_size`` bars however many trades there are. The bar still
+        being built when the trades run out is left out.
+
+        Args:
+            symbol: Trading symbol.
+            exchange: Exchange name.
+            trades: Trades as ``(timestamp in ms, price, amount)`` in time order
+                (e.g. from ``read_trade_file``).
+            aggregator: Bar aggregator; its name is the cached timeframe.
+            batch_size: Bars buffered between cache appends.
+
+        Returns:
+            Number of bars written.
+        """
+        writer = self._bar_writer(symbol, exchange, aggregator, batch_size)
+        for bar in iter_bars(trades, aggregator):
+            writer.write(bar)
+        writer.flush()
+        return writer.written
+
+    async def record_trade_bars(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        trades: AsyncIterable[TradeTick],
+        aggregator: BarAggregator,
+        batch_size: int = 100,
+    ) -> int:
+        """Aggregate a live trade feed into bars until the feed ends.
+
+        Args:
+            symbol: Trading symbol.
+            exchange: Exchange name.
+            trades: Trade feed (e.g. from ``poll_exchange_trades``).
+            aggregator: Bar aggregator; its name is the cached timeframe.
+            batch_size: Bars buffered between cache appends.
+
+        Returns:
+            Number of bars written.
+        """
+        writer = self._bar_writer(symbol, exchange, aggregator, batch_size)
+        try:
+            async for timestamp, price, amount in trades:
+                bar = aggregator.update(timestamp, price, amount)
+                # Keep cache writes off the event loop
+                if bar is not None and writer.add(bar):
+                    await asyncio.to_thread(writer.flush)
+        finally:
+            await asyncio.to_thread(writer.flush)
+        return writer.written
+
+    def get_trade_bars(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        bar_type: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> pd.DataFrame:
+        """Read cached bars built from trades.
+
+        Args:
+            symbol: Trading symbol.
+            exchange: Exchange name.
+            bar_type: Aggregator name (e.g. ``"volume-100"``, ``"time-1m"``).
+            start_date: Start date for data.
+            end_date: End date for data.
+
+        Returns:
+            OHLCV DataFrame indexed by bar opening time.
+        """
+        return self.store.read(exchange.value, symbol, bar_type, start_date, end_date)
+
+    def _bar_writer(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        aggregator: BarAggregator,
+        batch_size: int,
+    ) -> BarWriter:
+        """Create a writer appending bars to the cache."""
+
+        def save(bars: pd.DataFrame) -> None:
+            self._append_cached_data(bars, symbol, exchange, aggregator.name)
+            self._schedule_compaction(symbol, exchange, aggregator.name)
+
+        return BarWriter(save, batch_size)
+
+    def compact_cache(self, symbol: str, exchange: Exchange, timeframe: str) -> int:
+        """Fold appended segments of a series into its month partitions.
+
+        Args:
+            symbol: Trading symbol.
+            exchange: Exchange name.
+            timeframe: Data timeframe.
+
+        Returns:
+            Number of months compacted.
+        """
+        try:
+            compacted = self.store.compact(exchange.value, symbol, timeframe)
+            if compacted:
+                logger.info(
+                    "Compacted %d months of %s %s %s",
+                    compacted,
+                    symbol,
+                    exchange,
+                    timeframe,
+                )
+            return compacted
+        except Exception as e:
+            logger.warning(
+                "Failed to compact cached data for %s %s: %s", symbol, timeframe, e
+            )
+            return 0
+
+    def _schedule_compaction(
+        self, symbol: str, exchange: Exchange, timeframe: str
+    ) -> Future | None:
+        """Compact a series in the background once it has enough segments."""
+        segments = self.store.stats(exchange.value, symbol, timeframe)["segments"]
+        if segments < self.compact_segments:
+            return None
+
+        key = (exchange, symbol, timeframe)
+        with self._compactions_lock:
+            pending = self._compactions.get(key)
+            if pending is not None and not pending.done():
+                return pending
+            if self._compactor is None:
+                self._compactor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="candle-compaction"
+                )
+            future = self._compactor.submit(
+                self.compact_cache, symbol, exchange, timeframe
+            )
+            self._compactions[key] = future
+            return future
+
+    def _timeframe_ms(self, exchange: Exchange, timeframe: str) -> int:
+        """Get the duration of one candle in milliseconds."""
+        ex = self.client.get_exchange(exchange)
+        return int(ex.parse_timeframe(timeframe) * 1000)
+
+    def _fetch_pages(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        timeframe: str,
+        timeframe_ms: int,
+        start_ms: int,
+        end_ms: int,
+        max_workers: int,
+        checkpoint_pages: int,
+        checkpoint: Callable[[pd.DataFrame], None] | None,
+    ) -> pd.DataFrame:
+        """Fetch the pages covering ``[start_ms, end_ms]`` concurrently."""
+        limit = PAGE_LIMITS.get(exchange, DEFAULT_PAGE_LIMIT)
+        page_ms = limit * timeframe_ms
+        page_starts = list(range(start_ms, end_ms + 1, page_ms))
+
+        checkpoints = _PageCheckpoints(checkpoint, checkpoint_pages)
+        error: Exception | None = None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self._fetch_page,
+                    symbol,
+                    exchange,
+                    timeframe,
+                    since,
+                    limit,
+                    min(since + page_ms - 1, end_ms),
+                ): i
+                for i, since in enumerate(page_starts)
+            }
+
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                try:
+                    if checkpoints.add(futures[future], future.result()):
+                        checkpoints.flush()
+                except Exception as e:
+                    # Stop queued pages but keep the ones already in flight
+                    if error is None:
+                        error = e
+                        for pending in futures:
+                            pending.cancel()
+                    continue
+
+                if len(checkpoints.pages) % 10 == 0:
+                    logger.info(
+                        "Downloaded %d/%d pages of %s %s",
+                        len(checkpoints.pages),
+                        len(page_starts),
+                        symbol,
+                        timeframe,
+                    )
+
+        if error is not None:
+            checkpoints.flush()
+            logger.error(
+                "Download of %s %s stopped after %d contiguous pages: %s",
+                symbol,
+                timeframe,
+                checkpoints.contiguous,
+                error,
+            )
+            raise error
+
+        checkpoints.flush()
+        return checkpoints.result(len(page_starts))
+
+    @retry_sync(max_attempts=5, delay=1.0, exceptions=ccxt.NetworkError)
+    def _fetch_page(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        timeframe: str,
+        since: int,
+        limit: int,
+        until: int,
+    ) -> pd.DataFrame:
+        """Fetch one page of candles in ``[since, until]``."""
+        self._get_rate_limiter(exchange).acquire_sync()
+        data = self.client.get_ohlcv_dataframe(
+            symbol, exchange, timeframe, limit=limit, since=since
+        )
+
+        index_ms = data.index.asi8 // 1_000_000
+        return data[(index_ms >= since) & (index_ms <= until)]
+
+    def _get_rate_limiter(self, exchange: Exchange) -> RateLimiter:
+        """Get the rate limiter of an exchange, sized from its rate limit."""
+        with self._rate_limiters_lock:
+            if exchange not in self._rate_limiters:
+                rate_limit_ms = self.client.get_exchange(exchange).rateLimit or 100
+                self._rate_limiters[exchange] = RateLimiter(
+                    rate=1000 / rate_limit_ms, capacity=1
+                )
+            return self._rate_limiters[exchange]
+
+    def _merge_candles(
+        self, existing: pd.DataFrame, new_data: pd.DataFrame
+    ) -> pd.DataFrame:
+        """Merge candles, keeping the latest copy of duplicate timestamps."""
+        if existing.empty:
+            combined = new_data
+        elif new_data.empty:
+            return existing
+        else:
+            combined = pd.concat([existing, new_data])
+        combined = combined[~combined.index.duplicated(keep="last")]
+        return combined.sort_index()
+
     def download_bulk_data(
         self,
         symbols: list[str],
@@ -90,6 +896,9 @@ class BacktestDataManager:
     ) -> dict[str, dict[str, pd.DataFrame]]:
         """Download bulk historical data.
 
+        Timeframes derived from the base timeframe are built locally once the
+        base candles are cached, so they cost no extra requests.
+
         Args:
             symbols: List of trading symbols.
             exchange: Exchange name.
@@ -152,36 +961,17 @@ class BacktestDataManager:
             Updated OHLCV DataFrame.
         """
         try:
-            cache_file = self._get_cache_filename(symbol, exchange, timeframe)
-
-            # Load existing data
-            if cache_file.exists():
-                existing_data = self._load_cached_data(cache_file)
-                existing_data.index[-1]
-
-                # Get latest data
-                new_data = self.client.get_ohlcv_dataframe(
-                    symbol, exchange, timeframe, limit=100
-                )
-
-                # Merge data
-                combined_data = pd.concat([existing_data, new_data])
-                combined_data = combined_data[
-                    ~combined_data.index.duplicated(keep="last")
-                ]
-                combined_data = combined_data.sort_index()
-
+            if self._get_cache_bounds(symbol, exchange, timeframe) is not None:
+                # Append only the candles after the last cached one
+                self.refresh_tail(symbol, exchange, timeframe)
             else:
-                # Get fresh data
-                combined_data = self.client.get_ohlcv_dataframe(
+                new_data = self.client.get_ohlcv_dataframe(
                     symbol, exchange, timeframe, limit=1000
                 )
-
-            # Save updated data
-            self._save_cached_data(combined_data, cache_file)
+                self._save_cached_data(new_data, symbol, exchange, timeframe)
 
             logger.info("Updated cached data for %s %s %s", symbol, exchange, timeframe)
-            return combined_data
+            return self.store.read(exchange.value, symbol, timeframe)
 
         except Exception as e:
             logger.error("Failed to update cached data for %s: %s", symbol, e)
@@ -190,42 +980,65 @@ class BacktestDataManager:
     def _get_cache_filename(
         self, symbol: str, exchange: Exchange, timeframe: str
     ) -> Path:
-        """Generate cache filename."""
+        """Generate the legacy single-file cache filename."""
         safe_symbol = symbol.replace("/", "_").replace("-", "_")
         filename = f"{exchange.value}_{safe_symbol}_{timeframe}.parquet"
         return self.data_dir / filename
 
-    def _load_cached_data(self, cache_file: Path) -> pd.DataFrame:
-        """Load data from cache file."""
+    def _get_cache_bounds(
+        self, symbol: str, exchange: Exchange, timeframe: str
+    ) -> tuple[pd.Timestamp, pd.Timestamp] | None:
+        """Get the first and last cached timestamps of a series."""
+        self._migrate_legacy_cache(symbol, exchange, timeframe)
+        return self.store.bounds(exchange.value, symbol, timeframe)
+
+    def _migrate_legacy_cache(
+        self, symbol: str, exchange: Exchange, timeframe: str
+    ) -> None:
+        """Move a legacy single-file cache into the partitioned store."""
+        cache_file = self._get_cache_filename(symbol, exchange, timeframe)
+        if not cache_file.exists():
+            return
+
         try:
             data = pd.read_parquet(cache_file)
             data.index = pd.to_datetime(data.index)
-            return data
+            self.store.write(data, exchange.value, symbol, timeframe)
+            cache_file.rename(cache_file.with_suffix(".parquet.migrated"))
+            logger.info("Migrated %s into the partitioned candle store", cache_file)
         except Exception as e:
-            logger.warning("Failed to load cached data from %s: %s", cache_file, e)
-            return pd.DataFrame()
+            logger.warning("Failed to migrate cached data from %s: %s", cache_file, e)
 
-    def _save_cached_data(self, data: pd.DataFrame, cache_file: Path) -> None:
-        """Save data to cache file."""
+    def _save_cached_data(
+        self, data: pd.DataFrame, symbol: str, exchange: Exchange, timeframe: str
+    ) -> None:
+        """Upsert candles into the partitioned store."""
         try:
-            data.to_parquet(cache_file)
-            logger.debug("Saved cached data to %s", cache_file)
+            self.store.write(data, exchange.value, symbol, timeframe)
         except Exception as e:
-            logger.warning("Failed to save cached data to %s: %s", cache_file, e)
+            logger.warning(
+                "Failed to save cached data for %s %s: %s", symbol, timeframe, e
+            )
 
-    def _is_cache_valid(
+    def _append_cached_data(
+        self, data: pd.DataFrame, symbol: str, exchange: Exchange, timeframe: str
+    ) -> None:
+        """Append candles to the partitioned store as new segments."""
+        try:
+            self.store.append(data, exchange.value, symbol, timeframe)
+        except Exception as e:
+            logger.warning(
+                "Failed to append cached data for %s %s: %s", symbol, timeframe, e
+            )
+
+    def _is_range_valid(
         self,
-        cached_data: pd.DataFrame,
+        cache_start: pd.Timestamp,
+        cache_end: pd.Timestamp,
         start_date: datetime | None,
         end_date: datetime | None,
     ) -> bool:
-        """Check if cached data is valid for the requested date range."""
-        if cached_data.empty:
-            return False
-
-        cache_start = cached_data.index[0]
-        cache_end = cached_data.index[-1]
-
+        """Check if cached index bounds are valid for the requested date range."""
         # Check if cache covers requested range
         if start_date and cache_start > start_date:
             return False
@@ -233,13 +1046,64 @@ class BacktestDataManager:
         if end_date and cache_end < end_date:
             return False
 
-        # Check if cache is recent (within last hour)
-        now = datetime.now()
-        if (now - cache_end.to_pydatetime()).total_seconds() > 3600:
+        # Open-ended ranges also need a recent cache (within last hour)
+        age = datetime.now() - cache_end.to_pydatetime()
+        if end_date is None and age.total_seconds() > 3600:
             return False
 
         return True
 
+    def get_data_fingerprint(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        timeframe: str = "1h",
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> str | None:
+        """Get a fingerprint of the cached data a backtest request would use.
+
+        The fingerprint identifies the series, the version (modification time
+        and size) of every partition overlapping the requested range, and the
+        range itself, so it changes whenever that data is refreshed. Only file
+        metadata is read once the partition bounds are known.
+
+        Args:
+            symbol: Trading symbol.
+            exchange: Exchange name.
+            timeframe: Data timeframe.
+            start_date: Start date for data.
+            end_date: End date for data.
+
+        Returns:
+            Fingerprint string, or None if the cache would not be used.
+        """
+        if self._is_derived(timeframe):
+            # Derived candles are as fresh as the base candles they come from
+            base = self.get_data_fingerprint(
+                symbol,
+                exchange,
+                self.base_timeframe,
+                self._bar_start(start_date, timeframe) if start_date else None,
+                end_date,
+            )
+            return f"{timeframe}<-{base}" if base else None
+
+        bounds = self._get_cache_bounds(symbol, exchange, timeframe)
+        if bounds is None or not self._is_range_valid(*bounds, start_date, end_date):
+            return None
+
+        return ":".join(
+            [
+                f"{exchange.value}/{symbol}/{timeframe}",
+                self.store.version(
+                    exchange.value, symbol, timeframe, start_date, end_date
+                ),
+                start_date.isoformat() if start_date else "",
+                end_date.isoformat() if end_date else "",
+            ]
+        )
+
     def _filter_data_by_date(
         self,
         data: pd.DataFrame,
@@ -264,6 +1128,10 @@ class BacktestDataManager:
     ) -> pd.DataFrame:
         """Prepare and validate data for backtesting.
 
+        Validated data is cached under the fingerprint of the candles it was
+        cleaned from and the validator's tag, so repeated backtests of
+        unchanged data skip both loading the candles and cleaning them.
+
         Args:
             symbol: Trading symbol.
             exchange: Exchange name.
@@ -276,17 +1144,18 @@ class BacktestDataManager:
             Clean OHLCV DataFrame ready for backtesting.
         """
         try:
-            # Get historical data
-            data = self.get_historical_data(
-                symbol=symbol,
-                exchange=exchange,
-                timeframe=timeframe,
-                start_date=start_date,
-                end_date=end_date,
-            )
-
             if validate:
-                data = self._validate_and_clean_data(data)
+                data = self._get_validated_data(
+                    symbol, exchange, timeframe, start_date, end_date
+                )
+            else:
+                data = self.get_historical_data(
+                    symbol=symbol,
+                    exchange=exchange,
+                    timeframe=timeframe,
+                    start_date=start_date,
+                    end_date=end_date,
+                )
 
             logger.info("Prepared %d candles for backtesting %s", len(data), symbol)
             return data
@@ -295,47 +1164,196 @@ class BacktestDataManager:
             logger.error("Failed to prepare backtest data for %s: %s", symbol, e)
             raise
 
-    def _validate_and_clean_data(self, data: pd.DataFrame) -> pd.DataFrame:
-        """Validate and clean OHLCV data."""
-        try:
-            original_length = len(data)
-
-            # Remove rows with missing values
-            data = data.dropna()
-
-            # Remove rows with zero or negative prices
-            price_columns = ["open", "high", "low", "close"]
-            for col in price_columns:
-                if col in data.columns:
-                    data = data[data[col] > 0]
-
-            # Remove rows with zero volume
-            if "volume" in data.columns:
-                data = data[data["volume"] >= 0]
-
-            # Validate OHLC relationships
-            data = data[
-                (data["low"] <= data["high"])
-                & (data["low"] <= data["open"])
-                & (data["low"] <= data["close"])
-                & (data["high"] >= data["open"])
-                & (data["high"] >= data["close"])
-            ]
+    def export_shared(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        timeframe: str = "1h",
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        validate: bool = True,
+    ) -> SharedOHLCV:
+        """Export backtest data as read-only memory-mapped column files.
+
+        Exports are keyed by the data fingerprint, so repeated requests for
+        unchanged data reuse the existing files without touching Parquet, and
+        every process opening them shares the same pages of the OS cache.
+        Older exports of the same series are removed once the data changes.
+
+        Args:
+            symbol: Trading symbol.
+            exchange: Exchange name.
+            timeframe: Data timeframe.
+            start_date: Start date for backtest.
+            end_date: End date for backtest.
+            validate: Whether to validate data quality.
+
+        Returns:
+            Handle to the export, cheap to pickle to worker processes.
+        """
+        series_dir = self.shared_dir / self.store.series_dir(
+            exchange.value, symbol, timeframe
+        ).relative_to(self.store.root)
+
+        fingerprint = self.get_data_fingerprint(
+            symbol, exchange, timeframe, start_date, end_date
+        )
+        if fingerprint is not None:
+            shared = SharedOHLCV(series_dir / self._export_key(fingerprint, validate))
+            if shared.exists():
+                return shared
+
+        data = self.prepare_backtest_data(
+            symbol, exchange, timeframe, start_date, end_date, validate
+        )
+        # Key by the data itself when the fetch bypassed the cache
+        fingerprint = (
+            self.get_data_fingerprint(symbol, exchange, timeframe, start_date, end_date)
+            or hashlib.blake2b(
+                pd.util.hash_pandas_object(data).to_numpy().tobytes(), digest_size=16
+            ).hexdigest()
+        )
+
+        directory = series_dir / self._export_key(fingerprint, validate)
+        if SharedOHLCV(directory).exists():
+            return SharedOHLCV(directory)
+
+        shared = SharedOHLCV.export(data, directory)
+        logger.info("Exported %d candles of %s to %s", len(data), symbol, directory)
+
+        # Processes still mapping removed files keep reading them safely
+        for stale in series_dir.iterdir():
+            if stale != directory and not stale.name.startswith("."):
+                shutil.rmtree(stale, ignore_errors=True)
+
+        return shared
+
+    def open_shared(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        timeframe: str = "1h",
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        validate: bool = True,
+    ) -> pd.DataFrame:
+        """Get backtest data backed by read-only memory maps.
+
+        Process-pool optimizations and walk-forward runs attach their workers
+        to the frame's export directly instead of writing a copy.
+
+        Args:
+            symbol: Trading symbol.
+            exchange: Exchange name.
+            timeframe: Data timeframe.
+            start_date: Start date for backtest.
+            end_date: End date for backtest.
+            validate: Whether to validate data quality.
 
-            # Remove extreme outliers (more than 10x price change)
-            if "close" in data.columns:
-                price_change = data["close"].pct_change().abs()
-                data = data[price_change < 10.0]
+        Returns:
+            Read-only OHLCV DataFrame with datetime index.
+        """
+        return self.export_shared(
+            symbol, exchange, timeframe, start_date, end_date, validate
+        ).open()
+
+    def _export_key(self, fingerprint: str, validate: bool) -> str:
+        """Get the cache key of data prepared from fingerprinted candles."""
+        validation = self.validator.tag if validate else "none"
+        payload = f"{fingerprint}:validate={validation}".encode()
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def _get_validated_data(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        timeframe: str,
+        start_date: datetime | None,
+        end_date: datetime | None,
+    ) -> pd.DataFrame:
+        """Get validated data, from the cleaned cache when it is current."""
+        series_dir = self.validated_dir / self.store.series_dir(
+            exchange.value, symbol, timeframe
+        ).relative_to(self.store.root)
+
+        fingerprint = self.get_data_fingerprint(
+            symbol, exchange, timeframe, start_date, end_date
+        )
+        if fingerprint is not None:
+            cache_file = series_dir / f"{self._export_key(fingerprint, True)}.parquet"
+            if cache_file.exists():
+                data = pd.read_parquet(cache_file)
+                data.index = pd.to_datetime(data.index)
+                return data
+
+        data = self.get_historical_data(
+            symbol=symbol,
+            exchange=exchange,
+            timeframe=timeframe,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        data = self._validate_and_clean_data(data, timeframe)
+
+        # The fetch may have filled the cache
+        fingerprint = self.get_data_fingerprint(
+            symbol, exchange, timeframe, start_date, end_date
+        )
+        if fingerprint is not None:
+            self._save_derived(data, series_dir, self._export_key(fingerprint, True))
+        return data
 
-            cleaned_length = len(data)
-            if cleaned_length < original_length:
+    def validate_data(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        timeframe: str = "1h",
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> ValidationReport:
+        """Validate the quality of historical data without repairing it.
+
+        Args:
+            symbol: Trading symbol.
+            exchange: Exchange name.
+            timeframe: Data timeframe.
+            start_date: Start date for data.
+            end_date: End date for data.
+
+        Returns:
+            Validation report of the raw candles.
+        """
+        data = self.get_historical_data(
+            symbol=symbol,
+            exchange=exchange,
+            timeframe=timeframe,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return self.validator.validate(data, timeframe)[1]
+
+    def _validate_and_clean_data(
+        self, data: pd.DataFrame, timeframe: str | None = None
+    ) -> pd.DataFrame:
+        """Validate and clean OHLCV data."""
+        try:
+            data, report = self.validator.validate(data, timeframe)
+            if not report.is_clean:
                 logger.warning(
-                    "Removed %d invalid candles (%d -> %d)",
-                    original_length - cleaned_length,
-                    original_length,
-                    cleaned_length,
+                    "Data quality issues (%s policy): %d duplicates, %d missing "
+                    "values, %d invalid prices, %d OHLC violations, %d outliers, "
+                    "%d missing candles in %d gaps; removed %d, filled %d",
+                    self.validator.policy,
+                    report.duplicates,
+                    report.missing_values,
+                    report.invalid_prices,
+                    report.ohlc_violations,
+                    report.outliers,
+                    report.missing_candles,
+                    len(report.gaps),
+                    report.removed,
+                    report.filled,
                 )
-
             return data
 
         except Exception as e:
@@ -356,27 +1374,44 @@ class BacktestDataManager:
             Data information dictionary.
         """
         try:
-            cache_file = self._get_cache_filename(symbol, exchange, timeframe)
-
-            if not cache_file.exists():
+            entry = self.store.catalog_entry(exchange.value, symbol, timeframe)
+            if entry is None:
                 return {"cached": False}
-
-            data = self._load_cached_data(cache_file)
-
-            if data.empty:
-                return {"cached": False}
-
-            return {
-                "cached": True,
-                "start_date": data.index[0].isoformat(),
-                "end_date": data.index[-1].isoformat(),
-                "total_candles": len(data),
-                "file_size": cache_file.stat().st_size,
-                "last_modified": datetime.fromtimestamp(
-                    cache_file.stat().st_mtime
-                ).isoformat(),
-            }
+            return {"cached": True, **self._catalog_info(entry)}
 
         except Exception as e:
             logger.error("Failed to get data info for %s: %s", symbol, e)
             return {"cached": False, "error": str(e)}
+
+    def get_catalog(self) -> list[dict[str, Any]]:
+        """List every cached dataset from the catalog.
+
+        Returns:
+            Dataset information dictionaries, without reading any candles.
+        """
+        return [
+            {
+                "exchange": entry["exchange"],
+                "symbol": entry["symbol"],
+                "timeframe": entry["timeframe"],
+                **self._catalog_info(entry),
+            }
+            for entry in self.store.catalog.list_datasets()
+        ]
+
+    def _catalog_info(self, entry: dict[str, Any]) -> dict[str, Any]:
+        """Format a catalog entry with ISO dates."""
+        return {
+            "start_date": pd.Timestamp(entry["start_ns"]).isoformat(),
+            "end_date": pd.Timestamp(entry["end_ns"]).isoformat(),
+            "total_candles": entry["rows"],
+            "gaps": [
+                [pd.Timestamp(start).isoformat(), pd.Timestamp(end).isoformat()]
+                for start, end in entry["gaps"]
+            ],
+            "partitions": entry["partitions"],
+            "segments": entry["segments"],
+            "file_size": entry["bytes"],
+            "checksum": entry["checksum"],
+            "last_refresh": datetime.fromtimestamp(entry["last_refresh"]).isoformat(),
+        }
@@ -1,17 +1,60 @@
 """Vectorbt-based backtesting engine."""
 
 import logging
+import math
+import os
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 import numpy as np
 import pandas as pd
 import vectorbt as vbt
 
+from system_trading.backtesting.metrics import (
+    infer_bar_frequency,
+    periods_per_year,
+    portfolio_metrics,
+)
+from system_trading.backtesting.parallel import (
+    POOL_CONTEXT,
+    init_optimization_worker,
+    run_optimization_batch,
+    shared_ohlcv,
+)
+from system_trading.backtesting.results import ResultSpill, TopKResults
+from system_trading.backtesting.search import GridSearch, ParameterSearch, grid_size
 from system_trading.strategies.base_strategy import BaseStrategy
+from system_trading.strategies.indicator_cache import indicator_cache
 
 logger = logging.getLogger(__name__)
 
+# Bar frequency assumed by vectorbt portfolios (adjust based on data frequency)
+_PORTFOLIO_FREQ = "1h"
+
+# Metrics backends: vectorbt's portfolio.stats() or the lean NumPy kernel
+METRICS_ENGINES = ("vectorbt", "numpy")
+
+# Metrics ranked alongside the optimization metric when keeping top-k results
+_RANKED_METRICS = ["sharpe_ratio", "total_return", "max_drawdown", "calmar_ratio"]
+
+
+def _row_window(data: pd.DataFrame, subset: pd.DataFrame) -> tuple[int, int] | None:
+    """Get the positions of ``subset`` in ``data`` if it is a contiguous slice."""
+    if subset is data:
+        return 0, len(data)
+    if subset.empty:
+        return None
+
+    start = int(np.searchsorted(data.index, subset.index[0]))
+    stop = start + len(subset)
+    if stop > len(data) or not data.index[start:stop].equals(subset.index):
+        return None
+    return start, stop
+
 
 class BacktestResult:
     """Backtesting result container."""
@@ -74,6 +117,7 @@ class BacktestEngine:
         initial_cash: float = 10000.0,
         commission: float = 0.001,
         slippage: float = 0.001,
+        metrics_engine: str = "vectorbt",
     ) -> None:
         """Initialize backtesting engine.
 
@@ -81,10 +125,17 @@ class BacktestEngine:
             initial_cash: Initial portfolio cash.
             commission: Trading commission rate.
             slippage: Price slippage rate.
+            metrics_engine: ``"vectorbt"`` for ``portfolio.stats()`` with
+                252-period annualization, or ``"numpy"`` for the lean metrics
+                kernel annualized by the bar frequency of the data.
         """
+        if metrics_engine not in METRICS_ENGINES:
+            raise ValueError(f"Unknown metrics engine: {metrics_engine}")
+
         self.initial_cash = initial_cash
         self.commission = commission
         self.slippage = slippage
+        self.metrics_engine = metrics_engine
 
     def run_backtest(
         self,
@@ -137,6 +188,196 @@ class BacktestEngine:
             logger.error("Backtest failed for %s: %s", strategy.name, e)
             raise
 
+    def run_backtest_window(
+        self,
+        strategy: BaseStrategy,
+        data: pd.DataFrame,
+        symbol: str,
+        window_start: int,
+        window_end: int | None = None,
+    ) -> BacktestResult:
+        """Run backtest on a positional window of the data.
+
+        Bars before ``window_start`` are used only as indicator history, so
+        signals at the start of the window are not lost to warmup.
+
+        Args:
+            strategy: Trading strategy to test.
+            data: OHLCV price data.
+            symbol: Trading symbol.
+            window_start: Position of the first traded bar.
+            window_end: Position after the last traded bar (defaults to end).
+
+        Returns:
+            Backtest results for the window only.
+        """
+        try:
+            window_end = len(data) if window_end is None else window_end
+            history = data.iloc[:window_end]
+
+            signals = self._generate_signals(strategy, history).iloc[window_start:]
+            window = history.iloc[window_start:]
+
+            portfolio = self._run_vectorbt_backtest(window, signals)
+            stats = self._calculate_statistics(portfolio, window)
+            trades = self._extract_trades(portfolio)
+
+            return BacktestResult(
+                portfolio=portfolio,
+                trades=trades,
+                stats=stats,
+                strategy_name=strategy.name,
+                symbol=symbol,
+                start_date=window.index[0],
+                end_date=window.index[-1],
+            )
+
+        except Exception as e:
+            logger.error("Window backtest failed for %s: %s", strategy.name, e)
+            raise
+
+    def run_portfolio_backtest(
+        self,
+        strategy: BaseStrategy,
+        data: dict[str, pd.DataFrame],
+        allocations: dict[str, float] | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> BacktestResult:
+        """Run one strategy over several symbols sharing a single cash pool.
+
+        Every symbol becomes a column of one vectorbt portfolio grouped with
+        ``cash_sharing``, so entries compete for the same capital the way the
+        live trading engine allocates its balance across symbols.
+
+        Args:
+            strategy: Trading strategy applied to every symbol.
+            data: OHLCV price data per symbol (e.g. one timeframe of
+                ``download_bulk_data`` output).
+            allocations: Fraction of initial cash committed per entry for
+                each symbol (defaults to an equal split).
+            start_date: Backtest start date.
+            end_date: Backtest end date.
+
+        Returns:
+            Backtest results for the combined portfolio, with per-symbol
+            statistics under ``stats["per_symbol"]``.
+        """
+        try:
+            panel = self._align_panel(data)
+            if start_date or end_date:
+                panel = {
+                    symbol: self._filter_data_by_date(frame, start_date, end_date)
+                    for symbol, frame in panel.items()
+                }
+            symbols = list(panel)
+            index = panel[symbols[0]].index
+
+            allocations = allocations or {
+                symbol: 1.0 / len(symbols) for symbol in symbols
+            }
+            unknown = set(allocations) - set(symbols)
+            if unknown:
+                raise ValueError(f"Allocations for unknown symbols: {sorted(unknown)}")
+
+            entries = {}
+            exits = {}
+            for symbol in symbols:
+                signals = self._generate_signals(strategy, panel[symbol])
+                entries[symbol] = signals["entries"]
+                exits[symbol] = signals["exits"]
+
+            close = pd.DataFrame(
+                {symbol: panel[symbol]["close"] for symbol in symbols}, index=index
+            )
+            size = pd.Series(
+                {
+                    symbol: allocations.get(symbol, 0.0) * self.initial_cash
+                    for symbol in symbols
+                }
+            )
+
+            portfolio = vbt.Portfolio.from_signals(
+                close=close,
+                entries=pd.DataFrame(entries, index=index),
+                exits=pd.DataFrame(exits, index=index),
+                size=size.to_numpy()[None, :],
+                size_type="value",
+                init_cash=self.initial_cash,
+                fees=self.commission,
+                slippage=self.slippage,
+                group_by=True,
+                cash_sharing=True,
+                call_seq="auto",  # Sell before buying within a bar
+                freq=_PORTFOLIO_FREQ,
+            )
+
+            stats = self._calculate_statistics(portfolio, close)
+            stats["per_symbol"] = self._calculate_symbol_statistics(portfolio, symbols)
+            trades = self._extract_trades(portfolio)
+            if not trades.empty and "Column" in trades.columns:
+                trades = trades.rename(columns={"Column": "symbol"})
+
+            return BacktestResult(
+                portfolio=portfolio,
+                trades=trades,
+                stats=stats,
+                strategy_name=strategy.name,
+                symbol=",".join(symbols),
+                start_date=start_date or index[0],
+                end_date=end_date or index[-1],
+            )
+
+        except Exception as e:
+            logger.error("Portfolio backtest failed for %s: %s", strategy.name, e)
+            raise
+
+    def _align_panel(self, data: dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
+        """Restrict per-symbol frames to their common timestamps."""
+        panel = {symbol: frame for symbol, frame in data.items() if not frame.empty}
+        if not panel:
+            raise ValueError("No data provided for portfolio backtest")
+
+        index = None
+        for frame in panel.values():
+            index = frame.index if index is None else index.intersection(frame.index)
+
+        if index is None or index.empty:
+            raise ValueError("Symbols have no overlapping timestamps")
+
+        dropped = max(len(frame) for frame in panel.values()) - len(index)
+        if dropped:
+            logger.info("Aligned portfolio panel drops %d unmatched bars", dropped)
+
+        return {symbol: frame.loc[index] for symbol, frame in panel.items()}
+
+    def _calculate_symbol_statistics(
+        self, portfolio: Any, symbols: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Calculate trade statistics for each symbol of a portfolio."""
+        records = portfolio.trades.records
+        trade_columns = np.asarray(records["col"], dtype=np.int64)
+        pnl = np.asarray(records["pnl"], dtype=float)
+
+        total_trades = np.bincount(trade_columns, minlength=len(symbols))
+        winning_trades = np.bincount(
+            trade_columns, weights=pnl > 0, minlength=len(symbols)
+        )
+        total_pnl = np.bincount(trade_columns, weights=pnl, minlength=len(symbols))
+
+        return {
+            symbol: {
+                "total_trades": int(total_trades[i]),
+                "win_rate": (
+                    float(winning_trades[i] / total_trades[i])
+                    if total_trades[i]
+                    else 0.0
+                ),
+                "total_pnl": float(total_pnl[i]),
+            }
+            for i, symbol in enumerate(symbols)
+        }
+
     def run_optimization(
         self,
         strategy_class: type[BaseStrategy],
@@ -144,6 +385,12 @@ class BacktestEngine:
         param_ranges: dict[str, list[Any]],
         symbol: str,
         metric: str = "sharpe_ratio",
+        n_jobs: int = 1,
+        progress_callback: Callable[[dict[str, Any]], None] | None = None,
+        broadcast: bool = False,
+        search: ParameterSearch | None = None,
+        top_k: int | None = None,
+        results_path: str | Path | None = None,
     ) -> dict[str, Any]:
         """Run parameter optimization.
 
@@ -153,71 +400,437 @@ class BacktestEngine:
             param_ranges: Parameter ranges to test.
             symbol: Trading symbol.
             metric: Optimization metric.
+            n_jobs: Number of worker processes (-1 uses all cores).
+            progress_callback: Called with each result as soon as it is
+                available (completion order when running in parallel).
+            broadcast: Simulate all combinations as columns of one vectorbt
+                portfolio instead of one backtest per combination.
+            search: Parameter search strategy (defaults to exhaustive grid).
+            top_k: Keep only the best ``top_k`` results per metric instead of
+                every result, so memory stays bounded for large grids.
+            results_path: Optional Parquet file receiving every result.
 
         Returns:
-            Optimization results.
+            Optimization results. With ``top_k``, ``all_results`` holds the
+            best results for ``metric`` and ``top_results`` the best results
+            per ranked metric.
         """
         try:
-            best_params = {}
-            best_score = float("-inf") if metric != "max_drawdown" else float("inf")
-            all_results = []
-
-            # Generate parameter combinations
-            param_combinations = self._generate_param_combinations(param_ranges)
+            search = search or GridSearch()
+            total_combinations = grid_size(param_ranges)
+            evaluated = 0
+            top_results = (
+                TopKResults(top_k, [metric, *_RANKED_METRICS]) if top_k else None
+            )
+            spill = ResultSpill(results_path) if results_path else None
 
             logger.info(
-                "Starting optimization with %d parameter combinations",
-                len(param_combinations),
+                "Starting optimization over %d parameter combinations (%s)",
+                total_combinations,
+                type(search).__name__,
             )
 
-            for i, params in enumerate(param_combinations):
-                try:
-                    # Create strategy instance
-                    strategy = strategy_class(**params)
-
-                    # Run backtest
-                    result = self.run_backtest(strategy, data, symbol)
-
-                    # Get metric score
-                    score = result.stats.get(metric, 0.0)
-
-                    # Track results
-                    result_data = {"params": params, "score": score, **result.stats}
-                    all_results.append(result_data)
-
-                    # Update best parameters
-                    is_better = (
-                        score > best_score
-                        if metric != "max_drawdown"
-                        else score < best_score
+            # One pool and data export serve every chunk the search evaluates
+            pool_jobs = (
+                1 if broadcast else self._resolve_n_jobs(n_jobs, total_combinations)
+            )
+            with self._optimization_pool(data, pool_jobs) as executor:
+
+                def evaluate(
+                    param_combinations: list[dict[str, Any]], eval_data: pd.DataFrame
+                ) -> list[dict[str, Any]]:
+                    nonlocal evaluated
+                    evaluated += len(param_combinations)
+                    return self.evaluate_combinations(
+                        strategy_class,
+                        eval_data,
+                        param_combinations,
+                        symbol,
+                        metric,
+                        n_jobs=n_jobs,
+                        progress_callback=progress_callback,
+                        broadcast=broadcast,
+                        executor=executor,
+                        rows=_row_window(data, eval_data),
                     )
 
-                    if is_better:
-                        best_score = score
-                        best_params = params.copy()
-
-                    if (i + 1) % 10 == 0:
-                        logger.info(
-                            "Completed %d/%d optimizations",
-                            i + 1,
-                            len(param_combinations),
-                        )
+                try:
+                    best_params, best_score, all_results = self._collect_results(
+                        search.run(evaluate, param_ranges, data, metric),
+                        metric,
+                        top_results,
+                        spill,
+                    )
+                finally:
+                    if spill is not None:
+                        spill.close()
 
-                except Exception as e:
-                    logger.warning("Optimization failed for params %s: %s", params, e)
+            logger.info("Indicator cache: %s", indicator_cache.get_stats())
 
-            return {
+            result = {
                 "best_params": best_params,
                 "best_score": best_score,
                 "metric": metric,
                 "all_results": all_results,
-                "total_combinations": len(param_combinations),
+                "total_combinations": total_combinations,
+                "evaluated_combinations": evaluated,
+                "search": type(search).__name__,
             }
+            if top_results is not None:
+                result["all_results"] = top_results.top(metric)
+                result["top_results"] = {
+                    name: top_results.top(name) for name in top_results.metrics
+                }
+            if spill is not None:
+                result["results_path"] = str(spill.path)
+
+            return result
 
         except Exception as e:
             logger.error("Optimization failed: %s", e)
             raise
 
+    def _collect_results(
+        self,
+        batches: Iterable[list[dict[str, Any]]],
+        metric: str,
+        top_results: TopKResults | None,
+        spill: ResultSpill | None,
+    ) -> tuple[dict[str, Any], float, list[dict[str, Any]]]:
+        """Track the best parameters while keeping or spilling every result.
+
+        Returns:
+            Best parameters, their score and the results kept in memory
+            (empty when ``top_results`` collects them instead).
+        """
+        all_results: list[dict[str, Any]] = []
+        best_params: dict[str, Any] = {}
+        best_score = float("-inf") if metric != "max_drawdown" else float("inf")
+
+        for batch in batches:
+            for result_data in batch:
+                # Update best parameters
+                score = result_data["score"]
+                is_better = (
+                    score > best_score
+                    if metric != "max_drawdown"
+                    else score < best_score
+                )
+
+                if is_better:
+                    best_score = score
+                    best_params = result_data["params"].copy()
+
+                if top_results is not None:
+                    top_results.push(result_data)
+                else:
+                    all_results.append(result_data)
+                if spill is not None:
+                    spill.append(result_data)
+
+        return best_params, best_score, all_results
+
+    @contextmanager
+    def _optimization_pool(
+        self, data: pd.DataFrame, n_jobs: int
+    ) -> Iterator[ProcessPoolExecutor | None]:
+        """Start worker processes attached to a shared export of the data.
+
+        Yields None when ``n_jobs`` is 1, so work stays in this process.
+        """
+        if n_jobs <= 1:
+            yield None
+            return
+
+        engine_settings = {
+            "initial_cash": self.initial_cash,
+            "commission": self.commission,
+            "slippage": self.slippage,
+            "metrics_engine": self.metrics_engine,
+        }
+        with shared_ohlcv(data, prefix="backtest_") as shared:
+            with ProcessPoolExecutor(
+                max_workers=n_jobs,
+                mp_context=POOL_CONTEXT,
+                initializer=init_optimization_worker,
+                initargs=(shared, engine_settings),
+            ) as executor:
+                yield executor
+
+    def evaluate_combinations(
+        self,
+        strategy_class: type[BaseStrategy],
+        data: pd.DataFrame,
+        param_combinations: list[dict[str, Any]],
+        symbol: str,
+        metric: str,
+        n_jobs: int = 1,
+        progress_callback: Callable[[dict[str, Any]], None] | None = None,
+        broadcast: bool = False,
+        executor: ProcessPoolExecutor | None = None,
+        rows: tuple[int, int] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Backtest a list of parameter combinations.
+
+        Args:
+            strategy_class: Strategy class to optimize.
+            data: OHLCV price data.
+            param_combinations: Parameter combinations to evaluate.
+            symbol: Trading symbol.
+            metric: Optimization metric.
+            n_jobs: Number of worker processes (-1 uses all cores).
+            progress_callback: Called with each result as soon as it is
+                available.
+            broadcast: Simulate all combinations in one vectorbt portfolio.
+            executor: Running pool from ``_optimization_pool`` to reuse
+                instead of starting one for this call.
+            rows: Positions of ``data`` within the frame the executor's
+                workers hold (required with ``executor``).
+
+        Returns:
+            Results of successful combinations, in input order.
+        """
+        n_jobs = self._resolve_n_jobs(n_jobs, len(param_combinations))
+        if broadcast:
+            results = self._run_optimization_broadcast(
+                strategy_class,
+                data,
+                param_combinations,
+                metric,
+                progress_callback,
+            )
+        elif n_jobs > 1:
+            results = self._run_optimization_parallel(
+                strategy_class,
+                data,
+                param_combinations,
+                symbol,
+                metric,
+                n_jobs,
+                progress_callback,
+                executor if rows is not None else None,
+                rows,
+            )
+        else:
+            results = self._run_optimization_serial(
+                strategy_class,
+                data,
+                param_combinations,
+                symbol,
+                metric,
+                progress_callback,
+            )
+
+        # Merge in combination order so results are deterministic
+        return [results[index] for index in sorted(results)]
+
+    def _evaluate_params(
+        self,
+        strategy_class: type[BaseStrategy],
+        data: pd.DataFrame,
+        params: dict[str, Any],
+        symbol: str,
+        metric: str,
+    ) -> dict[str, Any]:
+        """Backtest one parameter combination and score it."""
+        # Create strategy instance
+        strategy = strategy_class(**params)
+
+        # Run backtest
+        result = self.run_backtest(strategy, data, symbol)
+
+        # Get metric score
+        score = result.stats.get(metric, 0.0)
+
+        return {"params": params, "score": score, **result.stats}
+
+    def _run_optimization_serial(
+        self,
+        strategy_class: type[BaseStrategy],
+        data: pd.DataFrame,
+        param_combinations: list[dict[str, Any]],
+        symbol: str,
+        metric: str,
+        progress_callback: Callable[[dict[str, Any]], None] | None,
+    ) -> dict[int, dict[str, Any]]:
+        """Evaluate parameter combinations in the current process."""
+        results = {}
+
+        for i, params in enumerate(param_combinations):
+            try:
+                results[i] = self._evaluate_params(
+                    strategy_class, data, params, symbol, metric
+                )
+                if progress_callback:
+                    progress_callback(results[i])
+
+            except Exception as e:
+                logger.warning("Optimization failed for params %s: %s", params, e)
+
+            if (i + 1) % 10 == 0:
+                logger.info(
+                    "Completed %d/%d optimizations", i + 1, len(param_combinations)
+                )
+
+        return results
+
+    def _run_optimization_parallel(
+        self,
+        strategy_class: type[BaseStrategy],
+        data: pd.DataFrame,
+        param_combinations: list[dict[str, Any]],
+        symbol: str,
+        metric: str,
+        n_jobs: int,
+        progress_callback: Callable[[dict[str, Any]], None] | None,
+        executor: ProcessPoolExecutor | None = None,
+        rows: tuple[int, int] | None = None,
+    ) -> dict[int, dict[str, Any]]:
+        """Evaluate parameter combinations across a process pool.
+
+        Every worker attaches to a memory-mapped copy of the OHLCV frame at
+        startup (the frame's own export when it was opened from one), so tasks
+        only carry parameter batches. A running ``executor`` is reused, with
+        ``rows`` selecting ``data`` from the frame its workers hold.
+        """
+        if executor is None:
+            with self._optimization_pool(data, n_jobs) as pool:
+                return self._run_optimization_parallel(
+                    strategy_class,
+                    data,
+                    param_combinations,
+                    symbol,
+                    metric,
+                    n_jobs,
+                    progress_callback,
+                    pool,
+                )
+
+        indexed = list(enumerate(param_combinations))
+        batch_size = max(1, math.ceil(len(indexed) / (n_jobs * 4)))
+        batches = [
+            indexed[i : i + batch_size] for i in range(0, len(indexed), batch_size)
+        ]
+
+        results = {}
+        completed = 0
+
+        futures = [
+            executor.submit(
+                run_optimization_batch, strategy_class, batch, symbol, metric, rows
+            )
+            for batch in batches
+        ]
+
+        for future in as_completed(futures):
+            for index, result_data in future.result():
+                completed += 1
+                if result_data is None:
+                    continue
+
+                results[index] = result_data
+                if progress_callback:
+                    progress_callback(result_data)
+
+            logger.info(
+                "Completed %d/%d optimizations",
+                completed,
+                len(param_combinations),
+            )
+
+        return results
+
+    def _run_optimization_broadcast(
+        self,
+        strategy_class: type[BaseStrategy],
+        data: pd.DataFrame,
+        param_combinations: list[dict[str, Any]],
+        metric: str,
+        progress_callback: Callable[[dict[str, Any]], None] | None,
+    ) -> dict[int, dict[str, Any]]:
+        """Evaluate parameter combinations in one multi-column portfolio.
+
+        Each combination's entries and exits become one column of a 2D signal
+        matrix, so vectorbt runs a single broadcast simulation and metrics are
+        reduced column-wise instead of calling ``portfolio.stats()`` per run.
+        """
+        entries = {}
+        exits = {}
+
+        for i, params in enumerate(param_combinations):
+            try:
+                signals = self._generate_signals(strategy_class(**params), data)
+                entries[i] = signals["entries"]
+                exits[i] = signals["exits"]
+            except Exception as e:
+                logger.warning("Optimization failed for params %s: %s", params, e)
+
+        if not entries:
+            return {}
+
+        columns = list(entries)
+        portfolio = vbt.Portfolio.from_signals(
+            close=data["close"],
+            entries=pd.DataFrame(entries, index=data.index),
+            exits=pd.DataFrame(exits, index=data.index),
+            init_cash=self.initial_cash,
+            fees=self.commission,
+            slippage=self.slippage,
+            freq=_PORTFOLIO_FREQ,
+        )
+        column_stats = self._calculate_statistics_columnwise(portfolio, data)
+
+        results = {}
+        for position, index in enumerate(columns):
+            stats = {key: values[position] for key, values in column_stats.items()}
+            results[index] = {
+                "params": param_combinations[index],
+                "score": stats.get(metric, 0.0),
+                **stats,
+            }
+            if progress_callback:
+                progress_callback(results[index])
+
+        logger.info(
+            "Completed %d/%d optimizations in one broadcast portfolio",
+            len(results),
+            len(param_combinations),
+        )
+
+        return results
+
+    def _calculate_statistics_columnwise(
+        self, portfolio: Any, data: pd.DataFrame
+    ) -> dict[str, list[Any]]:
+        """Calculate performance statistics for every portfolio column.
+
+        Produces the same metrics as ``_calculate_statistics`` from the value
+        matrix and raw trade records instead of ``portfolio.stats()``.
+        """
+        metrics = portfolio_metrics(
+            portfolio, self.initial_cash, self._annualization(data)
+        )
+        n_columns = len(metrics["end_value"])
+        bar = infer_bar_frequency(data.index, _PORTFOLIO_FREQ)
+        duration = str(bar * len(data))
+
+        return {
+            **{name: values.tolist() for name, values in metrics.items()},
+            "duration": [duration] * n_columns,
+        }
+
+    def _annualization(self, data: pd.DataFrame) -> float:
+        """Get the number of bars per year used to annualize metrics."""
+        if self.metrics_engine == "numpy":
+            return periods_per_year(infer_bar_frequency(data.index, _PORTFOLIO_FREQ))
+        return 252.0  # Same convention as _calculate_sharpe_ratio
+
+    def _resolve_n_jobs(self, n_jobs: int, total_tasks: int) -> int:
+        """Resolve requested worker count against CPUs and task count."""
+        if n_jobs < 0:
+            n_jobs = os.cpu_count() or 1
+        return max(1, min(n_jobs, total_tasks))
+
     def _filter_data_by_date(
         self,
         data: pd.DataFrame,
@@ -234,28 +847,28 @@ class BacktestEngine:
     def _generate_signals(
         self, strategy: BaseStrategy, data: pd.DataFrame
     ) -> pd.DataFrame:
-        """Generate buy/sell signals from strategy."""
-        try:
-            signals = pd.DataFrame(index=data.index)
-            signals["entries"] = False
-            signals["exits"] = False
-
-            # Generate signals for each time step
-            for i in range(len(data)):
-                if i < strategy.parameters.get(
-                    "long_window", 30
-                ):  # Skip insufficient data
-                    continue
-
-                # Get data up to current point
-                current_data = data.iloc[: i + 1]
-
-                # Generate buy/sell signals
-                buy_signal = strategy.should_buy(current_data)
-                sell_signal = strategy.should_sell(current_data)
+        """Generate buy/sell signals from strategy.
 
-                signals.iloc[i, signals.columns.get_loc("entries")] = buy_signal
-                signals.iloc[i, signals.columns.get_loc("exits")] = sell_signal
+        Uses the strategy's vectorized signal generation when available and
+        falls back to evaluating every bar on its data prefix otherwise.
+        """
+        try:
+            # Skip insufficient data
+            warmup = strategy.parameters.get("long_window", 30)
+
+            vectorized = strategy.generate_signals_vectorized(data)
+            if vectorized is None:
+                return self._generate_signals_per_bar(strategy, data, warmup)
+
+            entries, exits = vectorized
+            signals = pd.DataFrame(
+                {
+                    "entries": np.asarray(entries, dtype=bool),
+                    "exits": np.asarray(exits, dtype=bool),
+                },
+                index=data.index,
+            )
+            signals.iloc[:warmup] = False
 
             return signals
 
@@ -263,6 +876,28 @@ class BacktestEngine:
             logger.error("Signal generation failed: %s", e)
             raise
 
+    def _generate_signals_per_bar(
+        self, strategy: BaseStrategy, data: pd.DataFrame, warmup: int
+    ) -> pd.DataFrame:
+        """Generate signals by evaluating the strategy on each data prefix."""
+        signals = pd.DataFrame(index=data.index)
+        signals["entries"] = False
+        signals["exits"] = False
+
+        # Generate signals for each time step
+        for i in range(warmup, len(data)):
+            # Get data up to current point
+            current_data = data.iloc[: i + 1]
+
+            # Generate buy/sell signals
+            buy_signal = strategy.should_buy(current_data)
+            sell_signal = strategy.should_sell(current_data)
+
+            signals.iloc[i, signals.columns.get_loc("entries")] = buy_signal
+            signals.iloc[i, signals.columns.get_loc("exits")] = sell_signal
+
+        return signals
+
     def _run_vectorbt_backtest(self, data: pd.DataFrame, signals: pd.DataFrame) -> Any:
         """Run vectorbt backtest."""
         try:
@@ -274,7 +909,7 @@ class BacktestEngine:
                 init_cash=self.initial_cash,
                 fees=self.commission,
                 slippage=self.slippage,
-                freq="1h",  # Adjust based on data frequency
+                freq=_PORTFOLIO_FREQ,
             )
 
             return portfolio
@@ -287,6 +922,10 @@ class BacktestEngine:
         self, portfolio: Any, data: pd.DataFrame
     ) -> dict[str, Any]:
         """Calculate performance statistics."""
+        if self.metrics_engine == "numpy":
+            column_stats = self._calculate_statistics_columnwise(portfolio, data)
+            return {key: values[0] for key, values in column_stats.items()}
+
         try:
             # Get portfolio statistics
             stats = portfolio.stats()
@@ -330,7 +969,8 @@ class BacktestEngine:
                 "total_trades": len(trades),
                 "start_value": float(stats["Start Value"]),
                 "end_value": float(stats["End Value"]),
-                "duration": str(stats["Duration"]),
+                # Newer vectorbt versions report the span as "Period"
+                "duration": str(stats.get("Period", stats.get("Duration"))),
             }
 
         except Exception as e:
@@ -395,22 +1035,6 @@ class BacktestEngine:
             logger.error("Trade extraction failed: %s", e)
             return pd.DataFrame()
 
-    def _generate_param_combinations(
-        self, param_ranges: dict[str, list[Any]]
-    ) -> list[dict[str, Any]]:
-        """Generate all parameter combinations."""
-        import itertools
-
-        keys = list(param_ranges.keys())
-        values = list(param_ranges.values())
-
-        combinations = []
-        for combination in itertools.product(*values):
-            param_dict = dict(zip(keys, combination, strict=False))
-            combinations.append(param_dict)
-
-        return combinations
-
     def compare_strategies(
         self,
         strategies: list[BaseStrategy],
@@ -0,0 +1,146 @@
+"""NumPy performance metrics computed from equity curves and trade records."""
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+# Crypto markets trade around the clock
+_YEAR = pd.Timedelta(days=365)
+
+
+def periods_per_year(freq: str | pd.Timedelta) -> float:
+    """Get the number of bars per year for a bar frequency.
+
+    Args:
+        freq: Bar frequency (e.g. ``"1h"``, ``"1d"``).
+
+    Returns:
+        Annualization factor for per-bar returns.
+    """
+    return float(_YEAR / pd.Timedelta(freq))
+
+
+def infer_bar_frequency(index: pd.Index, default: str = "1h") -> pd.Timedelta:
+    """Infer the bar frequency of a datetime index from its median spacing."""
+    if isinstance(index, pd.DatetimeIndex) and len(index) > 1:
+        spacing = np.median(np.diff(index.asi8))
+        if spacing > 0:
+            return pd.Timedelta(int(spacing), unit="ns")
+    return pd.Timedelta(default)
+
+
+def calculate_metrics(
+    values: np.ndarray,
+    initial_cash: float,
+    trade_columns: np.ndarray,
+    trade_pnl: np.ndarray,
+    annualization: float,
+    risk_free_rate: float = 0.02,
+) -> dict[str, np.ndarray]:
+    """Calculate performance metrics for one or more equity curves.
+
+    Args:
+        values: Portfolio values, shape ``(bars,)`` or ``(bars, columns)``.
+        initial_cash: Portfolio value before the first bar.
+        trade_columns: Column of each trade record.
+        trade_pnl: PnL of each trade record.
+        annualization: Bars per year used to annualize the Sharpe ratio.
+        risk_free_rate: Annual risk-free rate.
+
+    Returns:
+        Metric arrays with one value per column.
+    """
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        values = values[:, None]
+    n_columns = values.shape[1]
+
+    previous = np.empty_like(values)
+    previous[0] = initial_cash
+    previous[1:] = values[:-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.where(previous != 0, values / previous - 1, 0.0)
+
+    start_value = np.full(n_columns, initial_cash, dtype=float)
+    end_value = values[-1]
+    total_return = end_value / start_value - 1
+
+    std = returns.std(axis=0, ddof=1) if len(returns) > 1 else np.zeros(n_columns)
+    mean_excess = (returns - risk_free_rate / annualization).mean(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe_ratio = np.where(
+            std > 0, mean_excess / std * np.sqrt(annualization), 0.0
+        )
+
+    # Max drawdown as a positive fraction
+    running_max = np.maximum.accumulate(values, axis=0)
+    max_drawdown = np.max(1 - values / running_max, axis=0)
+
+    trade_columns = np.asarray(trade_columns, dtype=np.int64)
+    trade_pnl = np.asarray(trade_pnl, dtype=float)
+    total_trades = np.bincount(trade_columns, minlength=n_columns)
+    winning_trades = np.bincount(
+        trade_columns, weights=trade_pnl > 0, minlength=n_columns
+    )
+    gross_profit = np.bincount(
+        trade_columns,
+        weights=np.where(trade_pnl > 0, trade_pnl, 0.0),
+        minlength=n_columns,
+    )
+    gross_loss = np.bincount(
+        trade_columns,
+        weights=np.where(trade_pnl < 0, -trade_pnl, 0.0),
+        minlength=n_columns,
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        win_rate = np.where(total_trades > 0, winning_trades / total_trades, 0.0)
+        profit_factor = np.where(
+            gross_loss > 0,
+            gross_profit / gross_loss,
+            np.where(gross_profit > 0, np.inf, 0.0),
+        )
+        calmar_ratio = np.where(
+            max_drawdown != 0, total_return / np.abs(max_drawdown), 0.0
+        )
+
+    return {
+        "total_return": total_return,
+        "sharpe_ratio": sharpe_ratio,
+        "max_drawdown": max_drawdown,
+        "win_rate": win_rate,
+        "profit_factor": profit_factor,
+        "calmar_ratio": calmar_ratio,
+        "total_trades": total_trades,
+        "start_value": start_value,
+        "end_value": end_value,
+    }
+
+
+def portfolio_metrics(
+    portfolio: Any,
+    initial_cash: float,
+    annualization: float,
+    risk_free_rate: float = 0.02,
+) -> dict[str, np.ndarray]:
+    """Calculate metrics of a vectorbt portfolio from its raw arrays.
+
+    Reads the value matrix and raw trade records instead of
+    ``portfolio.stats()`` and ``trades.records_readable``.
+    """
+    values = np.asarray(portfolio.value(), dtype=float)
+    records = portfolio.trades.records
+    trade_columns = np.asarray(records["col"], dtype=np.int64)
+    if values.ndim == 1:
+        # Single column or one cash-sharing group: every trade belongs to it
+        trade_columns = np.zeros_like(trade_columns)
+
+    return calculate_metrics(
+        values,
+        initial_cash,
+        trade_columns,
+        records["pnl"],
+        annualization,
+        risk_free_rate,
+    )
@@ -0,0 +1,264 @@
+"""Process-pool helpers for parallel backtesting."""
+
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from system_trading.strategies.base_strategy import BaseStrategy
+
+logger = logging.getLogger(__name__)
+
+# Worker pools start from a forkserver: forking the (often threaded) API
+# process could copy locks held by its other threads and deadlock workers
+POOL_CONTEXT = multiprocessing.get_context("forkserver")
+
+# Per-process state populated by init_optimization_worker
+_worker_data: pd.DataFrame | None = None
+_worker_engine: Any = None
+
+
+class SharedOHLCV:
+    """OHLCV frame stored as memory-mapped ``.npy`` columns.
+
+    The frame is written once by the parent process; worker processes open the
+    files read-only with ``mmap_mode="r"`` so the OS page cache is shared
+    instead of every task pickling its own copy of the data.
+    """
+
+    META_FILE = "meta.json"
+    INDEX_FILE = "index.npy"
+    # DataFrame.attrs key recording the export a frame was opened from
+    ATTRS_KEY = "shared_ohlcv"
+
+    def __init__(self, directory: str | Path) -> None:
+        """Initialize shared OHLCV handle.
+
+        Args:
+            directory: Directory containing the exported columns.
+        """
+        self.directory = Path(directory)
+
+    @classmethod
+    def export(cls, data: pd.DataFrame, directory: str | Path) -> "SharedOHLCV":
+        """Export a DataFrame to memory-mappable column files.
+
+        Args:
+            data: OHLCV DataFrame with datetime index.
+            directory: Target directory (created if missing).
+
+        Returns:
+            Handle that can be pickled cheaply and opened in workers.
+        """
+        directory = Path(directory)
+        directory.parent.mkdir(parents=True, exist_ok=True)
+        # Write next to the target and publish atomically, so processes that
+        # attach concurrently never see a partial export
+        tmp_dir = Path(
+            tempfile.mkdtemp(prefix=f".{directory.name}.", dir=directory.parent)
+        )
+
+        try:
+            index = pd.DatetimeIndex(data.index)
+            np.save(tmp_dir / cls.INDEX_FILE, index.asi8)
+
+            columns = []
+            for column in data.columns:
+                values = np.ascontiguousarray(data[column].to_numpy())
+                np.save(tmp_dir / f"{column}.npy", values)
+                columns.append(str(column))
+
+            meta = {
+                "columns": columns,
+                "index_name": index.name,
+                "tz": str(index.tz) if index.tz is not None else None,
+                "rows": len(data),
+            }
+            (tmp_dir / cls.META_FILE).write_text(json.dumps(meta))
+
+            if directory.exists():
+                if not cls(directory).exists() and any(directory.iterdir()):
+                    raise FileExistsError(f"{directory} is not an OHLCV export")
+                shutil.rmtree(directory)
+            os.replace(tmp_dir, directory)
+        except BaseException:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+
+        return cls(directory)
+
+    @classmethod
+    def attached(cls, data: pd.DataFrame) -> "SharedOHLCV | None":
+        """Get the export a frame was opened from, if it still matches it.
+
+        Slices of an opened frame keep its ``attrs``, so the export is only
+        reused when the frame still covers exactly the exported rows.
+        """
+        directory = data.attrs.get(cls.ATTRS_KEY)
+        if directory is None:
+            return None
+
+        shared = cls(directory)
+        if not shared.exists():
+            return None
+        meta = json.loads((shared.directory / cls.META_FILE).read_text())
+        if meta["rows"] != len(data) or meta["columns"] != [
+            str(column) for column in data.columns
+        ]:
+            return None
+        index = np.load(shared.directory / cls.INDEX_FILE, mmap_mode="r")
+        if len(index) and (
+            index[0] != data.index[0].value or index[-1] != data.index[-1].value
+        ):
+            return None
+        return shared
+
+    def exists(self) -> bool:
+        """Check whether the export is complete."""
+        return (self.directory / self.META_FILE).exists()
+
+    def open(self) -> pd.DataFrame:
+        """Open the exported frame backed by read-only memory maps."""
+        meta = json.loads((self.directory / self.META_FILE).read_text())
+
+        # Viewing the int64 nanoseconds as datetime64 keeps the index mapped
+        index = pd.DatetimeIndex(
+            np.load(self.directory / self.INDEX_FILE, mmap_mode="r").view("M8[ns]"),
+            name=meta["index_name"],
+            copy=False,
+        )
+        if meta["tz"]:
+            index = index.tz_localize("UTC").tz_convert(meta["tz"])
+
+        columns = {
+            column: np.load(self.directory / f"{column}.npy", mmap_mode="r")
+            for column in meta["columns"]
+        }
+        frame = pd.DataFrame(columns, index=index, copy=False)
+        frame.attrs[self.ATTRS_KEY] = str(self.directory)
+        return frame
+
+
+@contextmanager
+def shared_ohlcv(
+    data: pd.DataFrame, prefix: str = "backtest_"
+) -> Iterator[SharedOHLCV]:
+    """Get a memory-mapped export of a frame for worker processes.
+
+    Frames opened from an export (e.g. by
+    ``BacktestDataManager.open_shared``) reuse it without writing anything;
+    other frames are exported to a temporary directory removed on exit.
+
+    Args:
+        data: OHLCV DataFrame with datetime index.
+        prefix: Prefix of the temporary directory.
+
+    Yields:
+        Handle that workers open with ``SharedOHLCV.open``.
+    """
+    shared = SharedOHLCV.attached(data)
+    if shared is not None:
+        yield shared
+        return
+
+    with tempfile.TemporaryDirectory(prefix=prefix) as tmp_dir:
+        yield SharedOHLCV.export(data, Path(tmp_dir) / "ohlcv")
+
+
+def init_optimization_worker(
+    shared: SharedOHLCV, engine_settings: dict[str, Any]
+) -> None:
+    """Attach a worker process to the shared data and build its engine.
+
+    Args:
+        shared: Handle to the memory-mapped OHLCV frame.
+        engine_settings: BacktestEngine constructor arguments.
+    """
+    # Import here to avoid circular imports
+    from system_trading.backtesting.engine import BacktestEngine
+
+    global _worker_data, _worker_engine
+    _worker_data = shared.open()
+    _worker_engine = BacktestEngine(**engine_settings)
+
+
+def get_worker_context() -> tuple[pd.DataFrame, Any]:
+    """Get the shared data and engine of an initialized worker process."""
+    if _worker_data is None or _worker_engine is None:
+        raise RuntimeError("Optimization worker is not initialized")
+    return _worker_data, _worker_engine
+
+
+def run_optimization_batch(
+    strategy_class: type[BaseStrategy],
+    batch: list[tuple[int, dict[str, Any]]],
+    symbol: str,
+    metric: str,
+    rows: tuple[int, int] | None = None,
+) -> list[tuple[int, dict[str, Any] | None]]:
+    """Evaluate a batch of parameter combinations inside a worker.
+
+    Args:
+        strategy_class: Strategy class to optimize.
+        batch: ``(combination index, params)`` pairs.
+        symbol: Trading symbol.
+        metric: Optimization metric.
+        rows: Start and stop positions of the bars to backtest on (all bars
+            if None).
+
+    Returns:
+        ``(combination index, result)`` pairs; result is None on failure.
+    """
+    data, engine = get_worker_context()
+    if rows is not None:
+        data = data.iloc[rows[0] : rows[1]]
+
+    results: list[tuple[int, dict[str, Any] | None]] = []
+    for index, params in batch:
+        try:
+            result = engine._evaluate_params(
+                strategy_class, data, params, symbol, metric
+            )
+        except Exception as e:
+            logger.warning("Optimization failed for params %s: %s", params, e)
+            result = None
+        results.append((index, result))
+
+    return results
+
+
+def run_walk_forward_fold(
+    strategy_class: type[BaseStrategy],
+    fold: dict[str, int],
+    param_ranges: dict[str, list[Any]],
+    symbol: str,
+    metric: str,
+) -> dict[str, Any]:
+    """Optimize and evaluate one walk-forward fold inside a worker.
+
+    Args:
+        strategy_class: Strategy class to optimize.
+        fold: Fold boundaries (positional train/test windows).
+        param_ranges: Parameter ranges to test.
+        symbol: Trading symbol.
+        metric: Optimization metric.
+
+    Returns:
+        Fold result.
+    """
+    # Import here to avoid circular imports
+    from system_trading.backtesting.walk_forward import evaluate_fold
+
+    data, engine = get_worker_context()
+    return evaluate_fold(
+        engine, strategy_class, data, fold, param_ranges, symbol, metric
+    )
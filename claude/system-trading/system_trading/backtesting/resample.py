@@ -0,0 +1,131 @@
+"""Vectorized OHLCV resampling to coarser timeframes."""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+from system_trading.backtesting.metrics import infer_bar_frequency
+
+_UNIT_SECONDS = {"m": 60, "h": 3600, "d": 86400, "w": 7 * 86400}
+# Weekly candles open on Monday 00:00 UTC; the epoch was a Thursday
+_WEEK_ORIGIN_NS = 4 * 86400 * 10**9
+
+
+def parse_timeframe(timeframe: str) -> tuple[int, str]:
+    """Split a ccxt-style timeframe such as ``"4h"`` into count and unit."""
+    match = re.fullmatch(r"([1-9]\d*)([mhdwM])", timeframe)
+    if match is None:
+        raise ValueError(f"Unsupported timeframe: {timeframe}")
+    return int(match[1]), match[2]
+
+
+def timeframe_to_timedelta(timeframe: str) -> pd.Timedelta:
+    """Get the duration of a fixed-length timeframe."""
+    count, unit = parse_timeframe(timeframe)
+    if unit == "M":
+        raise ValueError(f"Timeframe {timeframe} has no fixed duration")
+    return pd.Timedelta(seconds=count * _UNIT_SECONDS[unit])
+
+
+def can_resample(timeframe: str, base_timeframe: str) -> bool:
+    """Check whether every bar of a timeframe is made of whole base bars."""
+    try:
+        base = timeframe_to_timedelta(base_timeframe)
+        if parse_timeframe(timeframe)[1] == "M":
+            # Months are whole days
+            return pd.Timedelta(days=1) % base == pd.Timedelta(0)
+        target = timeframe_to_timedelta(timeframe)
+    except ValueError:
+        return False
+    return target > base and target % base == pd.Timedelta(0)
+
+
+def bucket_starts(index: pd.DatetimeIndex, timeframe: str) -> np.ndarray:
+    """Get the opening time (UTC nanoseconds) of the bar holding each timestamp.
+
+    Bars are aligned the way exchanges align them: to the Unix epoch for
+    minutes, hours and days, to Monday for weeks and to calendar months.
+    """
+    count, unit = parse_timeframe(timeframe)
+    if unit == "M":
+        months = index.asi8.astype("datetime64[ns]").astype("datetime64[M]")
+        months = months.astype(np.int64) // count * count
+        return months.astype("datetime64[M]").astype("datetime64[ns]").astype(np.int64)
+
+    step = count * _UNIT_SECONDS[unit] * 10**9
+    origin = _WEEK_ORIGIN_NS if unit == "w" else 0
+    return (index.asi8 - origin) // step * step + origin
+
+
+def bucket_end(start_ns: int, timeframe: str) -> int:
+    """Get the closing time (UTC nanoseconds) of the bar opening at a time."""
+    count, unit = parse_timeframe(timeframe)
+    if unit == "M":
+        return (pd.Timestamp(start_ns).to_period("M") + count).start_time.value
+    return start_ns + count * _UNIT_SECONDS[unit] * 10**9
+
+
+def resample_ohlcv(
+    data: pd.DataFrame,
+    timeframe: str,
+    base_timeframe: str | None = None,
+    include_partial: bool = False,
+) -> pd.DataFrame:
+    """Aggregate OHLCV candles into a coarser timeframe.
+
+    Bars are formed with ``reduceat`` over contiguous runs of the same bucket,
+    so no Python-level grouping is involved. Missing base candles simply make
+    a bar from fewer candles, and buckets without any candle are skipped, as
+    exchanges do.
+
+    Args:
+        data: OHLCV DataFrame with a sorted datetime index.
+        timeframe: Target timeframe (e.g. ``"4h"``, ``"1d"``, ``"1w"``).
+        base_timeframe: Timeframe of ``data`` (inferred if None).
+        include_partial: Keep the first and last bars even if the data starts
+            after their opening or ends before their closing.
+
+    Returns:
+        OHLCV DataFrame indexed by bar opening time.
+    """
+    columns = ["open", "high", "low", "close", "volume"]
+    data = data[columns].dropna(subset=["open", "high", "low", "close"])
+    if data.empty:
+        return data.copy()
+
+    starts = bucket_starts(data.index, timeframe)
+    first_rows = np.flatnonzero(np.r_[True, starts[1:] != starts[:-1]])
+    last_rows = np.r_[first_rows[1:] - 1, len(data) - 1]
+
+    index = pd.DatetimeIndex(starts[first_rows].astype("datetime64[ns]"))
+    if data.index.tz is not None:
+        index = index.tz_localize("UTC").tz_convert(data.index.tz)
+
+    bars = pd.DataFrame(
+        {
+            "open": data["open"].to_numpy()[first_rows],
+            "high": np.maximum.reduceat(data["high"].to_numpy(), first_rows),
+            "low": np.minimum.reduceat(data["low"].to_numpy(), first_rows),
+            "close": data["close"].to_numpy()[last_rows],
+            "volume": np.add.reduceat(data["volume"].to_numpy(), first_rows),
+        },
+        index=index.rename(data.index.name),
+    )
+
+    if not include_partial:
+        base = (
+            timeframe_to_timedelta(base_timeframe)
+            if base_timeframe
+            else infer_bar_frequency(data.index)
+        )
+        # The first bar lacks candles if the data opens after it did
+        if data.index.asi8[0] > starts[0]:
+            bars = bars.iloc[1:]
+        # The last bar is still forming if its closing time is not covered
+        if len(bars) and data.index.asi8[-1] + base.value < bucket_end(
+            int(starts[-1]), timeframe
+        ):
+            bars = bars.iloc[:-1]
+
+    return bars
@@ -0,0 +1,192 @@
+"""Content-addressed on-disk cache of backtest results."""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from system_trading.strategies.base_strategy import BaseStrategy
+
+logger = logging.getLogger(__name__)
+
+
+class BacktestResultCache:
+    """Disk cache of backtest responses keyed by a hash of their inputs.
+
+    Each entry is a directory named after the key holding the statistics as
+    ``result.json`` and the trade records as ``trades.parquet``. Any change to
+    the data, strategy, parameters or engine settings produces a different
+    key, so stale entries are never returned; they simply age out through
+    least-recently-used eviction once the cache exceeds ``max_bytes``.
+    """
+
+    RESULT_FILE = "result.json"
+    TRADES_FILE = "trades.parquet"
+
+    def __init__(
+        self, cache_dir: str = "data/results", max_bytes: int = 512 * 1024 * 1024
+    ) -> None:
+        """Initialize result cache.
+
+        Args:
+            cache_dir: Directory to store cached results.
+            max_bytes: Disk budget for cached results.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def make_key(
+        self,
+        data_fingerprint: str,
+        strategy_class: type[BaseStrategy],
+        parameters: dict[str, Any],
+        settings: dict[str, Any],
+        symbol: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> str:
+        """Compute the cache key of a backtest.
+
+        Args:
+            data_fingerprint: Fingerprint of the input data.
+            strategy_class: Strategy class being tested.
+            parameters: Strategy parameters.
+            settings: Engine settings (initial cash, commission, slippage).
+            symbol: Trading symbol.
+            start_date: Backtest start date.
+            end_date: Backtest end date.
+
+        Returns:
+            Hex digest identifying the backtest inputs.
+        """
+        payload = {
+            "data": data_fingerprint,
+            "strategy": f"{strategy_class.__module__}.{strategy_class.__qualname__}",
+            "parameters": parameters,
+            "settings": settings,
+            "symbol": symbol,
+            "start_date": start_date.isoformat() if start_date else None,
+            "end_date": end_date.isoformat() if end_date else None,
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Get a cached result.
+
+        Args:
+            key: Cache key from ``make_key``.
+
+        Returns:
+            Cached result with its ``trades`` records, or None on a miss.
+        """
+        entry_dir = self.cache_dir / key
+        result_file = entry_dir / self.RESULT_FILE
+
+        try:
+            result = json.loads(result_file.read_text())
+            trades_file = entry_dir / self.TRADES_FILE
+            if trades_file.exists():
+                result["trades"] = pd.read_parquet(trades_file).to_dict("records")
+            else:
+                result["trades"] = []
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as e:
+            logger.warning("Discarding unreadable cached result %s: %s", key, e)
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            self.misses += 1
+            return None
+
+        # Mark as recently used for eviction
+        os.utime(result_file)
+        self.hits += 1
+        return result
+
+    def put(self, key: str, result: dict[str, Any], trades: pd.DataFrame) -> None:
+        """Store a result.
+
+        Args:
+            key: Cache key from ``make_key``.
+            result: JSON-serializable result without trades.
+            trades: Trade records.
+        """
+        entry_dir = self.cache_dir / key
+        tmp_dir = self.cache_dir / f".{key}.tmp"
+
+        try:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            tmp_dir.mkdir()
+            (tmp_dir / self.RESULT_FILE).write_text(json.dumps(result, default=str))
+            if not trades.empty:
+                trades.to_parquet(tmp_dir / self.TRADES_FILE, index=False)
+
+            # Publish atomically so readers never see a partial entry
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            tmp_dir.rename(entry_dir)
+        except Exception as e:
+            logger.warning("Failed to cache backtest result %s: %s", key, e)
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return
+
+        self._evict()
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        """List entries as ``(last used, size, path)``."""
+        entries = []
+        for entry_dir in self.cache_dir.iterdir():
+            result_file = entry_dir / self.RESULT_FILE
+            if entry_dir.name.startswith(".") or not result_file.exists():
+                continue
+            size = sum(f.stat().st_size for f in entry_dir.iterdir())
+            entries.append((result_file.stat().st_mtime, size, entry_dir))
+        return entries
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until under the disk budget."""
+        with self._lock:
+            entries = sorted(self._entries())
+            total = sum(size for _, size, _ in entries)
+
+            for _, size, entry_dir in entries:
+                if total <= self.max_bytes:
+                    break
+                shutil.rmtree(entry_dir, ignore_errors=True)
+                total -= size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters."""
+        with self._lock:
+            for entry_dir in self.cache_dir.iterdir():
+                shutil.rmtree(entry_dir, ignore_errors=True)
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache hit/miss statistics."""
+        entries = self._entries()
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "evictions": self.evictions,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            "max_bytes": self.max_bytes,
+        }
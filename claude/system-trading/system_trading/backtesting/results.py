@@ -0,0 +1,143 @@
+"""Bounded collection and on-disk spill of optimization results."""
+
+import heapq
+import itertools
+import logging
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+# Metrics where a lower value is better
+LOWER_IS_BETTER = frozenset({"max_drawdown"})
+
+
+def metric_value(result: dict[str, Any], metric: str) -> float:
+    """Get a sortable metric value where higher is always better."""
+    value = result.get(metric)
+    if value is None or value != value:  # NaN
+        return float("-inf")
+    return -value if metric in LOWER_IS_BETTER else value
+
+
+class TopKResults:
+    """Keep only the best ``k`` optimization results for each metric.
+
+    Every metric has its own min-heap of size ``k``, so memory stays bounded by
+    ``k * len(metrics)`` results regardless of how many combinations are
+    pushed. Ties keep the earliest result.
+    """
+
+    def __init__(self, k: int, metrics: list[str]) -> None:
+        """Initialize top-k collector.
+
+        Args:
+            k: Number of results kept per metric.
+            metrics: Metrics to rank results by.
+        """
+        if k <= 0:
+            raise ValueError("k must be positive")
+        self.k = k
+        self.metrics = list(dict.fromkeys(metrics))
+        self.count = 0
+        self._heaps: dict[str, list[tuple[float, int, dict[str, Any]]]] = {
+            metric: [] for metric in self.metrics
+        }
+        self._sequence = itertools.count()
+
+    def push(self, result: dict[str, Any]) -> None:
+        """Offer a result to every metric's heap."""
+        self.count += 1
+        # Negated sequence so that, on equal values, the earlier result wins
+        order = -next(self._sequence)
+
+        for metric, heap in self._heaps.items():
+            entry = (metric_value(result, metric), order, result)
+            if len(heap) < self.k:
+                heapq.heappush(heap, entry)
+            elif entry[:2] > heap[0][:2]:
+                heapq.heapreplace(heap, entry)
+
+    def top(self, metric: str) -> list[dict[str, Any]]:
+        """Get the kept results for a metric, best first."""
+        heap = self._heaps[metric]
+        return [entry[2] for entry in sorted(heap, key=lambda e: e[:2], reverse=True)]
+
+    def best(self, metric: str) -> dict[str, Any] | None:
+        """Get the best result for a metric."""
+        heap = self._heaps[metric]
+        if not heap:
+            return None
+        return max(heap, key=lambda e: e[:2])[2]
+
+
+class ResultSpill:
+    """Append optimization results to a Parquet file in row groups.
+
+    Results are buffered and flushed every ``chunk_size`` rows, so the full
+    result table can be analysed later without keeping it in memory.
+    Parameters are stored as ``param_<name>`` columns next to the statistics.
+    """
+
+    def __init__(self, path: str | Path, chunk_size: int = 10_000) -> None:
+        """Initialize result spill.
+
+        Args:
+            path: Target Parquet file (parent directories are created).
+            chunk_size: Rows buffered before a row group is written.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.chunk_size = chunk_size
+        self.rows_written = 0
+        self._buffer: list[dict[str, Any]] = []
+        self._writer: Any = None
+
+    def append(self, result: dict[str, Any]) -> None:
+        """Buffer one result and flush when the buffer is full."""
+        row = {f"param_{key}": value for key, value in result.get("params", {}).items()}
+        row.update({key: value for key, value in result.items() if key != "params"})
+        self._buffer.append(row)
+
+        if len(self._buffer) >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered rows as one row group."""
+        if not self._buffer:
+            return
+
+        frame = pd.DataFrame(self._buffer)
+        if self._writer is None:
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            self._writer = pq.ParquetWriter(self.path, table.schema)
+        else:
+            table = pa.Table.from_pandas(
+                frame, schema=self._writer.schema, preserve_index=False
+            )
+
+        self._writer.write_table(table)
+        self.rows_written += len(self._buffer)
+        self._buffer.clear()
+
+    def close(self) -> None:
+        """Flush remaining rows and close the file."""
+        self.flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        logger.info(
+            "Spilled %d optimization results to %s", self.rows_written, self.path
+        )
+
+    def __enter__(self) -> "ResultSpill":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the file on exit."""
+        self.close()
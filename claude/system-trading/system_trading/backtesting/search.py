@@ -0,0 +1,358 @@
+"""Parameter search strategies for backtest optimization."""
+
+import itertools
+import logging
+import math
+import random
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Evaluates parameter combinations on a dataset and returns their results
+Evaluator = Callable[[list[dict[str, Any]], pd.DataFrame], list[dict[str, Any]]]
+
+
+def grid_size(param_ranges: dict[str, list[Any]]) -> int:
+    """Get the number of combinations in a parameter grid."""
+    return math.prod(len(values) for values in param_ranges.values())
+
+
+def iter_param_combinations(
+    param_ranges: dict[str, list[Any]],
+) -> Iterator[dict[str, Any]]:
+    """Lazily iterate over every combination of a parameter grid."""
+    keys = list(param_ranges.keys())
+    for combination in itertools.product(*param_ranges.values()):
+        yield dict(zip(keys, combination, strict=True))
+
+
+def combination_at(param_ranges: dict[str, list[Any]], index: int) -> dict[str, Any]:
+    """Get the combination at a position of the grid without materializing it.
+
+    Positions follow ``itertools.product`` order (last parameter varies
+    fastest).
+    """
+    params = {}
+    for key in reversed(list(param_ranges.keys())):
+        values = param_ranges[key]
+        index, position = divmod(index, len(values))
+        params[key] = values[position]
+    return {key: params[key] for key in param_ranges}
+
+
+def rank_value(result: dict[str, Any], metric: str) -> float:
+    """Get a sortable value where higher is always better."""
+    score = result.get("score", 0.0)
+    if score is None or score != score:  # NaN
+        return float("-inf")
+    return -score if metric == "max_drawdown" else score
+
+
+class ParameterSearch(ABC):
+    """Abstract base class for parameter search strategies."""
+
+    @abstractmethod
+    def run(
+        self,
+        evaluate: Evaluator,
+        param_ranges: dict[str, list[Any]],
+        data: pd.DataFrame,
+        metric: str,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Search the parameter space.
+
+        Args:
+            evaluate: Backtests parameter combinations on a dataset.
+            param_ranges: Parameter ranges to search.
+            data: OHLCV price data.
+            metric: Optimization metric.
+
+        Yields:
+            Batches of results evaluated on the full dataset, in deterministic
+            order. Results on partial data (e.g. early halving rungs) are not
+            yielded.
+        """
+        pass
+
+
+class GridSearch(ParameterSearch):
+    """Exhaustive search over the Cartesian product of parameter ranges."""
+
+    def __init__(self, chunk_size: int = 1000) -> None:
+        """Initialize grid search.
+
+        Args:
+            chunk_size: Combinations materialized and evaluated at a time.
+        """
+        self.chunk_size = max(1, chunk_size)
+
+    def run(
+        self,
+        evaluate: Evaluator,
+        param_ranges: dict[str, list[Any]],
+        data: pd.DataFrame,
+        metric: str,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Evaluate every parameter combination, one chunk at a time."""
+        combinations = iter_param_combinations(param_ranges)
+        while chunk := list(itertools.islice(combinations, self.chunk_size)):
+            yield evaluate(chunk, data)
+
+
+class RandomSearch(ParameterSearch):
+    """Random sampling of the parameter grid with a fixed budget."""
+
+    def __init__(self, n_iter: int = 100, seed: int | None = None) -> None:
+        """Initialize random search.
+
+        Args:
+            n_iter: Number of combinations to evaluate.
+            seed: Random seed for reproducible sampling.
+        """
+        self.n_iter = n_iter
+        self.seed = seed
+
+    def run(
+        self,
+        evaluate: Evaluator,
+        param_ranges: dict[str, list[Any]],
+        data: pd.DataFrame,
+        metric: str,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Evaluate a random sample of distinct combinations."""
+        rng = random.Random(self.seed)  # noqa: S311 - parameter sampling, not crypto
+        size = grid_size(param_ranges)
+        indices = sorted(rng.sample(range(size), min(self.n_iter, size)))
+        yield evaluate([combination_at(param_ranges, i) for i in indices], data)
+
+
+class SuccessiveHalvingSearch(ParameterSearch):
+    """Successive halving on growing slices of the data.
+
+    Random candidates are first scored on a short recent slice of the data;
+    only the best ``1 / eta`` of each rung advance to a longer slice, and the
+    final rung is scored on the full dataset.
+    """
+
+    def __init__(
+        self,
+        n_candidates: int = 81,
+        eta: int = 3,
+        min_bars: int = 200,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize successive halving search.
+
+        Args:
+            n_candidates: Number of random candidates in the first rung.
+            eta: Reduction factor between rungs.
+            min_bars: Minimum number of bars used by any rung.
+            seed: Random seed for reproducible sampling.
+        """
+        if eta < 2:
+            raise ValueError("eta must be >= 2")
+        self.n_candidates = n_candidates
+        self.eta = eta
+        self.min_bars = min_bars
+        self.seed = seed
+
+    def run(
+        self,
+        evaluate: Evaluator,
+        param_ranges: dict[str, list[Any]],
+        data: pd.DataFrame,
+        metric: str,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Run successive halving rungs and yield the final rung results."""
+        rng = random.Random(self.seed)  # noqa: S311 - parameter sampling, not crypto
+        size = grid_size(param_ranges)
+        indices = sorted(rng.sample(range(size), min(self.n_candidates, size)))
+        candidates = [combination_at(param_ranges, i) for i in indices]
+
+        # One rung per factor of eta in the candidate count
+        n_rungs = 1
+        while self.eta**n_rungs <= len(candidates):
+            n_rungs += 1
+
+        for rung in range(n_rungs):
+            fraction = self.eta ** (rung - n_rungs + 1)
+            n_bars = min(len(data), max(self.min_bars, int(len(data) * fraction)))
+            rung_data = data.iloc[-n_bars:]
+
+            results = evaluate(candidates, rung_data)
+            logger.info(
+                "Successive halving rung %d/%d: %d candidates on %d bars",
+                rung + 1,
+                n_rungs,
+                len(candidates),
+                n_bars,
+            )
+
+            if rung == n_rungs - 1:
+                yield results
+                return
+            if not results:
+                return
+
+            survivors = max(1, math.ceil(len(results) / self.eta))
+            ranked = sorted(
+                results, key=lambda result: rank_value(result, metric), reverse=True
+            )
+            candidates = [result["params"] for result in ranked[:survivors]]
+
+
+class TPESearch(ParameterSearch):
+    """Tree-structured Parzen estimator over discrete parameter ranges.
+
+    After random startup trials, completed trials are split into a good set
+    (top ``gamma`` fraction) and a bad set. Each parameter gets smoothed
+    categorical densities ``l(x)`` and ``g(x)`` from those sets; candidates are
+    drawn from ``l`` and the one maximizing ``l(x) / g(x)`` is evaluated next.
+    """
+
+    def __init__(
+        self,
+        n_iter: int = 100,
+        n_startup: int = 20,
+        gamma: float = 0.25,
+        n_candidates: int = 24,
+        batch_size: int = 1,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize TPE search.
+
+        Args:
+            n_iter: Total number of combinations to evaluate.
+            n_startup: Random trials before the surrogate model is used.
+            gamma: Fraction of trials treated as good.
+            n_candidates: Candidates drawn from l(x) per proposal.
+            batch_size: Proposals evaluated together (useful with n_jobs > 1).
+            seed: Random seed for reproducible sampling.
+        """
+        self.n_iter = n_iter
+        self.n_startup = n_startup
+        self.gamma = gamma
+        self.n_candidates = n_candidates
+        self.batch_size = max(1, batch_size)
+        self.seed = seed
+
+    def run(
+        self,
+        evaluate: Evaluator,
+        param_ranges: dict[str, list[Any]],
+        data: pd.DataFrame,
+        metric: str,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Evaluate startup trials, then TPE proposals until the budget is used."""
+        rng = random.Random(self.seed)  # noqa: S311 - parameter sampling, not crypto
+        keys = list(param_ranges.keys())
+        budget = min(self.n_iter, grid_size(param_ranges))
+
+        seen: set[tuple[int, ...]] = set()
+        trials: list[tuple[tuple[int, ...], float]] = []
+
+        def run_batch(batch: list[tuple[int, ...]]) -> list[dict[str, Any]]:
+            seen.update(batch)
+            params = [self._to_params(param_ranges, keys, point) for point in batch]
+            results = evaluate(params, data)
+            for result in results:
+                point = tuple(
+                    param_ranges[key].index(result["params"][key]) for key in keys
+                )
+                trials.append((point, rank_value(result, metric)))
+            return results
+
+        startup: list[tuple[int, ...]] = []
+        while len(startup) < min(self.n_startup, budget):
+            point = self._random_point(rng, param_ranges, keys)
+            if point not in startup:
+                startup.append(point)
+        yield run_batch(startup)
+
+        while len(seen) < budget:
+            batch: list[tuple[int, ...]] = []
+            while len(batch) < min(self.batch_size, budget - len(seen)):
+                point = self._propose(rng, param_ranges, keys, trials, seen, batch)
+                batch.append(point)
+            yield run_batch(batch)
+
+    def _propose(
+        self,
+        rng: random.Random,
+        param_ranges: dict[str, list[Any]],
+        keys: list[str],
+        trials: list[tuple[tuple[int, ...], float]],
+        seen: set[tuple[int, ...]],
+        pending: list[tuple[int, ...]],
+    ) -> tuple[int, ...]:
+        """Propose an unseen point maximizing l(x) / g(x)."""
+        excluded = seen.union(pending)
+
+        if trials:
+            ranked = sorted(trials, key=lambda trial: trial[1], reverse=True)
+            n_good = max(1, math.ceil(self.gamma * len(ranked)))
+            good = [point for point, _ in ranked[:n_good]]
+            bad = [point for point, _ in ranked[n_good:]]
+
+            good_density = self._densities(param_ranges, keys, good)
+            bad_density = self._densities(param_ranges, keys, bad)
+
+            best_point = None
+            best_ratio = float("-inf")
+            for _ in range(self.n_candidates):
+                point = tuple(
+                    rng.choices(range(len(weights)), weights=weights)[0]
+                    for weights in good_density
+                )
+                if point in excluded:
+                    continue
+                ratio = sum(
+                    math.log(good_density[i][value] / bad_density[i][value])
+                    for i, value in enumerate(point)
+                )
+                if ratio > best_ratio:
+                    best_point, best_ratio = point, ratio
+
+            if best_point is not None:
+                return best_point
+
+        # Surrogate proposals exhausted: fall back to an unseen random point
+        while True:
+            point = self._random_point(rng, param_ranges, keys)
+            if point not in excluded:
+                return point
+
+    def _densities(
+        self,
+        param_ranges: dict[str, list[Any]],
+        keys: list[str],
+        points: list[tuple[int, ...]],
+    ) -> list[list[float]]:
+        """Get smoothed categorical densities per parameter."""
+        densities = []
+        for i, key in enumerate(keys):
+            counts = [1.0] * len(param_ranges[key])  # Uniform prior
+            for point in points:
+                counts[point[i]] += 1.0
+            total = sum(counts)
+            densities.append([count / total for count in counts])
+        return densities
+
+    def _random_point(
+        self, rng: random.Random, param_ranges: dict[str, list[Any]], keys: list[str]
+    ) -> tuple[int, ...]:
+        """Draw a uniformly random grid point."""
+        return tuple(rng.randrange(len(param_ranges[key])) for key in keys)
+
+    def _to_params(
+        self,
+        param_ranges: dict[str, list[Any]],
+        keys: list[str],
+        point: tuple[int, ...],
+    ) -> dict[str, Any]:
+        """Convert a grid point to a parameter dictionary."""
+        return {key: param_ranges[key][point[i]] for i, key in enumerate(keys)}
@@ -0,0 +1,186 @@
+"""Storage profiles controlling how candle files are encoded on disk."""
+
+import logging
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+PRICE_COLUMNS = ["open", "high", "low", "close"]
+
+
+class StorageProfile:
+    """Column encoding and compression of candle files.
+
+    Prices may be stored as float32 when every value round-trips within a
+    relative error bound, and volumes as int64 counts of ``10**-decimals``
+    units. Columns failing their check are stored as they are, so a profile
+    never loses more precision than it promises. The encoding is recorded in
+    each file's metadata and undone on read, so files written with different
+    profiles can sit side by side and always load as float64.
+    """
+
+    ATTRS_KEY = "storage_profile"
+
+    def __init__(
+        self,
+        name: str = "default",
+        price_dtype: str = "float64",
+        price_tolerance: float = 1e-6,
+        volume_decimals: int | None = None,
+        compression: str | None = "snappy",
+        compression_level: int | None = None,
+    ) -> None:
+        """Initialize storage profile.
+
+        Args:
+            name: Profile name.
+            price_dtype: On-disk dtype of prices (``"float64"`` or
+                ``"float32"``).
+            price_tolerance: Largest relative error allowed when downcasting
+                prices.
+            volume_decimals: Decimals kept when storing volumes as scaled
+                integers (None keeps floats).
+            compression: Parquet codec (``"snappy"``, ``"zstd"``, ``"lz4"``,
+                ``"gzip"``, ``"brotli"`` or None).
+            compression_level: Codec level (codec default if None).
+        """
+        if price_dtype not in ("float64", "float32"):
+            raise ValueError(f"Unsupported price dtype: {price_dtype}")
+        self.name = name
+        self.price_dtype = price_dtype
+        self.price_tolerance = price_tolerance
+        self.volume_decimals = volume_decimals
+        self.compression = compression
+        self.compression_level = compression_level
+
+    def encode(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Convert candles to their on-disk representation."""
+        encoded = {}
+        volume_scale = None
+
+        if self.price_dtype == "float32":
+            for column in PRICE_COLUMNS:
+                if column not in data:
+                    continue
+                values = data[column].to_numpy(dtype=np.float64)
+                downcast = values.astype(np.float32)
+                if self._within_tolerance(values, downcast):
+                    encoded[column] = downcast
+                else:
+                    logger.warning(
+                        "Keeping %s as float64: float32 exceeds the %s relative "
+                        "error bound",
+                        column,
+                        self.price_tolerance,
+                    )
+
+        if self.volume_decimals is not None and "volume" in data:
+            scale = 10**self.volume_decimals
+            scaled = np.rint(data["volume"].to_numpy(dtype=np.float64) * scale)
+            # NaN or values beyond int64 cannot be stored as counts
+            if np.isfinite(scaled).all() and np.abs(scaled).max(initial=0) < 2**63:
+                encoded["volume"] = scaled.astype(np.int64)
+                volume_scale = scale
+            else:
+                logger.warning("Keeping volume as float: not representable as int64")
+
+        if not encoded:
+            return data
+        data = data.assign(**encoded)
+        data.attrs = {
+            **data.attrs,
+            self.ATTRS_KEY: {"name": self.name, "volume_scale": volume_scale},
+        }
+        return data
+
+    @classmethod
+    def decode(cls, data: pd.DataFrame) -> pd.DataFrame:
+        """Convert candles read from disk back to float64 columns."""
+        encoding = data.attrs.get(cls.ATTRS_KEY)
+        if encoding is None:
+            return data
+
+        decoded: dict[str, Any] = {
+            column: data[column].to_numpy(dtype=np.float64)
+            for column in PRICE_COLUMNS
+            if column in data and data[column].dtype == np.float32
+        }
+        if encoding.get("volume_scale") and "volume" in data:
+            decoded["volume"] = (
+                data["volume"].to_numpy(dtype=np.float64) / encoding["volume_scale"]
+            )
+
+        if decoded:
+            data = data.assign(**decoded)
+        data.attrs = {
+            key: value for key, value in data.attrs.items() if key != cls.ATTRS_KEY
+        }
+        return data
+
+    def to_parquet(self, data: pd.DataFrame, path: str | Path) -> None:
+        """Write candles to a Parquet file with this profile."""
+        options: dict[str, Any] = {"compression": self.compression}
+        if self.compression_level is not None:
+            options["compression_level"] = self.compression_level
+        self.encode(data).to_parquet(path, **options)
+
+    def _within_tolerance(self, values: np.ndarray, downcast: np.ndarray) -> bool:
+        """Check downcast values are within the relative error bound."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            error = np.abs(downcast.astype(np.float64) - values) / np.abs(values)
+        # Zeros and NaNs round-trip exactly
+        error = error[np.isfinite(values) & (values != 0)]
+        return bool(np.all(error <= self.price_tolerance))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert profile to a dictionary."""
+        return {
+            "name": self.name,
+            "price_dtype": self.price_dtype,
+            "price_tolerance": self.price_tolerance,
+            "volume_decimals": self.volume_decimals,
+            "compression": self.compression,
+            "compression_level": self.compression_level,
+        }
+
+
+STORAGE_PROFILES = {
+    # pandas defaults
+    "default": StorageProfile("default"),
+    # Smallest files still decompressing quickly; the choice for large caches
+    "compact": StorageProfile(
+        "compact",
+        price_dtype="float32",
+        volume_decimals=8,
+        compression="zstd",
+        compression_level=3,
+    ),
+    # Cheapest decompression for data read over and over
+    "fast": StorageProfile(
+        "fast", price_dtype="float32", volume_decimals=8, compression="lz4"
+    ),
+    # Slow to write, for history that is rarely rewritten
+    "archive": StorageProfile(
+        "archive",
+        price_dtype="float32",
+        volume_decimals=8,
+        compression="zstd",
+        compression_level=19,
+    ),
+}
+
+
+def get_storage_profile(profile: str | StorageProfile) -> StorageProfile:
+    """Get a storage profile by name, or return the given profile."""
+    if isinstance(profile, StorageProfile):
+        return profile
+    if profile not in STORAGE_PROFILES:
+        raise ValueError(
+            f"Unknown storage profile: {profile} "
+            f"(expected one of {list(STORAGE_PROFILES)})"
+        )
+    return STORAGE_PROFILES[profile]
@@ -0,0 +1,251 @@
+"""Vectorized data-quality validation of OHLCV candles."""
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from system_trading.backtesting.metrics import infer_bar_frequency
+from system_trading.backtesting.resample import timeframe_to_timedelta
+
+# Bump whenever validation or repair results change, invalidating cleaned caches
+VALIDATION_VERSION = 1
+REPAIR_POLICIES = ("drop", "ffill", "mark")
+PRICE_COLUMNS = ["open", "high", "low", "close"]
+
+
+class ValidationReport:
+    """Data-quality findings of one validation pass."""
+
+    def __init__(
+        self,
+        rows: int = 0,
+        duplicates: int = 0,
+        missing_values: int = 0,
+        invalid_prices: int = 0,
+        ohlc_violations: int = 0,
+        outliers: int = 0,
+        gaps: list[tuple[pd.Timestamp, pd.Timestamp]] | None = None,
+        missing_candles: int = 0,
+        removed: int = 0,
+        filled: int = 0,
+    ) -> None:
+        """Initialize validation report.
+
+        Args:
+            rows: Candles validated.
+            duplicates: Earlier copies of repeated timestamps.
+            missing_values: Candles with a missing price or volume.
+            invalid_prices: Candles with non-positive prices or negative volume.
+            ohlc_violations: Candles whose low/high do not bound open/close.
+            outliers: Candles whose close moved at least the outlier
+                threshold from the previous valid close.
+            gaps: First and last missing candle of each hole in the
+                timeframe grid.
+            missing_candles: Candles missing from the grid.
+            removed: Candles removed by the repair.
+            filled: Candles inserted by the repair.
+        """
+        self.rows = rows
+        self.duplicates = duplicates
+        self.missing_values = missing_values
+        self.invalid_prices = invalid_prices
+        self.ohlc_violations = ohlc_violations
+        self.outliers = outliers
+        self.gaps = gaps or []
+        self.missing_candles = missing_candles
+        self.removed = removed
+        self.filled = filled
+
+    @property
+    def is_clean(self) -> bool:
+        """Check whether no issue was found."""
+        return not (
+            self.duplicates
+            or self.missing_values
+            or self.invalid_prices
+            or self.ohlc_violations
+            or self.outliers
+            or self.gaps
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert report to a dictionary."""
+        return {
+            "rows": self.rows,
+            "duplicates": self.duplicates,
+            "missing_values": self.missing_values,
+            "invalid_prices": self.invalid_prices,
+            "ohlc_violations": self.ohlc_violations,
+            "outliers": self.outliers,
+            "gaps": [[start.isoformat(), end.isoformat()] for start, end in self.gaps],
+            "missing_candles": self.missing_candles,
+            "removed": self.removed,
+            "filled": self.filled,
+            "is_clean": self.is_clean,
+        }
+
+
+class DataValidator:
+    """Single-pass OHLCV validator with configurable repair.
+
+    All checks are evaluated as NumPy masks over one copy of the price
+    columns, and the data is indexed once by the combined mask.
+
+    Repair policies:
+        ``drop``: remove invalid candles and earlier copies of duplicates.
+        ``ffill``: like ``drop``, then fill every hole of the timeframe grid
+            with flat candles at the previous close and zero volume.
+        ``mark``: keep invalid candles, flagged in an ``invalid`` column;
+            duplicates are still removed so the index stays unique.
+    """
+
+    def __init__(self, policy: str = "drop", outlier_threshold: float = 10.0) -> None:
+        """Initialize data validator.
+
+        Args:
+            policy: Repair policy (``"drop"``, ``"ffill"`` or ``"mark"``).
+            outlier_threshold: Absolute close-to-close change (1.0 = 100%)
+                from which a candle is an outlier.
+        """
+        if policy not in REPAIR_POLICIES:
+            raise ValueError(
+                f"Unknown repair policy: {policy} (expected one of {REPAIR_POLICIES})"
+            )
+        self.policy = policy
+        self.outlier_threshold = outlier_threshold
+
+    @property
+    def tag(self) -> str:
+        """Get a tag identifying the validation results of this validator."""
+        return f"v{VALIDATION_VERSION}-{self.policy}-{self.outlier_threshold:g}"
+
+    def validate(
+        self, data: pd.DataFrame, timeframe: str | None = None
+    ) -> tuple[pd.DataFrame, ValidationReport]:
+        """Validate candles and repair them according to the policy.
+
+        Args:
+            data: OHLCV DataFrame with datetime index.
+            timeframe: Candle timeframe used to find gaps (inferred from the
+                median spacing if None; calendar months are not checked).
+
+        Returns:
+            Repaired data and the validation report.
+        """
+        if data.empty:
+            return data, ValidationReport()
+        if not data.index.is_monotonic_increasing:
+            data = data.sort_index(kind="stable")
+
+        index_ns = data.index.asi8
+        # Later copies of a timestamp win, as in the candle store
+        duplicated = np.r_[index_ns[1:] == index_ns[:-1], False]
+
+        prices = data[PRICE_COLUMNS].to_numpy(dtype=float)
+        volume = data["volume"].to_numpy(dtype=float)
+        open_, high, low, close = prices.T
+
+        missing = np.isnan(prices).any(axis=1) | np.isnan(volume)
+        invalid = (prices <= 0).any(axis=1) | (volume < 0)
+        # Comparisons with NaN are False, so missing prices are not violations
+        violations = (
+            (low > high)
+            | (low > np.minimum(open_, close))
+            | (high < np.maximum(open_, close))
+        )
+
+        bad = duplicated | missing | invalid | violations
+        valid_rows = np.flatnonzero(~bad)
+        valid_close = close[valid_rows]
+        change = np.abs(valid_close[1:] / valid_close[:-1] - 1)
+        outliers = np.zeros(len(data), dtype=bool)
+        outliers[valid_rows[1:][change >= self.outlier_threshold]] = True
+
+        keep = ~(bad | outliers)
+        step_ns = self._step_ns(data.index, timeframe)
+        gaps, missing_candles = self._find_gaps(index_ns[~duplicated], step_ns)
+
+        report = ValidationReport(
+            rows=len(data),
+            duplicates=int(duplicated.sum()),
+            missing_values=int(missing.sum()),
+            invalid_prices=int(invalid.sum()),
+            ohlc_violations=int(violations.sum()),
+            outliers=int(outliers.sum()),
+            gaps=[self._timestamps(gap, data.index.tz) for gap in gaps],
+            missing_candles=missing_candles,
+        )
+
+        if self.policy == "mark":
+            cleaned = data[~duplicated].assign(invalid=~keep[~duplicated])
+            report.removed = report.duplicates
+            return cleaned, report
+
+        cleaned = data if keep.all() else data[keep]
+        report.removed = len(data) - len(cleaned)
+        if self.policy == "ffill" and step_ns and len(cleaned):
+            kept = len(cleaned)
+            cleaned = self._fill_grid(cleaned, step_ns)
+            report.filled = len(cleaned) - kept
+        return cleaned, report
+
+    def _step_ns(self, index: pd.DatetimeIndex, timeframe: str | None) -> int | None:
+        """Get the candle spacing in nanoseconds (None if irregular)."""
+        if timeframe is None:
+            return infer_bar_frequency(index).value
+        try:
+            return timeframe_to_timedelta(timeframe).value
+        except ValueError:
+            return None
+
+    def _find_gaps(
+        self, index_ns: np.ndarray, step_ns: int | None
+    ) -> tuple[list[tuple[int, int]], int]:
+        """Find holes in the timeframe grid of sorted, unique timestamps."""
+        if not step_ns or len(index_ns) < 2:
+            return [], 0
+        spacing = np.diff(index_ns)
+        holes = np.flatnonzero(spacing > step_ns)
+        gaps = [
+            (int(index_ns[i]) + step_ns, int(index_ns[i + 1]) - step_ns) for i in holes
+        ]
+        return gaps, int((spacing[holes] // step_ns - 1).sum())
+
+    def _fill_grid(self, data: pd.DataFrame, step_ns: int) -> pd.DataFrame:
+        """Insert flat candles at the previous close for every grid hole."""
+        index_ns = data.index.asi8
+        grid = np.union1d(
+            np.arange(index_ns[0], index_ns[-1] + 1, step_ns, dtype=np.int64),
+            index_ns,
+        )
+        if len(grid) == len(index_ns):
+            return data
+
+        # Each grid slot takes the last real candle at or before it
+        source = np.searchsorted(index_ns, grid, side="right") - 1
+        filled = grid != index_ns[source]
+        close = data["close"].to_numpy()[source]
+
+        columns = {}
+        for column in data.columns:
+            values = data[column].to_numpy()[source]
+            if column in ("open", "high", "low"):
+                values = np.where(filled, close, values)
+            elif column == "volume":
+                values = np.where(filled, 0, values)
+            columns[column] = values
+
+        index = pd.DatetimeIndex(grid.astype("datetime64[ns]"), name=data.index.name)
+        if data.index.tz is not None:
+            index = index.tz_localize("UTC").tz_convert(data.index.tz)
+        return pd.DataFrame(columns, index=index)
+
+    def _timestamps(
+        self, gap: tuple[int, int], tz: Any
+    ) -> tuple[pd.Timestamp, pd.Timestamp]:
+        """Convert a gap in UTC nanoseconds to timestamps of the data's zone."""
+        start, end = (pd.Timestamp(value, tz="UTC") for value in gap)
+        if tz is None:
+            return start.tz_localize(None), end.tz_localize(None)
+        return start.tz_convert(tz), end.tz_convert(tz)
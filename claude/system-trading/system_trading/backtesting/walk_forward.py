@@ -0,0 +1,285 @@
+"""Walk-forward optimization on top of the backtesting engine."""
+
+import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from system_trading.backtesting.engine import BacktestEngine
+from system_trading.backtesting.parallel import (
+    POOL_CONTEXT,
+    init_optimization_worker,
+    run_walk_forward_fold,
+    shared_ohlcv,
+)
+from system_trading.strategies.base_strategy import BaseStrategy
+
+logger = logging.getLogger(__name__)
+
+
+def evaluate_fold(
+    engine: BacktestEngine,
+    strategy_class: type[BaseStrategy],
+    data: pd.DataFrame,
+    fold: dict[str, int],
+    param_ranges: dict[str, list[Any]],
+    symbol: str,
+    metric: str,
+) -> dict[str, Any]:
+    """Optimize a fold's train window and evaluate it on the test window.
+
+    Args:
+        engine: Backtesting engine.
+        strategy_class: Strategy class to optimize.
+        data: Full OHLCV price data.
+        fold: Fold boundaries (positional train/test windows).
+        param_ranges: Parameter ranges to test.
+        symbol: Trading symbol.
+        metric: Optimization metric.
+
+    Returns:
+        Fold result with chosen parameters, scores and test equity curve.
+    """
+    train_data = data.iloc[fold["train_start"] : fold["train_end"]]
+    optimization = engine.run_optimization(
+        strategy_class=strategy_class,
+        data=train_data,
+        param_ranges=param_ranges,
+        symbol=symbol,
+        metric=metric,
+        top_k=1,
+    )
+    best_params = optimization["best_params"]
+
+    # Train bars are indicator history only; trading happens in the test window
+    history = data.iloc[fold["train_start"] : fold["test_end"]]
+    result = engine.run_backtest_window(
+        strategy=strategy_class(**best_params),
+        data=history,
+        symbol=symbol,
+        window_start=fold["test_start"] - fold["train_start"],
+    )
+
+    return {
+        **fold,
+        "train_period": (train_data.index[0], train_data.index[-1]),
+        "test_period": (result.start_date, result.end_date),
+        "best_params": best_params,
+        "train_score": optimization["best_score"],
+        "test_score": result.stats.get(metric, 0.0),
+        "test_stats": result.stats,
+        "test_equity": result.portfolio.value(),
+    }
+
+
+class WalkForwardOptimizer:
+    """Rolling or anchored walk-forward optimization."""
+
+    def __init__(
+        self,
+        engine: BacktestEngine,
+        train_size: int,
+        test_size: int,
+        step: int | None = None,
+        anchored: bool = False,
+    ) -> None:
+        """Initialize walk-forward optimizer.
+
+        Args:
+            engine: Backtesting engine used for every fold.
+            train_size: Number of bars in each training window.
+            test_size: Number of bars in each test window.
+            step: Bars between consecutive folds (defaults to test_size).
+            anchored: Keep every training window anchored at the first bar.
+        """
+        step = step or test_size
+        if train_size <= 0 or test_size <= 0:
+            raise ValueError("train_size and test_size must be positive")
+        if step < test_size:
+            raise ValueError("step must be >= test_size so test windows don't overlap")
+
+        self.engine = engine
+        self.train_size = train_size
+        self.test_size = test_size
+        self.step = step
+        self.anchored = anchored
+
+    def generate_folds(self, n_bars: int) -> list[dict[str, int]]:
+        """Split ``n_bars`` into positional train/test windows.
+
+        Args:
+            n_bars: Number of bars in the dataset.
+
+        Returns:
+            Fold boundaries in chronological order.
+        """
+        folds: list[dict[str, int]] = []
+        test_start = self.train_size
+
+        while test_start + self.test_size <= n_bars:
+            folds.append(
+                {
+                    "fold": len(folds),
+                    "train_start": 0 if self.anchored else test_start - self.train_size,
+                    "train_end": test_start,
+                    "test_start": test_start,
+                    "test_end": test_start + self.test_size,
+                }
+            )
+            test_start += self.step
+
+        return folds
+
+    def run(
+        self,
+        strategy_class: type[BaseStrategy],
+        data: pd.DataFrame,
+        param_ranges: dict[str, list[Any]],
+        symbol: str,
+        metric: str = "sharpe_ratio",
+        n_jobs: int = 1,
+    ) -> dict[str, Any]:
+        """Run walk-forward optimization.
+
+        Args:
+            strategy_class: Strategy class to optimize.
+            data: OHLCV price data.
+            param_ranges: Parameter ranges to test.
+            symbol: Trading symbol.
+            metric: Optimization metric.
+            n_jobs: Number of folds evaluated concurrently (-1 uses all cores).
+
+        Returns:
+            Per-fold results, stitched out-of-sample equity and its statistics.
+        """
+        try:
+            folds = self.generate_folds(len(data))
+            if not folds:
+                raise ValueError(
+                    f"Not enough data for walk-forward: {len(data)} bars, need "
+                    f"{self.train_size + self.test_size}"
+                )
+
+            logger.info(
+                "Starting walk-forward optimization with %d folds (%s)",
+                len(folds),
+                "anchored" if self.anchored else "rolling",
+            )
+
+            n_jobs = self.engine._resolve_n_jobs(n_jobs, len(folds))
+            if n_jobs > 1:
+                fold_results = self._run_folds_parallel(
+                    strategy_class, data, folds, param_ranges, symbol, metric, n_jobs
+                )
+            else:
+                fold_results = [
+                    evaluate_fold(
+                        self.engine,
+                        strategy_class,
+                        data,
+                        fold,
+                        param_ranges,
+                        symbol,
+                        metric,
+                    )
+                    for fold in folds
+                ]
+
+            oos_equity = self._stitch_equity(fold_results)
+
+            return {
+                "metric": metric,
+                "anchored": self.anchored,
+                "folds": fold_results,
+                "oos_equity": oos_equity,
+                "oos_stats": self._equity_statistics(oos_equity),
+            }
+
+        except Exception as e:
+            logger.error("Walk-forward optimization failed: %s", e)
+            raise
+
+    def _run_folds_parallel(
+        self,
+        strategy_class: type[BaseStrategy],
+        data: pd.DataFrame,
+        folds: list[dict[str, int]],
+        param_ranges: dict[str, list[Any]],
+        symbol: str,
+        metric: str,
+        n_jobs: int,
+    ) -> list[dict[str, Any]]:
+        """Evaluate independent folds across a process pool."""
+        engine_settings = {
+            "initial_cash": self.engine.initial_cash,
+            "commission": self.engine.commission,
+            "slippage": self.engine.slippage,
+            "metrics_engine": self.engine.metrics_engine,
+        }
+        results = {}
+
+        with shared_ohlcv(data, prefix="walk_forward_") as shared:
+            with ProcessPoolExecutor(
+                max_workers=n_jobs,
+                mp_context=POOL_CONTEXT,
+                initializer=init_optimization_worker,
+                initargs=(shared, engine_settings),
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        run_walk_forward_fold,
+                        strategy_class,
+                        fold,
+                        param_ranges,
+                        symbol,
+                        metric,
+                    )
+                    for fold in folds
+                ]
+
+                for future in as_completed(futures):
+                    fold_result = future.result()
+                    results[fold_result["fold"]] = fold_result
+                    logger.info(
+                        "Completed walk-forward fold %d/%d",
+                        len(results),
+                        len(folds),
+                    )
+
+        return [results[index] for index in sorted(results)]
+
+    def _stitch_equity(self, fold_results: list[dict[str, Any]]) -> pd.Series:
+        """Chain test-window equity curves into one out-of-sample curve.
+
+        Each fold starts with the capital the previous fold ended with.
+        """
+        segments = []
+        capital = self.engine.initial_cash
+
+        for fold_result in fold_results:
+            equity = fold_result["test_equity"]
+            segment = equity / self.engine.initial_cash * capital
+            segments.append(segment)
+            capital = float(segment.iloc[-1])
+
+        return pd.concat(segments)
+
+    def _equity_statistics(self, equity: pd.Series) -> dict[str, Any]:
+        """Calculate statistics of the stitched out-of-sample equity curve."""
+        returns = equity.pct_change().fillna(
+            equity.iloc[0] / self.engine.initial_cash - 1
+        )
+        running_max = np.maximum.accumulate(equity.to_numpy())
+        max_drawdown = float(np.max(1 - equity.to_numpy() / running_max))
+        total_return = float(equity.iloc[-1] / self.engine.initial_cash - 1)
+
+        return {
+            "total_return": total_return,
+            "sharpe_ratio": self.engine._calculate_sharpe_ratio(returns, 0.02),
+            "max_drawdown": max_drawdown,
+            "calmar_ratio": total_return / max_drawdown if max_drawdown else 0.0,
+            "start_value": self.engine.initial_cash,
+            "end_value": float(equity.iloc[-1]),
+        }
@@ -0,0 +1,123 @@
+"""Historical data CLI commands."""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+
+import click
+
+from system_trading.backtesting.bars import (
+    BAR_TYPES,
+    create_aggregator,
+    read_trade_file,
+)
+from system_trading.backtesting.bulk_download import BulkDownloader, SeriesProgress
+from system_trading.backtesting.data_manager import BacktestDataManager
+from system_trading.data.models import Exchange
+
+logger = logging.getLogger(__name__)
+
+
+@click.group()
+def data() -> None:
+    """Historical data commands."""
+    pass
+
+
+@data.command()
+@click.option(
+    "--exchange",
+    type=click.Choice([exchange.value for exchange in Exchange]),
+    required=True,
+    help="Exchange to download from",
+)
+@click.option(
+    "--symbol", "symbols", multiple=True, required=True, help="Trading symbol"
+)
+@click.option(
+    "--timeframe", "timeframes", multiple=True, default=["1h"], help="Timeframe"
+)
+@click.option("--days-back", default=365, show_default=True, help="Days to download")
+@click.option("--concurrency", default=8, show_default=True, help="Requests in flight")
+@click.option("--data-dir", default="data", show_default=True, help="Cache directory")
+def download(
+    exchange: str,
+    symbols: tuple[str, ...],
+    timeframes: tuple[str, ...],
+    days_back: int,
+    concurrency: int,
+    data_dir: str,
+) -> None:
+    """Download historical candles for many symbols concurrently."""
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=days_back)
+
+    def report(progress: SeriesProgress) -> None:
+        if progress.status == "done":
+            click.echo(
+                f"✅ {progress.symbol} {progress.timeframe}: {progress.candles} candles"
+            )
+        elif progress.status == "failed":
+            click.echo(f"❌ {progress.symbol} {progress.timeframe}: {progress.error}")
+
+    async def _download() -> None:
+        downloader = BulkDownloader(
+            BacktestDataManager(data_dir=data_dir), max_concurrency=concurrency
+        )
+        progress = await downloader.download(
+            list(symbols),
+            Exchange(exchange),
+            list(timeframes),
+            start_date,
+            end_date,
+            progress_callback=report,
+        )
+
+        series = [p for timeframes in progress.values() for p in timeframes.values()]
+        failed = sum(p.status == "failed" for p in series)
+        click.echo(f"Downloaded {len(series) - failed}/{len(series)} series")
+        if failed:
+            raise click.ClickException(f"{failed} series failed")
+
+    asyncio.run(_download())
+
+
+@data.command("build-bars")
+@click.option(
+    "--exchange",
+    type=click.Choice([exchange.value for exchange in Exchange]),
+    required=True,
+    help="Exchange the trades come from",
+)
+@click.option("--symbol", required=True, help="Trading symbol")
+@click.option(
+    "--trades-file",
+    type=click.Path(exists=True, dir_okay=False),
+    required=True,
+    help="CSV of trades with timestamp, price and amount columns",
+)
+@click.option(
+    "--bar-type", type=click.Choice(list(BAR_TYPES)), required=True, help="Bar type"
+)
+@click.option(
+    "--size", required=True, help="Timeframe of time bars, threshold of the others"
+)
+@click.option("--data-dir", default="data", show_default=True, help="Cache directory")
+def build_bars(
+    exchange: str,
+    symbol: str,
+    trades_file: str,
+    bar_type: str,
+    size: str,
+    data_dir: str,
+) -> None:
+    """Aggregate recorded trades into bars in the candle cache."""
+    aggregator = create_aggregator(bar_type, size)
+    count = BacktestDataManager(data_dir=data_dir).build_trade_bars(
+        symbol, Exchange(exchange), read_trade_file(trades_file), aggregator
+    )
+    click.echo(f"✅ Wrote {count} {aggregator.name} bars for {symbol}")
+
+
+if __name__ == "__main__":
+    data()
@@ -29,6 +29,14 @@ class TradingSettings(BaseSettings):
         default=0.02, description="Risk percentage per trade"
     )
 
+    # Market Metadata Cache
+    markets_cache_dir: str = Field(
+        default="data/markets", description="Directory of market snapshots"
+    )
+    markets_refresh_interval: float = Field(
+        default=86400.0, description="Seconds before market snapshots are refreshed"
+    )
+
     # Logging Configuration
     log_level: str = Field(default="INFO", description="Logging level")
     log_file: str | None = Field(default=None, description="Log file path")
@@ -12,9 +12,11 @@ from system_trading.data.models import (
     OrderStatus,
     OrderType,
     Position,
+    Ticker,
     TradingSignal,
 )
 from system_trading.data.portfolio_manager import PortfolioManager
+from system_trading.exchanges.streaming import MarketDataStream, create_streams
 from system_trading.exchanges.unified_client import UnifiedExchangeClient
 from system_trading.strategies.base_strategy import BaseStrategy
 
@@ -34,6 +36,9 @@ class TradingEngine:
         self.update_interval = 60  # seconds
         self.max_concurrent_orders = 5
         self.active_orders: dict[str, Order] = {}
+        # Prices come from WebSocket streams when fresh, REST otherwise
+        self.use_streaming = True
+        self.streams: dict[Exchange, MarketDataStream] = {}
 
     def add_strategy(
         self,
@@ -88,6 +93,9 @@ class TradingEngine:
         logger.info("Starting trading engine")
 
         try:
+            if self.use_streaming:
+                await self._start_streams()
+
             # Initialize portfolio state
             await self._initialize_portfolio()
 
@@ -106,6 +114,48 @@ class TradingEngine:
         # Cancel all open orders
         await self._cancel_all_orders()
 
+        for stream in self.streams.values():
+            await stream.stop()
+        self.streams = {}
+
+        # Release the exchange connection pools
+        await self.client.close()
+
+    async def _start_streams(self) -> None:
+        """Start streaming market data for the active symbols."""
+        self.streams = create_streams(self.active_symbols, channels=["ticker"])
+        for exchange, stream in self.streams.items():
+            await stream.start()
+            logger.info(
+                "Streaming %d symbols from %s", len(stream.symbols), exchange.value
+            )
+
+    async def _get_ticker(self, symbol: str, exchange: Exchange) -> Ticker:
+        """Get the latest ticker, from the stream while it is fresh."""
+        stream = self.streams.get(exchange)
+        if stream is not None:
+            ticker = stream.get_ticker(symbol, max_age=self.update_interval)
+            if ticker is not None:
+                return ticker
+        return await self.client.get_ticker(symbol, exchange)
+
+    async def _get_tickers(
+        self, symbols: list[str], exchange: Exchange
+    ) -> dict[str, Ticker]:
+        """Get the latest tickers, fetching those not fresh in the stream at once."""
+        tickers = {}
+        stream = self.streams.get(exchange)
+        if stream is not None:
+            for symbol in symbols:
+                ticker = stream.get_ticker(symbol, max_age=self.update_interval)
+                if ticker is not None:
+                    tickers[symbol] = ticker
+
+        missing = [symbol for symbol in symbols if symbol not in tickers]
+        if missing:
+            tickers.update(await self.client.get_tickers(missing, exchange))
+        return tickers
+
     async def _initialize_portfolio(self) -> None:
         """Initialize portfolio state."""
         logger.info("Initializing portfolio state")
@@ -248,7 +298,7 @@ class TradingEngine:
         )
 
         # Get current market data
-        ticker = await self.client.get_ticker(signal.symbol, exchange)
+        ticker = await self._get_ticker(signal.symbol, exchange)
         current_price = ticker.last
 
         # Calculate position size
@@ -513,12 +563,18 @@ class TradingEngine:
     async def _update_position_market_values(self, exchange: Exchange) -> None:
         """Update market prices and unrealized P&L for positions."""
         try:
+            positions = {}
             for symbol in self.active_symbols.get(exchange, []):
                 position = self.portfolio_manager.get_position(symbol, exchange)
                 if position:
-                    # Get current market price
-                    ticker = await self.client.get_ticker(symbol, exchange)
-                    current_price = ticker.last
+                    positions[symbol] = position
+
+            # Get current market prices in one request
+            tickers = await self._get_tickers(list(positions), exchange)
+
+            for symbol, position in positions.items():
+                if symbol in tickers:
+                    current_price = tickers[symbol].last
 
                     # Calculate unrealized P&L
                     price_diff = current_price - position.entry_price
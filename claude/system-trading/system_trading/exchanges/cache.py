@@ -0,0 +1,154 @@
+"""Read-through cache of exchange responses with request coalescing."""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+STAT_NAMES = ("hits", "misses", "coalesced", "errors")
+
+
+class RequestCache:
+    """Time-to-live cache sharing one upstream call between callers.
+
+    A fresh cached response is returned immediately. Otherwise the first
+    caller starts the fetch and everyone asking for the same key before it
+    completes awaits that same call. Failures are shared with the waiting
+    callers but never cached. Endpoints with a zero TTL are only coalesced.
+    """
+
+    DEFAULT_TTLS = {"ticker": 1.0, "ohlcv": 5.0}
+
+    def __init__(
+        self, ttls: dict[str, float] | None = None, max_entries: int = 10_000
+    ) -> None:
+        """Initialize request cache.
+
+        Args:
+            ttls: Seconds responses stay fresh, by endpoint (defaults to
+                ``DEFAULT_TTLS``; unknown endpoints are not cached).
+            max_entries: Cached responses kept before the oldest are evicted.
+        """
+        self.ttls = dict(self.DEFAULT_TTLS if ttls is None else ttls)
+        self.max_entries = max_entries
+        self._entries: dict[tuple[str, Hashable], tuple[float, Any]] = {}
+        self._pending: dict[tuple[str, Hashable], asyncio.Future] = {}
+        self._stats: dict[str, dict[str, int]] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    async def get(
+        self, endpoint: str, key: Hashable, fetch: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Get a response, fetching it unless fresh or already in flight.
+
+        Args:
+            endpoint: Endpoint name selecting the TTL.
+            key: Request parameters identifying the response.
+            fetch: Makes the upstream call.
+
+        Returns:
+            Response.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Calls in flight belong to the loop that started them
+            self._pending.clear()
+            self._loop = loop
+
+        stats = self._stats.setdefault(endpoint, dict.fromkeys(STAT_NAMES, 0))
+        cache_key = (endpoint, key)
+        entry = self._entries.get(cache_key)
+        if entry is not None and time.monotonic() < entry[0]:
+            stats["hits"] += 1
+            return entry[1]
+
+        pending = self._pending.get(cache_key)
+        if pending is not None:
+            stats["coalesced"] += 1
+        else:
+            stats["misses"] += 1
+            pending = asyncio.ensure_future(fetch())
+            self._pending[cache_key] = pending
+            pending.add_done_callback(
+                lambda future: self._complete(cache_key, future, stats)
+            )
+        # A caller giving up must not cancel the call others are waiting for
+        return await asyncio.shield(pending)
+
+    def peek(self, endpoint: str, key: Hashable) -> Any | None:
+        """Get a fresh cached response without fetching, counting a hit."""
+        entry = self._entries.get((endpoint, key))
+        if entry is None or time.monotonic() >= entry[0]:
+            return None
+        self._stats.setdefault(endpoint, dict.fromkeys(STAT_NAMES, 0))["hits"] += 1
+        return entry[1]
+
+    def put(self, endpoint: str, key: Hashable, value: Any) -> None:
+        """Cache a response obtained another way, such as a bulk request."""
+        self._store((endpoint, key), value)
+
+    def _complete(
+        self,
+        cache_key: tuple[str, Hashable],
+        future: asyncio.Future,
+        stats: dict[str, int],
+    ) -> None:
+        """Store the response of a finished call."""
+        if self._pending.get(cache_key) is future:
+            del self._pending[cache_key]
+        if future.cancelled() or future.exception() is not None:
+            stats["errors"] += 1
+            return
+
+        self._store(cache_key, future.result())
+
+    def _store(self, cache_key: tuple[str, Hashable], value: Any) -> None:
+        """Cache a response for its endpoint's TTL."""
+        ttl = self.ttls.get(cache_key[0], 0.0)
+        if ttl <= 0:
+            return
+        self._entries.pop(cache_key, None)
+        self._entries[cache_key] = (time.monotonic() + ttl, value)
+        if len(self._entries) > self.max_entries:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop expired responses, then the oldest ones, down to the limit."""
+        now = time.monotonic()
+        self._entries = {
+            key: entry for key, entry in self._entries.items() if entry[0] > now
+        }
+        while len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+
+    def invalidate(self, endpoint: str | None = None) -> None:
+        """Forget cached responses of an endpoint, or all of them."""
+        if endpoint is None:
+            self._entries.clear()
+            return
+        self._entries = {
+            key: entry for key, entry in self._entries.items() if key[0] != endpoint
+        }
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get hit, miss, coalesce and error counts per endpoint.
+
+        ``upstream_saved`` is the share of requests answered without a call
+        of their own.
+        """
+        endpoints = {}
+        for endpoint, stats in self._stats.items():
+            requests = stats["hits"] + stats["misses"] + stats["coalesced"]
+            saved = stats["hits"] + stats["coalesced"]
+            endpoints[endpoint] = {
+                **stats,
+                "ttl": self.ttls.get(endpoint, 0.0),
+                "upstream_saved": saved / requests if requests else 0.0,
+            }
+        return {
+            "entries": len(self._entries),
+            "in_flight": len(self._pending),
+            "endpoints": endpoints,
+        }
@@ -0,0 +1,124 @@
+"""On-disk snapshots of exchange market metadata."""
+
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import ccxt
+
+logger = logging.getLogger(__name__)
+
+# Version 1 snapshots lack the market payloads orders need
+SNAPSHOT_VERSION = 2
+
+
+class MarketCache:
+    """Markets, currencies and timeframes of exchanges, saved as JSON files.
+
+    A snapshot younger than the refresh interval is loaded into new ccxt
+    instances, so they answer without the several seconds of requests
+    ``load_markets`` needs. Markets keep their raw ``info`` payload, which
+    ccxt reads when building orders; currencies drop it to keep snapshots
+    small.
+    """
+
+    def __init__(
+        self, directory: str | Path = "data/markets", refresh_interval: float = 86400.0
+    ) -> None:
+        """Initialize market cache.
+
+        Args:
+            directory: Directory holding the snapshots.
+            refresh_interval: Seconds a snapshot is used before markets are
+                fetched again.
+        """
+        self.directory = Path(directory)
+        self.refresh_interval = refresh_interval
+        self._snapshots: dict[str, dict[str, Any] | None] = {}
+
+    def path(self, name: str) -> Path:
+        """Get the snapshot file of an exchange configuration."""
+        return self.directory / f"{name}.json"
+
+    def load(self, name: str) -> dict[str, Any] | None:
+        """Get the snapshot of an exchange configuration if it is fresh."""
+        if name not in self._snapshots:
+            self._snapshots[name] = self._read(name)
+        snapshot = self._snapshots[name]
+        if snapshot is None or self._age(snapshot) > self.refresh_interval:
+            return None
+        return snapshot
+
+    def age(self, name: str) -> float | None:
+        """Get the age of a snapshot in seconds (None if there is none)."""
+        if name not in self._snapshots:
+            self._snapshots[name] = self._read(name)
+        snapshot = self._snapshots[name]
+        return self._age(snapshot) if snapshot is not None else None
+
+    def apply(self, name: str, exchange: ccxt.Exchange) -> bool:
+        """Load a fresh snapshot into a ccxt instance.
+
+        Returns:
+            Whether a snapshot was loaded.
+        """
+        snapshot = self.load(name)
+        if snapshot is None:
+            return False
+        exchange.set_markets(snapshot["markets"], snapshot["currencies"] or None)
+        return True
+
+    def save(self, name: str, exchange: ccxt.Exchange) -> None:
+        """Write the loaded markets of a ccxt instance to disk."""
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "exchange": exchange.id,
+            "fetched_at": time.time(),
+            "markets": list(exchange.markets.values()),
+            "currencies": {
+                code: self._strip(currency)
+                for code, currency in (exchange.currencies or {}).items()
+            },
+            "timeframes": exchange.timeframes,
+        }
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Write then rename so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(snapshot, file)
+            os.replace(tmp_path, self.path(name))
+        except Exception:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        self._snapshots[name] = snapshot
+        logger.info("Saved %d %s markets", len(snapshot["markets"]), name)
+
+    def _read(self, name: str) -> dict[str, Any] | None:
+        """Read a snapshot file, ignoring missing or unreadable ones."""
+        path = self.path(name)
+        if not path.exists():
+            return None
+        try:
+            with open(path, encoding="utf-8") as file:
+                snapshot = json.load(file)
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable market snapshot %s: %s", path, e)
+            return None
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            return None
+        return snapshot
+
+    @staticmethod
+    def _age(snapshot: dict[str, Any]) -> float:
+        """Get the seconds since a snapshot was taken."""
+        return time.time() - snapshot["fetched_at"]
+
+    @staticmethod
+    def _strip(entry: dict[str, Any]) -> dict[str, Any]:
+        """Drop the raw exchange payload of a currency."""
+        return {key: value for key, value in entry.items() if key != "info"}
@@ -0,0 +1,217 @@
+"""Local WebSocket stand-in for exchange streams, replaying recorded frames.
+
+Frames are ``(seconds since the start, frame)`` pairs, as recorded by
+``MarketDataStream(record=True)`` and stored with ``save_frames``. The
+server lets streams be tested and load-tested without network access.
+"""
+
+import asyncio
+import json
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from aiohttp import WSMsgType, web
+
+Frame = tuple[float, str | bytes]
+
+
+def save_frames(path: str | Path, frames: Iterable[Frame]) -> None:
+    """Write frames to a JSON lines file."""
+    with open(path, "w", encoding="utf-8") as file:
+        for offset, frame in frames:
+            record = {
+                "t": offset,
+                "binary": isinstance(frame, bytes),
+                "frame": frame.decode() if isinstance(frame, bytes) else frame,
+            }
+            file.write(json.dumps(record) + "\n")
+
+
+def load_frames(path: str | Path) -> list[Frame]:
+    """Read frames written by ``save_frames``."""
+    frames: list[Frame] = []
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            frame = record["frame"]
+            frames.append((record["t"], frame.encode() if record["binary"] else frame))
+    return frames
+
+
+def binance_frames(
+    symbols: list[str], trades: int, start_ms: int = 1_704_067_200_000
+) -> list[Frame]:
+    """Create Binance combined-stream frames: a trade and a ticker per step.
+
+    Args:
+        symbols: Symbols in standard format (e.g. ``"BTC/USDT"``).
+        trades: Trades per symbol, numbered from 1.
+        start_ms: Time of the first trade in milliseconds.
+
+    Returns:
+        Frames, all at offset zero.
+    """
+    frames: list[Frame] = []
+    for i in range(1, trades + 1):
+        timestamp = start_ms + i * 1000
+        price = f"{100 + i % 10}.0"
+        for symbol in symbols:
+            market_id = symbol.replace("/", "")
+            name = market_id.lower()
+            trade = {
+                "e": "trade",
+                "E": timestamp,
+                "s": market_id,
+                "t": i,
+                "p": price,
+                "q": "1.0",
+                "T": timestamp,
+                "m": i % 2 == 0,
+            }
+            ticker = {
+                "e": "24hrTicker",
+                "E": timestamp,
+                "s": market_id,
+                "c": price,
+                "b": price,
+                "a": price,
+                "v": f"{i}.0",
+                "p": "0.0",
+                "P": "0.0",
+            }
+            frames.append((0.0, json.dumps({"stream": f"{name}@trade", "data": trade})))
+            frames.append(
+                (0.0, json.dumps({"stream": f"{name}@ticker", "data": ticker}))
+            )
+    return frames
+
+
+class MockStreamServer:
+    """WebSocket server replaying frames to its clients.
+
+    Every client is sent the frames once it has subscribed. Replay resumes
+    across connections where the previous one stopped, so a dropped
+    connection can be simulated with ``drop_after`` and frames missed while
+    reconnecting with ``skip_on_reconnect``.
+    """
+
+    def __init__(
+        self,
+        frames: list[Frame],
+        speed: float = 0.0,
+        repeat: int = 1,
+        drop_after: int | None = None,
+        skip_on_reconnect: int = 0,
+    ) -> None:
+        """Initialize mock stream server.
+
+        Args:
+            frames: Frames to replay.
+            speed: Replay speed relative to the recording (0 for as fast
+                as possible).
+            repeat: Times the frames are replayed in a row.
+            drop_after: Frames sent before the server closes a connection
+                (never if None).
+            skip_on_reconnect: Frames left out when a client reconnects.
+        """
+        self.frames = frames
+        self.speed = speed
+        self.repeat = repeat
+        self.drop_after = drop_after
+        self.skip_on_reconnect = skip_on_reconnect
+        self.url = ""
+        self.connections = 0
+        self.sent = 0
+        self.received: list[str | bytes] = []
+        self._position = 0
+        self._sockets: set[web.WebSocketResponse] = set()
+        self._runner: web.AppRunner | None = None
+
+    async def start(self) -> str:
+        """Start serving on a free local port.
+
+        Returns:
+            WebSocket URL of the server.
+        """
+        app = web.Application()
+        app.router.add_get("/{path:.*}", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, "127.0.0.1", 0).start()
+        self.url = f"ws://127.0.0.1:{self._runner.addresses[0][1]}/stream"
+        return self.url
+
+    async def stop(self) -> None:
+        """Close every connection and stop serving."""
+        for ws in list(self._sockets):
+            await ws.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "MockStreamServer":
+        """Start the server."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Stop the server."""
+        await self.stop()
+
+    async def _handle(self, request: web.Request) -> web.WebSocketResponse:
+        """Replay frames to a client after its first subscription."""
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self._sockets.add(ws)
+        if self.connections:
+            self._position += self.skip_on_reconnect
+        self.connections += 1
+
+        subscribed = asyncio.Event()
+        reader = asyncio.create_task(self._read(ws, subscribed))
+        try:
+            await subscribed.wait()
+            await self._replay(ws)
+            if self.drop_after is None:
+                await reader
+        finally:
+            reader.cancel()
+            self._sockets.discard(ws)
+            await ws.close()
+        return ws
+
+    async def _read(self, ws: web.WebSocketResponse, subscribed: asyncio.Event) -> None:
+        """Record the client's messages until it disconnects."""
+        async for message in ws:
+            if message.type in (WSMsgType.TEXT, WSMsgType.BINARY):
+                self.received.append(message.data)
+                subscribed.set()
+        # Unblock the handler when the client leaves before subscribing
+        subscribed.set()
+
+    async def _replay(self, ws: web.WebSocketResponse) -> None:
+        """Send frames from the current position until done or dropped."""
+        total = len(self.frames) * self.repeat
+        sent = 0
+        last_offset = None
+        while self._position < total and not ws.closed:
+            if self.drop_after is not None and sent >= self.drop_after:
+                return
+            offset, frame = self.frames[self._position % len(self.frames)]
+            if self.speed and last_offset is not None and offset > last_offset:
+                await asyncio.sleep((offset - last_offset) / self.speed)
+            last_offset = offset
+
+            if isinstance(frame, bytes):
+                await ws.send_bytes(frame)
+            else:
+                await ws.send_str(frame)
+            self._position += 1
+            self.sent += 1
+            sent += 1
+            if sent % 100 == 0:
+                # Let other connections and the client run
+                await asyncio.sleep(0)
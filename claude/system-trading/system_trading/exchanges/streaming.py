@@ -0,0 +1,698 @@
+"""WebSocket market data streams keeping the latest state per symbol."""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from collections.abc import AsyncIterator, Iterable
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import Any
+
+import aiohttp
+
+from system_trading.config.settings import settings
+from system_trading.data.models import Exchange, Ticker
+from system_trading.utils.symbol_converter import symbol_converter
+
+logger = logging.getLogger(__name__)
+
+CHANNELS = ("ticker", "trade", "kline")
+
+
+class StreamEvent:
+    """Update received from a market data stream, in a common format.
+
+    ``data`` holds floats whatever the exchange sent: ``last``, ``bid``,
+    ``ask``, ``volume``, ``change`` and ``percentage`` for tickers; ``id``,
+    ``price``, ``amount`` and ``side`` for trades; ``timeframe``,
+    ``open_time``, OHLCV and ``closed`` for klines. ``gap`` events report
+    trades lost between two received ones.
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        exchange: Exchange,
+        symbol: str,
+        timestamp: int,
+        data: dict[str, Any],
+        sequence: int | None = None,
+    ) -> None:
+        """Initialize stream event.
+
+        Args:
+            channel: ``"ticker"``, ``"trade"``, ``"kline"`` or ``"gap"``.
+            exchange: Exchange the event comes from.
+            symbol: Symbol in standard format.
+            timestamp: Exchange time of the event in milliseconds.
+            data: Channel fields.
+            sequence: Exchange sequence number of trades.
+        """
+        self.channel = channel
+        self.exchange = exchange
+        self.symbol = symbol
+        self.timestamp = timestamp
+        self.data = data
+        self.sequence = sequence
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert event to a dictionary."""
+        return {
+            "channel": self.channel,
+            "exchange": self.exchange.value,
+            "symbol": self.symbol,
+            "timestamp": self.timestamp,
+            "sequence": self.sequence,
+            "data": self.data,
+        }
+
+
+class StreamProtocol:
+    """Subscription and message format of an exchange WebSocket API."""
+
+    EXCHANGE: Exchange
+    URL = ""
+    # Whether consecutive trades carry consecutive sequence numbers
+    CONTIGUOUS_SEQUENCES = False
+
+    def __init__(self, timeframe: str = "1m") -> None:
+        """Initialize stream protocol.
+
+        Args:
+            timeframe: Interval of the kline channel.
+        """
+        self.timeframe = timeframe
+        self._symbols: dict[str, str] = {}
+
+    def default_url(self) -> str:
+        """Get the WebSocket endpoint of the exchange."""
+        return self.URL
+
+    def subscribe_messages(
+        self, symbols: Iterable[str], channels: Iterable[str]
+    ) -> list[str]:
+        """Build the messages subscribing to every channel of the symbols.
+
+        The messages replace any earlier subscription of the connection.
+        """
+        raise NotImplementedError
+
+    def parse(self, message: str | bytes) -> list[StreamEvent]:
+        """Convert a received frame to events (none for control frames)."""
+        raise NotImplementedError
+
+    def _market_id(self, symbol: str) -> str:
+        """Get the exchange id of a symbol and remember the reverse mapping."""
+        market_id = symbol_converter.from_standard_format(symbol, self.EXCHANGE)
+        self._symbols[market_id] = symbol
+        return market_id
+
+    def _symbol(self, market_id: str) -> str:
+        """Get the standard symbol of an exchange id."""
+        return self._symbols.get(market_id) or symbol_converter.to_standard_format(
+            market_id, self.EXCHANGE
+        )
+
+
+class BinanceStreamProtocol(StreamProtocol):
+    """Binance combined streams (``<symbol>@ticker``, ``@trade``, ``@kline``)."""
+
+    EXCHANGE = Exchange.BINANCE
+    URL = "wss://stream.binance.com:9443/stream"
+    TESTNET_URL = "wss://stream.testnet.binance.vision/stream"
+    # Trade ids increase by one per trade of a symbol
+    CONTIGUOUS_SEQUENCES = True
+
+    def __init__(self, timeframe: str = "1m") -> None:
+        """Initialize Binance stream protocol."""
+        super().__init__(timeframe)
+        self._request_id = 0
+
+    def default_url(self) -> str:
+        """Get the WebSocket endpoint, honouring the testnet setting."""
+        return self.TESTNET_URL if settings.binance_testnet else self.URL
+
+    def subscribe_messages(
+        self, symbols: Iterable[str], channels: Iterable[str]
+    ) -> list[str]:
+        """Build the SUBSCRIBE request of the symbols' streams."""
+        names = {
+            "ticker": "ticker",
+            "trade": "trade",
+            "kline": f"kline_{self.timeframe}",
+        }
+        channels = list(channels)
+        params = [
+            f"{self._market_id(symbol).lower()}@{names[channel]}"
+            for symbol in symbols
+            for channel in channels
+        ]
+        self._request_id += 1
+        request = {"method": "SUBSCRIBE", "params": params, "id": self._request_id}
+        return [json.dumps(request)]
+
+    def parse(self, message: str | bytes) -> list[StreamEvent]:
+        """Convert a combined stream frame to events."""
+        data = json.loads(message).get("data")
+        # Subscription replies carry no data
+        if not isinstance(data, dict):
+            return []
+
+        symbol = self._symbol(data["s"])
+        if data["e"] == "24hrTicker":
+            fields = {
+                "last": "c",
+                "bid": "b",
+                "ask": "a",
+                "volume": "v",
+                "change": "p",
+                "percentage": "P",
+            }
+            ticker = {name: float(data[key]) for name, key in fields.items()}
+            return [StreamEvent("ticker", self.EXCHANGE, symbol, data["E"], ticker)]
+
+        if data["e"] == "trade":
+            trade = {
+                "id": data["t"],
+                "price": float(data["p"]),
+                "amount": float(data["q"]),
+                # The buyer being the maker means a seller took the order
+                "side": "sell" if data["m"] else "buy",
+            }
+            return [
+                StreamEvent(
+                    "trade", self.EXCHANGE, symbol, data["T"], trade, sequence=data["t"]
+                )
+            ]
+
+        if data["e"] == "kline":
+            k = data["k"]
+            kline = {
+                "timeframe": k["i"],
+                "open_time": k["t"],
+                "open": float(k["o"]),
+                "high": float(k["h"]),
+                "low": float(k["l"]),
+                "close": float(k["c"]),
+                "volume": float(k["v"]),
+                "closed": k["x"],
+            }
+            return [StreamEvent("kline", self.EXCHANGE, symbol, data["E"], kline)]
+
+        return []
+
+
+class UpbitStreamProtocol(StreamProtocol):
+    """Upbit WebSocket API (``ticker``, ``trade`` and ``candle`` types)."""
+
+    EXCHANGE = Exchange.UPBIT
+    URL = "wss://api.upbit.com/websocket/v1"
+    # Candle types are named in seconds or minutes only
+    CANDLE_UNITS = {"1h": "60m", "4h": "240m"}
+
+    def subscribe_messages(
+        self, symbols: Iterable[str], channels: Iterable[str]
+    ) -> list[str]:
+        """Build the request of the symbols' types."""
+        codes = [self._market_id(symbol) for symbol in symbols]
+        candle = f"candle.{self.CANDLE_UNITS.get(self.timeframe, self.timeframe)}"
+        request: list[dict[str, Any]] = [{"ticket": str(uuid.uuid4())}]
+        request.extend(
+            {"type": candle if channel == "kline" else channel, "codes": codes}
+            for channel in channels
+        )
+        request.append({"format": "DEFAULT"})
+        return [json.dumps(request)]
+
+    def parse(self, message: str | bytes) -> list[StreamEvent]:
+        """Convert a frame to events."""
+        data = json.loads(message)
+        if "error" in data:
+            logger.warning("Upbit stream error: %s", data["error"])
+            return []
+        # Replies to pings ({"status": "UP"}) have no type
+        message_type = data.get("type", "")
+        if not message_type:
+            return []
+
+        symbol = self._symbol(data["code"])
+        if message_type == "ticker":
+            ticker = {
+                "last": float(data["trade_price"]),
+                # The ticker type carries no order book
+                "bid": 0.0,
+                "ask": 0.0,
+                "volume": float(data["acc_trade_volume_24h"]),
+                "change": float(data["signed_change_price"]),
+                "percentage": float(data["signed_change_rate"]) * 100,
+            }
+            return [
+                StreamEvent("ticker", self.EXCHANGE, symbol, data["timestamp"], ticker)
+            ]
+
+        if message_type == "trade":
+            trade = {
+                "id": data["sequential_id"],
+                "price": float(data["trade_price"]),
+                "amount": float(data["trade_volume"]),
+                "side": "sell" if data["ask_bid"] == "ASK" else "buy",
+            }
+            return [
+                StreamEvent(
+                    "trade",
+                    self.EXCHANGE,
+                    symbol,
+                    data["trade_timestamp"],
+                    trade,
+                    sequence=data["sequential_id"],
+                )
+            ]
+
+        if message_type.startswith("candle."):
+            open_time = datetime.fromisoformat(data["candle_date_time_utc"])
+            kline = {
+                "timeframe": self.timeframe,
+                "open_time": int(open_time.replace(tzinfo=UTC).timestamp() * 1000),
+                "open": float(data["opening_price"]),
+                "high": float(data["high_price"]),
+                "low": float(data["low_price"]),
+                "close": float(data["trade_price"]),
+                "volume": float(data["candle_acc_trade_volume"]),
+                # Upbit does not flag closed candles
+                "closed": None,
+            }
+            return [
+                StreamEvent("kline", self.EXCHANGE, symbol, data["timestamp"], kline)
+            ]
+
+        return []
+
+
+STREAM_PROTOCOLS: dict[Exchange, type[StreamProtocol]] = {
+    Exchange.BINANCE: BinanceStreamProtocol,
+    Exchange.UPBIT: UpbitStreamProtocol,
+}
+
+
+class Subscription:
+    """Async iterator over the stream events a subscriber asked for.
+
+    A subscriber falling behind loses its oldest events instead of slowing
+    the stream down; ``dropped`` counts them.
+    """
+
+    def __init__(
+        self,
+        stream: "MarketDataStream",
+        channels: Iterable[str] | None = None,
+        symbols: Iterable[str] | None = None,
+        maxsize: int = 10_000,
+    ) -> None:
+        """Initialize subscription.
+
+        Args:
+            stream: Stream publishing the events.
+            channels: Channels to receive (all if None).
+            symbols: Symbols to receive (all if None).
+            maxsize: Events buffered before the oldest are dropped.
+        """
+        self.stream = stream
+        self.channels = set(channels) if channels is not None else None
+        self.symbols = set(symbols) if symbols is not None else None
+        self.dropped = 0
+        self._queue: asyncio.Queue[StreamEvent | None] = asyncio.Queue(maxsize)
+        self._closed = False
+
+    def matches(self, event: StreamEvent) -> bool:
+        """Check whether the subscriber asked for an event."""
+        if self.symbols is not None and event.symbol not in self.symbols:
+            return False
+        channel = event.data["channel"] if event.channel == "gap" else event.channel
+        return self.channels is None or channel in self.channels
+
+    def put(self, event: StreamEvent | None) -> None:
+        """Queue an event, dropping the oldest one when full."""
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(event)
+
+    def close(self) -> None:
+        """Stop receiving events and end the iteration."""
+        if self._closed:
+            return
+        self._closed = True
+        self.stream._subscriptions.discard(self)
+        self.put(None)
+
+    def __aiter__(self) -> "Subscription":
+        """Iterate over the events."""
+        return self
+
+    async def __anext__(self) -> StreamEvent:
+        """Wait for the next event."""
+        event = await self._queue.get()
+        if event is None:
+            raise StopAsyncIteration
+        return event
+
+
+class MarketDataStream:
+    """Streaming ticker, trade and kline feed of one exchange.
+
+    The connection is kept up in a background task: after a drop it
+    reconnects with exponential backoff and subscribes again. The latest
+    ticker, trade and kline of every symbol are kept in memory, and every
+    event is published to the subscriptions.
+
+    Trades repeated after a reconnect are discarded. Where the exchange
+    numbers trades contiguously, a skipped number is logged, counted in
+    ``gaps`` and published as a ``gap`` event.
+    """
+
+    # Trade ids remembered per symbol to discard repeats
+    RECENT_TRADES = 1000
+
+    def __init__(
+        self,
+        exchange: Exchange,
+        symbols: Iterable[str] = (),
+        channels: Iterable[str] = CHANNELS,
+        timeframe: str = "1m",
+        url: str | None = None,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+        idle_timeout: float = 60.0,
+        heartbeat: float = 20.0,
+        record: bool = False,
+    ) -> None:
+        """Initialize market data stream.
+
+        Args:
+            exchange: Exchange to stream from.
+            symbols: Symbols in standard format.
+            channels: Subset of ``"ticker"``, ``"trade"`` and ``"kline"``.
+            timeframe: Interval of the kline channel.
+            url: WebSocket endpoint (the exchange's if None).
+            reconnect_delay: First wait before reconnecting, in seconds.
+            max_reconnect_delay: Longest wait before reconnecting.
+            idle_timeout: Seconds without a frame before reconnecting.
+            heartbeat: Seconds between WebSocket pings.
+            record: Keep every received frame in ``recording``.
+        """
+        if exchange not in STREAM_PROTOCOLS:
+            raise ValueError(f"Streaming not supported for {exchange}")
+        channels = list(channels)
+        unknown = set(channels) - set(CHANNELS)
+        if unknown:
+            raise ValueError(f"Unknown channels: {sorted(unknown)}")
+
+        self.exchange = exchange
+        self.protocol = STREAM_PROTOCOLS[exchange](timeframe)
+        self.symbols = list(dict.fromkeys(symbols))
+        self.channels = channels
+        self.url = url or self.protocol.default_url()
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.idle_timeout = idle_timeout
+        self.heartbeat = heartbeat
+        self.recording: list[tuple[float, str | bytes]] | None = [] if record else None
+
+        self.tickers: dict[str, Ticker] = {}
+        self.trades: dict[str, StreamEvent] = {}
+        self.klines: dict[str, StreamEvent] = {}
+        self.updated: dict[str, float] = {}
+        self.connected = asyncio.Event()
+        self.messages = 0
+        self.reconnects = 0
+        self.gaps = 0
+        self.errors = 0
+
+        self._subscriptions: set[Subscription] = set()
+        self._last_sequence: dict[str, int] = {}
+        self._recent_trades: dict[str, dict[int, None]] = {}
+        self._ws: aiohttp.ClientWebSocketResponse | None = None
+        self._task: asyncio.Task | None = None
+        self._started = time.monotonic()
+
+    async def start(self) -> None:
+        """Connect in the background; returns without waiting."""
+        if self._task is None or self._task.done():
+            self._started = time.monotonic()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Disconnect and end every subscription."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for subscription in list(self._subscriptions):
+            subscription.close()
+
+    async def __aenter__(self) -> "MarketDataStream":
+        """Start the stream."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Stop the stream."""
+        await self.stop()
+
+    async def wait_connected(self, timeout: float | None = None) -> None:
+        """Wait until the stream is connected and subscribed."""
+        await asyncio.wait_for(self.connected.wait(), timeout)
+
+    async def add_symbols(self, symbols: Iterable[str]) -> None:
+        """Subscribe to more symbols, on the live connection if there is one."""
+        new = [symbol for symbol in symbols if symbol not in self.symbols]
+        if not new:
+            return
+        self.symbols.extend(new)
+        if self._ws is not None and not self._ws.closed:
+            await self._subscribe(self._ws)
+
+    @property
+    def subscribers(self) -> int:
+        """Get the number of open subscriptions."""
+        return len(self._subscriptions)
+
+    def subscribe(
+        self,
+        channels: Iterable[str] | None = None,
+        symbols: Iterable[str] | None = None,
+        maxsize: int = 10_000,
+    ) -> Subscription:
+        """Receive the stream's events.
+
+        Args:
+            channels: Channels to receive (all if None). Gaps are delivered
+                to subscribers of the trade channel.
+            symbols: Symbols to receive (all if None).
+            maxsize: Events buffered before the oldest are dropped.
+
+        Returns:
+            Subscription to iterate over; close it when done.
+        """
+        subscription = Subscription(self, channels, symbols, maxsize)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    async def trade_ticks(self, symbol: str) -> AsyncIterator[tuple[int, float, float]]:
+        """Stream the trades of a symbol as ``(timestamp in ms, price, amount)``."""
+        subscription = self.subscribe(["trade"], [symbol])
+        try:
+            async for event in subscription:
+                if event.channel == "trade":
+                    yield event.timestamp, event.data["price"], event.data["amount"]
+        finally:
+            subscription.close()
+
+    def get_ticker(self, symbol: str, max_age: float | None = None) -> Ticker | None:
+        """Get the latest ticker of a symbol.
+
+        Args:
+            symbol: Symbol in standard format.
+            max_age: Seconds since the last update after which the ticker is
+                considered stale (no limit if None).
+
+        Returns:
+            Ticker, or None while disconnected, stale or not yet received.
+        """
+        ticker = self.tickers.get(symbol)
+        if ticker is None or not self.connected.is_set():
+            return None
+        if max_age is not None and time.monotonic() - self.updated[symbol] > max_age:
+            return None
+        return ticker
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get connection and traffic counters."""
+        return {
+            "exchange": self.exchange.value,
+            "url": self.url,
+            "connected": self.connected.is_set(),
+            "symbols": len(self.symbols),
+            "subscribers": len(self._subscriptions),
+            "messages": self.messages,
+            "reconnects": self.reconnects,
+            "gaps": self.gaps,
+            "errors": self.errors,
+        }
+
+    async def _run(self) -> None:
+        """Keep a connection up, reconnecting with backoff after drops."""
+        delay = self.reconnect_delay
+        async with aiohttp.ClientSession() as session:
+            while True:
+                try:
+                    async with session.ws_connect(
+                        self.url, heartbeat=self.heartbeat
+                    ) as ws:
+                        self._ws = ws
+                        await self._subscribe(ws)
+                        self.connected.set()
+                        logger.info("%s stream connected", self.exchange.value)
+
+                        while True:
+                            message = await ws.receive(timeout=self.idle_timeout)
+                            if message.type not in (
+                                aiohttp.WSMsgType.TEXT,
+                                aiohttp.WSMsgType.BINARY,
+                            ):
+                                break
+                            self._handle(message.data)
+                            delay = self.reconnect_delay
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.warning("%s stream error: %s", self.exchange.value, e)
+                finally:
+                    self._ws = None
+                    self.connected.clear()
+
+                self.reconnects += 1
+                logger.info(
+                    "Reconnecting %s stream in %.1fs", self.exchange.value, delay
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def _subscribe(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        """Subscribe the connection to every symbol and channel."""
+        if not self.symbols:
+            return
+        for message in self.protocol.subscribe_messages(self.symbols, self.channels):
+            await ws.send_str(message)
+
+    def _handle(self, message: str | bytes) -> None:
+        """Apply and publish the events of a received frame."""
+        self.messages += 1
+        if self.recording is not None:
+            self.recording.append((time.monotonic() - self._started, message))
+
+        try:
+            events = self.protocol.parse(message)
+        except (ValueError, KeyError, TypeError) as e:
+            self.errors += 1
+            logger.warning("Malformed %s frame: %s", self.exchange.value, e)
+            return
+
+        for event in events:
+            if event.sequence is not None and not self._check_sequence(event):
+                continue
+            self._apply(event)
+            self._publish(event)
+
+    def _check_sequence(self, event: StreamEvent) -> bool:
+        """Discard repeated trades and report skipped ones.
+
+        Returns:
+            Whether the event is new.
+        """
+        sequence = event.sequence
+        assert sequence is not None
+        recent = self._recent_trades.setdefault(event.symbol, {})
+        if sequence in recent:
+            return False
+        recent[sequence] = None
+        if len(recent) > self.RECENT_TRADES:
+            del recent[next(iter(recent))]
+
+        if not self.protocol.CONTIGUOUS_SEQUENCES:
+            return True
+        last = self._last_sequence.get(event.symbol)
+        if last is not None and sequence <= last:
+            return False
+        self._last_sequence[event.symbol] = sequence
+
+        if last is not None and sequence != last + 1:
+            self.gaps += 1
+            missing = sequence - last - 1
+            logger.warning(
+                "%s %s trade stream skipped %d trades after %d",
+                self.exchange.value,
+                event.symbol,
+                missing,
+                last,
+            )
+            gap = {
+                "channel": event.channel,
+                "after": last,
+                "before": sequence,
+                "missing": missing,
+            }
+            self._publish(
+                StreamEvent("gap", self.exchange, event.symbol, event.timestamp, gap)
+            )
+        return True
+
+    def _apply(self, event: StreamEvent) -> None:
+        """Update the latest state of the event's symbol."""
+        self.updated[event.symbol] = time.monotonic()
+        if event.channel == "ticker":
+            data = event.data
+            self.tickers[event.symbol] = Ticker(
+                symbol=event.symbol,
+                timestamp=datetime.fromtimestamp(event.timestamp / 1000),
+                bid=Decimal(str(data["bid"])),
+                ask=Decimal(str(data["ask"])),
+                last=Decimal(str(data["last"])),
+                volume=Decimal(str(data["volume"])),
+                change=Decimal(str(data["change"])),
+                percentage=Decimal(str(data["percentage"])),
+            )
+        elif event.channel == "trade":
+            self.trades[event.symbol] = event
+        elif event.channel == "kline":
+            self.klines[event.symbol] = event
+
+    def _publish(self, event: StreamEvent) -> None:
+        """Hand an event to the matching subscriptions."""
+        for subscription in self._subscriptions:
+            if subscription.matches(event):
+                subscription.put(event)
+
+
+def create_streams(
+    symbols: dict[Exchange, list[str]], **kwargs: Any
+) -> dict[Exchange, MarketDataStream]:
+    """Create a stream per exchange supporting streaming.
+
+    Args:
+        symbols: Symbols to stream per exchange.
+        **kwargs: Options passed to every MarketDataStream.
+
+    Returns:
+        Streams by exchange; exchanges without streaming are left out.
+    """
+    return {
+        exchange: MarketDataStream(exchange, exchange_symbols, **kwargs)
+        for exchange, exchange_symbols in symbols.items()
+        if exchange in STREAM_PROTOCOLS
+    }
@@ -1,10 +1,17 @@
 """Unified exchange client using CCXT."""
 
+import asyncio
 import logging
+import ssl
+import threading
 from datetime import datetime
 from decimal import Decimal
+from typing import Any
 
+import aiohttp
 import ccxt
+import ccxt.async_support as ccxt_async
+import certifi
 import pandas as pd
 
 from system_trading.config.settings import settings
@@ -20,87 +27,260 @@ from system_trading.data.models import (
     Ticker,
     Trade,
 )
+from system_trading.exchanges.cache import RequestCache
+from system_trading.exchanges.markets import MarketCache
 from system_trading.utils.symbol_converter import symbol_converter
 from system_trading.utils.retry import handle_exchange_errors, retry_async, error_aggregator
-from system_trading.utils.exceptions import map_ccxt_exception
+from system_trading.utils.exceptions import (
+    ExchangeError,
+    SymbolNotFoundError,
+    map_ccxt_exception,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class UnifiedExchangeClient:
-    """Unified client for multiple exchanges using CCXT."""
+    """Unified client for multiple exchanges using CCXT.
+
+    Async methods run on ccxt's ``async_support`` and never block the event
+    loop, so concurrent requests overlap. Each exchange gets one aiohttp
+    session over a keep-alive connection pool, created on first use in the
+    running loop and released by ``close()``.
+
+    The synchronous instances from ``get_exchange`` remain for callers that
+    work in threads, such as the paginated backtest downloads.
+
+    Exchange instances are only constructed when first used, and start with
+    the markets of the on-disk snapshot when it is fresh, so creating a
+    client makes no network calls.
+    """
+
+    EXCHANGE_IDS = {Exchange.BINANCE: "binance", Exchange.UPBIT: "upbit"}
 
-    def __init__(self) -> None:
-        """Initialize unified exchange client."""
+    def __init__(
+        self,
+        pool_size: int = 100,
+        keepalive_timeout: float = 30.0,
+        cache_ttls: dict[str, float] | None = None,
+        market_cache: MarketCache | None = None,
+    ) -> None:
+        """Initialize unified exchange client.
+
+        Args:
+            pool_size: Open connections per exchange.
+            keepalive_timeout: Seconds an idle connection is kept open.
+            cache_ttls: Seconds ticker and OHLCV responses are reused, by
+                endpoint (``RequestCache.DEFAULT_TTLS`` if None).
+            market_cache: Snapshots of market metadata (defaults to the
+                configured directory and refresh interval).
+        """
         self.exchanges: dict[Exchange, ccxt.Exchange] = {}
-        self._initialize_exchanges()
+        self.pool_size = pool_size
+        self.keepalive_timeout = keepalive_timeout
+        # Public market data is shared between callers asking within the TTL
+        self.cache = RequestCache(cache_ttls)
+        self.market_cache = market_cache or MarketCache(
+            settings.markets_cache_dir, settings.markets_refresh_interval
+        )
+        self._async_exchanges: dict[Exchange, ccxt_async.Exchange] = {}
+        self._sessions: dict[Exchange, aiohttp.ClientSession] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._closing: set[asyncio.Task] = set()
+        self._lock = threading.Lock()
+
+    def _exchange_config(self, exchange: Exchange) -> dict[str, Any]:
+        """Get the ccxt configuration of an exchange."""
+        if exchange == Exchange.BINANCE:
+            return {
+                "apiKey": settings.binance_api_key,
+                "secret": settings.binance_secret_key,
+                "sandbox": settings.binance_testnet,
+                "enableRateLimit": True,
+                "options": {
+                    "defaultType": "spot",
+                },
+            }
+        return {
+            "apiKey": settings.upbit_access_key,
+            "secret": settings.upbit_secret_key,
+            "enableRateLimit": True,
+        }
 
-    def _initialize_exchanges(self) -> None:
-        """Initialize exchange connections."""
-        # Initialize Binance
-        try:
-            self.exchanges[Exchange.BINANCE] = ccxt.binance(
-                {
-                    "apiKey": settings.binance_api_key,
-                    "secret": settings.binance_secret_key,
-                    "sandbox": settings.binance_testnet,
-                    "enableRateLimit": True,
-                    "options": {
-                        "defaultType": "spot",
-                    },
-                }
+    def _snapshot_name(self, exchange: Exchange) -> str:
+        """Get the market snapshot name, separating testnet markets."""
+        name = self.EXCHANGE_IDS[exchange]
+        if exchange == Exchange.BINANCE and settings.binance_testnet:
+            return f"{name}-testnet"
+        return name
+
+    def _create_exchange(
+        self, module: Any, exchange: Exchange, **config: Any
+    ) -> ccxt.Exchange:
+        """Construct an exchange instance with the snapshot's markets."""
+        if exchange not in self.EXCHANGE_IDS:
+            raise ValueError(f"Exchange {exchange} not supported")
+        ex = getattr(module, self.EXCHANGE_IDS[exchange])(
+            {**self._exchange_config(exchange), **config}
+        )
+        if self.market_cache.apply(self._snapshot_name(exchange), ex):
+            logger.debug("Loaded %s markets from snapshot", exchange.value)
+        return ex
+
+    def get_exchange(self, exchange: Exchange) -> ccxt.Exchange:
+        """Get the synchronous exchange instance, for use outside the event loop."""
+        with self._lock:
+            if exchange not in self.exchanges:
+                self.exchanges[exchange] = self._create_exchange(ccxt, exchange)
+                logger.info("%s client initialized", exchange.value)
+            return self.exchanges[exchange]
+
+    def get_async_exchange(self, exchange: Exchange) -> ccxt_async.Exchange:
+        """Get the async exchange instance of the running event loop.
+
+        Must be called from a coroutine. The instance and its connection pool
+        are created on first use.
+        """
+        if exchange not in self.EXCHANGE_IDS:
+            raise ValueError(f"Exchange {exchange} not supported")
+
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Sessions are bound to the loop that created them
+            if self._sessions:
+                logger.warning("Event loop changed; opening new exchange sessions")
+                task = loop.create_task(
+                    self._close_stale_pools(self._async_exchanges, self._sessions)
+                )
+                self._closing.add(task)
+                task.add_done_callback(self._closing.discard)
+            self._async_exchanges, self._sessions = {}, {}
+            self._loop = loop
+
+        if exchange not in self._async_exchanges:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                keepalive_timeout=self.keepalive_timeout,
+                ssl=ssl.create_default_context(cafile=certifi.where()),
             )
-            logger.info(
-                "Binance client initialized (testnet=%s)", settings.binance_testnet
+            session = aiohttp.ClientSession(connector=connector)
+            self._sessions[exchange] = session
+            # A session passed in is shared, not owned, by the ccxt instance
+            self._async_exchanges[exchange] = self._create_exchange(
+                ccxt_async, exchange, session=session
             )
-        except Exception as e:
-            logger.error("Failed to initialize Binance client: %s", e)
+        return self._async_exchanges[exchange]
+
+    async def load_markets(
+        self, exchange: Exchange, reload: bool = False
+    ) -> dict[str, dict[str, Any]]:
+        """Get the markets of an exchange, from the snapshot while it is fresh.
+
+        Markets are fetched and the snapshot rewritten once it is older than
+        the refresh interval, or when ``reload`` is set. Concurrent loads
+        share one fetch.
+        """
+        ex = self.get_async_exchange(exchange)
+        name = self._snapshot_name(exchange)
+        if not reload and self.market_cache.load(name) is not None:
+            if not ex.markets:
+                # Written by another client after this instance was created
+                self.market_cache.apply(name, ex)
+            return ex.markets
+
+        return await self.cache.get(
+            "markets", exchange, lambda: self._fetch_markets(exchange)
+        )
 
-        # Initialize Upbit using CCXT
+    async def _fetch_markets(self, exchange: Exchange) -> dict[str, dict[str, Any]]:
+        """Fetch the markets of an exchange and save their snapshot."""
+        ex = self.get_async_exchange(exchange)
+        markets = await ex.load_markets(reload=True)
         try:
-            self.exchanges[Exchange.UPBIT] = ccxt.upbit(
-                {
-                    "apiKey": settings.upbit_access_key,
-                    "secret": settings.upbit_secret_key,
-                    "enableRateLimit": True,
-                }
+            await asyncio.to_thread(
+                self.market_cache.save, self._snapshot_name(exchange), ex
             )
-            logger.info("Upbit client initialized")
-        except Exception as e:
-            logger.error("Failed to initialize Upbit client: %s", e)
+        except OSError as e:
+            logger.warning("Failed to save %s markets: %s", exchange.value, e)
+        return markets
 
-    def get_exchange(self, exchange: Exchange) -> ccxt.Exchange:
-        """Get exchange instance."""
-        if exchange not in self.exchanges:
-            raise ValueError(f"Exchange {exchange} not initialized")
-        return self.exchanges[exchange]
+    def get_markets_age(self, exchange: Exchange) -> float | None:
+        """Get the age of an exchange's market snapshot in seconds."""
+        return self.market_cache.age(self._snapshot_name(exchange))
+
+    async def _close_stale_pools(
+        self,
+        exchanges: dict[Exchange, ccxt_async.Exchange],
+        sessions: dict[Exchange, aiohttp.ClientSession],
+    ) -> None:
+        """Close the connection pools of an event loop that is no longer used."""
+        for ex in exchanges.values():
+            # The instance does not own its session, so only drop the reference
+            ex.session = None
+        for exchange, session in sessions.items():
+            try:
+                await session.close()
+            except RuntimeError as e:
+                # Sockets still open on an already closed loop cannot be closed
+                logger.warning(
+                    "Leaked %s connection pool of a previous event loop: %s",
+                    exchange.value,
+                    e,
+                )
+
+    async def close(self) -> None:
+        """Close the async exchange instances and their connection pools.
+
+        The client stays usable; new sessions are opened on the next request.
+        """
+        exchanges, sessions = self._async_exchanges, self._sessions
+        self._async_exchanges, self._sessions = {}, {}
+        await asyncio.gather(
+            *(ex.close() for ex in exchanges.values()), return_exceptions=True
+        )
+        await asyncio.gather(
+            *(session.close() for session in sessions.values()),
+            return_exceptions=True,
+        )
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(task for task in self._closing if task.get_loop() is loop)
+        )
+
+    async def __aenter__(self) -> "UnifiedExchangeClient":
+        """Use the client as an async context manager."""
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Close the connection pools on exit."""
+        await self.close()
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        """Get hit, miss and coalesce counts of the market data cache."""
+        return self.cache.get_stats()
 
-    @handle_exchange_errors
     async def get_ticker(self, symbol: str, exchange: Exchange) -> Ticker:
-        """Get ticker data."""
+        """Get ticker data, shared with concurrent and recent callers."""
+        return await self.cache.get(
+            "ticker", (exchange, symbol), lambda: self._fetch_ticker(symbol, exchange)
+        )
+
+    @handle_exchange_errors
+    async def _fetch_ticker(self, symbol: str, exchange: Exchange) -> Ticker:
+        """Fetch ticker data from the exchange."""
         try:
-            ex = self.get_exchange(exchange)
+            ex = self.get_async_exchange(exchange)
             # Convert symbol to exchange-specific format
             exchange_symbol = symbol_converter.from_standard_format(symbol, exchange)
-            ticker_data = ex.fetch_ticker(exchange_symbol)
-
-            return Ticker(
-                symbol=symbol,  # Return in standard format
-                timestamp=datetime.fromtimestamp(ticker_data["timestamp"] / 1000),
-                bid=Decimal(str(ticker_data["bid"] or 0)),
-                ask=Decimal(str(ticker_data["ask"] or 0)),
-                last=Decimal(str(ticker_data["last"] or 0)),
-                volume=Decimal(str(ticker_data["baseVolume"] or 0)),
-                change=Decimal(str(ticker_data["change"] or 0)),
-                percentage=Decimal(str(ticker_data["percentage"] or 0)),
-            )
+            ticker_data = await ex.fetch_ticker(exchange_symbol)
+
+            return self._to_ticker(symbol, ticker_data)
         except Exception as e:
             # Map CCXT exceptions to custom exceptions
             custom_exception = map_ccxt_exception(e, exchange.value)
             logger.error("Failed to get ticker for %s on %s: %s", symbol, exchange, custom_exception)
             raise custom_exception
 
-    @handle_exchange_errors
     async def get_ohlcv(
         self,
         symbol: str,
@@ -108,12 +288,130 @@ class UnifiedExchangeClient:
         timeframe: str = "1h",
         limit: int = 100,
     ) -> list[OHLCV]:
-        """Get OHLCV data."""
+        """Get OHLCV data, shared with concurrent and recent callers."""
+        return await self.cache.get(
+            "ohlcv",
+            (exchange, symbol, timeframe, limit),
+            lambda: self._fetch_ohlcv(symbol, exchange, timeframe, limit),
+        )
+
+    async def get_tickers(
+        self, symbols: list[str], exchange: Exchange
+    ) -> dict[str, Ticker]:
+        """Get tickers of several symbols in as few requests as possible.
+
+        Fresh cached tickers are reused. The others come from one bulk
+        request where the exchange supports it, or from concurrent
+        single-symbol requests otherwise or when the bulk request fails (e.g.
+        on an unknown symbol or a network error).
+
+        Args:
+            symbols: Trading symbols.
+            exchange: Exchange name.
+
+        Returns:
+            Tickers by symbol; symbols that could not be fetched are left out.
+        """
+        symbols = list(dict.fromkeys(symbols))
+        tickers = {}
+        missing = []
+        for symbol in symbols:
+            ticker = self.cache.peek("ticker", (exchange, symbol))
+            if ticker is None:
+                missing.append(symbol)
+            else:
+                tickers[symbol] = ticker
+
+        if missing:
+            ex = self.get_async_exchange(exchange)
+            fetched = None
+            if ex.has.get("fetchTickers"):
+                try:
+                    fetched = await self.cache.get(
+                        "tickers",
+                        (exchange, tuple(missing)),
+                        lambda: self._fetch_tickers(missing, exchange),
+                    )
+                except ExchangeError as e:
+                    # Symbols that fail again are left out, not the whole batch
+                    logger.warning("Fetching tickers one by one: %s", e)
+
+            if fetched is None:
+                fetched = await self._gather_tickers(missing, exchange)
+            for symbol, ticker in fetched.items():
+                self.cache.put("ticker", (exchange, symbol), ticker)
+            tickers.update(fetched)
+
+        return {symbol: tickers[symbol] for symbol in symbols if symbol in tickers}
+
+    @handle_exchange_errors
+    async def _fetch_tickers(
+        self, symbols: list[str], exchange: Exchange
+    ) -> dict[str, Ticker]:
+        """Fetch tickers of several symbols in one request."""
         try:
-            ex = self.get_exchange(exchange)
+            ex = self.get_async_exchange(exchange)
+            # Standard symbols are ccxt's unified symbols
+            tickers_data = await ex.fetch_tickers(symbols)
+
+            return {
+                symbol: self._to_ticker(symbol, tickers_data[symbol])
+                for symbol in symbols
+                if symbol in tickers_data
+            }
+        except ccxt.BadSymbol as e:
+            # A single unknown symbol fails the whole batch
+            raise SymbolNotFoundError(
+                message=str(e), exchange=exchange.value, symbol=",".join(symbols)
+            ) from e
+        except Exception as e:
+            custom_exception = map_ccxt_exception(e, exchange.value)
+            logger.error("Failed to get tickers on %s: %s", exchange, custom_exception)
+            raise custom_exception from e
+
+    async def _gather_tickers(
+        self, symbols: list[str], exchange: Exchange
+    ) -> dict[str, Ticker]:
+        """Fetch tickers with concurrent single-symbol requests."""
+        results = await asyncio.gather(
+            *(self.get_ticker(symbol, exchange) for symbol in symbols),
+            return_exceptions=True,
+        )
+        tickers = {}
+        for symbol, result in zip(symbols, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning("Failed to get ticker for %s: %s", symbol, result)
+            else:
+                tickers[symbol] = result
+        return tickers
+
+    def _to_ticker(self, symbol: str, ticker_data: dict[str, Any]) -> Ticker:
+        """Convert a ccxt ticker to a Ticker in standard symbol format."""
+        return Ticker(
+            symbol=symbol,  # Return in standard format
+            timestamp=datetime.fromtimestamp(ticker_data["timestamp"] / 1000),
+            bid=Decimal(str(ticker_data["bid"] or 0)),
+            ask=Decimal(str(ticker_data["ask"] or 0)),
+            last=Decimal(str(ticker_data["last"] or 0)),
+            volume=Decimal(str(ticker_data["baseVolume"] or 0)),
+            change=Decimal(str(ticker_data["change"] or 0)),
+            percentage=Decimal(str(ticker_data["percentage"] or 0)),
+        )
+
+    @handle_exchange_errors
+    async def _fetch_ohlcv(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        timeframe: str = "1h",
+        limit: int = 100,
+    ) -> list[OHLCV]:
+        """Fetch OHLCV data from the exchange."""
+        try:
+            ex = self.get_async_exchange(exchange)
             # Convert symbol to exchange-specific format
             exchange_symbol = symbol_converter.from_standard_format(symbol, exchange)
-            ohlcv_data = ex.fetch_ohlcv(exchange_symbol, timeframe, limit=limit)
+            ohlcv_data = await ex.fetch_ohlcv(exchange_symbol, timeframe, limit=limit)
 
             ohlcv_list = []
             for candle in ohlcv_data:
@@ -141,8 +439,10 @@ class UnifiedExchangeClient:
         limit: int = 100,
     ) -> MarketData:
         """Get complete market data."""
-        ohlcv = await self.get_ohlcv(symbol, exchange, timeframe, limit)
-        ticker = await self.get_ticker(symbol, exchange)
+        ohlcv, ticker = await asyncio.gather(
+            self.get_ohlcv(symbol, exchange, timeframe, limit),
+            self.get_ticker(symbol, exchange),
+        )
 
         return MarketData(
             symbol=symbol,
@@ -154,8 +454,8 @@ class UnifiedExchangeClient:
     async def get_balance(self, exchange: Exchange) -> list[Balance]:
         """Get account balance."""
         try:
-            ex = self.get_exchange(exchange)
-            balance_data = ex.fetch_balance()
+            ex = self.get_async_exchange(exchange)
+            balance_data = await ex.fetch_balance()
 
             balances = []
             for asset, balance_info in balance_data.items():
@@ -191,7 +491,7 @@ class UnifiedExchangeClient:
     ) -> Order:
         """Create order."""
         try:
-            ex = self.get_exchange(exchange)
+            ex = self.get_async_exchange(exchange)
 
             # Convert symbol to exchange-specific format
             exchange_symbol = symbol_converter.from_standard_format(symbol, exchange)
@@ -208,7 +508,7 @@ class UnifiedExchangeClient:
                 order_params["price"] = float(price)
 
             # Create order
-            order_result = ex.create_order(**order_params)
+            order_result = await ex.create_order(**order_params)
 
             return Order(
                 id=order_result["id"],
@@ -232,8 +532,8 @@ class UnifiedExchangeClient:
     ) -> Order:
         """Cancel order."""
         try:
-            ex = self.get_exchange(exchange)
-            order_result = ex.cancel_order(order_id, symbol)
+            ex = self.get_async_exchange(exchange)
+            order_result = await ex.cancel_order(order_id, symbol)
 
             return Order(
                 id=order_result["id"],
@@ -263,8 +563,8 @@ class UnifiedExchangeClient:
     async def get_order(self, order_id: str, symbol: str, exchange: Exchange) -> Order:
         """Get order status."""
         try:
-            ex = self.get_exchange(exchange)
-            order_result = ex.fetch_order(order_id, symbol)
+            ex = self.get_async_exchange(exchange)
+            order_result = await ex.fetch_order(order_id, symbol)
 
             return Order(
                 id=order_result["id"],
@@ -290,15 +590,13 @@ class UnifiedExchangeClient:
     async def get_open_orders(
         self, symbol: str | None = None, exchange: Exchange | None = None
     ) -> list[Order]:
-        """Get open orders."""
-        orders = []
+        """Get open orders, querying the exchanges concurrently."""
 
-        exchanges_to_check = [exchange] if exchange else list(self.exchanges.keys())
-
-        for ex_name in exchanges_to_check:
+        async def fetch(ex_name: Exchange) -> list[Order]:
+            orders = []
             try:
-                ex = self.get_exchange(ex_name)
-                open_orders = ex.fetch_open_orders(symbol)
+                ex = self.get_async_exchange(ex_name)
+                open_orders = await ex.fetch_open_orders(symbol)
 
                 for order_data in open_orders:
                     orders.append(
@@ -324,8 +622,11 @@ class UnifiedExchangeClient:
                     )
             except Exception as e:
                 logger.error("Failed to get open orders for %s: %s", ex_name, e)
+            return orders
 
-        return orders
+        exchanges_to_check = [exchange] if exchange else list(self.EXCHANGE_IDS)
+        results = await asyncio.gather(*map(fetch, exchanges_to_check))
+        return [order for orders in results for order in orders]
 
     async def get_trades(
         self,
@@ -333,15 +634,13 @@ class UnifiedExchangeClient:
         exchange: Exchange | None = None,
         limit: int = 100,
     ) -> list[Trade]:
-        """Get trade history."""
-        trades = []
-
-        exchanges_to_check = [exchange] if exchange else list(self.exchanges.keys())
+        """Get trade history, querying the exchanges concurrently."""
 
-        for ex_name in exchanges_to_check:
+        async def fetch(ex_name: Exchange) -> list[Trade]:
+            trades = []
             try:
-                ex = self.get_exchange(ex_name)
-                trade_data = ex.fetch_my_trades(symbol, limit=limit)
+                ex = self.get_async_exchange(ex_name)
+                trade_data = await ex.fetch_my_trades(symbol, limit=limit)
 
                 for trade_info in trade_data:
                     trades.append(
@@ -362,8 +661,11 @@ class UnifiedExchangeClient:
                     )
             except Exception as e:
                 logger.error("Failed to get trades for %s: %s", ex_name, e)
+            return trades
 
-        return trades
+        exchanges_to_check = [exchange] if exchange else list(self.EXCHANGE_IDS)
+        results = await asyncio.gather(*map(fetch, exchanges_to_check))
+        return [trade for trades in results for trade in trades]
 
     def get_ohlcv_dataframe(
         self,
@@ -371,11 +673,24 @@ class UnifiedExchangeClient:
         exchange: Exchange,
         timeframe: str = "1h",
         limit: int = 100,
+        since: int | None = None,
     ) -> pd.DataFrame:
-        """Get OHLCV data as pandas DataFrame."""
+        """Get OHLCV data as pandas DataFrame.
+
+        Args:
+            symbol: Trading symbol.
+            exchange: Exchange name.
+            timeframe: Data timeframe.
+            limit: Maximum number of candles.
+            since: Timestamp in milliseconds of the first candle (latest
+                candles if None).
+
+        Returns:
+            OHLCV DataFrame with datetime index.
+        """
         try:
             ex = self.get_exchange(exchange)
-            ohlcv_data = ex.fetch_ohlcv(symbol, timeframe, limit=limit)
+            ohlcv_data = ex.fetch_ohlcv(symbol, timeframe, since=since, limit=limit)
 
             df = pd.DataFrame(
                 ohlcv_data,
@@ -56,6 +56,25 @@ class BaseStrategy(ABC):
         """
         pass
 
+    def generate_signals_vectorized(
+        self, data: pd.DataFrame
+    ) -> tuple[pd.Series, pd.Series] | None:
+        """Generate buy/sell signals for every bar in a single pass.
+
+        Strategies whose indicators are causal can compute full indicator
+        columns once and derive boolean signal series from them, instead of
+        re-evaluating ``should_buy``/``should_sell`` on every prefix of the data.
+
+        Args:
+            data: OHLCV market data.
+
+        Returns:
+            Tuple of boolean ``(entries, exits)`` series aligned with
+            ``data.index``, or None if the strategy only supports per-bar
+            evaluation.
+        """
+        return None
+
     def get_position_size(self, balance: float, current_price: float) -> float:
         """Calculate position size based on risk management.
 
@@ -3,15 +3,25 @@
 import logging
 from typing import Any
 
+import numpy as np
 import pandas as pd
 import pandas_ta as ta
 
 from system_trading.data.models import OrderSide, TradingSignal
 from system_trading.strategies.base_strategy import BaseStrategy
+from system_trading.strategies.indicator_cache import indicator_cache
 
 logger = logging.getLogger(__name__)
 
 
+def _indicator_column(frame: pd.DataFrame, prefix: str) -> pd.Series:
+    """Get a pandas_ta output column by prefix (e.g. ``MACDh_``)."""
+    for column in frame.columns:
+        if str(column).startswith(prefix):
+            return frame[column]
+    raise KeyError(f"No indicator column with prefix {prefix}")
+
+
 class EnhancedMAStrategy(BaseStrategy):
     """Enhanced moving average strategy with EMA, RSI, MACD, and volume confirmation."""
 
@@ -139,15 +149,15 @@ class EnhancedMAStrategy(BaseStrategy):
         return {
             "fast_ema": float(fast_ema.iloc[-1]),
             "slow_ema": float(slow_ema.iloc[-1]),
-            "macd": float(macd["MACD_12_26_9"].iloc[-1]),
-            "macd_signal": float(macd["MACDs_12_26_9"].iloc[-1]),
-            "macd_histogram": float(macd["MACDh_12_26_9"].iloc[-1]),
+            "macd": float(_indicator_column(macd, "MACD_").iloc[-1]),
+            "macd_signal": float(_indicator_column(macd, "MACDs_").iloc[-1]),
+            "macd_histogram": float(_indicator_column(macd, "MACDh_").iloc[-1]),
             "rsi": float(rsi.iloc[-1]),
             "atr": float(atr.iloc[-1]),
             "volume_ratio": float(volume_ratio.iloc[-1]),
-            "bb_upper": float(bb["BBU_20_2.0"].iloc[-1]),
-            "bb_middle": float(bb["BBM_20_2.0"].iloc[-1]),
-            "bb_lower": float(bb["BBL_20_2.0"].iloc[-1]),
+            "bb_upper": float(_indicator_column(bb, "BBU_").iloc[-1]),
+            "bb_middle": float(_indicator_column(bb, "BBM_").iloc[-1]),
+            "bb_lower": float(_indicator_column(bb, "BBL_").iloc[-1]),
             "support": support,
             "resistance": resistance,
         }
@@ -286,7 +296,7 @@ class EnhancedMAStrategy(BaseStrategy):
             ]
 
             # Require majority of conditions to be true
-            return sum(conditions) >= len(conditions) * 0.6
+            return bool(sum(conditions) >= len(conditions) * 0.6)
 
         except Exception as e:
             logger.error("Error in buy signal calculation: %s", e)
@@ -315,12 +325,140 @@ class EnhancedMAStrategy(BaseStrategy):
             ]
 
             # Require majority of conditions to be true
-            return sum(conditions) >= len(conditions) * 0.6
+            return bool(sum(conditions) >= len(conditions) * 0.6)
 
         except Exception as e:
             logger.error("Error in sell signal calculation: %s", e)
             return False
 
+    def generate_signals_vectorized(
+        self, data: pd.DataFrame
+    ) -> tuple[pd.Series, pd.Series]:
+        """Generate buy/sell signals for every bar from full indicator columns.
+
+        Mirrors ``should_buy``/``should_sell`` evaluated on each prefix of the
+        data, but computes every indicator once over the whole series.
+        """
+        indicators = self._calculate_indicator_columns(data)
+        if indicators is None:
+            no_signal = pd.Series(False, index=data.index)
+            return no_signal, no_signal.copy()
+
+        close = data["close"]
+        macd = indicators["macd"]
+        macd_signal = indicators["macd_signal"]
+        macd_histogram = indicators["macd_histogram"]
+        fast_ema = indicators["fast_ema"]
+        slow_ema = indicators["slow_ema"]
+        rsi = indicators["rsi"]
+
+        # Signal analysis (same weights as _analyze_signals)
+        ema_bullish = fast_ema > slow_ema
+        ema_bearish = fast_ema < slow_ema
+        rsi_neutral = (rsi >= 40) & (rsi <= 60)
+        volume_spike = indicators["volume_ratio"] > self.parameters["volume_threshold"]
+        above_support = close > indicators["support"]
+        below_resistance = close < indicators["resistance"]
+
+        bullish_score = (
+            ((macd > macd_signal) & (macd_histogram > 0)) * 0.25
+            + ema_bullish * 0.25
+            + ((rsi < self.parameters["rsi_oversold"]) | (rsi_neutral & ema_bullish))
+            * 0.20
+            + volume_spike * 0.15
+            + above_support * 0.15
+        )
+        bearish_score = (
+            ((macd < macd_signal) & (macd_histogram < 0)) * 0.25
+            + ema_bearish * 0.25
+            + ((rsi > self.parameters["rsi_overbought"]) | (rsi_neutral & ema_bearish))
+            * 0.20
+            + volume_spike * 0.15
+            + below_resistance * 0.15
+        )
+
+        min_confidence = self.parameters["min_confidence"]
+        strong_signal = np.maximum(bullish_score, bearish_score) > min_confidence
+        bullish = (bullish_score > bearish_score) & (bullish_score > min_confidence)
+        bearish = (bearish_score > bullish_score) & (bearish_score > min_confidence)
+
+        buy_conditions = [
+            macd > macd_signal,
+            macd_histogram > 0,
+            ema_bullish,
+            rsi < self.parameters["rsi_overbought"],
+            above_support,
+            bullish,
+            strong_signal,
+        ]
+        sell_conditions = [
+            macd < macd_signal,
+            macd_histogram < 0,
+            ema_bearish,
+            rsi > self.parameters["rsi_oversold"],
+            below_resistance,
+            bearish,
+            strong_signal,
+        ]
+
+        # Require majority of conditions to be true
+        entries = (
+            sum(c.astype(int) for c in buy_conditions) >= len(buy_conditions) * 0.6
+        )
+        exits = (
+            sum(c.astype(int) for c in sell_conditions) >= len(sell_conditions) * 0.6
+        )
+
+        return entries.astype(bool), exits.astype(bool)
+
+    def _calculate_indicator_columns(self, data: pd.DataFrame) -> pd.DataFrame | None:
+        """Calculate full indicator columns used for signal generation.
+
+        Indicators are requested through the shared indicator cache, so
+        parameter sweeps that only vary thresholds reuse the same series.
+
+        Returns:
+            DataFrame of indicators aligned with ``data.index``, or None if the
+            data is too short for pandas_ta to produce them.
+        """
+        close = data["close"]
+        fast_ema = indicator_cache.indicator(
+            "ema", close, length=self.parameters["fast_ema"]
+        )
+        slow_ema = indicator_cache.indicator(
+            "ema", close, length=self.parameters["slow_ema"]
+        )
+        macd = indicator_cache.indicator(
+            "macd",
+            close,
+            fast=self.parameters["fast_ema"],
+            slow=self.parameters["slow_ema"],
+            signal=self.parameters["signal_ema"],
+        )
+        rsi = indicator_cache.indicator(
+            "rsi", close, length=self.parameters["rsi_period"]
+        )
+        volume_sma = indicator_cache.indicator("sma", data["volume"], length=20)
+
+        if any(x is None for x in (fast_ema, slow_ema, macd, rsi, volume_sma)):
+            return None
+
+        return pd.DataFrame(
+            {
+                "fast_ema": fast_ema,
+                "slow_ema": slow_ema,
+                "macd": _indicator_column(macd, "MACD_"),
+                "macd_signal": _indicator_column(macd, "MACDs_"),
+                "macd_histogram": _indicator_column(macd, "MACDh_"),
+                "rsi": rsi,
+                "volume_ratio": data["volume"] / volume_sma,
+                # Rolling equivalent of _calculate_support_resistance
+                "support": data["low"].rolling(20, min_periods=1).min(),
+                "resistance": data["high"].rolling(20, min_periods=1).max(),
+            },
+            index=data.index,
+        )
+
     def generate_signal(self, data: pd.DataFrame) -> TradingSignal | None:
         """Generate trading signal with metadata."""
         try:
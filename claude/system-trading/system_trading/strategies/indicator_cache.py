@@ -0,0 +1,143 @@
+"""Memoized technical indicator cache shared across strategies."""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pandas_ta as ta
+
+logger = logging.getLogger(__name__)
+
+
+class IndicatorCache:
+    """LRU cache of pandas_ta indicator results.
+
+    Entries are keyed by a fingerprint of the input series, the indicator name
+    and its parameters, so strategies evaluated on the same dataset (e.g. every
+    combination of a grid search) compute each distinct indicator only once.
+    Cached objects are shared between callers and must not be mutated.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024) -> None:
+        """Initialize indicator cache.
+
+        Args:
+            max_bytes: Memory budget for cached indicator results.
+        """
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[tuple[Any, ...], tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def indicator(self, name: str, *inputs: pd.Series, **params: Any) -> Any:
+        """Get a pandas_ta indicator, computing it on a cache miss.
+
+        Args:
+            name: pandas_ta function name (e.g. ``"ema"``, ``"atr"``).
+            *inputs: Input series passed positionally to the indicator.
+            **params: Indicator parameters.
+
+        Returns:
+            Indicator result as returned by pandas_ta (may be None if the
+            input is too short).
+        """
+        key = (
+            tuple(self.fingerprint(series) for series in inputs),
+            name,
+            tuple(sorted(params.items())),
+        )
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        value = getattr(ta, name)(*inputs, **params)
+        self._store(key, value)
+        return value
+
+    def fingerprint(self, series: pd.Series) -> str:
+        """Compute a content fingerprint of a series' values and index."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(str(series.dtype).encode())
+        values = series.to_numpy()
+        if values.dtype.kind in "biufcmM":
+            digest.update(np.ascontiguousarray(values).view(np.uint8))
+        else:
+            digest.update(
+                pd.util.hash_pandas_object(series, index=False)
+                .to_numpy()
+                .view(np.uint8)
+            )
+        if isinstance(series.index, pd.DatetimeIndex):
+            digest.update(np.ascontiguousarray(series.index.asi8).view(np.uint8))
+        else:
+            digest.update(
+                pd.util.hash_pandas_object(series.index, index=False)
+                .to_numpy()
+                .view(np.uint8)
+            )
+        return digest.hexdigest()
+
+    def _store(self, key: tuple[Any, ...], value: Any) -> None:
+        """Store a value and evict least recently used entries over budget."""
+        size = self._estimate_size(value)
+        if size > self.max_bytes:
+            logger.debug("Indicator %s exceeds cache budget, not cached", key[1])
+            return
+
+        with self._lock:
+            if key in self._entries:
+                return
+
+            self._entries[key] = (value, size)
+            self.current_bytes += size
+
+            while self.current_bytes > self.max_bytes and self._entries:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+
+    def _estimate_size(self, value: Any) -> int:
+        """Estimate memory used by a cached value."""
+        if isinstance(value, pd.DataFrame):
+            return int(value.memory_usage(index=True).sum())
+        if isinstance(value, pd.Series):
+            return int(value.memory_usage(index=True))
+        return 0
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache hit/miss statistics."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+
+# Global indicator cache instance
+indicator_cache = IndicatorCache()
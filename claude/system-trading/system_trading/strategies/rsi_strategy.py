@@ -3,11 +3,13 @@
 import logging
 from typing import Any
 
+import numpy as np
 import pandas as pd
 import pandas_ta as ta
 
 from system_trading.data.models import OrderSide, TradingSignal
 from system_trading.strategies.base_strategy import BaseStrategy
+from system_trading.strategies.indicator_cache import indicator_cache
 
 logger = logging.getLogger(__name__)
 
@@ -100,8 +102,12 @@ class RSIStrategy(BaseStrategy):
             trend = "bullish" if current_price > current_trend_ema else "bearish"
 
             # Generate signals
-            buy_signal = self.should_buy(data)
-            sell_signal = self.should_sell(data)
+            buy_signal = self._buy_condition(
+                current_rsi, bullish_divergence, trend, volume_analysis["spike"]
+            )
+            sell_signal = self._sell_condition(
+                current_rsi, bearish_divergence, trend, volume_analysis["spike"]
+            )
 
             # Calculate signal strength
             signal_strength = self._calculate_signal_strength(
@@ -285,28 +291,39 @@ class RSIStrategy(BaseStrategy):
 
         return min(strength, 1.0)
 
+    def _buy_condition(
+        self, rsi: float, bullish_divergence: bool, trend: str, volume_spike: bool
+    ) -> bool:
+        """Check the buy conditions on analyzed indicator values."""
+        rsi_oversold = rsi < self.parameters["oversold_level"]
+        trend_support = trend == "bullish"
+        volume_confirm = not self.parameters["volume_confirmation"] or volume_spike
+
+        # Require RSI oversold AND either divergence OR trend support
+        return bool(
+            rsi_oversold and (bullish_divergence or trend_support) and volume_confirm
+        )
+
+    def _sell_condition(
+        self, rsi: float, bearish_divergence: bool, trend: str, volume_spike: bool
+    ) -> bool:
+        """Check the sell conditions on analyzed indicator values."""
+        rsi_overbought = rsi > self.parameters["overbought_level"]
+        trend_resistance = trend == "bearish"
+        volume_confirm = not self.parameters["volume_confirmation"] or volume_spike
+
+        # Require RSI overbought AND either divergence OR trend resistance
+        return bool(
+            rsi_overbought
+            and (bearish_divergence or trend_resistance)
+            and volume_confirm
+        )
+
     def should_buy(self, data: pd.DataFrame) -> bool:
         """Determine if strategy should generate buy signal."""
         try:
             analysis = self.analyze(data)
-
-            if "error" in analysis:
-                return False
-
-            # Buy conditions
-            rsi_oversold = analysis["rsi"] < self.parameters["oversold_level"]
-            bullish_divergence = analysis["bullish_divergence"]
-            trend_support = analysis["trend"] == "bullish"
-            volume_confirm = (
-                not self.parameters["volume_confirmation"] or analysis["volume_spike"]
-            )
-
-            # Require RSI oversold AND either divergence OR trend support
-            return (
-                rsi_oversold
-                and (bullish_divergence or trend_support)
-                and volume_confirm
-            )
+            return "error" not in analysis and analysis["buy_signal"]
 
         except Exception as e:
             logger.error("Error in RSI buy signal: %s", e)
@@ -316,28 +333,129 @@ class RSIStrategy(BaseStrategy):
         """Determine if strategy should generate sell signal."""
         try:
             analysis = self.analyze(data)
+            return "error" not in analysis and analysis["sell_signal"]
 
-            if "error" in analysis:
-                return False
+        except Exception as e:
+            logger.error("Error in RSI sell signal: %s", e)
+            return False
+
+    def generate_signals_vectorized(
+        self, data: pd.DataFrame
+    ) -> tuple[pd.Series, pd.Series]:
+        """Generate buy/sell signals for every bar from full indicator columns.
+
+        Mirrors ``should_buy``/``should_sell`` evaluated on each prefix of the
+        data, but computes RSI, trend EMA, volume and divergences once.
+        """
+        close = data["close"]
+        rsi = indicator_cache.indicator(
+            "rsi", close, length=self.parameters["rsi_period"]
+        )
+        trend_ema = indicator_cache.indicator(
+            "ema", close, length=self.parameters["trend_ema_period"]
+        )
+
+        if rsi is None or trend_ema is None:
+            no_signal = pd.Series(False, index=data.index)
+            return no_signal, no_signal.copy()
 
-            # Sell conditions
-            rsi_overbought = analysis["rsi"] > self.parameters["overbought_level"]
-            bearish_divergence = analysis["bearish_divergence"]
-            trend_resistance = analysis["trend"] == "bearish"
-            volume_confirm = (
-                not self.parameters["volume_confirmation"] or analysis["volume_spike"]
+        # Bars with enough history for analyze() to run
+        required_periods = (
+            max(
+                self.parameters["rsi_period"],
+                self.parameters["trend_ema_period"],
+                self.parameters["divergence_lookback"],
             )
+            + 10
+        )
+        bar_count = pd.Series(np.arange(1, len(data) + 1), index=data.index)
+        sufficient_data = bar_count >= required_periods
+
+        trend_bullish = close > trend_ema
+        bullish_divergence = self._divergence_series(close, rsi, bullish=True)
+        bearish_divergence = self._divergence_series(close, rsi, bullish=False)
+
+        if self.parameters["volume_confirmation"]:
+            volume_ma = indicator_cache.indicator("sma", data["volume"], length=20)
+            if volume_ma is None:
+                volume_confirm = pd.Series(False, index=data.index)
+            else:
+                volume_ratio = (data["volume"] / volume_ma).where(volume_ma > 0, 1.0)
+                volume_confirm = volume_ratio > 1.5
+        else:
+            volume_confirm = pd.Series(True, index=data.index)
+
+        entries = (
+            sufficient_data
+            & (rsi < self.parameters["oversold_level"])
+            & (bullish_divergence | trend_bullish)
+            & volume_confirm
+        )
+        exits = (
+            sufficient_data
+            & (rsi > self.parameters["overbought_level"])
+            & (bearish_divergence | ~trend_bullish)
+            & volume_confirm
+        )
+
+        return entries.astype(bool), exits.astype(bool)
+
+    def _divergence_series(
+        self, close: pd.Series, rsi: pd.Series, bullish: bool
+    ) -> pd.Series:
+        """Detect divergence at every bar.
+
+        Vectorized equivalent of ``_detect_bullish_divergence`` and
+        ``_detect_bearish_divergence``: a pivot needs two strictly higher (lows)
+        or lower (highs) neighbours on each side, and only the last two pivots
+        inside the trailing ``divergence_lookback`` window are compared.
+        """
+        lookback = self.parameters["divergence_lookback"]
+        min_bars = self.parameters["min_divergence_bars"]
+        positions = pd.Series(np.arange(len(close)), index=close.index, dtype=float)
+
+        def last_two_pivots(series: pd.Series) -> pd.DataFrame:
+            neighbours = [series.shift(k) for k in (1, 2, -1, -2)]
+            if bullish:
+                is_pivot = np.logical_and.reduce([series < n for n in neighbours])
+            else:
+                is_pivot = np.logical_and.reduce([series > n for n in neighbours])
+
+            pivots = pd.DataFrame({"value": series, "position": positions})[is_pivot]
+            previous = pivots.shift(1)
+            frame = pd.DataFrame(
+                {
+                    "last": pivots["value"],
+                    "previous": previous["value"],
+                    "previous_position": previous["position"],
+                },
+                index=close.index,
+            ).ffill()
+            # A pivot at bar j needs bars j+1 and j+2, so the newest pivot
+            # visible at bar i is at i-2.
+            return frame.shift(2)
+
+        price = last_two_pivots(close)
+        oscillator = last_two_pivots(rsi)
+
+        window_start = positions - lookback + 3
+        has_two_pivots = (price["previous_position"] >= window_start) & (
+            oscillator["previous_position"] >= window_start
+        )
+        enough_bars = positions + 1 >= lookback + min_bars
 
-            # Require RSI overbought AND either divergence OR trend resistance
-            return (
-                rsi_overbought
-                and (bearish_divergence or trend_resistance)
-                and volume_confirm
+        if bullish:
+            # Price making lower lows, RSI making higher lows
+            diverging = (price["last"] < price["previous"]) & (
+                oscillator["last"] > oscillator["previous"]
+            )
+        else:
+            # Price making higher highs, RSI making lower highs
+            diverging = (price["last"] > price["previous"]) & (
+                oscillator["last"] < oscillator["previous"]
             )
 
-        except Exception as e:
-            logger.error("Error in RSI sell signal: %s", e)
-            return False
+        return has_two_pivots & enough_bars & diverging
 
     def generate_signal(self, data: pd.DataFrame) -> TradingSignal | None:
         """Generate trading signal with metadata."""
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import threading
 import time
 from functools import wraps
 from typing import Any, Callable, List, Type, TypeVar, Union
@@ -244,6 +245,7 @@ class RateLimiter:
         self.capacity = capacity
         self.tokens = capacity
         self.last_refill = time.time()
+        self._lock = threading.Lock()
 
     async def acquire(self, tokens: int = 1) -> None:
         """Acquire tokens from bucket."""
@@ -258,8 +260,26 @@ class RateLimiter:
             await self._refill()
             self.tokens -= tokens
 
+    def acquire_sync(self, tokens: int = 1) -> None:
+        """Acquire tokens from bucket, blocking the calling thread.
+
+        Safe to call from several threads; waiting callers are served in turn.
+        """
+        with self._lock:
+            self._refill_tokens()
+
+            if self.tokens < tokens:
+                time.sleep((tokens - self.tokens) / self.rate)
+                self._refill_tokens()
+
+            self.tokens -= tokens
+
     async def _refill(self) -> None:
         """Refill token bucket."""
+        self._refill_tokens()
+
+    def _refill_tokens(self) -> None:
+        """Add tokens accrued since the last refill."""
         now = time.time()
         elapsed = now - self.last_refill
         new_tokens = elapsed * self.rate
@@ -7,6 +7,8 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from system_trading.backtesting import data_manager as data_manager_module
+from system_trading.backtesting.data_manager import BacktestDataManager
 from system_trading.data.models import (
     Balance,
     Exchange,
@@ -18,6 +20,27 @@ from system_trading.data.models import (
     Trade,
 )
 
+HOUR_MS = 3_600_000
+EPOCH = pd.Timestamp("2024-01-01")
+
+
+def make_candles(
+    start: str = "2024-01-01", periods: int = 48, freq: str = "h"
+) -> pd.DataFrame:
+    """Create OHLCV candles with distinct values."""
+    index = pd.date_range(start, periods=periods, freq=freq, name="timestamp")
+    close = np.arange(periods, dtype=float) + 100
+    return pd.DataFrame(
+        {
+            "open": close - 0.5,
+            "high": close + 1,
+            "low": close - 1,
+            "close": close,
+            "volume": np.arange(periods, dtype=float) + 1,
+        },
+        index=index,
+    )
+
 
 @pytest.fixture
 def sample_ohlcv_data() -> pd.DataFrame:
@@ -325,3 +348,63 @@ class MockExchangeClient:
 def mock_exchange_client():
     """Mock exchange client fixture."""
     return MockExchangeClient()
+
+
+class FakeExchange:
+    """Exchange exposing the attributes used for pagination."""
+
+    rateLimit = 1  # noqa: N815 - ccxt attribute name
+
+    def parse_timeframe(self, timeframe: str) -> int:
+        return int(pd.Timedelta(timeframe).total_seconds())
+
+
+class FakeClient:
+    """Client serving deterministic hourly candles from a fixed listing date."""
+
+    def __init__(self) -> None:
+        self.calls: list[int] = []
+        self.fail_after: int | None = None
+
+    def get_exchange(self, exchange: Exchange) -> FakeExchange:
+        return FakeExchange()
+
+    def get_ohlcv_dataframe(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        timeframe: str = "1h",
+        limit: int = 100,
+        since: int | None = None,
+    ) -> pd.DataFrame:
+        if self.fail_after is not None and len(self.calls) >= self.fail_after:
+            raise RuntimeError("connection dropped")
+        self.calls.append(since)
+
+        first = max(since, EPOCH.value // 1_000_000)
+        index = pd.to_datetime(
+            np.arange(first, first + limit * HOUR_MS, HOUR_MS), unit="ms"
+        )
+        close = np.arange(len(index), dtype=float) + (first - since) / HOUR_MS
+        return pd.DataFrame(
+            {
+                "open": close,
+                "high": close + 1,
+                "low": close,
+                "close": close,
+                "volume": 1.0,
+            },
+            index=index,
+        )
+
+
+@pytest.fixture
+def use_fake_client(monkeypatch) -> None:
+    """Make data managers download candles from FakeClient."""
+    monkeypatch.setattr(data_manager_module, "UnifiedExchangeClient", FakeClient)
+
+
+@pytest.fixture
+def manager(tmp_path, use_fake_client) -> BacktestDataManager:
+    """Data manager caching in a temporary directory."""
+    return BacktestDataManager(data_dir=str(tmp_path))
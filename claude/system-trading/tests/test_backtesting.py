@@ -8,6 +8,7 @@ import pytest
 
 from system_trading.backtesting.engine import BacktestEngine
 from system_trading.strategies.enhanced_ma_strategy import EnhancedMAStrategy
+from system_trading.strategies.rsi_strategy import RSIStrategy
 
 
 class TestBacktestEngine:
@@ -71,6 +72,203 @@ class TestBacktestEngine:
         assert "all_results" in result
         assert result["total_combinations"] == 9  # 3 * 3 combinations
 
+    def test_run_optimization_top_k(self) -> None:
+        """Test top-k optimization keeps the best results of a full run."""
+        engine = BacktestEngine(initial_cash=10000.0)
+        data = self._create_test_data(100)
+        param_ranges = {
+            "fast_ema": [5, 10, 15],
+            "slow_ema": [20, 25, 30],
+        }
+
+        full = engine.run_optimization(
+            strategy_class=EnhancedMAStrategy,
+            data=data,
+            param_ranges=param_ranges,
+            symbol="BTC/USDT",
+        )
+        top = engine.run_optimization(
+            strategy_class=EnhancedMAStrategy,
+            data=data,
+            param_ranges=param_ranges,
+            symbol="BTC/USDT",
+            top_k=3,
+        )
+
+        expected = sorted(full["all_results"], key=lambda r: r["score"], reverse=True)
+        assert [r["score"] for r in top["all_results"]] == [
+            r["score"] for r in expected[:3]
+        ]
+        assert top["best_params"] == full["best_params"]
+        assert len(top["top_results"]["max_drawdown"]) == 3
+        assert top["evaluated_combinations"] == 9
+
+    def test_run_optimization_parallel(self) -> None:
+        """Test parallel optimization matches serial results."""
+        engine = BacktestEngine(initial_cash=10000.0)
+        data = self._create_test_data(100)
+
+        param_ranges = {
+            "fast_ema": [5, 10],
+            "slow_ema": [20, 30],
+        }
+
+        streamed = []
+        serial = engine.run_optimization(
+            strategy_class=EnhancedMAStrategy,
+            data=data,
+            param_ranges=param_ranges,
+            symbol="BTC/USDT",
+        )
+        parallel = engine.run_optimization(
+            strategy_class=EnhancedMAStrategy,
+            data=data,
+            param_ranges=param_ranges,
+            symbol="BTC/USDT",
+            n_jobs=2,
+            progress_callback=streamed.append,
+        )
+
+        assert parallel["best_params"] == serial["best_params"]
+        assert [r["params"] for r in parallel["all_results"]] == [
+            r["params"] for r in serial["all_results"]
+        ]
+        assert len(streamed) == len(parallel["all_results"])
+
+    def test_run_optimization_reuses_one_pool(self, monkeypatch) -> None:
+        """Test every rung of a search runs on one pool and data export."""
+        from system_trading.backtesting import engine as engine_module
+        from system_trading.backtesting.search import SuccessiveHalvingSearch
+
+        pools = []
+
+        class CountingPool(engine_module.ProcessPoolExecutor):
+            def __init__(self, *args, **kwargs) -> None:
+                pools.append(self)
+                super().__init__(*args, **kwargs)
+
+        monkeypatch.setattr(engine_module, "ProcessPoolExecutor", CountingPool)
+
+        engine = BacktestEngine(initial_cash=10000.0)
+        data = self._create_test_data(120)
+        param_ranges = {"fast_ema": [5, 8, 10], "slow_ema": [20, 26, 30]}
+
+        def run(n_jobs: int) -> dict:
+            return engine.run_optimization(
+                strategy_class=EnhancedMAStrategy,
+                data=data,
+                param_ranges=param_ranges,
+                symbol="BTC/USDT",
+                n_jobs=n_jobs,
+                search=SuccessiveHalvingSearch(n_candidates=9, min_bars=60, seed=1),
+            )
+
+        serial = run(1)
+        parallel = run(2)
+
+        assert len(pools) == 1
+        assert parallel["evaluated_combinations"] == 9 + 3 + 1
+        assert parallel["best_params"] == serial["best_params"]
+        assert parallel["best_score"] == pytest.approx(serial["best_score"])
+
+    def test_run_optimization_broadcast(self) -> None:
+        """Test broadcast optimization matches per-combination backtests."""
+        engine = BacktestEngine(initial_cash=10000.0)
+        data = self._create_test_data(100)
+
+        param_ranges = {
+            "fast_ema": [5, 10],
+            "slow_ema": [20, 30],
+            "min_confidence": [0.3],
+        }
+
+        serial = engine.run_optimization(
+            strategy_class=EnhancedMAStrategy,
+            data=data,
+            param_ranges=param_ranges,
+            symbol="BTC/USDT",
+        )
+        broadcast = engine.run_optimization(
+            strategy_class=EnhancedMAStrategy,
+            data=data,
+            param_ranges=param_ranges,
+            symbol="BTC/USDT",
+            broadcast=True,
+        )
+
+        assert broadcast["total_combinations"] == 4
+        for expected, actual in zip(
+            serial["all_results"], broadcast["all_results"], strict=True
+        ):
+            assert actual["params"] == expected["params"]
+            assert actual["total_trades"] == expected["total_trades"]
+            assert actual["total_return"] == pytest.approx(expected["total_return"])
+            assert actual["max_drawdown"] == pytest.approx(expected["max_drawdown"])
+
+    def test_shared_ohlcv_roundtrip(self, tmp_path) -> None:
+        """Test memory-mapped OHLCV export and reopen."""
+        from system_trading.backtesting.parallel import SharedOHLCV
+
+        data = self._create_test_data(50)
+
+        shared = SharedOHLCV.export(data, tmp_path)
+        reopened = shared.open()
+
+        pd.testing.assert_frame_equal(reopened, data, check_freq=False)
+
+    def test_shared_ohlcv_reuses_attached_export(self, tmp_path) -> None:
+        """Test frames opened from an export are not exported again."""
+        from system_trading.backtesting.parallel import SharedOHLCV, shared_ohlcv
+
+        data = self._create_test_data(50)
+        opened = SharedOHLCV.export(data, tmp_path / "ohlcv").open()
+
+        with shared_ohlcv(opened) as shared:
+            assert shared.directory == tmp_path / "ohlcv"
+        # Slices no longer match the export and get their own copy
+        with shared_ohlcv(opened.iloc[10:]) as shared:
+            assert shared.directory != tmp_path / "ohlcv"
+            pd.testing.assert_frame_equal(
+                shared.open(), data.iloc[10:], check_freq=False
+            )
+        assert (tmp_path / "ohlcv").exists()
+
+    def test_run_portfolio_backtest(self) -> None:
+        """Test multi-asset backtest with shared cash."""
+        engine = BacktestEngine(initial_cash=10000.0)
+        strategy = EnhancedMAStrategy(fast_ema=5, slow_ema=10, min_confidence=0.3)
+
+        btc = self._create_test_data(120)
+        eth = btc * 0.05
+        eth = eth.iloc[::-1].set_axis(btc.index)  # Different price path
+        data = {"BTC/USDT": btc, "ETH/USDT": eth.iloc[10:]}
+
+        result = engine.run_portfolio_backtest(
+            strategy=strategy,
+            data=data,
+            allocations={"BTC/USDT": 0.6, "ETH/USDT": 0.4},
+        )
+
+        assert result.symbol == "BTC/USDT,ETH/USDT"
+        assert result.start_date == btc.index[10]  # Aligned to common bars
+        assert result.stats["start_value"] == 10000.0
+        assert set(result.stats["per_symbol"]) == {"BTC/USDT", "ETH/USDT"}
+        # One cash pool: cash never goes negative across symbols
+        assert (np.asarray(result.portfolio.cash()) >= -1e-6).all()
+        assert result.stats["total_trades"] == sum(
+            stats["total_trades"] for stats in result.stats["per_symbol"].values()
+        )
+
+    def test_run_portfolio_backtest_unknown_allocation(self) -> None:
+        """Test allocations must refer to symbols in the panel."""
+        engine = BacktestEngine()
+        data = {"BTC/USDT": self._create_test_data(60)}
+
+        with pytest.raises(ValueError):
+            engine.run_portfolio_backtest(
+                EnhancedMAStrategy(), data, allocations={"ETH/USDT": 1.0}
+            )
+
     def test_compare_strategies(self) -> None:
         """Test strategy comparison."""
         engine = BacktestEngine(initial_cash=10000.0)
@@ -125,6 +323,73 @@ class TestBacktestEngine:
         assert signals["entries"].dtype == bool
         assert signals["exits"].dtype == bool
 
+    def test_vectorized_signals_match_per_bar(self) -> None:
+        """Test vectorized signals match per-bar signal generation."""
+        engine = BacktestEngine()
+        data = self._create_test_data(120)
+
+        strategy = EnhancedMAStrategy(fast_ema=5, slow_ema=10, min_confidence=0.3)
+        vectorized = engine._generate_signals(strategy, data)
+        per_bar = engine._generate_signals_per_bar(strategy, data, 30)
+
+        pd.testing.assert_frame_equal(vectorized, per_bar)
+
+    def test_rsi_vectorized_signals_match_per_bar(self) -> None:
+        """Test vectorized RSI signals match per-bar signal generation."""
+        engine = BacktestEngine()
+        data = self._create_test_data(200)
+        strategy = RSIStrategy(
+            oversold_level=50,
+            overbought_level=50,
+            trend_ema_period=20,
+            divergence_lookback=20,
+            volume_confirmation=False,
+        )
+
+        vectorized = engine._generate_signals(strategy, data)
+        per_bar = engine._generate_signals_per_bar(strategy, data, 30)
+
+        assert vectorized["entries"].any() and vectorized["exits"].any()
+        pd.testing.assert_frame_equal(vectorized, per_bar)
+
+    def test_generate_signals_per_bar_fallback(self) -> None:
+        """Test strategies without vectorized signals use the per-bar path."""
+        engine = BacktestEngine()
+        strategy = EnhancedMAStrategy(fast_ema=5, slow_ema=10)
+        strategy.generate_signals_vectorized = lambda data: None
+        strategy.should_buy = lambda data: len(data) % 2 == 0
+        strategy.should_sell = lambda data: False
+
+        data = self._create_test_data(40)
+
+        signals = engine._generate_signals(strategy, data)
+
+        assert not signals["entries"].iloc[:30].any()
+        assert signals["entries"].iloc[30:].sum() == 5
+        assert not signals["exits"].any()
+
+    def test_numpy_metrics_engine_matches_vectorbt(self) -> None:
+        """Test the NumPy metrics kernel agrees with portfolio.stats()."""
+        data = self._create_test_data(150)
+        strategy = EnhancedMAStrategy(fast_ema=5, slow_ema=10, min_confidence=0.3)
+
+        reference = BacktestEngine().run_backtest(strategy, data, "BTC/USDT")
+        lean = BacktestEngine(metrics_engine="numpy").run_backtest(
+            strategy, data, "BTC/USDT"
+        )
+
+        for key in ["total_return", "max_drawdown", "win_rate", "end_value"]:
+            assert lean.stats[key] == pytest.approx(reference.stats[key])
+        assert lean.stats["total_trades"] == reference.stats["total_trades"]
+        assert lean.stats["duration"] == reference.stats["duration"]
+        # Hourly bars are annualized with 365 * 24 periods instead of 252
+        assert lean.stats["sharpe_ratio"] != reference.stats["sharpe_ratio"]
+
+    def test_unknown_metrics_engine(self) -> None:
+        """Test unknown metrics engines are rejected."""
+        with pytest.raises(ValueError):
+            BacktestEngine(metrics_engine="pandas")
+
     def test_calculate_statistics(self) -> None:
         """Test statistics calculation."""
         engine = BacktestEngine()
@@ -220,6 +485,68 @@ class TestBacktestEngine:
         return data
 
 
+class TestWalkForwardOptimizer:
+    """Test cases for WalkForwardOptimizer."""
+
+    def test_rolling_folds(self) -> None:
+        """Test rolling train/test window generation."""
+        from system_trading.backtesting.walk_forward import WalkForwardOptimizer
+
+        optimizer = WalkForwardOptimizer(BacktestEngine(), train_size=50, test_size=20)
+
+        folds = optimizer.generate_folds(130)
+
+        assert len(folds) == 4
+        assert folds[0]["train_start"] == 0
+        assert folds[1]["train_start"] == 20
+        assert folds[-1]["test_end"] == 130
+        for fold in folds:
+            assert fold["train_end"] - fold["train_start"] == 50
+            assert fold["train_end"] == fold["test_start"]
+
+    def test_anchored_folds(self) -> None:
+        """Test anchored windows always start at the first bar."""
+        from system_trading.backtesting.walk_forward import WalkForwardOptimizer
+
+        optimizer = WalkForwardOptimizer(
+            BacktestEngine(), train_size=50, test_size=20, anchored=True
+        )
+
+        folds = optimizer.generate_folds(130)
+
+        assert all(fold["train_start"] == 0 for fold in folds)
+        assert folds[-1]["train_end"] == 110
+
+    def test_overlapping_test_windows_rejected(self) -> None:
+        """Test step smaller than the test window is rejected."""
+        from system_trading.backtesting.walk_forward import WalkForwardOptimizer
+
+        with pytest.raises(ValueError):
+            WalkForwardOptimizer(BacktestEngine(), train_size=50, test_size=20, step=10)
+
+    def test_run_walk_forward(self) -> None:
+        """Test walk-forward run stitches out-of-sample equity."""
+        from system_trading.backtesting.walk_forward import WalkForwardOptimizer
+
+        engine = BacktestEngine(initial_cash=10000.0)
+        optimizer = WalkForwardOptimizer(engine, train_size=80, test_size=40)
+        data = TestBacktestEngine()._create_test_data(200)
+
+        result = optimizer.run(
+            strategy_class=EnhancedMAStrategy,
+            data=data,
+            param_ranges={"fast_ema": [5, 10], "slow_ema": [20]},
+            symbol="BTC/USDT",
+            n_jobs=2,
+        )
+
+        assert len(result["folds"]) == 3
+        assert [fold["fold"] for fold in result["folds"]] == [0, 1, 2]
+        assert len(result["oos_equity"]) == 120
+        assert result["oos_equity"].index[0] == data.index[80]
+        assert "total_return" in result["oos_stats"]
+
+
 class TestBacktestResult:
     """Test cases for BacktestResult."""
 
@@ -0,0 +1,138 @@
+"""Tests for trade-to-bar aggregation."""
+
+import asyncio
+
+import pandas as pd
+import pytest
+
+from system_trading.backtesting.bars import (
+    DollarBarAggregator,
+    TickBarAggregator,
+    TimeBarAggregator,
+    VolumeBarAggregator,
+    create_aggregator,
+    iter_bars,
+    read_trade_file,
+)
+from system_trading.data.models import Exchange
+
+MINUTE_MS = 60_000
+START_MS = pd.Timestamp("2024-01-01").value // 1_000_000
+
+
+def make_trades() -> list[tuple[int, float, float]]:
+    """Create trades: three in the first minute, one late, two later."""
+    return [
+        (START_MS + 1_000, 100.0, 1.0),
+        (START_MS + 20_000, 103.0, 2.0),
+        (START_MS + 50_000, 99.0, 1.0),
+        (START_MS + MINUTE_MS + 5_000, 101.0, 3.0),
+        (START_MS + MINUTE_MS + 1_000, 102.0, 1.0),  # arrives late
+        (START_MS + 3 * MINUTE_MS, 104.0, 2.0),
+    ]
+
+
+class TestBarAggregators:
+    """Test cases for the bar aggregators."""
+
+    def test_time_bars(self) -> None:
+        """Test time bars align to intervals and skip empty ones."""
+        aggregator = TimeBarAggregator("1m")
+        bars = list(iter_bars(make_trades(), aggregator))
+
+        assert bars == [
+            (START_MS, 100.0, 103.0, 99.0, 99.0, 4.0),
+            (START_MS + MINUTE_MS, 101.0, 102.0, 101.0, 102.0, 4.0),
+        ]
+        last = (START_MS + 3 * MINUTE_MS, 104.0, 104.0, 104.0, 104.0, 2.0)
+        assert aggregator.flush() == last
+        assert aggregator.flush() is None
+
+    def test_weekly_bars_open_on_monday(self) -> None:
+        """Test weekly bars are aligned like exchange candles."""
+        aggregator = TimeBarAggregator("1w")
+        wednesday = pd.Timestamp("2024-01-03 12:00").value // 1_000_000
+        aggregator.update(wednesday, 1.0, 1.0)
+
+        assert aggregator.flush()[0] == pd.Timestamp("2024-01-01").value // 1_000_000
+
+    def test_threshold_bars(self) -> None:
+        """Test tick, volume and dollar bars close at their threshold."""
+        trades = make_trades()
+
+        ticks = list(iter_bars(trades, TickBarAggregator(2)))
+        assert [bar[0] for bar in ticks] == [trade[0] for trade in trades[::2]]
+
+        volumes = list(iter_bars(trades, VolumeBarAggregator(3)))
+        assert [bar[5] for bar in volumes] == [3.0, 4.0, 3.0]
+
+        # 100 + 206 + 99 + 303 crosses 500 on the fourth trade
+        dollars = list(iter_bars(trades, DollarBarAggregator(500)))
+        assert [bar[5] for bar in dollars] == [7.0]
+
+    def test_names_and_validation(self) -> None:
+        """Test series names and rejected configurations."""
+        assert create_aggregator("time", "5m").name == "time-5m"
+        assert create_aggregator("dollar", "1000000").name == "dollar-1000000"
+        assert create_aggregator("volume", "0.5").name == "volume-0.5"
+        with pytest.raises(ValueError, match="Unknown bar type"):
+            create_aggregator("range", "10")
+        with pytest.raises(ValueError, match="must be positive"):
+            TickBarAggregator(0)
+
+
+class TestTradeBarCache:
+    """Test cases for caching bars built from trades."""
+
+    def test_build_from_file(self, manager, tmp_path) -> None:
+        """Test recorded trades are streamed into cached bars."""
+        trades_file = tmp_path / "trades.csv"
+        pd.DataFrame(make_trades(), columns=["timestamp", "price", "amount"]).to_csv(
+            trades_file, index=False
+        )
+
+        assert list(read_trade_file(trades_file, chunksize=2)) == make_trades()
+
+        written = manager.build_trade_bars(
+            "BTC/USDT",
+            Exchange.BINANCE,
+            read_trade_file(trades_file, chunksize=2),
+            VolumeBarAggregator(3),
+            batch_size=2,
+        )
+
+        bars = manager.get_trade_bars("BTC/USDT", Exchange.BINANCE, "volume-3")
+        assert written == len(bars) == 3
+        assert bars["volume"].tolist() == [3.0, 4.0, 3.0]
+        assert bars.index[0] == pd.Timestamp("2024-01-01 00:00:01")
+
+    def test_bars_within_one_millisecond(self, manager) -> None:
+        """Test bars opening in the same millisecond are all kept."""
+        trades = [(START_MS + i // 6, 100.0 + i, 1.0) for i in range(12)]
+
+        written = manager.build_trade_bars(
+            "BTC/USDT", Exchange.BINANCE, trades, TickBarAggregator(2), batch_size=4
+        )
+
+        bars = manager.get_trade_bars("BTC/USDT", Exchange.BINANCE, "tick-2")
+        assert written == len(bars) == 6
+        assert bars["open"].tolist() == [100.0, 102.0, 104.0, 106.0, 108.0, 110.0]
+        assert bars.index.is_monotonic_increasing
+        assert (bars.index.floor("ms") <= pd.Timestamp(START_MS + 1, unit="ms")).all()
+
+    def test_record_live_feed(self, manager) -> None:
+        """Test bars from an async trade feed reach the cache."""
+
+        async def feed():
+            for trade in make_trades():
+                yield trade
+
+        written = asyncio.run(
+            manager.record_trade_bars(
+                "BTC/USDT", Exchange.BINANCE, feed(), TimeBarAggregator("1m")
+            )
+        )
+
+        bars = manager.get_trade_bars("BTC/USDT", Exchange.BINANCE, "time-1m")
+        assert written == len(bars) == 2
+        assert bars["close"].tolist() == [99.0, 102.0]
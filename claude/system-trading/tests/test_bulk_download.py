@@ -0,0 +1,134 @@
+"""Tests for asynchronous bulk downloads."""
+
+import asyncio
+import threading
+import time
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from system_trading.backtesting import data_manager as data_manager_module
+from system_trading.backtesting.bulk_download import BulkDownloader
+from system_trading.backtesting.data_manager import BacktestDataManager
+from system_trading.data.models import Exchange
+from tests.conftest import FakeClient
+
+
+class SlowClient(FakeClient):
+    """Client recording how many requests are in flight at once."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def get_ohlcv_dataframe(self, symbol: str, *args, **kwargs) -> pd.DataFrame:
+        if symbol == "BAD/USDT":
+            raise ValueError("unknown symbol")
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(0.01)
+            return super().get_ohlcv_dataframe(symbol, *args, **kwargs)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+class TestBulkDownloader:
+    """Test cases for BulkDownloader."""
+
+    @pytest.fixture
+    def manager(self, tmp_path, monkeypatch) -> BacktestDataManager:
+        monkeypatch.setattr(data_manager_module, "UnifiedExchangeClient", SlowClient)
+        # Download every timeframe instead of deriving coarser ones
+        return BacktestDataManager(data_dir=str(tmp_path), base_timeframe=None)
+
+    def test_downloads_series_concurrently_into_cache(self, manager) -> None:
+        """Test every series is cached and requests stay within the bound."""
+        downloader = BulkDownloader(manager, max_concurrency=3, checkpoint_pages=2)
+        start, end = datetime(2024, 1, 1), datetime(2024, 6, 30)
+        updates = []
+
+        progress = asyncio.run(
+            downloader.download(
+                ["BTC/USDT", "ETH/USDT"],
+                Exchange.BINANCE,
+                ["1h", "4h"],
+                start,
+                end,
+                progress_callback=lambda p: updates.append((p.symbol, p.status)),
+            )
+        )
+
+        for symbol in ["BTC/USDT", "ETH/USDT"]:
+            for timeframe in ["1h", "4h"]:
+                series = progress[symbol][timeframe]
+                assert series.status == "done"
+                assert series.pages_done == series.pages_total > 0
+                cached = manager.store.read(Exchange.BINANCE.value, symbol, timeframe)
+                assert cached.index[0] == pd.Timestamp(start)
+                assert cached.index[-1] == pd.Timestamp(end)
+                assert series.candles == len(cached)
+
+        assert 1 < manager.client.max_in_flight <= 3
+        assert ("BTC/USDT", "done") in updates
+
+    def test_cache_writes_run_off_the_event_loop(self, manager, monkeypatch) -> None:
+        """Test checkpoints are saved in worker threads, not on the loop."""
+        threads = []
+        for name in ["_save_cached_data", "_append_cached_data"]:
+            store = getattr(manager, name)
+
+            def record(*args, store=store, **kwargs) -> None:
+                threads.append(threading.get_ident())
+                store(*args, **kwargs)
+
+            monkeypatch.setattr(manager, name, record)
+
+        async def run() -> int:
+            loop_thread = threading.get_ident()
+            await BulkDownloader(manager, checkpoint_pages=1).download(
+                ["BTC/USDT"],
+                Exchange.BINANCE,
+                ["1h"],
+                datetime(2024, 1, 1),
+                datetime(2024, 3, 31),
+            )
+            return loop_thread
+
+        loop_thread = asyncio.run(run())
+
+        assert len(threads) > 1
+        assert loop_thread not in threads
+
+    def test_failed_series_does_not_stop_others(self, manager) -> None:
+        """Test failures are reported per series."""
+        downloader = BulkDownloader(manager)
+
+        progress = asyncio.run(
+            downloader.download(
+                ["BAD/USDT", "BTC/USDT"],
+                Exchange.BINANCE,
+                ["1h"],
+                datetime(2024, 1, 1),
+                datetime(2024, 1, 10),
+            )
+        )
+
+        assert progress["BAD/USDT"]["1h"].status == "failed"
+        assert "unknown symbol" in progress["BAD/USDT"]["1h"].error
+        assert progress["BTC/USDT"]["1h"].status == "done"
+
+    def test_derived_timeframes_download_base(self, tmp_path, monkeypatch) -> None:
+        """Test timeframes derived locally are served by the base download."""
+        monkeypatch.setattr(data_manager_module, "UnifiedExchangeClient", SlowClient)
+        manager = BacktestDataManager(data_dir=str(tmp_path), base_timeframe="1h")
+        downloader = BulkDownloader(manager)
+
+        progress = downloader.create_progress(["BTC/USDT"], ["4h", "1h", "1d"])
+
+        assert list(progress["BTC/USDT"]) == ["1h"]
@@ -0,0 +1,136 @@
+"""Tests for the partitioned candle store."""
+
+import threading
+
+import pandas as pd
+
+from system_trading.backtesting.candle_store import CandleStore
+from tests.conftest import make_candles
+
+
+class TestCandleStore:
+    """Test cases for CandleStore."""
+
+    def test_write_partitions_by_month(self, tmp_path) -> None:
+        """Test candles are split into one file per month."""
+        store = CandleStore(tmp_path)
+        data = make_candles("2024-01-30", 24 * 5)
+
+        assert store.write(data, "binance", "BTC/USDT", "1h") == 2
+
+        files = store.partitions("binance", "BTC/USDT", "1h")
+        assert [f.parent.name for f in files] == ["month=2024-01", "month=2024-02"]
+        assert store.read("binance", "BTC/USDT", "1h").equals(data)
+
+    def test_read_prunes_and_filters(self, tmp_path) -> None:
+        """Test range reads open only overlapping months and trim the edges."""
+        store = CandleStore(tmp_path)
+        data = make_candles("2024-01-01", 24 * 90)
+        store.write(data, "binance", "BTC/USDT", "1h")
+        start, end = pd.Timestamp("2024-02-10 05:00"), pd.Timestamp("2024-02-20")
+
+        assert len(store.partitions("binance", "BTC/USDT", "1h", start, end)) == 1
+        result = store.read("binance", "BTC/USDT", "1h", start, end, columns=["close"])
+
+        assert list(result.columns) == ["close"]
+        assert result.index[0] == start
+        assert result.index[-1] == end
+        assert result["close"].equals(data.loc[start:end, "close"])
+
+    def test_write_touches_only_affected_months(self, tmp_path) -> None:
+        """Test upserts rewrite only the months containing new candles."""
+        store = CandleStore(tmp_path)
+        store.write(make_candles("2024-01-01", 24 * 60), "binance", "BTC/USDT", "1h")
+        january = store.partitions("binance", "BTC/USDT", "1h")[0]
+        january_mtime = january.stat().st_mtime_ns
+
+        update = make_candles("2024-02-29", 48) * 2
+        assert store.write(update, "binance", "BTC/USDT", "1h") == 2
+
+        result = store.read("binance", "BTC/USDT", "1h")
+        assert january.stat().st_mtime_ns == january_mtime
+        assert result.index.is_unique
+        assert result.index[-1] == pd.Timestamp("2024-03-01 23:00")
+        assert result.loc["2024-02-29 00:00", "close"] == update["close"].iloc[0]
+
+    def test_bounds_and_version(self, tmp_path) -> None:
+        """Test bounds and version follow writes."""
+        store = CandleStore(tmp_path)
+        assert store.bounds("binance", "ETH/USDT", "1h") is None
+
+        store.write(make_candles("2024-01-15", 24 * 30), "binance", "ETH/USDT", "1h")
+        version = store.version("binance", "ETH/USDT", "1h")
+
+        assert store.bounds("binance", "ETH/USDT", "1h") == (
+            pd.Timestamp("2024-01-15"),
+            pd.Timestamp("2024-02-13 23:00"),
+        )
+
+        store.write(make_candles("2024-02-14", 24), "binance", "ETH/USDT", "1h")
+        assert store.version("binance", "ETH/USDT", "1h") != version
+        assert store.bounds("binance", "ETH/USDT", "1h")[1] == pd.Timestamp(
+            "2024-02-14 23:00"
+        )
+        # Versions are scoped to the requested range
+        assert (
+            store.version(
+                "binance", "ETH/USDT", "1h", end_date=pd.Timestamp("2024-01-31")
+            )
+            == version.split(",")[0]
+        )
+
+    def test_append_adds_segments_without_rewrites(self, tmp_path) -> None:
+        """Test appends leave compacted files untouched and win on read."""
+        store = CandleStore(tmp_path)
+        store.write(make_candles("2024-01-01", 24 * 10), "binance", "BTC/USDT", "1h")
+        base = store.partitions("binance", "BTC/USDT", "1h")[0]
+        base_mtime = base.stat().st_mtime_ns
+
+        # Overlaps the last stored candle, which may have been incomplete
+        tail = make_candles("2024-01-10 23:00", 3) * 2
+        assert store.append(tail, "binance", "BTC/USDT", "1h") == 1
+
+        result = store.read("binance", "BTC/USDT", "1h")
+        assert base.stat().st_mtime_ns == base_mtime
+        assert store.stats("binance", "BTC/USDT", "1h")["segments"] == 1
+        assert result.index.is_unique and result.index.is_monotonic_increasing
+        assert len(result) == 24 * 10 + 2
+        assert result.loc["2024-01-10 23:00", "close"] == tail["close"].iloc[0]
+        assert store.bounds("binance", "BTC/USDT", "1h")[1] == tail.index[-1]
+
+    def test_compact_folds_segments(self, tmp_path) -> None:
+        """Test compaction merges segments into one file per month."""
+        store = CandleStore(tmp_path)
+        store.write(make_candles("2024-01-01", 24 * 10), "binance", "BTC/USDT", "1h")
+        for start in ["2024-01-11", "2024-01-31 12:00"]:
+            store.append(make_candles(start, 24), "binance", "BTC/USDT", "1h")
+        before = store.read("binance", "BTC/USDT", "1h")
+
+        assert store.compact("binance", "BTC/USDT", "1h") == 2
+        assert store.compact("binance", "BTC/USDT", "1h") == 0
+
+        files = store.partitions("binance", "BTC/USDT", "1h")
+        assert [f.name for f in files] == ["data.parquet", "data.parquet"]
+        pd.testing.assert_frame_equal(store.read("binance", "BTC/USDT", "1h"), before)
+
+    def test_reads_during_compaction(self, tmp_path) -> None:
+        """Test reads never see segments compaction is removing."""
+        store = CandleStore(tmp_path)
+        data = make_candles("2024-01-01", 24 * 365)
+        store.write(data, "binance", "BTC/USDT", "1h")
+        months = pd.date_range("2024-01-01", periods=12, freq="MS") + pd.Timedelta(
+            days=9
+        )
+
+        for _ in range(5):
+            for start in months:
+                for _ in range(3):
+                    store.append(make_candles(start, 24), "binance", "BTC/USDT", "1h")
+
+            compaction = threading.Thread(
+                target=store.compact, args=("binance", "BTC/USDT", "1h")
+            )
+            compaction.start()
+            while compaction.is_alive():
+                assert len(store.read("binance", "BTC/USDT", "1h")) == len(data)
+            compaction.join()
@@ -0,0 +1,79 @@
+"""Tests for the candle dataset catalog."""
+
+import pandas as pd
+
+from system_trading.backtesting.candle_store import CandleStore
+from tests.conftest import make_candles
+
+
+def ns(value: str) -> int:
+    """Get the UTC nanoseconds of a naive timestamp."""
+    return pd.Timestamp(value).value
+
+
+class TestDataCatalog:
+    """Test cases for DataCatalog kept by CandleStore."""
+
+    def test_write_records_coverage_and_gaps(self, tmp_path) -> None:
+        """Test writes catalog candle counts, coverage and missing ranges."""
+        store = CandleStore(tmp_path)
+        data = make_candles("2024-01-30", 24 * 5)
+        # One hole inside a month, one spanning the month boundary
+        data = data.drop(data.index[5:8]).drop(data.index[40:50])
+        store.write(data, "binance", "BTC/USDT", "1h")
+
+        entry = store.catalog.get("binance", "BTC/USDT", "1h")
+        assert entry["rows"] == len(data)
+        assert entry["partitions"] == 2
+        assert entry["segments"] == 0
+        assert (entry["start_ns"], entry["end_ns"]) == (
+            data.index[0].value,
+            data.index[-1].value,
+        )
+        assert entry["gaps"] == [
+            [ns("2024-01-30 05:00"), ns("2024-01-30 07:00")],
+            [ns("2024-01-31 16:00"), ns("2024-02-01 01:00")],
+        ]
+
+        checksum = entry["checksum"]
+        store.write(make_candles("2024-02-03", 1) * 2, "binance", "BTC/USDT", "1h")
+        assert store.catalog.get("binance", "BTC/USDT", "1h")["checksum"] != checksum
+
+    def test_append_and_compact_keep_entry_exact(self, tmp_path) -> None:
+        """Test appended segments are counted once and survive compaction."""
+        store = CandleStore(tmp_path)
+        store.write(make_candles("2024-01-01", 24 * 10), "binance", "BTC/USDT", "1h")
+
+        # Overlaps the last stored candle, then skips two hours
+        store.append(make_candles("2024-01-10 23:00", 2), "binance", "BTC/USDT", "1h")
+        store.append(make_candles("2024-01-11 03:00", 3), "binance", "BTC/USDT", "1h")
+
+        entry = store.catalog.get("binance", "BTC/USDT", "1h")
+        assert entry["rows"] == 24 * 10 + 4
+        assert entry["segments"] == 2
+        assert entry["gaps"] == [[ns("2024-01-11 01:00"), ns("2024-01-11 02:00")]]
+        assert entry["rows"] == len(store.read("binance", "BTC/USDT", "1h"))
+
+        store.compact("binance", "BTC/USDT", "1h")
+        compacted = store.catalog.get("binance", "BTC/USDT", "1h")
+        assert compacted["segments"] == 0
+        assert compacted["rows"] == entry["rows"]
+        assert compacted["gaps"] == entry["gaps"]
+
+    def test_missing_catalog_is_rebuilt(self, tmp_path) -> None:
+        """Test series stored without a catalog are cataloged on first use."""
+        store = CandleStore(tmp_path)
+        store.write(make_candles("2024-01-20", 24 * 20), "binance", "ETH/USDT", "1h")
+        expected = store.catalog.get("binance", "ETH/USDT", "1h")
+        store.catalog.remove("binance", "ETH/USDT", "1h")
+
+        assert store.catalog.list_datasets() == []
+        assert store.bounds("binance", "ETH/USDT", "1h") == (
+            pd.Timestamp("2024-01-20"),
+            pd.Timestamp("2024-02-08 23:00"),
+        )
+
+        entry = store.catalog.get("binance", "ETH/USDT", "1h")
+        assert entry["rows"] == expected["rows"]
+        assert entry["checksum"] == expected["checksum"]
+        assert [d["symbol"] for d in store.catalog.list_datasets()] == ["ETH/USDT"]
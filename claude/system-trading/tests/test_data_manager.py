@@ -0,0 +1,256 @@
+"""Tests for backtest data manager downloads."""
+
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from system_trading.backtesting.data_manager import BacktestDataManager
+from system_trading.backtesting.validation import DataValidator
+from system_trading.data.models import Exchange
+from tests.conftest import EPOCH, HOUR_MS
+
+
+class TestDownloadHistory:
+    """Test cases for paginated history downloads."""
+
+    def test_downloads_whole_range_in_pages(self, manager) -> None:
+        """Test every page is fetched and the range ends exactly at end_date."""
+        start = datetime(2024, 1, 2)
+        end = datetime(2024, 4, 30, 5)
+
+        data = manager.download_history(
+            "BTC/USDT", Exchange.BINANCE, "1h", start, end, max_workers=3
+        )
+
+        expected = pd.date_range(start, end, freq="h")
+        assert data.index.equals(expected)
+        assert len(manager.client.calls) == -(-len(expected) // 1000)
+
+    def test_resumes_from_cache(self, manager) -> None:
+        """Test a second download only fetches candles after the cache."""
+        start = datetime(2024, 1, 2)
+        manager.download_history(
+            "BTC/USDT", Exchange.BINANCE, "1h", start, datetime(2024, 2, 1)
+        )
+        manager.client.calls.clear()
+
+        data = manager.download_history(
+            "BTC/USDT", Exchange.BINANCE, "1h", start, datetime(2024, 2, 10)
+        )
+
+        last_cached = pd.Timestamp(datetime(2024, 2, 1)).value // 1_000_000
+        assert manager.client.calls == [last_cached]
+        assert data.index[-1] == pd.Timestamp(datetime(2024, 2, 10))
+        assert data.index.is_unique
+
+    def test_interrupted_download_keeps_contiguous_pages(self, manager) -> None:
+        """Test checkpoints let an interrupted download resume."""
+        start = datetime(2024, 1, 2)
+        end = datetime(2024, 12, 31)
+        manager.client.fail_after = 3
+
+        with pytest.raises(RuntimeError):
+            manager.download_history(
+                "BTC/USDT",
+                Exchange.BINANCE,
+                "1h",
+                start,
+                end,
+                max_workers=1,
+                checkpoint_pages=1,
+            )
+
+        cached = manager.store.read(Exchange.BINANCE.value, "BTC/USDT", "1h")
+        assert len(cached) == 3000
+
+        manager.client.fail_after = None
+        manager.client.calls.clear()
+        data = manager.download_history(
+            "BTC/USDT", Exchange.BINANCE, "1h", start, end, max_workers=2
+        )
+
+        assert data.index.equals(pd.date_range(start, end, freq="h"))
+        assert manager.client.calls[0] == cached.index[-1].value // 1_000_000
+
+
+class TestSharedExport:
+    """Test cases for memory-mapped backtest data exports."""
+
+    def test_open_shared_is_read_only_view(self, manager) -> None:
+        """Test shared frames match prepared data and map the export."""
+        start, end = datetime(2024, 1, 2), datetime(2024, 1, 20)
+
+        shared = manager.open_shared("BTC/USDT", Exchange.BINANCE, "1h", start, end)
+        prepared = manager.prepare_backtest_data(
+            "BTC/USDT", Exchange.BINANCE, "1h", start, end
+        )
+
+        pd.testing.assert_frame_equal(shared, prepared, check_freq=False)
+        assert not shared["close"].to_numpy().flags.writeable
+
+    def test_export_is_reused_until_data_changes(self, manager) -> None:
+        """Test unchanged data reuses its export and stale exports are removed."""
+        start, end = datetime(2024, 1, 2), datetime(2024, 1, 20)
+
+        first = manager.export_shared("BTC/USDT", Exchange.BINANCE, "1h", start, end)
+        mtime = (first.directory / first.META_FILE).stat().st_mtime_ns
+        again = manager.export_shared("BTC/USDT", Exchange.BINANCE, "1h", start, end)
+
+        assert again.directory == first.directory
+        assert (again.directory / again.META_FILE).stat().st_mtime_ns == mtime
+
+        updated = manager.store.read(Exchange.BINANCE.value, "BTC/USDT", "1h")
+        manager.store.write(updated + 1, Exchange.BINANCE.value, "BTC/USDT", "1h")
+        refreshed = manager.export_shared(
+            "BTC/USDT", Exchange.BINANCE, "1h", start, end
+        )
+
+        assert refreshed.directory != first.directory
+        assert not first.directory.exists()
+        pd.testing.assert_frame_equal(
+            refreshed.open(),
+            manager.prepare_backtest_data(
+                "BTC/USDT", Exchange.BINANCE, "1h", start, end
+            ),
+            check_freq=False,
+        )
+
+
+class TestTailRefresh:
+    """Test cases for append-only cache refreshes."""
+
+    @pytest.fixture
+    def manager(self, tmp_path, use_fake_client) -> BacktestDataManager:
+        return BacktestDataManager(data_dir=str(tmp_path), compact_segments=2)
+
+    def test_refresh_fetches_only_new_candles(self, manager) -> None:
+        """Test refreshes start at the last stored candle and append segments."""
+        end = datetime(2024, 1, 20)
+        manager.download_history(
+            "BTC/USDT", Exchange.BINANCE, "1h", datetime(2024, 1, 1), end
+        )
+        manager.client.calls.clear()
+
+        new_data = manager.refresh_tail("BTC/USDT", Exchange.BINANCE, "1h")
+
+        last_ms = EPOCH.value // 1_000_000 + 19 * 24 * HOUR_MS
+        assert min(manager.client.calls) == last_ms
+        assert new_data.index[0] == pd.Timestamp(end)
+
+        # Enough segments were appended to trigger a background compaction
+        future = manager._compactions[(Exchange.BINANCE, "BTC/USDT", "1h")]
+        assert future.result() > 0
+        stats = manager.store.stats(Exchange.BINANCE.value, "BTC/USDT", "1h")
+        assert stats["segments"] == 0
+
+        cached = manager.store.read(Exchange.BINANCE.value, "BTC/USDT", "1h")
+        assert cached.index.is_unique
+        assert (cached.index.to_series().diff().dropna() == pd.Timedelta("1h")).all()
+
+    def test_refresh_requires_cached_data(self, manager) -> None:
+        """Test refreshing an uncached series is rejected."""
+        with pytest.raises(ValueError, match="No cached data"):
+            manager.refresh_tail("ETH/USDT", Exchange.BINANCE, "1h")
+
+
+class TestDerivedTimeframes:
+    """Test cases for timeframes derived from the base timeframe."""
+
+    def test_coarser_timeframe_is_derived_and_cached(self, manager) -> None:
+        """Test 6h candles come from cached 1h candles without new requests."""
+        start, end = datetime(2024, 1, 2, 3), datetime(2024, 1, 20)
+        manager.download_history(
+            "BTC/USDT", Exchange.BINANCE, "1h", datetime(2024, 1, 1), end
+        )
+        manager.client.calls.clear()
+
+        data = manager.get_historical_data(
+            "BTC/USDT", Exchange.BINANCE, "6h", start, end
+        )
+
+        assert manager.client.calls == []
+        assert data.index[0] == pd.Timestamp("2024-01-02 06:00")
+        assert data.index[-1] == pd.Timestamp("2024-01-19 18:00")  # Last whole bar
+        hourly = manager.store.read(Exchange.BINANCE.value, "BTC/USDT", "1h")
+        first_bar = hourly.loc["2024-01-02 06:00":"2024-01-02 11:00"]
+        assert data["volume"].iloc[0] == first_bar["volume"].sum()
+        assert data["close"].iloc[0] == first_bar["close"].iloc[-1]
+        assert not manager.store.exists(Exchange.BINANCE.value, "BTC/USDT", "6h")
+
+        derived_files = list(manager.derived_dir.rglob("*.parquet"))
+        assert len(derived_files) == 1
+        mtime = derived_files[0].stat().st_mtime_ns
+
+        cached = manager.get_historical_data(
+            "BTC/USDT", Exchange.BINANCE, "6h", start, end
+        )
+        pd.testing.assert_frame_equal(cached, data, check_freq=False)
+        assert derived_files[0].stat().st_mtime_ns == mtime
+
+        # Refreshed base candles invalidate the derived ones
+        manager.store.write(hourly * 2, Exchange.BINANCE.value, "BTC/USDT", "1h")
+        refreshed = manager.get_historical_data(
+            "BTC/USDT", Exchange.BINANCE, "6h", start, end
+        )
+        assert refreshed["close"].iloc[0] == data["close"].iloc[0] * 2
+        assert not derived_files[0].exists()
+
+    def test_fingerprint_follows_base_candles(self, manager) -> None:
+        """Test derived fingerprints change with the base candles."""
+        end = datetime(2024, 1, 20)
+        manager.download_history(
+            "BTC/USDT", Exchange.BINANCE, "1h", datetime(2024, 1, 1), end
+        )
+
+        fingerprint = manager.get_data_fingerprint(
+            "BTC/USDT", Exchange.BINANCE, "4h", datetime(2024, 1, 2), end
+        )
+        assert fingerprint is not None and fingerprint.startswith("4h<-")
+
+
+class TestValidatedCache:
+    """Test cases for caching validated backtest data."""
+
+    def test_repeat_preparation_skips_cleaning(self, manager, monkeypatch) -> None:
+        """Test unchanged data is served from the cleaned cache."""
+        start, end = datetime(2024, 1, 2), datetime(2024, 1, 20)
+        first = manager.prepare_backtest_data(
+            "BTC/USDT", Exchange.BINANCE, "1h", start, end
+        )
+
+        def fail(*args, **kwargs):
+            raise AssertionError("cleaned again")
+
+        monkeypatch.setattr(manager.validator, "validate", fail)
+        monkeypatch.setattr(manager, "get_historical_data", fail)
+        again = manager.prepare_backtest_data(
+            "BTC/USDT", Exchange.BINANCE, "1h", start, end
+        )
+        pd.testing.assert_frame_equal(again, first, check_freq=False)
+
+    def test_cleaned_cache_follows_data_and_policy(self, manager) -> None:
+        """Test refreshed candles or another policy are cleaned again."""
+        start, end = datetime(2024, 1, 2), datetime(2024, 1, 20)
+        manager.prepare_backtest_data("BTC/USDT", Exchange.BINANCE, "1h", start, end)
+
+        # A candle whose high is below its low
+        broken = manager.store.read(
+            Exchange.BINANCE.value, "BTC/USDT", "1h", "2024-01-05", "2024-01-05"
+        )
+        broken["high"] = broken["low"] - 5
+        manager.store.write(broken, Exchange.BINANCE.value, "BTC/USDT", "1h")
+
+        dropped = manager.prepare_backtest_data(
+            "BTC/USDT", Exchange.BINANCE, "1h", start, end
+        )
+        assert pd.Timestamp("2024-01-05") not in dropped.index
+
+        manager.validator = DataValidator(policy="ffill")
+        filled = manager.prepare_backtest_data(
+            "BTC/USDT", Exchange.BINANCE, "1h", start, end
+        )
+        previous_close = filled.loc["2024-01-04 23:00", "close"]
+        assert filled.loc["2024-01-05 00:00", "high"] == previous_close
+        assert filled.loc["2024-01-05 00:00", "volume"] == 0
+        assert (filled.index.to_series().diff().dropna() == pd.Timedelta("1h")).all()
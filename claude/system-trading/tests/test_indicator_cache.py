@@ -0,0 +1,69 @@
+"""Tests for the indicator cache."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from system_trading.strategies.enhanced_ma_strategy import EnhancedMAStrategy
+from system_trading.strategies.indicator_cache import IndicatorCache, indicator_cache
+
+
+class TestIndicatorCache:
+    """Test cases for IndicatorCache."""
+
+    def test_hit_and_miss_counters(self, sample_ohlcv_data: pd.DataFrame) -> None:
+        """Test repeated requests are served from the cache."""
+        cache = IndicatorCache()
+
+        first = cache.indicator("ema", sample_ohlcv_data["close"], length=10)
+        second = cache.indicator("ema", sample_ohlcv_data["close"], length=10)
+        cache.indicator("ema", sample_ohlcv_data["close"], length=20)
+
+        assert second is first
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["entries"] == 2
+
+    def test_different_data_is_not_shared(
+        self, sample_ohlcv_data: pd.DataFrame
+    ) -> None:
+        """Test changed input data produces a new cache entry."""
+        cache = IndicatorCache()
+        changed = sample_ohlcv_data["close"] * 1.01
+
+        cache.indicator("rsi", sample_ohlcv_data["close"], length=14)
+        cache.indicator("rsi", changed, length=14)
+
+        assert cache.get_stats()["misses"] == 2
+
+    def test_lru_eviction(self, sample_ohlcv_data: pd.DataFrame) -> None:
+        """Test least recently used entries are evicted over budget."""
+        close = sample_ohlcv_data["close"]
+        entry_size = int(close.memory_usage(index=True))
+        cache = IndicatorCache(max_bytes=entry_size * 2)
+
+        cache.indicator("sma", close, length=5)
+        cache.indicator("sma", close, length=10)
+        cache.indicator("sma", close, length=5)  # refresh
+        cache.indicator("sma", close, length=20)  # evicts length=10
+
+        assert cache.get_stats()["evictions"] == 1
+        assert cache.get_stats()["bytes"] <= cache.max_bytes
+        cache.indicator("sma", close, length=5)
+        assert cache.get_stats()["hits"] == 2
+
+    def test_strategy_threshold_sweep_reuses_indicators(
+        self, sample_ohlcv_data: pd.DataFrame
+    ) -> None:
+        """Test strategies that differ only in thresholds share indicators."""
+        indicator_cache.clear()
+
+        for min_confidence in np.linspace(0.3, 0.7, 5):
+            strategy = EnhancedMAStrategy(min_confidence=min_confidence)
+            strategy.generate_signals_vectorized(sample_ohlcv_data)
+
+        stats = indicator_cache.get_stats()
+        assert stats["misses"] == 5
+        assert stats["hits"] == 20
+        assert stats["hit_rate"] == pytest.approx(0.8)
@@ -0,0 +1,125 @@
+"""Tests for market metadata snapshots and lazy exchange creation."""
+
+import asyncio
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+ccxt = pytest.importorskip("ccxt")
+pytest.importorskip("aiohttp")
+
+from system_trading.data.models import Exchange  # noqa: E402
+from system_trading.exchanges.markets import MarketCache  # noqa: E402
+from system_trading.exchanges.unified_client import UnifiedExchangeClient  # noqa: E402
+
+SYMBOLS = ["BTC/USDT", "ETH/USDT"]
+
+
+def make_exchange() -> ccxt.Exchange:
+    """Create a Binance instance with markets set locally."""
+    ex = ccxt.binance()
+    ex.set_markets(
+        [
+            {
+                "id": symbol.replace("/", ""),
+                "symbol": symbol,
+                "base": symbol.split("/")[0],
+                "quote": "USDT",
+                "type": "spot",
+                "spot": True,
+                "precision": {"amount": 0.0001, "price": 0.01},
+                "info": {"orderTypes": ["LIMIT", "MARKET"]},
+            }
+            for symbol in SYMBOLS
+        ]
+    )
+    return ex
+
+
+class TestMarketCache:
+    """Test cases for MarketCache."""
+
+    def test_snapshot_round_trip(self, tmp_path: Path) -> None:
+        """Test saved markets load into a new instance with their payloads."""
+        MarketCache(tmp_path).save("binance", make_exchange())
+
+        ex = ccxt.binance()
+        assert MarketCache(tmp_path).apply("binance", ex)
+        assert sorted(ex.markets) == SYMBOLS
+        assert ex.markets["BTC/USDT"]["precision"]["price"] == 0.01
+        assert ex.markets["BTC/USDT"]["info"]["orderTypes"] == ["LIMIT", "MARKET"]
+
+    def test_snapshot_markets_build_orders(self, tmp_path: Path) -> None:
+        """Test instances loaded from a snapshot can build Binance orders."""
+        MarketCache(tmp_path).save("binance", make_exchange())
+
+        ex = ccxt.binance()
+        assert MarketCache(tmp_path).apply("binance", ex)
+        request = ex.create_order_request("BTC/USDT", "market", "buy", 0.001)
+        assert request["symbol"] == "BTCUSDT"
+        assert request["type"] == "MARKET"
+
+    def test_old_snapshots_are_refetched(self, tmp_path: Path) -> None:
+        """Test snapshots from before markets kept payloads are not used."""
+        cache = MarketCache(tmp_path)
+        cache.save("binance", make_exchange())
+        snapshot = json.loads(cache.path("binance").read_text())
+        snapshot["version"] = 1
+        cache.path("binance").write_text(json.dumps(snapshot))
+
+        assert MarketCache(tmp_path).load("binance") is None
+
+    def test_stale_and_unreadable_snapshots(self, tmp_path: Path) -> None:
+        """Test old or corrupt snapshots are not used."""
+        MarketCache(tmp_path).save("binance", make_exchange())
+        stale = MarketCache(tmp_path, refresh_interval=60.0)
+        snapshot = json.loads(stale.path("binance").read_text())
+        snapshot["fetched_at"] = time.time() - 120
+        stale.path("binance").write_text(json.dumps(snapshot))
+
+        assert stale.load("binance") is None
+        assert stale.age("binance") == pytest.approx(120, abs=5)
+        assert not stale.apply("binance", ccxt.binance())
+
+        stale.path("upbit").write_text("{not json")
+        assert MarketCache(tmp_path).load("upbit") is None
+        assert MarketCache(tmp_path).age("missing") is None
+        assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+class TestLazyClient:
+    """Test cases for lazy exchange creation in UnifiedExchangeClient."""
+
+    def test_client_starts_without_exchanges(self, tmp_path: Path) -> None:
+        """Test instances are built on first use with the snapshot's markets."""
+        cache = MarketCache(tmp_path)
+        client = UnifiedExchangeClient(market_cache=cache)
+        assert client.exchanges == {}
+
+        cache.save(client._snapshot_name(Exchange.BINANCE), make_exchange())
+        assert sorted(client.get_exchange(Exchange.BINANCE).markets) == SYMBOLS
+        assert list(client.exchanges) == [Exchange.BINANCE]
+
+    def test_load_markets_uses_fresh_snapshot(self, tmp_path: Path) -> None:
+        """Test fresh snapshots answer without fetching markets."""
+        cache = MarketCache(tmp_path)
+
+        async def run() -> None:
+            async with UnifiedExchangeClient(market_cache=cache) as client:
+                cache.save(client._snapshot_name(Exchange.BINANCE), make_exchange())
+                ex = client.get_async_exchange(Exchange.BINANCE)
+
+                async def fail(*args: object, **kwargs: object) -> None:
+                    raise AssertionError("markets fetched despite fresh snapshot")
+
+                ex.load_markets = fail
+                start = time.perf_counter()
+                markets = await client.load_markets(Exchange.BINANCE)
+                assert time.perf_counter() - start < 0.05
+                assert sorted(markets) == SYMBOLS
+                assert client.get_markets_age(Exchange.BINANCE) < 5
+
+        asyncio.run(run())
@@ -0,0 +1,67 @@
+"""Tests for the NumPy metrics kernel."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from system_trading.backtesting.metrics import (
+    calculate_metrics,
+    infer_bar_frequency,
+    periods_per_year,
+)
+
+
+class TestMetrics:
+    """Test cases for metrics kernel."""
+
+    def test_periods_per_year(self) -> None:
+        """Test annualization follows the bar frequency."""
+        assert periods_per_year("1d") == 365
+        assert periods_per_year("1h") == 365 * 24
+        assert periods_per_year(pd.Timedelta(minutes=15)) == 365 * 96
+
+    def test_infer_bar_frequency(self) -> None:
+        """Test bar frequency is inferred from the index spacing."""
+        index = pd.date_range("2024-01-01", periods=10, freq="4h")
+
+        assert infer_bar_frequency(index) == pd.Timedelta(hours=4)
+        assert infer_bar_frequency(pd.RangeIndex(3)) == pd.Timedelta(hours=1)
+
+    def test_known_equity_curve(self) -> None:
+        """Test metrics of a hand-computed equity curve."""
+        values = np.array([110.0, 99.0, 121.0])
+        metrics = calculate_metrics(
+            values,
+            initial_cash=100.0,
+            trade_columns=np.array([0, 0, 0]),
+            trade_pnl=np.array([10.0, -5.0, 15.0]),
+            annualization=365,
+            risk_free_rate=0.0,
+        )
+
+        returns = np.array([0.1, -0.1, 121 / 99 - 1])
+        expected_sharpe = returns.mean() / returns.std(ddof=1) * np.sqrt(365)
+
+        assert metrics["total_return"][0] == pytest.approx(0.21)
+        assert metrics["max_drawdown"][0] == pytest.approx(0.1)
+        assert metrics["sharpe_ratio"][0] == pytest.approx(expected_sharpe)
+        assert metrics["win_rate"][0] == pytest.approx(2 / 3)
+        assert metrics["profit_factor"][0] == pytest.approx(5.0)
+        assert metrics["calmar_ratio"][0] == pytest.approx(2.1)
+        assert metrics["total_trades"][0] == 3
+
+    def test_columns_are_independent(self) -> None:
+        """Test each column gets its own metrics and trades."""
+        values = np.array([[100.0, 100.0], [100.0, 90.0]])
+        metrics = calculate_metrics(
+            values,
+            initial_cash=100.0,
+            trade_columns=np.array([1]),
+            trade_pnl=np.array([-10.0]),
+            annualization=252,
+        )
+
+        assert metrics["total_return"].tolist() == pytest.approx([0.0, -0.1])
+        assert metrics["total_trades"].tolist() == [0, 1]
+        assert metrics["profit_factor"].tolist() == [0.0, 0.0]
+        assert metrics["sharpe_ratio"][0] == 0.0
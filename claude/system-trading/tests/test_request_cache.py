@@ -0,0 +1,129 @@
+"""Tests for the exchange request cache."""
+
+import asyncio
+
+import pytest
+
+from system_trading.exchanges.cache import RequestCache
+
+
+class CountingFetch:
+    """Upstream call counting its invocations."""
+
+    def __init__(self, delay: float = 0.05, error: Exception | None = None) -> None:
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    async def __call__(self) -> int:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return self.calls
+
+
+class TestRequestCache:
+    """Test cases for RequestCache."""
+
+    def test_concurrent_callers_share_one_call(self) -> None:
+        """Test simultaneous requests are coalesced, later ones hit the cache."""
+        cache = RequestCache({"ticker": 60.0})
+        fetch = CountingFetch()
+
+        async def run() -> None:
+            results = await asyncio.gather(
+                *(cache.get("ticker", "BTC/USDT", fetch) for _ in range(10))
+            )
+            assert results == [1] * 10
+            assert await cache.get("ticker", "BTC/USDT", fetch) == 1
+            assert await cache.get("ticker", "ETH/USDT", fetch) == 2
+
+        asyncio.run(run())
+
+        stats = cache.get_stats()["endpoints"]["ticker"]
+        assert fetch.calls == 2
+        assert (stats["hits"], stats["misses"], stats["coalesced"]) == (1, 2, 9)
+        assert stats["upstream_saved"] == pytest.approx(10 / 12)
+
+    def test_expiry_and_uncached_endpoints(self) -> None:
+        """Test stale responses are refetched and zero TTLs only coalesce."""
+        cache = RequestCache({"ticker": 0.01, "balance": 0.0})
+        fetch = CountingFetch(delay=0.0)
+
+        async def run() -> None:
+            await cache.get("ticker", "BTC/USDT", fetch)
+            await asyncio.sleep(0.02)
+            assert await cache.get("ticker", "BTC/USDT", fetch) == 2
+
+            await cache.get("balance", "binance", fetch)
+            assert await cache.get("balance", "binance", fetch) == 4
+
+        asyncio.run(run())
+        assert cache.get_stats()["entries"] == 1
+
+    def test_errors_are_shared_not_cached(self) -> None:
+        """Test a failure reaches every waiting caller and is retried later."""
+        cache = RequestCache({"ticker": 60.0})
+        fetch = CountingFetch(error=ConnectionError("down"))
+
+        async def run() -> None:
+            results = await asyncio.gather(
+                *(cache.get("ticker", "BTC/USDT", fetch) for _ in range(3)),
+                return_exceptions=True,
+            )
+            assert all(isinstance(result, ConnectionError) for result in results)
+
+            fetch.error = None
+            assert await cache.get("ticker", "BTC/USDT", fetch) == 2
+
+        asyncio.run(run())
+        assert cache.get_stats()["endpoints"]["ticker"]["errors"] == 1
+
+    def test_cancelled_caller_does_not_cancel_others(self) -> None:
+        """Test the shared call survives the caller that started it."""
+        cache = RequestCache({"ticker": 60.0})
+        fetch = CountingFetch()
+
+        async def run() -> None:
+            first = asyncio.create_task(cache.get("ticker", "BTC/USDT", fetch))
+            await asyncio.sleep(0)
+            second = asyncio.create_task(cache.get("ticker", "BTC/USDT", fetch))
+            await asyncio.sleep(0)
+            first.cancel()
+
+            assert await second == 1
+            assert first.cancelled()
+
+        asyncio.run(run())
+        assert fetch.calls == 1
+
+    def test_eviction_and_invalidation(self) -> None:
+        """Test the entry limit and invalidation by endpoint."""
+        cache = RequestCache({"ticker": 60.0, "ohlcv": 60.0}, max_entries=2)
+        fetch = CountingFetch(delay=0.0)
+
+        async def run() -> None:
+            for symbol in ["A", "B", "C"]:
+                await cache.get("ticker", symbol, fetch)
+            await cache.get("ohlcv", "A", fetch)
+
+        asyncio.run(run())
+        assert cache.get_stats()["entries"] == 2
+
+        cache.invalidate("ohlcv")
+        assert cache.get_stats()["entries"] == 1
+        cache.invalidate()
+        assert cache.get_stats()["entries"] == 0
+
+    def test_peek_and_put(self) -> None:
+        """Test responses stored from bulk requests are served as hits."""
+        cache = RequestCache({"ticker": 60.0})
+        assert cache.peek("ticker", "BTC/USDT") is None
+
+        cache.put("ticker", "BTC/USDT", 42)
+        cache.put("tickers", ("BTC/USDT",), {"BTC/USDT": 42})
+
+        assert cache.peek("ticker", "BTC/USDT") == 42
+        assert cache.get_stats()["entries"] == 1
+        assert cache.get_stats()["endpoints"]["ticker"]["hits"] == 1
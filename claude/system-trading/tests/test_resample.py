@@ -0,0 +1,115 @@
+"""Tests for OHLCV resampling."""
+
+import pandas as pd
+import pytest
+
+from system_trading.backtesting.resample import (
+    bucket_starts,
+    can_resample,
+    resample_ohlcv,
+)
+from tests.conftest import make_candles
+
+
+class TestResampleOHLCV:
+    """Test cases for resample_ohlcv."""
+
+    def test_matches_pandas_resample(self) -> None:
+        """Test aggregated values for epoch-aligned buckets."""
+        data = make_candles("2024-01-01", 24 * 3)
+
+        bars = resample_ohlcv(data, "4h", "1h")
+        expected = data.resample("4h").agg(
+            {
+                "open": "first",
+                "high": "max",
+                "low": "min",
+                "close": "last",
+                "volume": "sum",
+            }
+        )
+
+        pd.testing.assert_frame_equal(bars, expected, check_freq=False)
+
+    def test_drops_partial_edge_bars(self) -> None:
+        """Test bars not fully covered by the data are left out."""
+        data = make_candles("2024-01-01 02:00", 24)  # 02:00 to 01:00 next day
+
+        bars = resample_ohlcv(data, "4h", "1h")
+        partial = resample_ohlcv(data, "4h", "1h", include_partial=True)
+
+        assert bars.index[0] == pd.Timestamp("2024-01-01 04:00")
+        assert bars.index[-1] == pd.Timestamp("2024-01-01 20:00")
+        assert partial.index[0] == pd.Timestamp("2024-01-01 00:00")
+        assert partial.index[-1] == pd.Timestamp("2024-01-02 00:00")
+        assert partial["open"].iloc[0] == data["open"].iloc[0]
+
+    def test_gaps(self) -> None:
+        """Test missing candles shrink bars and empty buckets are skipped."""
+        data = make_candles("2024-01-01", 24)
+        data = data.drop(data.index[[5, 6]])  # Inside the 04:00 bar
+        data = data.drop(data.index[10:14])  # 12:00 bar entirely (after drop)
+
+        bars = resample_ohlcv(data, "4h", "1h")
+
+        assert pd.Timestamp("2024-01-01 12:00") not in bars.index
+        assert bars.loc["2024-01-01 04:00", "volume"] == 5 + 8
+        assert (
+            bars.loc["2024-01-01 04:00", "close"]
+            == data.loc["2024-01-01 07:00", "close"]
+        )
+
+    def test_weekly_and_monthly_alignment(self) -> None:
+        """Test weeks open on Monday and months on the first day."""
+        data = make_candles("2024-01-01", 24 * 70)  # 2024-01-01 is a Monday
+
+        weekly = resample_ohlcv(data, "1w", "1h")
+        monthly = resample_ohlcv(data, "1M", "1h")
+
+        assert (weekly.index.dayofweek == 0).all()
+        assert len(weekly) == 10
+        assert list(monthly.index) == [
+            pd.Timestamp("2024-01-01"),
+            pd.Timestamp("2024-02-01"),
+        ]
+        assert monthly["volume"].iloc[1] == data.loc["2024-02", "volume"].sum()
+
+    def test_timezone_aware_index(self) -> None:
+        """Test buckets follow UTC for timezone-aware data."""
+        data = make_candles("2024-01-01", 24)
+        data.index = data.index.tz_localize("UTC").tz_convert("Asia/Seoul")
+
+        bars = resample_ohlcv(data, "1d", "1h")
+
+        assert len(bars) == 1
+        assert bars.index[0] == pd.Timestamp("2024-01-01", tz="UTC")
+        assert str(bars.index.tz) == "Asia/Seoul"
+
+
+@pytest.mark.parametrize(
+    ("timeframe", "base", "expected"),
+    [
+        ("4h", "1h", True),
+        ("6h", "4h", False),
+        ("1d", "4h", True),
+        ("1M", "1h", True),
+        ("1h", "1h", False),
+        ("30m", "1h", False),
+        ("1x", "1h", False),
+    ],
+)
+def test_can_resample(timeframe: str, base: str, expected: bool) -> None:
+    """Test which timeframes can be built from whole base candles."""
+    assert can_resample(timeframe, base) is expected
+
+
+def test_bucket_starts_epoch_aligned() -> None:
+    """Test multi-hour buckets are aligned to midnight UTC."""
+    index = pd.DatetimeIndex(["2024-01-01 05:30", "2024-01-01 23:59"])
+
+    starts = bucket_starts(index, "6h")
+
+    assert list(pd.to_datetime(starts)) == [
+        pd.Timestamp("2024-01-01 00:00"),
+        pd.Timestamp("2024-01-01 18:00"),
+    ]
@@ -0,0 +1,82 @@
+"""Tests for backtest result cache."""
+
+import os
+
+import pandas as pd
+
+from system_trading.backtesting.result_cache import BacktestResultCache
+from system_trading.strategies.enhanced_ma_strategy import EnhancedMAStrategy
+from system_trading.strategies.rsi_strategy import RSIStrategy
+
+SETTINGS = {"initial_cash": 10000.0, "commission": 0.001, "slippage": 0.001}
+
+
+class TestBacktestResultCache:
+    """Test cases for BacktestResultCache."""
+
+    def _key(self, cache: BacktestResultCache, **overrides) -> str:
+        inputs = {
+            "data_fingerprint": "binance_BTC_USDT_1h.parquet:1:100::",
+            "strategy_class": EnhancedMAStrategy,
+            "parameters": {"fast_ema": 12, "slow_ema": 26},
+            "settings": SETTINGS,
+            "symbol": "BTC/USDT",
+        }
+        inputs.update(overrides)
+        return cache.make_key(**inputs)
+
+    def test_key_changes_with_inputs(self, tmp_path) -> None:
+        """Test any input change produces a different key."""
+        cache = BacktestResultCache(cache_dir=str(tmp_path))
+        base = self._key(cache)
+
+        assert self._key(cache) == base
+        assert self._key(cache, parameters={"slow_ema": 26, "fast_ema": 12}) == base
+        variants = [
+            self._key(cache, data_fingerprint="binance_BTC_USDT_1h.parquet:2:100::"),
+            self._key(cache, strategy_class=RSIStrategy),
+            self._key(cache, parameters={"fast_ema": 8, "slow_ema": 26}),
+            self._key(cache, settings={**SETTINGS, "commission": 0.002}),
+            self._key(cache, symbol="ETH/USDT"),
+        ]
+        assert len({base, *variants}) == 6
+
+    def test_roundtrip(self, tmp_path) -> None:
+        """Test stored results are returned on the next lookup."""
+        cache = BacktestResultCache(cache_dir=str(tmp_path))
+        key = self._key(cache)
+        result = {"success": True, "statistics": {"total_return": 0.1}}
+
+        assert cache.get(key) is None
+        cache.put(key, result, pd.DataFrame())
+
+        assert cache.get(key) == {**result, "trades": []}
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+
+    def test_roundtrip_with_trades(self, tmp_path) -> None:
+        """Test trade records are stored next to the statistics."""
+        cache = BacktestResultCache(cache_dir=str(tmp_path))
+        key = self._key(cache)
+        trades = pd.DataFrame({"size": [0.1, 0.2], "pnl": [5.0, -2.0]})
+
+        cache.put(key, {"success": True}, trades)
+
+        assert cache.get(key)["trades"] == trades.to_dict("records")
+
+    def test_size_based_eviction(self, tmp_path) -> None:
+        """Test least recently used entries are evicted over the budget."""
+        cache = BacktestResultCache(cache_dir=str(tmp_path), max_bytes=300)
+        payload = {"statistics": {"note": "x" * 100}}
+        keys = [self._key(cache, symbol=f"COIN{i}/USDT") for i in range(3)]
+
+        cache.put(keys[0], payload, pd.DataFrame())
+        cache.put(keys[1], payload, pd.DataFrame())
+        # Make the second entry the least recently used
+        os.utime(tmp_path / keys[1] / cache.RESULT_FILE, (0, 0))
+        cache.put(keys[2], payload, pd.DataFrame())
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[2]) is not None
+        assert cache.get_stats()["evictions"] == 1
@@ -0,0 +1,50 @@
+"""Tests for optimization result collection."""
+
+import pandas as pd
+
+from system_trading.backtesting.results import ResultSpill, TopKResults
+
+
+class TestTopKResults:
+    """Test cases for TopKResults."""
+
+    def _result(self, i: int) -> dict:
+        return {
+            "params": {"window": i},
+            "score": float(i % 7),
+            "sharpe_ratio": float(i % 7),
+            "max_drawdown": (i % 5) / 10,
+        }
+
+    def test_keeps_best_per_metric(self) -> None:
+        """Test each metric keeps its own best results."""
+        top = TopKResults(3, ["sharpe_ratio", "max_drawdown"])
+        results = [self._result(i) for i in range(50)]
+        for result in results:
+            top.push(result)
+
+        assert top.count == 50
+        assert [r["sharpe_ratio"] for r in top.top("sharpe_ratio")] == [6.0] * 3
+        # Lower drawdown is better; ties keep the earliest results
+        assert [r["params"]["window"] for r in top.top("max_drawdown")] == [0, 5, 10]
+        assert top.best("sharpe_ratio")["params"]["window"] == 6
+
+    def test_nan_ranks_last(self) -> None:
+        """Test NaN metric values never displace real values."""
+        top = TopKResults(1, ["sharpe_ratio"])
+        top.push({"params": {}, "sharpe_ratio": 0.5})
+        top.push({"params": {}, "sharpe_ratio": float("nan")})
+
+        assert top.best("sharpe_ratio")["sharpe_ratio"] == 0.5
+
+    def test_spill_writes_every_result(self, tmp_path) -> None:
+        """Test spilled results can be read back as one table."""
+        path = tmp_path / "results.parquet"
+
+        with ResultSpill(path, chunk_size=7) as spill:
+            for i in range(20):
+                spill.append(self._result(i))
+
+        table = pd.read_parquet(path)
+        assert spill.rows_written == 20
+        assert table["param_window"].tolist() == list(range(20))
@@ -0,0 +1,122 @@
+"""Tests for parameter search strategies."""
+
+import itertools
+from typing import Any
+
+import pandas as pd
+
+from system_trading.backtesting.search import (
+    GridSearch,
+    ParameterSearch,
+    RandomSearch,
+    SuccessiveHalvingSearch,
+    TPESearch,
+    combination_at,
+    grid_size,
+    iter_param_combinations,
+)
+
+PARAM_RANGES = {
+    "fast_ema": [5, 8, 12, 16],
+    "slow_ema": [20, 26, 30, 40, 50],
+    "min_confidence": [0.3, 0.4, 0.5, 0.6, 0.7],
+}
+
+
+class FakeEvaluator:
+    """Scores parameters with a smooth function peaking at known values."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[int, int]] = []
+
+    def __call__(
+        self, param_combinations: list[dict[str, Any]], data: pd.DataFrame
+    ) -> list[dict[str, Any]]:
+        self.calls.append((len(param_combinations), len(data)))
+        return [
+            {
+                "params": params,
+                "score": -((params["fast_ema"] - 12) ** 2)
+                - (params["slow_ema"] - 30) ** 2 / 10
+                - (params["min_confidence"] - 0.5) ** 2 * 100,
+            }
+            for params in param_combinations
+        ]
+
+
+def run_search(
+    search: ParameterSearch, evaluate: FakeEvaluator, data: pd.DataFrame
+) -> list[dict[str, Any]]:
+    """Run a search and flatten its result batches."""
+    batches = search.run(evaluate, PARAM_RANGES, data, "sharpe_ratio")
+    return list(itertools.chain.from_iterable(batches))
+
+
+class TestParameterSearch:
+    """Test cases for parameter search strategies."""
+
+    def _data(self, length: int = 1000) -> pd.DataFrame:
+        return pd.DataFrame(
+            {"close": range(length)},
+            index=pd.date_range("2024-01-01", periods=length, freq="h"),
+        )
+
+    def test_combination_at_matches_product_order(self) -> None:
+        """Test indexed combinations follow itertools.product order."""
+        combinations = list(iter_param_combinations(PARAM_RANGES))
+
+        assert grid_size(PARAM_RANGES) == len(combinations) == 100
+        assert [
+            combination_at(PARAM_RANGES, i) for i in range(len(combinations))
+        ] == combinations
+
+    def test_grid_search_evaluates_everything(self) -> None:
+        """Test grid search evaluates every combination once."""
+        evaluate = FakeEvaluator()
+
+        results = run_search(GridSearch(chunk_size=30), evaluate, self._data())
+
+        assert len(results) == 100
+        assert evaluate.calls == [(30, 1000), (30, 1000), (30, 1000), (10, 1000)]
+        assert [r["params"] for r in results] == list(
+            iter_param_combinations(PARAM_RANGES)
+        )
+
+    def test_random_search_budget(self) -> None:
+        """Test random search respects its budget and is reproducible."""
+        first = run_search(
+            RandomSearch(n_iter=20, seed=7), FakeEvaluator(), self._data()
+        )
+        second = run_search(
+            RandomSearch(n_iter=20, seed=7), FakeEvaluator(), self._data()
+        )
+
+        assert len(first) == 20
+        assert [r["params"] for r in first] == [r["params"] for r in second]
+
+    def test_successive_halving_grows_data(self) -> None:
+        """Test successive halving narrows candidates on growing slices."""
+        evaluate = FakeEvaluator()
+
+        search = SuccessiveHalvingSearch(n_candidates=27, min_bars=50, seed=1)
+        results = run_search(search, evaluate, self._data())
+
+        assert [count for count, _ in evaluate.calls] == [27, 9, 3, 1]
+        bars = [length for _, length in evaluate.calls]
+        assert bars == sorted(bars)
+        assert bars[-1] == 1000
+        assert len(results) == 1
+
+    def test_tpe_finds_optimum_with_small_budget(self) -> None:
+        """Test TPE reaches the optimum without exhaustive evaluation."""
+        evaluate = FakeEvaluator()
+
+        results = run_search(
+            TPESearch(n_iter=40, n_startup=10, seed=3), evaluate, self._data()
+        )
+
+        params = [tuple(r["params"].values()) for r in results]
+        assert len(results) == 40
+        assert len(set(params)) == 40
+        best = max(results, key=lambda r: r["score"])
+        assert best["score"] >= -2.0
@@ -0,0 +1,61 @@
+"""Tests for candle storage profiles."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from system_trading.backtesting.candle_store import CandleStore
+from system_trading.backtesting.storage import StorageProfile, get_storage_profile
+from tests.conftest import make_candles
+
+
+class TestStorageProfile:
+    """Test cases for StorageProfile."""
+
+    def test_compact_round_trip(self, tmp_path) -> None:
+        """Test compact files load as float64 within the precision bound."""
+        data = make_candles("2024-01-01", 24 * 10) * 123.456789
+        data["volume"] = np.linspace(0, 5, len(data)).round(8)
+        profile = get_storage_profile("compact")
+
+        profile.to_parquet(data, tmp_path / "compact.parquet")
+        stored = pd.read_parquet(tmp_path / "compact.parquet")
+        assert stored["close"].dtype == np.float32
+        assert stored["volume"].dtype == np.int64
+
+        result = StorageProfile.decode(stored)
+        assert (result.dtypes == np.float64).all()
+        assert StorageProfile.ATTRS_KEY not in result.attrs
+        np.testing.assert_allclose(result["close"], data["close"], rtol=1e-6)
+        np.testing.assert_array_equal(result["volume"], data["volume"])
+
+    def test_unrepresentable_columns_are_kept(self) -> None:
+        """Test columns failing their check are stored unchanged."""
+        data = make_candles("2024-01-01", 4)
+        data["close"] = [1e-45, 1.0, 2.0, 3.0]  # subnormal in float32
+        data["volume"] = [np.nan, 1.0, 2.0, 3.0]
+
+        encoded = get_storage_profile("compact").encode(data)
+
+        assert encoded["open"].dtype == np.float32
+        assert encoded["close"].dtype == np.float64
+        assert encoded["volume"].dtype == np.float64
+        assert encoded.attrs[StorageProfile.ATTRS_KEY]["volume_scale"] is None
+
+    def test_store_reads_mixed_profiles(self, tmp_path) -> None:
+        """Test files written with different profiles read back together."""
+        data = make_candles("2024-01-01", 24 * 40)
+        CandleStore(tmp_path).write(data, "binance", "BTC/USDT", "1h")
+
+        store = CandleStore(tmp_path, profile="compact")
+        tail = make_candles("2024-02-10", 24)
+        store.append(tail, "binance", "BTC/USDT", "1h")
+
+        result = store.read("binance", "BTC/USDT", "1h")
+        assert (result.dtypes == np.float64).all()
+        pd.testing.assert_frame_equal(result, pd.concat([data, tail]), check_freq=False)
+
+    def test_unknown_profile(self) -> None:
+        """Test unknown profile names are rejected."""
+        with pytest.raises(ValueError, match="Unknown storage profile"):
+            get_storage_profile("tiny")
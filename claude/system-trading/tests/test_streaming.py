@@ -0,0 +1,269 @@
+"""Tests for WebSocket market data streams against the mock server."""
+
+import asyncio
+import functools
+import json
+from collections.abc import Callable
+from decimal import Decimal
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from system_trading.api.routers import market_data  # noqa: E402
+from system_trading.data.models import Exchange  # noqa: E402
+from system_trading.exchanges.mock_stream import (  # noqa: E402
+    MockStreamServer,
+    binance_frames,
+    load_frames,
+    save_frames,
+)
+from system_trading.exchanges.streaming import (  # noqa: E402
+    BinanceStreamProtocol,
+    MarketDataStream,
+    StreamEvent,
+    Subscription,
+    UpbitStreamProtocol,
+)
+
+START_MS = 1_704_067_200_000
+
+
+async def wait_until(condition: Callable[[], bool], timeout: float = 5.0) -> None:
+    """Wait for a condition to hold."""
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+
+async def collect(subscription: Subscription, count: int) -> list[StreamEvent]:
+    """Receive a number of events."""
+    events = []
+    async with asyncio.timeout(5.0):
+        async for event in subscription:
+            events.append(event)
+            if len(events) == count:
+                break
+    return events
+
+
+class QuietWebSocket:
+    """Client connection that sends nothing until it disconnects."""
+
+    def __init__(self) -> None:
+        self.sent: list[dict] = []
+        self.disconnected = asyncio.Event()
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_json(self, data: dict) -> None:
+        self.sent.append(data)
+
+    async def receive(self) -> dict:
+        await self.disconnected.wait()
+        return {"type": "websocket.disconnect", "code": 1000}
+
+
+class TestStreamProtocols:
+    """Test cases for the exchange message formats."""
+
+    def test_binance(self) -> None:
+        """Test Binance subscriptions and stream payloads."""
+        protocol = BinanceStreamProtocol("5m")
+        (message,) = protocol.subscribe_messages(["BTC/USDT"], ["trade", "kline"])
+        assert json.loads(message)["params"] == ["btcusdt@trade", "btcusdt@kline_5m"]
+
+        trade, ticker = binance_frames(["BTC/USDT"], 1)
+        (event,) = protocol.parse(trade[1])
+        assert (event.channel, event.symbol, event.sequence) == ("trade", "BTC/USDT", 1)
+        assert event.data == {"id": 1, "price": 101.0, "amount": 1.0, "side": "buy"}
+        assert protocol.parse(ticker[1])[0].data["last"] == 101.0
+
+        kline = {
+            "e": "kline",
+            "E": START_MS,
+            "s": "BTCUSDT",
+            "k": {
+                "t": START_MS,
+                "i": "5m",
+                "o": "1",
+                "h": "3",
+                "l": "0.5",
+                "c": "2",
+                "v": "10",
+                "x": True,
+            },
+        }
+        (event,) = protocol.parse(json.dumps({"stream": "x", "data": kline}))
+        assert event.data["close"] == 2.0 and event.data["closed"] is True
+        assert protocol.parse(json.dumps({"result": None, "id": 1})) == []
+
+    def test_upbit(self) -> None:
+        """Test Upbit subscriptions and binary payloads."""
+        protocol = UpbitStreamProtocol("1h")
+        (message,) = protocol.subscribe_messages(["BTC/KRW"], ["ticker", "kline"])
+        request = json.loads(message)
+        assert request[1] == {"type": "ticker", "codes": ["KRW-BTC"]}
+        assert request[2] == {"type": "candle.60m", "codes": ["KRW-BTC"]}
+
+        trade = {
+            "type": "trade",
+            "code": "KRW-BTC",
+            "trade_price": 1000.0,
+            "trade_volume": 0.5,
+            "ask_bid": "ASK",
+            "sequential_id": 17,
+            "trade_timestamp": START_MS,
+        }
+        (event,) = protocol.parse(json.dumps(trade).encode())
+        assert (event.symbol, event.sequence, event.data["side"]) == (
+            "BTC/KRW",
+            17,
+            "sell",
+        )
+
+        candle = {
+            "type": "candle.60m",
+            "code": "KRW-BTC",
+            "candle_date_time_utc": "2024-01-01T00:00:00",
+            "opening_price": 1.0,
+            "high_price": 2.0,
+            "low_price": 0.5,
+            "trade_price": 1.5,
+            "candle_acc_trade_volume": 3.0,
+            "timestamp": START_MS + 1000,
+        }
+        (event,) = protocol.parse(json.dumps(candle).encode())
+        assert event.data["open_time"] == START_MS
+        assert protocol.parse(b'{"status": "UP"}') == []
+
+
+class TestMarketDataStream:
+    """Test cases for MarketDataStream against the mock server."""
+
+    def test_state_and_subscribers(self, tmp_path) -> None:
+        """Test frames update the latest state and reach subscribers."""
+        symbols = ["BTC/USDT", "ETH/USDT"]
+        frames = binance_frames(symbols, 5)
+        path = tmp_path / "frames.jsonl"
+        save_frames(path, frames)
+
+        async def run() -> None:
+            async with MockStreamServer(load_frames(path)) as server:
+                stream = MarketDataStream(Exchange.BINANCE, symbols, url=server.url)
+                trades = stream.subscribe(["trade"], ["BTC/USDT"])
+                async with stream:
+                    events = await collect(trades, 5)
+                    await wait_until(lambda: stream.messages == len(frames))
+
+                    assert [event.sequence for event in events] == [1, 2, 3, 4, 5]
+                    assert stream.get_ticker("ETH/USDT").last == Decimal("105.0")
+                    assert stream.get_ticker("ETH/USDT", max_age=0) is None
+                    assert stream.gaps == stream.errors == 0
+
+                # Stopping ends the subscriptions
+                assert [event async for event in trades] == []
+                assert stream.get_ticker("BTC/USDT") is None
+
+        asyncio.run(run())
+
+    def test_reconnect_reports_gap(self) -> None:
+        """Test a dropped connection is resubscribed and lost trades reported."""
+        # Trades 1 and 2, then a drop; trade 3 is missed while reconnecting
+        frames = binance_frames(["BTC/USDT"], 4)
+
+        async def run() -> None:
+            server = MockStreamServer(frames, drop_after=4, skip_on_reconnect=2)
+            async with server:
+                stream = MarketDataStream(
+                    Exchange.BINANCE,
+                    ["BTC/USDT"],
+                    channels=["trade", "ticker"],
+                    url=server.url,
+                    reconnect_delay=0.01,
+                )
+                trades = stream.subscribe(["trade"])
+                async with stream:
+                    events = await collect(trades, 4)
+
+                assert [event.channel for event in events] == [
+                    "trade",
+                    "trade",
+                    "gap",
+                    "trade",
+                ]
+                assert events[2].data["missing"] == 1
+                assert stream.gaps == 1
+                assert stream.reconnects >= 1
+                assert len(server.received) >= 2
+
+        asyncio.run(run())
+
+    def test_repeated_trades_are_discarded(self) -> None:
+        """Test trades sent twice are published once."""
+        frames = binance_frames(["BTC/USDT"], 3)
+        replayed = [frames[0], frames[2], frames[0], frames[4]]
+
+        async def run() -> None:
+            async with MockStreamServer(replayed) as server:
+                stream = MarketDataStream(
+                    Exchange.BINANCE, ["BTC/USDT"], url=server.url
+                )
+                trades = stream.subscribe(["trade"])
+                async with stream:
+                    events = await collect(trades, 3)
+                    await wait_until(lambda: stream.messages == len(replayed))
+
+                assert [event.sequence for event in events] == [1, 2, 3]
+                assert stream.gaps == 0
+
+        asyncio.run(run())
+
+    def test_slow_subscriber_drops_oldest(self) -> None:
+        """Test a full subscription keeps the newest events."""
+        stream = MarketDataStream(Exchange.BINANCE, ["BTC/USDT"], url="ws://unused")
+        subscription = stream.subscribe(maxsize=2)
+        for i in range(1, 4):
+            stream._publish(
+                StreamEvent("trade", Exchange.BINANCE, "BTC/USDT", START_MS, {}, i)
+            )
+
+        assert subscription.dropped == 1
+        assert subscription._queue.get_nowait().sequence == 2
+
+
+class TestStreamRoute:
+    """Test cases for the market data WebSocket route."""
+
+    def test_disconnect_of_quiet_subscriber_stops_stream(self, monkeypatch) -> None:
+        """Test a disconnect is noticed without events and idle streams stop."""
+        monkeypatch.setattr(market_data, "streams", {})
+
+        async def run() -> None:
+            async with MockStreamServer([]) as server:
+                monkeypatch.setattr(
+                    market_data,
+                    "MarketDataStream",
+                    functools.partial(MarketDataStream, url=server.url),
+                )
+                websocket = QuietWebSocket()
+                route = asyncio.create_task(
+                    market_data.stream_market_data(
+                        websocket, Exchange.BINANCE, "BTC/USDT", "trade"
+                    )
+                )
+                await wait_until(lambda: Exchange.BINANCE in market_data.streams)
+                stream = market_data.streams[Exchange.BINANCE]
+                await stream.wait_connected(5.0)
+                assert stream.subscribers == 1
+
+                websocket.disconnected.set()
+                await asyncio.wait_for(route, 5.0)
+
+                assert websocket.sent == []
+                assert market_data.streams == {}
+                assert stream.subscribers == 0
+                assert not stream.connected.is_set()
+
+        asyncio.run(run())
@@ -0,0 +1,185 @@
+"""Tests for the async exchange client against a local server."""
+
+import asyncio
+import json
+import time
+from typing import Any
+
+import pytest
+
+web = pytest.importorskip("aiohttp.web")
+
+from system_trading.data.models import Exchange  # noqa: E402
+from system_trading.exchanges.unified_client import UnifiedExchangeClient  # noqa: E402
+from system_trading.utils.exceptions import NetworkError  # noqa: E402
+
+LATENCY = 0.2
+SYMBOLS = [f"C{i}/USDT" for i in range(10)]
+
+
+def spot_market(symbol: str) -> dict[str, Any]:
+    """Create a ccxt spot market with the fields the Binance parser reads."""
+    base, quote = symbol.split("/")
+    return {
+        "id": f"{base}{quote}",
+        "symbol": symbol,
+        "base": base,
+        "quote": quote,
+        "baseId": base,
+        "quoteId": quote,
+        "type": "spot",
+        "spot": True,
+        "margin": False,
+        "swap": False,
+        "future": False,
+        "option": False,
+        "contract": False,
+        "linear": None,
+        "inverse": None,
+        "active": True,
+    }
+
+
+class LocalExchange:
+    """Local server answering Binance 24h ticker requests after a latency."""
+
+    def __init__(self, client: UnifiedExchangeClient) -> None:
+        self.client = client
+        self.requests: list[dict[str, str]] = []
+        self._runner: web.AppRunner | None = None
+
+    async def __aenter__(self) -> "LocalExchange":
+        app = web.Application()
+        app.router.add_get("/{path:.*}", self._ticker)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, "127.0.0.1", 0).start()
+        url = f"http://127.0.0.1:{self._runner.addresses[0][1]}"
+
+        ex = self.client.get_async_exchange(Exchange.BINANCE)
+        ex.urls["api"] = {key: url for key in ex.urls["api"]}
+        ex.enableRateLimit = False
+        ex.set_markets([spot_market(symbol) for symbol in SYMBOLS])
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self._runner.cleanup()
+
+    async def _ticker(self, request: web.Request) -> web.Response:
+        self.requests.append(dict(request.query))
+        await asyncio.sleep(LATENCY)
+        if "symbols" in request.query:
+            market_ids = json.loads(request.query["symbols"])
+            return web.json_response([self._ticker_data(id_) for id_ in market_ids])
+        return web.json_response(self._ticker_data(request.query["symbol"]))
+
+    def _ticker_data(self, market_id: str) -> dict[str, Any]:
+        return {
+            "symbol": market_id,
+            "lastPrice": "101.0",
+            "bidPrice": "100.9",
+            "askPrice": "101.1",
+            "volume": "10.0",
+            "closeTime": int(time.time() * 1000),
+        }
+
+
+class TestUnifiedExchangeClient:
+    """Test cases for UnifiedExchangeClient."""
+
+    def test_concurrent_requests_overlap(self) -> None:
+        """Test parallel fetches take about one round trip, not one each."""
+
+        async def run() -> float:
+            async with UnifiedExchangeClient() as client, LocalExchange(client):
+                start = time.perf_counter()
+                tickers = await asyncio.gather(
+                    *(client.get_ticker(symbol, Exchange.BINANCE) for symbol in SYMBOLS)
+                )
+                assert [float(t.last) for t in tickers] == [101.0] * len(SYMBOLS)
+                return time.perf_counter() - start
+
+        assert asyncio.run(run()) < 3 * LATENCY
+
+    def test_get_tickers_uses_one_request(self) -> None:
+        """Test a batch is one bulk request that also fills the ticker cache."""
+
+        async def run() -> None:
+            async with UnifiedExchangeClient() as client:
+                async with LocalExchange(client) as exchange:
+                    await client.get_ticker(SYMBOLS[0], Exchange.BINANCE)
+                    tickers = await client.get_tickers(SYMBOLS, Exchange.BINANCE)
+                    assert list(tickers) == SYMBOLS
+                    # The cached first ticker is left out of the bulk request
+                    assert len(exchange.requests) == 2
+                    assert len(json.loads(exchange.requests[1]["symbols"])) == 9
+
+                    await client.get_ticker(SYMBOLS[5], Exchange.BINANCE)
+                    assert len(exchange.requests) == 2
+
+        asyncio.run(run())
+
+    def test_get_tickers_falls_back_to_single_requests(self) -> None:
+        """Test exchanges without bulk tickers are queried concurrently."""
+
+        async def run() -> None:
+            async with UnifiedExchangeClient() as client:
+                async with LocalExchange(client) as exchange:
+                    ex = client.get_async_exchange(Exchange.BINANCE)
+                    ex.has["fetchTickers"] = False
+                    start = time.perf_counter()
+                    tickers = await client.get_tickers(SYMBOLS, Exchange.BINANCE)
+                    assert time.perf_counter() - start < 3 * LATENCY
+                    assert list(tickers) == SYMBOLS
+                    assert len(exchange.requests) == len(SYMBOLS)
+
+        asyncio.run(run())
+
+    def test_get_tickers_survives_failed_bulk_request(self) -> None:
+        """Test a failed bulk request falls back to single-symbol requests."""
+
+        async def fail(*args: object) -> None:
+            raise NetworkError("bulk request timed out", "binance")
+
+        async def run() -> None:
+            async with UnifiedExchangeClient() as client:
+                async with LocalExchange(client) as exchange:
+                    client._fetch_tickers = fail
+                    tickers = await client.get_tickers(SYMBOLS, Exchange.BINANCE)
+                    assert list(tickers) == SYMBOLS
+                    assert len(exchange.requests) == len(SYMBOLS)
+
+        asyncio.run(run())
+
+    def test_close_releases_sessions(self) -> None:
+        """Test close shuts the pools and the next request opens new ones."""
+
+        async def run() -> None:
+            client = UnifiedExchangeClient()
+            ex = client.get_async_exchange(Exchange.BINANCE)
+            session = ex.session
+            assert client.get_async_exchange(Exchange.BINANCE) is ex
+
+            await client.close()
+            assert session.closed
+            assert client.get_async_exchange(Exchange.BINANCE) is not ex
+            await client.close()
+
+        asyncio.run(run())
+
+    def test_loop_change_closes_previous_pools(self) -> None:
+        """Test pools of a finished event loop are closed, not leaked."""
+        client = UnifiedExchangeClient()
+
+        async def open_session() -> Any:
+            return client.get_async_exchange(Exchange.BINANCE).session
+
+        first = asyncio.run(open_session())
+
+        async def reopen() -> Any:
+            session = await open_session()
+            await client.close()
+            return session
+
+        assert asyncio.run(reopen()) is not first
+        assert first.closed
@@ -0,0 +1,85 @@
+"""Tests for OHLCV data-quality validation."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from system_trading.backtesting.validation import DataValidator
+from tests.conftest import make_candles
+
+
+def make_dirty_candles() -> pd.DataFrame:
+    """Create candles with one issue of each kind."""
+    data = make_candles()
+    data.iloc[3, data.columns.get_loc("high")] = 50.0  # high below low
+    data.iloc[5, data.columns.get_loc("close")] = np.nan
+    data.iloc[7, data.columns.get_loc("volume")] = -1.0
+    data.iloc[9, data.columns.get_loc("high")] = 5001.0
+    data.iloc[9, data.columns.get_loc("close")] = 5000.0  # outlier
+    data = data.drop(data.index[20:23])
+    # A corrected copy of the last candle arrives again
+    return pd.concat([data, data.iloc[[-1]] + 0.5])
+
+
+class TestDataValidator:
+    """Test cases for DataValidator."""
+
+    def test_clean_data_is_untouched(self) -> None:
+        """Test valid candles pass without findings or copies."""
+        data = make_candles()
+        cleaned, report = DataValidator().validate(data, "1h")
+
+        assert report.is_clean
+        assert cleaned is data
+
+    def test_reports_every_issue(self) -> None:
+        """Test duplicates, gaps, invalid candles and outliers are reported."""
+        cleaned, report = DataValidator().validate(make_dirty_candles(), "1h")
+
+        assert report.duplicates == 1
+        assert report.ohlc_violations == 1
+        assert report.missing_values == 1
+        assert report.invalid_prices == 1
+        assert report.outliers == 1
+        assert report.missing_candles == 3
+        assert report.gaps == [
+            (pd.Timestamp("2024-01-01 20:00"), pd.Timestamp("2024-01-01 22:00"))
+        ]
+
+        assert report.removed == 5
+        assert len(cleaned) == 48 - 3 - 4
+        assert cleaned.index.is_unique
+        # The later copy of a duplicated candle wins
+        assert cleaned["close"].iloc[-1] == make_dirty_candles()["close"].iloc[-1]
+
+    def test_first_candle_is_not_an_outlier(self) -> None:
+        """Test the first candle has no previous close to compare with."""
+        cleaned, report = DataValidator().validate(make_candles(), "1h")
+        assert cleaned.index[0] == pd.Timestamp("2024-01-01")
+        assert report.outliers == 0
+
+    def test_ffill_fills_the_grid(self) -> None:
+        """Test forward fill replaces removed and missing candles."""
+        cleaned, report = DataValidator("ffill").validate(make_dirty_candles(), "1h")
+
+        assert len(cleaned) == 48
+        assert report.filled == 3 + 4
+        assert (cleaned.index.to_series().diff().dropna() == pd.Timedelta("1h")).all()
+
+        filled = cleaned.loc["2024-01-01 21:00"]
+        previous_close = cleaned.loc["2024-01-01 19:00", "close"]
+        assert (filled[["open", "high", "low", "close"]] == previous_close).all()
+        assert filled["volume"] == 0
+
+    def test_mark_keeps_invalid_candles(self) -> None:
+        """Test marking flags invalid candles instead of removing them."""
+        cleaned, report = DataValidator("mark").validate(make_dirty_candles(), "1h")
+
+        assert len(cleaned) == 48 - 3
+        assert cleaned["invalid"].sum() == 4
+        assert report.removed == 1
+
+    def test_unknown_policy(self) -> None:
+        """Test unknown repair policies are rejected."""
+        with pytest.raises(ValueError, match="Unknown repair policy"):
+            DataValidator("interpolate")